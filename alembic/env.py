@@ -33,6 +33,7 @@ from src.database.bea_models import Base as BEABase
 from src.database.bea_tracking_models import Base as BEATrackingBase
 from src.database.treasury_models import Base as TreasuryBase
 from src.database.treasury_tracking_models import Base as TreasuryTrackingBase
+from src.database.job_models import Base as JobBase
 
 # Combine metadata from all Base objects for autogenerate
 from sqlalchemy import MetaData
@@ -51,6 +52,8 @@ for table in TreasuryBase.metadata.tables.values():
     table.to_metadata(combined_metadata)
 for table in TreasuryTrackingBase.metadata.tables.values():
     table.to_metadata(combined_metadata)
+for table in JobBase.metadata.tables.values():
+    table.to_metadata(combined_metadata)
 
 target_metadata = combined_metadata
 
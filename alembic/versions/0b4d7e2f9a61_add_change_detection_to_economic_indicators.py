@@ -0,0 +1,30 @@
+"""add_change_detection_to_economic_indicators
+
+Revision ID: 0b4d7e2f9a61
+Revises: f2a86d4c07b9
+Create Date: 2025-12-05 16:52:44.018376
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b4d7e2f9a61'
+down_revision: Union[str, Sequence[str], None] = 'f2a86d4c07b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('economic_indicators', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('economic_indicators', sa.Column('last_observation_date', sa.Date(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('economic_indicators', 'last_observation_date')
+    op.drop_column('economic_indicators', 'content_hash')
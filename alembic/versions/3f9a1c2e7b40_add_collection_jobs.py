@@ -0,0 +1,59 @@
+"""add_collection_jobs
+
+Revision ID: 3f9a1c2e7b40
+Revises: c80ee466b77b
+Create Date: 2025-12-04 10:12:44.518306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c2e7b40'
+down_revision: Union[str, Sequence[str], None] = 'c80ee466b77b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('collection_jobs',
+    sa.Column('job_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('job_type', sa.String(length=100), nullable=False),
+    sa.Column('params', postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'{}'::jsonb"), nullable=False),
+    sa.Column('concurrency_key', sa.String(length=100), nullable=True),
+    sa.Column('priority', sa.SmallInteger(), server_default='0', nullable=False),
+    sa.Column('status', sa.String(length=20), server_default='queued', nullable=False),
+    sa.Column('attempts', sa.SmallInteger(), server_default='0', nullable=False),
+    sa.Column('max_attempts', sa.SmallInteger(), server_default='3', nullable=False),
+    sa.Column('run_after', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('cancel_requested', sa.Boolean(), server_default='false', nullable=False),
+    sa.Column('worker_id', sa.String(length=100), nullable=True),
+    sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('progress', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('run_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('job_id')
+    )
+    op.create_index('ix_collection_jobs_claim', 'collection_jobs', ['status', 'priority', 'run_after'], unique=False)
+    op.create_index(op.f('ix_collection_jobs_job_type'), 'collection_jobs', ['job_type'], unique=False)
+    op.create_index(op.f('ix_collection_jobs_status'), 'collection_jobs', ['status'], unique=False)
+    op.create_index('uq_collection_jobs_active_key', 'collection_jobs', ['concurrency_key'], unique=True,
+                    postgresql_where=sa.text("status IN ('queued', 'running')"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_collection_jobs_active_key', table_name='collection_jobs',
+                  postgresql_where=sa.text("status IN ('queued', 'running')"))
+    op.drop_index(op.f('ix_collection_jobs_status'), table_name='collection_jobs')
+    op.drop_index(op.f('ix_collection_jobs_job_type'), table_name='collection_jobs')
+    op.drop_index('ix_collection_jobs_claim', table_name='collection_jobs')
+    op.drop_table('collection_jobs')
@@ -0,0 +1,48 @@
+"""add_peer_edges_table
+
+Revision ID: 7c1d4e9a2f63
+Revises: 3f9a1c2e7b40
+Create Date: 2025-12-04 15:32:08.271940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1d4e9a2f63'
+down_revision: Union[str, Sequence[str], None] = '3f9a1c2e7b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('peer_edges',
+    sa.Column('symbol', sa.String(length=20), nullable=False),
+    sa.Column('peer_symbol', sa.String(length=20), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['symbol'], ['peers_bulk.symbol'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('symbol', 'peer_symbol')
+    )
+
+    # Backfill from existing comma-separated lists; first occurrence wins for duplicates
+    op.execute("""
+        INSERT INTO peer_edges (symbol, peer_symbol, position)
+        SELECT p.symbol, trim(t.peer), (t.ord - 1)::int
+        FROM peers_bulk p
+        CROSS JOIN LATERAL unnest(string_to_array(p.peers_list, ',')) WITH ORDINALITY AS t(peer, ord)
+        WHERE trim(t.peer) <> '' AND length(trim(t.peer)) <= 20
+        ORDER BY p.symbol, t.ord
+        ON CONFLICT (symbol, peer_symbol) DO NOTHING
+    """)
+
+    op.create_index('ix_peer_edges_peer_symbol', 'peer_edges', ['peer_symbol', 'symbol'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_peer_edges_peer_symbol', table_name='peer_edges')
+    op.drop_table('peer_edges')
@@ -0,0 +1,31 @@
+"""add_last_updated_to_peers_bulk
+
+Revision ID: b2e8f05d61a4
+Revises: 7c1d4e9a2f63
+Create Date: 2025-12-04 17:05:41.806113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e8f05d61a4'
+down_revision: Union[str, Sequence[str], None] = '7c1d4e9a2f63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('peers_bulk', sa.Column('last_updated', sa.DateTime(), server_default=sa.text('now()'), nullable=False))
+    op.execute("UPDATE peers_bulk SET last_updated = collected_at")
+    op.create_index('ix_peers_bulk_last_updated', 'peers_bulk', ['last_updated'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_peers_bulk_last_updated', table_name='peers_bulk')
+    op.drop_column('peers_bulk', 'last_updated')
@@ -0,0 +1,471 @@
+"""add_trading_calendar_table
+
+Revision ID: d41f7a9c3e85
+Revises: b2e8f05d61a4
+Create Date: 2025-12-05 09:47:13.550218
+
+"""
+from typing import Sequence, Union
+
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f7a9c3e85'
+down_revision: Union[str, Sequence[str], None] = 'b2e8f05d61a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Weekday NYSE closures 1990-2035 as of this revision, frozen here so the rows
+# this migration writes never depend on the application code it runs beside
+# (src/utils/trading_calendar.py, which scripts/sync_trading_calendar.py uses)
+NYSE_CLOSURES = [
+    ('1990-01-01', "New Year's Day"),
+    ('1990-02-19', "Washington's Birthday"),
+    ('1990-04-13', 'Good Friday'),
+    ('1990-05-28', 'Memorial Day'),
+    ('1990-07-04', 'Independence Day'),
+    ('1990-09-03', 'Labor Day'),
+    ('1990-11-22', 'Thanksgiving Day'),
+    ('1990-12-25', 'Christmas Day'),
+    ('1991-01-01', "New Year's Day"),
+    ('1991-02-18', "Washington's Birthday"),
+    ('1991-03-29', 'Good Friday'),
+    ('1991-05-27', 'Memorial Day'),
+    ('1991-07-04', 'Independence Day'),
+    ('1991-09-02', 'Labor Day'),
+    ('1991-11-28', 'Thanksgiving Day'),
+    ('1991-12-25', 'Christmas Day'),
+    ('1992-01-01', "New Year's Day"),
+    ('1992-02-17', "Washington's Birthday"),
+    ('1992-04-17', 'Good Friday'),
+    ('1992-05-25', 'Memorial Day'),
+    ('1992-07-03', 'Independence Day'),
+    ('1992-09-07', 'Labor Day'),
+    ('1992-11-26', 'Thanksgiving Day'),
+    ('1992-12-25', 'Christmas Day'),
+    ('1993-01-01', "New Year's Day"),
+    ('1993-02-15', "Washington's Birthday"),
+    ('1993-04-09', 'Good Friday'),
+    ('1993-05-31', 'Memorial Day'),
+    ('1993-07-05', 'Independence Day'),
+    ('1993-09-06', 'Labor Day'),
+    ('1993-11-25', 'Thanksgiving Day'),
+    ('1993-12-24', 'Christmas Day'),
+    ('1994-02-21', "Washington's Birthday"),
+    ('1994-04-01', 'Good Friday'),
+    ('1994-04-27', 'Nixon National Day of Mourning'),
+    ('1994-05-30', 'Memorial Day'),
+    ('1994-07-04', 'Independence Day'),
+    ('1994-09-05', 'Labor Day'),
+    ('1994-11-24', 'Thanksgiving Day'),
+    ('1994-12-26', 'Christmas Day'),
+    ('1995-01-02', "New Year's Day"),
+    ('1995-02-20', "Washington's Birthday"),
+    ('1995-04-14', 'Good Friday'),
+    ('1995-05-29', 'Memorial Day'),
+    ('1995-07-04', 'Independence Day'),
+    ('1995-09-04', 'Labor Day'),
+    ('1995-11-23', 'Thanksgiving Day'),
+    ('1995-12-25', 'Christmas Day'),
+    ('1996-01-01', "New Year's Day"),
+    ('1996-02-19', "Washington's Birthday"),
+    ('1996-04-05', 'Good Friday'),
+    ('1996-05-27', 'Memorial Day'),
+    ('1996-07-04', 'Independence Day'),
+    ('1996-09-02', 'Labor Day'),
+    ('1996-11-28', 'Thanksgiving Day'),
+    ('1996-12-25', 'Christmas Day'),
+    ('1997-01-01', "New Year's Day"),
+    ('1997-02-17', "Washington's Birthday"),
+    ('1997-03-28', 'Good Friday'),
+    ('1997-05-26', 'Memorial Day'),
+    ('1997-07-04', 'Independence Day'),
+    ('1997-09-01', 'Labor Day'),
+    ('1997-11-27', 'Thanksgiving Day'),
+    ('1997-12-25', 'Christmas Day'),
+    ('1998-01-01', "New Year's Day"),
+    ('1998-01-19', 'Martin Luther King Jr. Day'),
+    ('1998-02-16', "Washington's Birthday"),
+    ('1998-04-10', 'Good Friday'),
+    ('1998-05-25', 'Memorial Day'),
+    ('1998-07-03', 'Independence Day'),
+    ('1998-09-07', 'Labor Day'),
+    ('1998-11-26', 'Thanksgiving Day'),
+    ('1998-12-25', 'Christmas Day'),
+    ('1999-01-01', "New Year's Day"),
+    ('1999-01-18', 'Martin Luther King Jr. Day'),
+    ('1999-02-15', "Washington's Birthday"),
+    ('1999-04-02', 'Good Friday'),
+    ('1999-05-31', 'Memorial Day'),
+    ('1999-07-05', 'Independence Day'),
+    ('1999-09-06', 'Labor Day'),
+    ('1999-11-25', 'Thanksgiving Day'),
+    ('1999-12-24', 'Christmas Day'),
+    ('2000-01-17', 'Martin Luther King Jr. Day'),
+    ('2000-02-21', "Washington's Birthday"),
+    ('2000-04-21', 'Good Friday'),
+    ('2000-05-29', 'Memorial Day'),
+    ('2000-07-04', 'Independence Day'),
+    ('2000-09-04', 'Labor Day'),
+    ('2000-11-23', 'Thanksgiving Day'),
+    ('2000-12-25', 'Christmas Day'),
+    ('2001-01-01', "New Year's Day"),
+    ('2001-01-15', 'Martin Luther King Jr. Day'),
+    ('2001-02-19', "Washington's Birthday"),
+    ('2001-04-13', 'Good Friday'),
+    ('2001-05-28', 'Memorial Day'),
+    ('2001-07-04', 'Independence Day'),
+    ('2001-09-03', 'Labor Day'),
+    ('2001-09-11', 'September 11 attacks'),
+    ('2001-09-12', 'September 11 attacks'),
+    ('2001-09-13', 'September 11 attacks'),
+    ('2001-09-14', 'September 11 attacks'),
+    ('2001-11-22', 'Thanksgiving Day'),
+    ('2001-12-25', 'Christmas Day'),
+    ('2002-01-01', "New Year's Day"),
+    ('2002-01-21', 'Martin Luther King Jr. Day'),
+    ('2002-02-18', "Washington's Birthday"),
+    ('2002-03-29', 'Good Friday'),
+    ('2002-05-27', 'Memorial Day'),
+    ('2002-07-04', 'Independence Day'),
+    ('2002-09-02', 'Labor Day'),
+    ('2002-11-28', 'Thanksgiving Day'),
+    ('2002-12-25', 'Christmas Day'),
+    ('2003-01-01', "New Year's Day"),
+    ('2003-01-20', 'Martin Luther King Jr. Day'),
+    ('2003-02-17', "Washington's Birthday"),
+    ('2003-04-18', 'Good Friday'),
+    ('2003-05-26', 'Memorial Day'),
+    ('2003-07-04', 'Independence Day'),
+    ('2003-09-01', 'Labor Day'),
+    ('2003-11-27', 'Thanksgiving Day'),
+    ('2003-12-25', 'Christmas Day'),
+    ('2004-01-01', "New Year's Day"),
+    ('2004-01-19', 'Martin Luther King Jr. Day'),
+    ('2004-02-16', "Washington's Birthday"),
+    ('2004-04-09', 'Good Friday'),
+    ('2004-05-31', 'Memorial Day'),
+    ('2004-06-11', 'Reagan National Day of Mourning'),
+    ('2004-07-05', 'Independence Day'),
+    ('2004-09-06', 'Labor Day'),
+    ('2004-11-25', 'Thanksgiving Day'),
+    ('2004-12-24', 'Christmas Day'),
+    ('2005-01-17', 'Martin Luther King Jr. Day'),
+    ('2005-02-21', "Washington's Birthday"),
+    ('2005-03-25', 'Good Friday'),
+    ('2005-05-30', 'Memorial Day'),
+    ('2005-07-04', 'Independence Day'),
+    ('2005-09-05', 'Labor Day'),
+    ('2005-11-24', 'Thanksgiving Day'),
+    ('2005-12-26', 'Christmas Day'),
+    ('2006-01-02', "New Year's Day"),
+    ('2006-01-16', 'Martin Luther King Jr. Day'),
+    ('2006-02-20', "Washington's Birthday"),
+    ('2006-04-14', 'Good Friday'),
+    ('2006-05-29', 'Memorial Day'),
+    ('2006-07-04', 'Independence Day'),
+    ('2006-09-04', 'Labor Day'),
+    ('2006-11-23', 'Thanksgiving Day'),
+    ('2006-12-25', 'Christmas Day'),
+    ('2007-01-01', "New Year's Day"),
+    ('2007-01-02', 'Ford National Day of Mourning'),
+    ('2007-01-15', 'Martin Luther King Jr. Day'),
+    ('2007-02-19', "Washington's Birthday"),
+    ('2007-04-06', 'Good Friday'),
+    ('2007-05-28', 'Memorial Day'),
+    ('2007-07-04', 'Independence Day'),
+    ('2007-09-03', 'Labor Day'),
+    ('2007-11-22', 'Thanksgiving Day'),
+    ('2007-12-25', 'Christmas Day'),
+    ('2008-01-01', "New Year's Day"),
+    ('2008-01-21', 'Martin Luther King Jr. Day'),
+    ('2008-02-18', "Washington's Birthday"),
+    ('2008-03-21', 'Good Friday'),
+    ('2008-05-26', 'Memorial Day'),
+    ('2008-07-04', 'Independence Day'),
+    ('2008-09-01', 'Labor Day'),
+    ('2008-11-27', 'Thanksgiving Day'),
+    ('2008-12-25', 'Christmas Day'),
+    ('2009-01-01', "New Year's Day"),
+    ('2009-01-19', 'Martin Luther King Jr. Day'),
+    ('2009-02-16', "Washington's Birthday"),
+    ('2009-04-10', 'Good Friday'),
+    ('2009-05-25', 'Memorial Day'),
+    ('2009-07-03', 'Independence Day'),
+    ('2009-09-07', 'Labor Day'),
+    ('2009-11-26', 'Thanksgiving Day'),
+    ('2009-12-25', 'Christmas Day'),
+    ('2010-01-01', "New Year's Day"),
+    ('2010-01-18', 'Martin Luther King Jr. Day'),
+    ('2010-02-15', "Washington's Birthday"),
+    ('2010-04-02', 'Good Friday'),
+    ('2010-05-31', 'Memorial Day'),
+    ('2010-07-05', 'Independence Day'),
+    ('2010-09-06', 'Labor Day'),
+    ('2010-11-25', 'Thanksgiving Day'),
+    ('2010-12-24', 'Christmas Day'),
+    ('2011-01-17', 'Martin Luther King Jr. Day'),
+    ('2011-02-21', "Washington's Birthday"),
+    ('2011-04-22', 'Good Friday'),
+    ('2011-05-30', 'Memorial Day'),
+    ('2011-07-04', 'Independence Day'),
+    ('2011-09-05', 'Labor Day'),
+    ('2011-11-24', 'Thanksgiving Day'),
+    ('2011-12-26', 'Christmas Day'),
+    ('2012-01-02', "New Year's Day"),
+    ('2012-01-16', 'Martin Luther King Jr. Day'),
+    ('2012-02-20', "Washington's Birthday"),
+    ('2012-04-06', 'Good Friday'),
+    ('2012-05-28', 'Memorial Day'),
+    ('2012-07-04', 'Independence Day'),
+    ('2012-09-03', 'Labor Day'),
+    ('2012-10-29', 'Hurricane Sandy'),
+    ('2012-10-30', 'Hurricane Sandy'),
+    ('2012-11-22', 'Thanksgiving Day'),
+    ('2012-12-25', 'Christmas Day'),
+    ('2013-01-01', "New Year's Day"),
+    ('2013-01-21', 'Martin Luther King Jr. Day'),
+    ('2013-02-18', "Washington's Birthday"),
+    ('2013-03-29', 'Good Friday'),
+    ('2013-05-27', 'Memorial Day'),
+    ('2013-07-04', 'Independence Day'),
+    ('2013-09-02', 'Labor Day'),
+    ('2013-11-28', 'Thanksgiving Day'),
+    ('2013-12-25', 'Christmas Day'),
+    ('2014-01-01', "New Year's Day"),
+    ('2014-01-20', 'Martin Luther King Jr. Day'),
+    ('2014-02-17', "Washington's Birthday"),
+    ('2014-04-18', 'Good Friday'),
+    ('2014-05-26', 'Memorial Day'),
+    ('2014-07-04', 'Independence Day'),
+    ('2014-09-01', 'Labor Day'),
+    ('2014-11-27', 'Thanksgiving Day'),
+    ('2014-12-25', 'Christmas Day'),
+    ('2015-01-01', "New Year's Day"),
+    ('2015-01-19', 'Martin Luther King Jr. Day'),
+    ('2015-02-16', "Washington's Birthday"),
+    ('2015-04-03', 'Good Friday'),
+    ('2015-05-25', 'Memorial Day'),
+    ('2015-07-03', 'Independence Day'),
+    ('2015-09-07', 'Labor Day'),
+    ('2015-11-26', 'Thanksgiving Day'),
+    ('2015-12-25', 'Christmas Day'),
+    ('2016-01-01', "New Year's Day"),
+    ('2016-01-18', 'Martin Luther King Jr. Day'),
+    ('2016-02-15', "Washington's Birthday"),
+    ('2016-03-25', 'Good Friday'),
+    ('2016-05-30', 'Memorial Day'),
+    ('2016-07-04', 'Independence Day'),
+    ('2016-09-05', 'Labor Day'),
+    ('2016-11-24', 'Thanksgiving Day'),
+    ('2016-12-26', 'Christmas Day'),
+    ('2017-01-02', "New Year's Day"),
+    ('2017-01-16', 'Martin Luther King Jr. Day'),
+    ('2017-02-20', "Washington's Birthday"),
+    ('2017-04-14', 'Good Friday'),
+    ('2017-05-29', 'Memorial Day'),
+    ('2017-07-04', 'Independence Day'),
+    ('2017-09-04', 'Labor Day'),
+    ('2017-11-23', 'Thanksgiving Day'),
+    ('2017-12-25', 'Christmas Day'),
+    ('2018-01-01', "New Year's Day"),
+    ('2018-01-15', 'Martin Luther King Jr. Day'),
+    ('2018-02-19', "Washington's Birthday"),
+    ('2018-03-30', 'Good Friday'),
+    ('2018-05-28', 'Memorial Day'),
+    ('2018-07-04', 'Independence Day'),
+    ('2018-09-03', 'Labor Day'),
+    ('2018-11-22', 'Thanksgiving Day'),
+    ('2018-12-05', 'George H.W. Bush National Day of Mourning'),
+    ('2018-12-25', 'Christmas Day'),
+    ('2019-01-01', "New Year's Day"),
+    ('2019-01-21', 'Martin Luther King Jr. Day'),
+    ('2019-02-18', "Washington's Birthday"),
+    ('2019-04-19', 'Good Friday'),
+    ('2019-05-27', 'Memorial Day'),
+    ('2019-07-04', 'Independence Day'),
+    ('2019-09-02', 'Labor Day'),
+    ('2019-11-28', 'Thanksgiving Day'),
+    ('2019-12-25', 'Christmas Day'),
+    ('2020-01-01', "New Year's Day"),
+    ('2020-01-20', 'Martin Luther King Jr. Day'),
+    ('2020-02-17', "Washington's Birthday"),
+    ('2020-04-10', 'Good Friday'),
+    ('2020-05-25', 'Memorial Day'),
+    ('2020-07-03', 'Independence Day'),
+    ('2020-09-07', 'Labor Day'),
+    ('2020-11-26', 'Thanksgiving Day'),
+    ('2020-12-25', 'Christmas Day'),
+    ('2021-01-01', "New Year's Day"),
+    ('2021-01-18', 'Martin Luther King Jr. Day'),
+    ('2021-02-15', "Washington's Birthday"),
+    ('2021-04-02', 'Good Friday'),
+    ('2021-05-31', 'Memorial Day'),
+    ('2021-07-05', 'Independence Day'),
+    ('2021-09-06', 'Labor Day'),
+    ('2021-11-25', 'Thanksgiving Day'),
+    ('2021-12-24', 'Christmas Day'),
+    ('2022-01-17', 'Martin Luther King Jr. Day'),
+    ('2022-02-21', "Washington's Birthday"),
+    ('2022-04-15', 'Good Friday'),
+    ('2022-05-30', 'Memorial Day'),
+    ('2022-06-20', 'Juneteenth'),
+    ('2022-07-04', 'Independence Day'),
+    ('2022-09-05', 'Labor Day'),
+    ('2022-11-24', 'Thanksgiving Day'),
+    ('2022-12-26', 'Christmas Day'),
+    ('2023-01-02', "New Year's Day"),
+    ('2023-01-16', 'Martin Luther King Jr. Day'),
+    ('2023-02-20', "Washington's Birthday"),
+    ('2023-04-07', 'Good Friday'),
+    ('2023-05-29', 'Memorial Day'),
+    ('2023-06-19', 'Juneteenth'),
+    ('2023-07-04', 'Independence Day'),
+    ('2023-09-04', 'Labor Day'),
+    ('2023-11-23', 'Thanksgiving Day'),
+    ('2023-12-25', 'Christmas Day'),
+    ('2024-01-01', "New Year's Day"),
+    ('2024-01-15', 'Martin Luther King Jr. Day'),
+    ('2024-02-19', "Washington's Birthday"),
+    ('2024-03-29', 'Good Friday'),
+    ('2024-05-27', 'Memorial Day'),
+    ('2024-06-19', 'Juneteenth'),
+    ('2024-07-04', 'Independence Day'),
+    ('2024-09-02', 'Labor Day'),
+    ('2024-11-28', 'Thanksgiving Day'),
+    ('2024-12-25', 'Christmas Day'),
+    ('2025-01-01', "New Year's Day"),
+    ('2025-01-09', 'Carter National Day of Mourning'),
+    ('2025-01-20', 'Martin Luther King Jr. Day'),
+    ('2025-02-17', "Washington's Birthday"),
+    ('2025-04-18', 'Good Friday'),
+    ('2025-05-26', 'Memorial Day'),
+    ('2025-06-19', 'Juneteenth'),
+    ('2025-07-04', 'Independence Day'),
+    ('2025-09-01', 'Labor Day'),
+    ('2025-11-27', 'Thanksgiving Day'),
+    ('2025-12-25', 'Christmas Day'),
+    ('2026-01-01', "New Year's Day"),
+    ('2026-01-19', 'Martin Luther King Jr. Day'),
+    ('2026-02-16', "Washington's Birthday"),
+    ('2026-04-03', 'Good Friday'),
+    ('2026-05-25', 'Memorial Day'),
+    ('2026-06-19', 'Juneteenth'),
+    ('2026-07-03', 'Independence Day'),
+    ('2026-09-07', 'Labor Day'),
+    ('2026-11-26', 'Thanksgiving Day'),
+    ('2026-12-25', 'Christmas Day'),
+    ('2027-01-01', "New Year's Day"),
+    ('2027-01-18', 'Martin Luther King Jr. Day'),
+    ('2027-02-15', "Washington's Birthday"),
+    ('2027-03-26', 'Good Friday'),
+    ('2027-05-31', 'Memorial Day'),
+    ('2027-06-18', 'Juneteenth'),
+    ('2027-07-05', 'Independence Day'),
+    ('2027-09-06', 'Labor Day'),
+    ('2027-11-25', 'Thanksgiving Day'),
+    ('2027-12-24', 'Christmas Day'),
+    ('2028-01-17', 'Martin Luther King Jr. Day'),
+    ('2028-02-21', "Washington's Birthday"),
+    ('2028-04-14', 'Good Friday'),
+    ('2028-05-29', 'Memorial Day'),
+    ('2028-06-19', 'Juneteenth'),
+    ('2028-07-04', 'Independence Day'),
+    ('2028-09-04', 'Labor Day'),
+    ('2028-11-23', 'Thanksgiving Day'),
+    ('2028-12-25', 'Christmas Day'),
+    ('2029-01-01', "New Year's Day"),
+    ('2029-01-15', 'Martin Luther King Jr. Day'),
+    ('2029-02-19', "Washington's Birthday"),
+    ('2029-03-30', 'Good Friday'),
+    ('2029-05-28', 'Memorial Day'),
+    ('2029-06-19', 'Juneteenth'),
+    ('2029-07-04', 'Independence Day'),
+    ('2029-09-03', 'Labor Day'),
+    ('2029-11-22', 'Thanksgiving Day'),
+    ('2029-12-25', 'Christmas Day'),
+    ('2030-01-01', "New Year's Day"),
+    ('2030-01-21', 'Martin Luther King Jr. Day'),
+    ('2030-02-18', "Washington's Birthday"),
+    ('2030-04-19', 'Good Friday'),
+    ('2030-05-27', 'Memorial Day'),
+    ('2030-06-19', 'Juneteenth'),
+    ('2030-07-04', 'Independence Day'),
+    ('2030-09-02', 'Labor Day'),
+    ('2030-11-28', 'Thanksgiving Day'),
+    ('2030-12-25', 'Christmas Day'),
+    ('2031-01-01', "New Year's Day"),
+    ('2031-01-20', 'Martin Luther King Jr. Day'),
+    ('2031-02-17', "Washington's Birthday"),
+    ('2031-04-11', 'Good Friday'),
+    ('2031-05-26', 'Memorial Day'),
+    ('2031-06-19', 'Juneteenth'),
+    ('2031-07-04', 'Independence Day'),
+    ('2031-09-01', 'Labor Day'),
+    ('2031-11-27', 'Thanksgiving Day'),
+    ('2031-12-25', 'Christmas Day'),
+    ('2032-01-01', "New Year's Day"),
+    ('2032-01-19', 'Martin Luther King Jr. Day'),
+    ('2032-02-16', "Washington's Birthday"),
+    ('2032-03-26', 'Good Friday'),
+    ('2032-05-31', 'Memorial Day'),
+    ('2032-06-18', 'Juneteenth'),
+    ('2032-07-05', 'Independence Day'),
+    ('2032-09-06', 'Labor Day'),
+    ('2032-11-25', 'Thanksgiving Day'),
+    ('2032-12-24', 'Christmas Day'),
+    ('2033-01-17', 'Martin Luther King Jr. Day'),
+    ('2033-02-21', "Washington's Birthday"),
+    ('2033-04-15', 'Good Friday'),
+    ('2033-05-30', 'Memorial Day'),
+    ('2033-06-20', 'Juneteenth'),
+    ('2033-07-04', 'Independence Day'),
+    ('2033-09-05', 'Labor Day'),
+    ('2033-11-24', 'Thanksgiving Day'),
+    ('2033-12-26', 'Christmas Day'),
+    ('2034-01-02', "New Year's Day"),
+    ('2034-01-16', 'Martin Luther King Jr. Day'),
+    ('2034-02-20', "Washington's Birthday"),
+    ('2034-04-07', 'Good Friday'),
+    ('2034-05-29', 'Memorial Day'),
+    ('2034-06-19', 'Juneteenth'),
+    ('2034-07-04', 'Independence Day'),
+    ('2034-09-04', 'Labor Day'),
+    ('2034-11-23', 'Thanksgiving Day'),
+    ('2034-12-25', 'Christmas Day'),
+    ('2035-01-01', "New Year's Day"),
+    ('2035-01-15', 'Martin Luther King Jr. Day'),
+    ('2035-02-19', "Washington's Birthday"),
+    ('2035-03-23', 'Good Friday'),
+    ('2035-05-28', 'Memorial Day'),
+    ('2035-06-19', 'Juneteenth'),
+    ('2035-07-04', 'Independence Day'),
+    ('2035-09-03', 'Labor Day'),
+    ('2035-11-22', 'Thanksgiving Day'),
+    ('2035-12-25', 'Christmas Day'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    trading_calendar = op.create_table('trading_calendar',
+    sa.Column('exchange', sa.String(length=10), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('description', sa.String(length=100), nullable=True),
+    sa.PrimaryKeyConstraint('exchange', 'date')
+    )
+
+    # Seed NYSE closures; extend later with scripts/sync_trading_calendar.py
+    op.bulk_insert(trading_calendar, [
+        {'exchange': 'XNYS', 'date': date.fromisoformat(day), 'description': description}
+        for day, description in NYSE_CLOSURES
+    ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('trading_calendar')
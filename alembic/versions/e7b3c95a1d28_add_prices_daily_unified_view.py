@@ -0,0 +1,47 @@
+"""add_prices_daily_unified_view
+
+Revision ID: e7b3c95a1d28
+Revises: d41f7a9c3e85
+Create Date: 2025-12-05 10:12:27.340519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3c95a1d28'
+down_revision: Union[str, Sequence[str], None] = 'd41f7a9c3e85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The view as of this revision, frozen here on purpose: models.py holds the
+# current definition for create_all, and a later change to the view gets its
+# own migration instead of editing this one.
+PRICES_DAILY_UNIFIED_SQL = """
+        CREATE OR REPLACE VIEW prices_daily_unified AS
+        SELECT p.symbol, p.date,
+               p.adj_open AS open, p.adj_high AS high, p.adj_low AS low, p.adj_close AS close,
+               p.adj_close, p.volume, 'regular'::varchar(10) AS source
+        FROM prices_daily p
+        UNION ALL
+        SELECT b.symbol, b.date,
+               b.open, b.high, b.low, b.close,
+               b.adj_close, b.volume, 'bulk'::varchar(10) AS source
+        FROM prices_daily_bulk b
+        WHERE NOT EXISTS (
+            SELECT 1 FROM prices_daily p WHERE p.symbol = b.symbol AND p.date = b.date
+        )
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(PRICES_DAILY_UNIFIED_SQL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP VIEW IF EXISTS prices_daily_unified")
@@ -0,0 +1,29 @@
+"""add_updated_at_to_prices_monthly
+
+Revision ID: f2a86d4c07b9
+Revises: e7b3c95a1d28
+Create Date: 2025-12-05 14:31:08.227461
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a86d4c07b9'
+down_revision: Union[str, Sequence[str], None] = 'e7b3c95a1d28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('prices_monthly', sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False))
+    op.execute("UPDATE prices_monthly SET updated_at = created_at")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('prices_monthly', 'updated_at')
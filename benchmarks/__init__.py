@@ -0,0 +1,10 @@
+"""
+Ingestion benchmarks
+
+Deterministic synthetic inputs (BLS AllData flat files, FMP eod-bulk CSVs,
+BEA GetData JSON) run through the real parse and load paths against a
+disposable PostgreSQL database. See benchmarks/run_ingestion.py.
+
+benchmarks/replay_server.py stands in for the upstream APIs (record/replay
+or synthetic responses) for offline client and retry tests.
+"""
@@ -0,0 +1,269 @@
+"""
+Synthetic Ingestion Fixtures
+
+Deterministic inputs in the formats the collectors consume:
+  - BLS CU flat files (cu.area, cu.item, cu.periodicity, cu.series and an
+    AllData file, tab-delimited and space-padded like download.bls.gov)
+  - FMP /stable/eod-bulk CSV for one date
+  - FMP /stable/profile-bulk CSV parts
+  - BEA GetData JSON for a NIPA table
+
+The same arguments and seed always produce byte-identical output, so runs
+on different commits load exactly the same rows (see fixture_digest()).
+
+FixtureAdapter serves generated bodies to a requests.Session, so the HTTP
+collectors run their real request/decode paths without network access.
+"""
+import hashlib
+import io
+import json
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+BLS_LAST_YEAR = 2025
+EOD_BULK_COLUMNS = ['symbol', 'date', 'open', 'low', 'high', 'close', 'adjClose', 'volume']
+PROFILE_BULK_COLUMNS = [
+    'symbol', 'price', 'marketCap', 'beta', 'lastDividend', 'range', 'change', 'changePercentage',
+    'volume', 'averageVolume', 'companyName', 'currency', 'cik', 'isin', 'cusip', 'exchange',
+    'exchangeFullName', 'industry', 'sector', 'website', 'description', 'ceo', 'country',
+    'fullTimeEmployees', 'phone', 'address', 'city', 'state', 'zip', 'image', 'ipoDate',
+    'defaultImage', 'isEtf', 'isActivelyTrading', 'isAdr', 'isFund',
+]
+PROFILE_BULK_PARTS = 4
+
+
+def fixture_digest(data: bytes) -> str:
+    """Short sha256 of a fixture, recorded with results so runs compare like with like."""
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+# ===================== BLS ===================== #
+
+def bls_series_ids(series: int) -> List[str]:
+    """CU series ids: seasonal flag, periodicity, area and item codes."""
+    areas = max(1, int(series ** 0.5))
+    return [
+        f"CU{'S' if i % 2 else 'U'}R{i % areas:04d}I{i // areas:04d}"
+        for i in range(series)
+    ]
+
+
+def write_bls_alldata(data_dir: Path, series: int, years: int, seed: int = 7) -> Dict[str, object]:
+    """
+    Write a CU survey directory with reference files and one AllData file
+
+    Args:
+        data_dir: Directory to write (created if missing)
+        series: Number of series
+        years: Years of monthly history per series (M01-M12 plus M13 annual average)
+        seed: Random seed
+
+    Returns:
+        {'data_files': [...], 'rows': data rows, 'bytes': data file size, 'digest': ...}
+    """
+    rng = random.Random(seed)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    ids = bls_series_ids(series)
+    areas = sorted({sid[4:8] for sid in ids})
+    items = sorted({sid[8:] for sid in ids})
+
+    def write(name: str, header: List[str], rows: List[List[object]]):
+        lines = ["\t".join(header)] + ["\t".join(str(v) for v in row) for row in rows]
+        (data_dir / name).write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+    write('cu.area', ['area_code', 'area_name', 'display_level', 'selectable', 'sort_sequence'],
+          [[a, f"Area {a}", 1, 'T', n] for n, a in enumerate(areas)])
+    write('cu.item', ['item_code', 'item_name', 'display_level', 'selectable', 'sort_sequence'],
+          [[i, f"Item {i}", 1, 'T', n] for n, i in enumerate(items)])
+    write('cu.periodicity', ['periodicity_code', 'periodicity_name', 'description'],
+          [['R', 'Monthly', 'Regular monthly release'], ['S', 'Semi-Annual', 'Semi-annual release']])
+
+    first_year = BLS_LAST_YEAR - years + 1
+    write('cu.series', ['series_id', 'area_code', 'item_code', 'seasonal', 'periodicity_code', 'base_code',
+                        'base_period', 'series_title', 'footnote_codes', 'begin_year', 'begin_period',
+                        'end_year', 'end_period'],
+          [[sid, sid[4:8], sid[8:], sid[2], 'R', 'S', '1982-84=100', f"Synthetic CPI {sid}", '',
+            first_year, 'M01', BLS_LAST_YEAR, 'M13'] for sid in ids])
+
+    # AllData layout: padded series id and value columns, as published
+    out = io.StringIO()
+    out.write("series_id                     \tyear\tperiod\t       value\tfootnote_codes\n")
+    rows = 0
+    for sid in ids:
+        level = rng.uniform(50, 300)
+        for year in range(first_year, BLS_LAST_YEAR + 1):
+            monthly = []
+            for month in range(1, 13):
+                level *= 1 + rng.gauss(0.002, 0.004)
+                monthly.append(level)
+                value = '-' if rng.random() < 0.005 else f"{level:.3f}"
+                footnote = 'P' if year == BLS_LAST_YEAR and month > 10 else ''
+                out.write(f"{sid:<30}\t{year}\tM{month:02d}\t{value:>12}\t{footnote}\n")
+            out.write(f"{sid:<30}\t{year}\tM13\t{sum(monthly) / 12:>12.3f}\t\n")
+            rows += 13
+
+    data_file = 'cu.data.1.AllItems'
+    body = out.getvalue().encode('utf-8')
+    (data_dir / data_file).write_bytes(body)
+    return {'data_files': [data_file], 'rows': rows, 'bytes': len(body), 'digest': fixture_digest(body)}
+
+
+# ===================== FMP ===================== #
+
+def build_eod_bulk_csv(symbols: int, trade_date: date, seed: int = 7) -> bytes:
+    """
+    FMP eod-bulk CSV for one date
+
+    A few rows per thousand have blank fields, as the live file does for
+    thinly traded listings.
+    """
+    rng = random.Random(f"{seed}-{trade_date.isoformat()}")
+    out = io.StringIO()
+    out.write(",".join(EOD_BULK_COLUMNS) + "\n")
+    day = trade_date.isoformat()
+    for i in range(symbols):
+        symbol = f"SYM{i:06d}" if i % 10 else f"SYM{i:06d}.L"
+        close = rng.uniform(1, 500)
+        low, high = close * rng.uniform(0.95, 1.0), close * rng.uniform(1.0, 1.05)
+        open_ = rng.uniform(low, high)
+        volume = '' if rng.random() < 0.003 else str(int(rng.expovariate(1 / 250_000)))
+        out.write(f"{symbol},{day},{open_:.4f},{low:.4f},{high:.4f},{close:.4f},{close:.4f},{volume}\n")
+    return out.getvalue().encode('utf-8')
+
+
+def build_profile_bulk_csv(symbols: int, part: int, seed: int = 7) -> bytes:
+    """
+    One part of the FMP profile-bulk CSV
+
+    Each of the PROFILE_BULK_PARTS parts holds its own `symbols` companies;
+    any other part number is an empty body, as the live endpoint returns
+    past the last part. Descriptions are a few hundred characters with
+    quoted commas, and cik/zip keep their leading zeros.
+    """
+    if not 0 <= part < PROFILE_BULK_PARTS:
+        return b''
+    rng = random.Random(f"{seed}-profile-{part}")
+    out = io.StringIO()
+    out.write(",".join(PROFILE_BULK_COLUMNS) + "\n")
+    for i in range(symbols):
+        n = part * symbols + i
+        price = rng.uniform(1, 500)
+        shares = rng.randint(10**6, 10**10)
+        etf = n % 7 == 0
+        description = " ".join(rng.choice(('revenue', 'growth', 'markets', 'products', 'services, and',
+                                            'operates', 'segments', 'customers'))
+                               for _ in range(rng.randint(20, 60)))
+        row = [
+            f"P{n:06d}", f"{price:.2f}", str(int(price * shares)), f"{rng.uniform(0, 2):.3f}",
+            f"{rng.uniform(0, 5):.2f}", f"{price * 0.7:.2f}-{price * 1.3:.2f}", f"{rng.uniform(-5, 5):.2f}",
+            f"{rng.uniform(-3, 3):.4f}", str(rng.randint(0, 10**7)), str(rng.randint(0, 10**7)),
+            f"Company {n} Inc.", 'USD', f"{n:010d}", f"US{n:09d}0", f"{n:09d}", 'NASDAQ',
+            'NASDAQ Global Select', 'Software', 'Technology', f"https://p{n}.example.com",
+            f'"{description}"', 'Jane Doe', 'US', str(rng.randint(1, 200000)), f"+1 555 {n % 10000:04d}",
+            f"{n} Main Street", 'Springfield', 'CA', f"{n % 100000:05d}", f"https://images.example.com/P{n:06d}.png",
+            (date(1990, 1, 1) + timedelta(days=n % 12000)).isoformat(),
+            'false', str(etf).lower(), 'true', 'false', str(etf).lower(),
+        ]
+        out.write(",".join(row) + "\n")
+    return out.getvalue().encode('utf-8')
+
+
+def eod_trading_dates(days: int, end: date = date(2025, 11, 28)) -> List[date]:
+    """Last `days` weekdays up to end."""
+    out = []
+    d = end
+    while len(out) < days:
+        if d.weekday() < 5:
+            out.append(d)
+        d -= timedelta(days=1)
+    return out[::-1]
+
+
+# ===================== BEA ===================== #
+
+def build_bea_nipa_response(table_name: str, series: int, quarters: int, seed: int = 7) -> bytes:
+    """
+    BEA GetData (NIPA, quarterly) response body with series x quarters rows
+
+    Values use BEA's comma thousands separators; a few are '(NA)'.
+    """
+    rng = random.Random(seed)
+    data = []
+    first_year = 2025 - quarters // 4
+    for line in range(1, series + 1):
+        code = f"A{line:03d}RC"
+        level = rng.uniform(100, 30_000)
+        for q in range(quarters):
+            level *= 1 + rng.gauss(0.01, 0.02)
+            data.append({
+                "TableName": table_name,
+                "SeriesCode": code,
+                "LineNumber": str(line),
+                "LineDescription": f"Synthetic line {line}",
+                "TimePeriod": f"{first_year + q // 4}Q{q % 4 + 1}",
+                "METRIC_NAME": "Current Dollars",
+                "CL_UNIT": "Level",
+                "UNIT_MULT": "6",
+                "DataValue": "(NA)" if rng.random() < 0.002 else f"{level:,.1f}",
+                "NoteRef": table_name,
+            })
+    doc = {
+        "BEAAPI": {
+            "Request": {"RequestParam": [{"ParameterName": "TABLENAME", "ParameterValue": table_name}]},
+            "Results": {
+                "Statistic": "NIPA Table",
+                "UTCProductionTime": "2025-11-28T13:30:00.000",
+                "Dimensions": [{"Ordinal": "1", "Name": "TableName", "DataType": "string", "IsValue": "0"}],
+                "Data": data,
+                "Notes": [{"NoteRef": table_name, "NoteText": f"Table {table_name}. Synthetic benchmark data."}],
+            },
+        }
+    }
+    return json.dumps(doc).encode('utf-8')
+
+
+# ===================== HTTP ===================== #
+
+class FixtureAdapter(BaseAdapter):
+    """
+    Transport adapter answering every request with a fixed body.
+
+    Mount it on a session for an API's URL prefix; responses are real
+    requests.Response objects over an in-memory stream, so iter_content(),
+    .text and .json() behave as they do for a network response.
+
+    Usage:
+        session.mount('https://financialmodelingprep.com/', FixtureAdapter(csv_bytes, 'text/csv'))
+    """
+
+    def __init__(self, body: bytes, content_type: str = 'application/json'):
+        super().__init__()
+        self.body = body
+        self.content_type = content_type
+        self.requests = 0
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        self.requests += 1
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict({
+            'Content-Type': self.content_type,
+            'Content-Length': str(len(self.body)),
+        })
+        response.raw = io.BytesIO(self.body)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.encoding = 'utf-8'
+        response.elapsed = timedelta(0)
+        return response
+
+    def close(self):
+        pass
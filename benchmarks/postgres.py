@@ -0,0 +1,128 @@
+"""
+Disposable PostgreSQL for benchmarks
+
+Either creates a throwaway database on an existing server
+(--pg-url / BENCH_PG_URL, any database the role can CREATE DATABASE from)
+or, without one, initializes a temporary cluster with the local initdb and
+pg_ctl, listening only on a Unix socket in the temp directory. Both are
+removed afterwards unless keep=True.
+"""
+import logging
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+
+log = logging.getLogger("BenchmarkPostgres")
+
+
+def _pg_bindir() -> Optional[Path]:
+    """Directory holding initdb/pg_ctl, from PATH or pg_config."""
+    initdb = shutil.which('initdb')
+    if initdb:
+        return Path(initdb).parent
+    pg_config = shutil.which('pg_config')
+    if pg_config:
+        bindir = subprocess.run([pg_config, '--bindir'], capture_output=True, text=True).stdout.strip()
+        if bindir and (Path(bindir) / 'initdb').exists():
+            return Path(bindir)
+    return None
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def _temporary_cluster(keep: bool = False) -> Iterator[str]:
+    """initdb + pg_ctl start in a temp dir; yields a URL to its 'postgres' database."""
+    bindir = _pg_bindir()
+    if bindir is None:
+        raise RuntimeError(
+            "No PostgreSQL server given and initdb not found; pass --pg-url "
+            "(or set BENCH_PG_URL) or install the PostgreSQL server binaries"
+        )
+
+    root = Path(tempfile.mkdtemp(prefix='finexus_bench_pg_'))
+    data_dir, log_file = root / 'data', root / 'server.log'
+    port = _free_port()
+    subprocess.run(
+        [str(bindir / 'initdb'), '-D', str(data_dir), '-U', 'postgres', '--auth=trust', '-E', 'UTF8'],
+        check=True, capture_output=True,
+    )
+    # fsync off: the cluster is thrown away, and disk flushes would dominate small loads
+    options = f"-p {port} -k {root} -c listen_addresses='' -c fsync=off -c synchronous_commit=off"
+    subprocess.run(
+        [str(bindir / 'pg_ctl'), '-D', str(data_dir), '-l', str(log_file), '-w', '-o', options, 'start'],
+        check=True, capture_output=True,
+    )
+    log.info(f"Started temporary PostgreSQL cluster in {root} (port {port})")
+    try:
+        yield f"postgresql+psycopg2://postgres@/postgres?host={root}&port={port}"
+    finally:
+        subprocess.run(
+            [str(bindir / 'pg_ctl'), '-D', str(data_dir), '-m', 'immediate', 'stop'],
+            capture_output=True,
+        )
+        if keep:
+            log.info(f"Kept temporary cluster data in {root}")
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+@contextmanager
+def disposable_database(server_url: Optional[str] = None, keep: bool = False) -> Iterator[str]:
+    """
+    Create an empty database for one benchmark run
+
+    Args:
+        server_url: URL of an existing server/database to create it from
+            (default: BENCH_PG_URL, else a temporary local cluster)
+        keep: Leave the database (and temporary cluster) in place
+
+    Yields:
+        SQLAlchemy URL of the new database
+    """
+    server_url = server_url or os.environ.get('BENCH_PG_URL')
+    if server_url is None:
+        with _temporary_cluster(keep) as cluster_url:
+            with disposable_database(cluster_url, keep) as url:
+                yield url
+        return
+
+    name = f"finexus_bench_{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+    admin = create_engine(server_url, isolation_level='AUTOCOMMIT')
+    try:
+        with admin.connect() as conn:
+            conn.execute(text(f'CREATE DATABASE "{name}"'))
+        log.info(f"Created benchmark database {name}")
+        yield make_url(server_url).set(database=name).render_as_string(hide_password=False)
+    finally:
+        if not keep:
+            with admin.connect() as conn:
+                conn.execute(text(
+                    "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                    "WHERE datname = :name AND pid <> pg_backend_pid()"
+                ), {'name': name})
+                conn.execute(text(f'DROP DATABASE IF EXISTS "{name}"'))
+            log.info(f"Dropped benchmark database {name}")
+        admin.dispose()
+
+
+def server_version(url: str) -> str:
+    engine = create_engine(url)
+    try:
+        with engine.connect() as conn:
+            return conn.execute(text("SHOW server_version")).scalar()
+    finally:
+        engine.dispose()
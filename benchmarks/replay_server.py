@@ -0,0 +1,568 @@
+"""
+Offline Replay Server for the FMP, FRED, BLS, BEA and Treasury APIs
+
+A local HTTP server standing in for the live APIs, so load and concurrency
+tests run offline and without spending quota. Each API is mounted under its
+own path prefix and forwards to its upstream when recording:
+
+    /fmp       https://financialmodelingprep.com
+    /fred      https://fred.stlouisfed.org
+    /bls       https://api.bls.gov
+    /bea       https://apps.bea.gov
+    /treasury  https://api.fiscaldata.treasury.gov
+
+Clients reach it through the base-URL settings (FMP_BASE_URL, FRED_BASE_URL,
+BLS_BASE_URL, BEA_BASE_URL, TREASURY_BASE_URL); ReplayServer.env() returns
+them for the server's address.
+
+Modes:
+  - replay:    serve recorded responses; anything unrecorded gets a synthetic
+               response where a generator exists, else 404
+  - record:    forward unrecorded requests upstream, save and serve the reply
+  - synthetic: ignore recordings and always generate
+
+Recordings are keyed by method, path, query and body with credentials
+(apikey, api_key, registrationkey, UserID) removed, so a cassette recorded
+with one key replays for any other and never stores it.
+
+Behavior (ReplayConfig):
+  - latency_ms / jitter_ms: delay before every response
+  - rate_limits: requests per rate_window seconds, per API; above it the
+    server answers 429 with Retry-After
+  - error_rate: fraction of requests answered 503 (seeded, repeatable)
+  - page_size / total_rows: paginated synthetic results (Treasury
+    page[number]/page[size], FMP page/limit)
+  - calendar_rows_per_day / result_cap: FMP earnings and economic calendar
+    rows per weekday; from/to ranges return at most result_cap rows, like
+    the live endpoints
+
+GET /_replay/stats returns per-API counters; POST /_replay/reset clears them
+and the rate-limit windows.
+
+Usage:
+    python -m benchmarks.replay_server --port 8765 --latency-ms 50 --rate-limit fmp=750
+    python -m benchmarks.replay_server --mode record --cassette benchmarks/cassettes
+"""
+import argparse
+import hashlib
+import json
+import logging
+import math
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+from benchmarks.fixtures import build_bea_nipa_response, build_eod_bulk_csv, build_profile_bulk_csv
+
+log = logging.getLogger("ReplayServer")
+
+UPSTREAMS = {
+    'fmp': 'https://financialmodelingprep.com',
+    'fred': 'https://fred.stlouisfed.org',
+    'bls': 'https://api.bls.gov',
+    'bea': 'https://apps.bea.gov',
+    'treasury': 'https://api.fiscaldata.treasury.gov',
+}
+
+# Settings variable -> path under the API's mount point
+BASE_URL_SETTINGS = {
+    'FMP_BASE_URL': ('fmp', ''),
+    'FRED_BASE_URL': ('fred', ''),
+    'BLS_BASE_URL': ('bls', '/publicAPI/v2'),
+    'BEA_BASE_URL': ('bea', '/api/data'),
+    'TREASURY_BASE_URL': ('treasury', '/services/api/fiscal_service'),
+}
+
+CREDENTIAL_PARAMS = {'apikey', 'api_key', 'registrationkey', 'userid'}
+
+MODES = ('replay', 'record', 'synthetic')
+
+
+@dataclass
+class ReplayConfig:
+    """Server behavior; every knob defaults to 'off'."""
+    mode: str = 'replay'
+    cassette_dir: Optional[Path] = None
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_limits: Dict[str, int] = field(default_factory=dict)  # api -> requests per window
+    rate_window: float = 60.0
+    retry_after: Optional[int] = None  # fixed Retry-After; default: until the window frees a slot
+    error_rate: float = 0.0
+    page_size: int = 100
+    total_rows: int = 250
+    symbols: int = 500  # rows in synthetic bulk files (per part for profile-bulk)
+    calendar_rows_per_day: int = 20
+    result_cap: int = 4000
+    seed: int = 7
+    upstreams: Dict[str, str] = field(default_factory=lambda: dict(UPSTREAMS))
+
+
+@dataclass
+class Reply:
+    status: int
+    body: bytes
+    content_type: str = 'application/json'
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+def _json(doc) -> Reply:
+    return Reply(200, json.dumps(doc).encode('utf-8'))
+
+
+def request_key(method: str, path: str, query: List[Tuple[str, str]], body: bytes) -> str:
+    """Cassette key: readable path stem plus a hash of everything but credentials."""
+    clean_query = sorted((k, v) for k, v in query if k.lower() not in CREDENTIAL_PARAMS)
+    clean_body = body
+    if body:
+        try:
+            doc = json.loads(body)
+            if isinstance(doc, dict):
+                doc = {k: v for k, v in doc.items() if k.lower() not in CREDENTIAL_PARAMS}
+            clean_body = json.dumps(doc, sort_keys=True).encode('utf-8')
+        except ValueError:
+            pass
+    digest = hashlib.sha256(
+        f"{method} {path}?{urlencode(clean_query)}\n".encode('utf-8') + clean_body
+    ).hexdigest()[:16]
+    stem = path.strip('/').replace('/', '_')[-60:] or 'root'
+    return f"{method.lower()}_{stem}_{digest}"
+
+
+# ===================== Synthetic responses ===================== #
+
+def _paged(rows_for: Callable[[int, int], List[dict]], total: int, number: int, size: int) -> Tuple[List[dict], int]:
+    """Rows for 1-based page `number` of `size`, and the total page count."""
+    start = (number - 1) * size
+    return rows_for(start, min(size, max(0, total - start))), max(1, math.ceil(total / size))
+
+
+def _fmp(path: str, params: Dict[str, str], body: bytes, config: ReplayConfig) -> Optional[Reply]:
+    if path == '/stable/eod-bulk':
+        day = date.fromisoformat(params.get('date', '2025-11-28'))
+        return Reply(200, build_eod_bulk_csv(config.symbols, day, config.seed), 'text/csv')
+    if path == '/stable/profile-bulk':
+        part = int(params.get('part', 0))
+        return Reply(200, build_profile_bulk_csv(config.symbols, part, config.seed), 'text/csv')
+    if not path.startswith('/stable/'):
+        return None
+    if path in ('/stable/earnings-calendar', '/stable/economic-calendar'):
+        return _json(_calendar_rows(path, params, config))
+
+    if params.get('period') in ('annual', 'quarter'):
+        # Statement-shaped rows (the columns every statement table shares), newest period first
+        symbol = params.get('symbol', 'SYN')
+        limit = int(params.get('limit', config.page_size))
+        rows = []
+        for i in range(limit):
+            if params['period'] == 'annual':
+                year, period, month = 2024 - i, 'FY', 12
+            else:
+                year, period, month = 2024 - i // 4, f"Q{4 - i % 4}", 12 - 3 * (i % 4)
+            day = (date(year + (month == 12), month % 12 + 1, 1) - timedelta(days=1)).isoformat()
+            rows.append({'date': day, 'symbol': symbol, 'reportedCurrency': 'USD',
+                         'fiscalYear': year, 'period': period})
+        return _json(rows)
+
+    # Generic dated rows, newest first; `page` (0-based) and `limit` paginate as FMP does
+    symbol = params.get('symbol', 'SYN')
+    rng = random.Random(f"{config.seed}-{path}-{symbol}")
+    limit = int(params.get('limit', config.page_size))
+    start = int(params.get('page', 0)) * limit
+    end = min(config.total_rows, start + limit)
+    today = date(2025, 11, 28)
+    return _json([
+        {'symbol': symbol, 'date': (today - timedelta(days=i)).isoformat(), 'value': round(rng.uniform(1, 500), 4)}
+        for i in range(start, end)
+    ])
+
+
+def _calendar_rows(path: str, params: Dict[str, str], config: ReplayConfig) -> List[dict]:
+    """Weekday calendar rows between from and to (inclusive), cut at result_cap."""
+    day = date.fromisoformat(params.get('from', '2025-11-28'))
+    last = date.fromisoformat(params.get('to', day.isoformat()))
+    rows = []
+    while day <= last and len(rows) < config.result_cap:
+        if day.weekday() < 5:
+            rng = random.Random(f"{config.seed}-{path}-{day}")
+            for i in range(config.calendar_rows_per_day):
+                if path == '/stable/earnings-calendar':
+                    eps = round(rng.uniform(-1, 5), 2)
+                    rows.append({'symbol': f"E{i:04d}", 'date': day.isoformat(),
+                                 'epsActual': eps, 'epsEstimated': round(eps * rng.uniform(0.9, 1.1), 2),
+                                 'revenueActual': round(rng.uniform(1e6, 1e10)), 'revenueEstimated': None,
+                                 'lastUpdated': day.isoformat()})
+                else:
+                    value = round(rng.uniform(-5, 5), 2)
+                    rows.append({'date': f"{day.isoformat()} {8 + i % 10:02d}:30:00", 'country': 'US',
+                                 'event': f"Indicator {i:03d}", 'currency': 'USD', 'previous': value,
+                                 'estimate': None, 'actual': round(value + rng.uniform(-1, 1), 2),
+                                 'change': None, 'changePercentage': None,
+                                 'impact': ('Low', 'Medium', 'High')[i % 3], 'unit': '%'})
+        day += timedelta(days=1)
+    return rows[:config.result_cap]
+
+
+def _fred(path: str, params: Dict[str, str], body: bytes, config: ReplayConfig) -> Optional[Reply]:
+    if path != '/graph/fredgraph.csv':
+        return None
+    series_id = params.get('id', 'SYN')
+    rng = random.Random(f"{config.seed}-{series_id}")
+    lines = [f"observation_date,{series_id}"]
+    level = rng.uniform(10, 500)
+    for i in range(config.total_rows):
+        level *= 1 + rng.gauss(0.002, 0.01)
+        lines.append(f"{2000 + i // 12}-{i % 12 + 1:02d}-01,{level:.3f}")
+    return Reply(200, ("\n".join(lines) + "\n").encode('utf-8'), 'text/csv')
+
+
+def _bls(path: str, params: Dict[str, str], body: bytes, config: ReplayConfig) -> Optional[Reply]:
+    if not path.startswith('/publicAPI/v2/timeseries/data'):
+        return None
+    request = json.loads(body) if body else {}
+    series_ids = request.get('seriesid') or [path.rstrip('/').rsplit('/', 1)[-1]]
+    end_year = int(request.get('endyear', 2025))
+    start_year = int(request.get('startyear', end_year))
+    series = []
+    for sid in series_ids:
+        rng = random.Random(f"{config.seed}-{sid}")
+        data = [
+            {'year': str(year), 'period': f"M{month:02d}", 'periodName': f"Month {month}",
+             'value': f"{rng.uniform(50, 300):.3f}", 'footnotes': [{}]}
+            for year in range(end_year, start_year - 1, -1) for month in range(12, 0, -1)
+        ]
+        series.append({'seriesID': sid, 'data': data})
+    return _json({'status': 'REQUEST_SUCCEEDED', 'responseTime': 1, 'message': [], 'Results': {'series': series}})
+
+
+def _bea(path: str, params: Dict[str, str], body: bytes, config: ReplayConfig) -> Optional[Reply]:
+    if path.rstrip('/') != '/api/data':
+        return None
+    lowered = {k.lower(): v for k, v in params.items()}
+    if lowered.get('method', '').lower() == 'getdata':
+        table = lowered.get('tablename', 'T10105')
+        return Reply(200, build_bea_nipa_response(table, max(1, config.total_rows // 40), 40, config.seed))
+    return _json({'BEAAPI': {'Request': {'RequestParam': []}, 'Results': {}}})
+
+
+def _treasury(path: str, params: Dict[str, str], body: bytes, config: ReplayConfig) -> Optional[Reply]:
+    if not path.startswith('/services/api/fiscal_service/'):
+        return None
+    size = int(params.get('page[size]', config.page_size))
+    number = int(params.get('page[number]', 1))
+    rng = random.Random(f"{config.seed}-{path}")
+    today = date(2025, 11, 28)
+
+    def rows(start: int, count: int) -> List[dict]:
+        return [
+            {'record_date': (today - timedelta(days=start + i)).isoformat(),
+             'security_term': '13-Week', 'security_type': 'Bill',
+             'cusip': f"912797{start + i:03d}", 'value': f"{rng.uniform(0, 6):.3f}"}
+            for i in range(count)
+        ]
+
+    data, pages = _paged(rows, config.total_rows, number, size)
+    return _json({
+        'data': data,
+        'meta': {'count': len(data), 'total-count': config.total_rows, 'total-pages': pages},
+        'links': {'self': f"&page%5Bnumber%5D={number}&page%5Bsize%5D={size}",
+                  'next': f"&page%5Bnumber%5D={number + 1}&page%5Bsize%5D={size}" if number < pages else None},
+    })
+
+
+SYNTHETIC: Dict[str, Callable[[str, Dict[str, str], bytes, ReplayConfig], Optional[Reply]]] = {
+    'fmp': _fmp,
+    'fred': _fred,
+    'bls': _bls,
+    'bea': _bea,
+    'treasury': _treasury,
+}
+
+
+# ===================== Server ===================== #
+
+class ReplayServer:
+    """
+    Record/replay stand-in for the upstream APIs.
+
+    Usage:
+        with ReplayServer(ReplayConfig(latency_ms=20, rate_limits={'bea': 100})) as server:
+            os.environ.update(server.env())   # before importing src.config
+            ...
+            print(server.stats())
+    """
+
+    def __init__(self, config: Optional[ReplayConfig] = None, host: str = '127.0.0.1', port: int = 0):
+        self.config = config or ReplayConfig()
+        if self.config.mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got {self.config.mode!r}")
+        if self.config.mode == 'record' and not self.config.cassette_dir:
+            raise ValueError("record mode needs a cassette_dir")
+
+        self._lock = threading.Lock()
+        self._windows: Dict[str, Deque[float]] = defaultdict(deque)
+        self._rng = random.Random(self.config.seed)
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._upstream = requests.Session()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    # ---------------------- Lifecycle ---------------------- #
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self) -> Dict[str, str]:
+        """Base-URL settings pointing every client at this server."""
+        return {name: f"{self.url}/{api}{suffix}" for name, (api, suffix) in BASE_URL_SETTINGS.items()}
+
+    def start(self) -> 'ReplayServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='replay-server', daemon=True)
+        self._thread.start()
+        log.info(f"Replay server ({self.config.mode}) listening on {self.url}")
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._upstream.close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> 'ReplayServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {api: dict(counters) for api, counters in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self._windows.clear()
+
+    # ---------------------- Request handling ---------------------- #
+
+    def handle(self, method: str, raw_path: str, body: bytes) -> Reply:
+        parts = urlsplit(raw_path)
+        if parts.path.startswith('/_replay/'):
+            return self._control(method, parts.path)
+
+        api, _, rest = parts.path.lstrip('/').partition('/')
+        if api not in UPSTREAMS:
+            return Reply(404, b'{"error": "unknown API prefix"}')
+        path = '/' + rest
+        query = parse_qsl(parts.query, keep_blank_values=True)
+
+        self._delay()
+        throttled = self._admit(api)
+        if throttled is not None:
+            return throttled
+        with self._lock:
+            self._stats[api]['requests'] += 1
+            fail = self.config.error_rate and self._rng.random() < self.config.error_rate
+        if fail:
+            self._count(api, 'errors')
+            return Reply(503, b'{"error": "injected failure"}')
+
+        key = request_key(method, path, query, body)
+        if self.config.mode != 'synthetic':
+            recorded = self._load(api, key)
+            if recorded is not None:
+                self._count(api, 'replayed')
+                return recorded
+        if self.config.mode == 'record':
+            reply = self._record(api, key, method, path, query, body)
+            self._count(api, 'recorded')
+            return reply
+
+        reply = SYNTHETIC[api](path, dict(query), body, self.config)
+        if reply is None:
+            self._count(api, 'misses')
+            return Reply(404, json.dumps({'error': f"no recording or generator for {method} {path}"}).encode())
+        self._count(api, 'synthetic')
+        return reply
+
+    def _control(self, method: str, path: str) -> Reply:
+        if path == '/_replay/stats':
+            return _json(self.stats())
+        if path == '/_replay/reset' and method == 'POST':
+            self.reset()
+            return _json({'reset': True})
+        return Reply(404, b'{"error": "unknown control endpoint"}')
+
+    def _count(self, api: str, counter: str):
+        with self._lock:
+            self._stats[api][counter] += 1
+
+    def _delay(self):
+        delay = self.config.latency_ms
+        if self.config.jitter_ms:
+            with self._lock:
+                delay += self._rng.uniform(0, self.config.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def _admit(self, api: str) -> Optional[Reply]:
+        """Sliding-window rate limit; a 429 reply when the API's budget is spent."""
+        limit = self.config.rate_limits.get(api)
+        if not limit:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows[api]
+            while window and window[0] <= now - self.config.rate_window:
+                window.popleft()
+            if len(window) < limit:
+                window.append(now)
+                return None
+            self._stats[api]['throttled'] += 1
+            wait = window[0] + self.config.rate_window - now
+        retry_after = self.config.retry_after if self.config.retry_after is not None else max(1, math.ceil(wait))
+        return Reply(429, b'{"error": "rate limit exceeded"}', headers={'Retry-After': str(retry_after)})
+
+    # ---------------------- Cassettes ---------------------- #
+
+    def _cassette(self, api: str, key: str) -> Tuple[Path, Path]:
+        folder = Path(self.config.cassette_dir) / api
+        return folder / f"{key}.json", folder / f"{key}.body"
+
+    def _load(self, api: str, key: str) -> Optional[Reply]:
+        if not self.config.cassette_dir:
+            return None
+        meta_path, body_path = self._cassette(api, key)
+        if not meta_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text(encoding='utf-8'))
+        return Reply(meta['status'], body_path.read_bytes(), meta.get('content_type', 'application/json'))
+
+    def _record(self, api: str, key: str, method: str, path: str,
+                query: List[Tuple[str, str]], body: bytes) -> Reply:
+        try:
+            upstream = self._upstream.request(
+                method, self.config.upstreams[api].rstrip('/') + path, params=query, data=body or None,
+                headers={'Content-Type': 'application/json'} if body else None, timeout=120,
+            )
+        except requests.RequestException as e:
+            log.warning(f"Upstream {api} {path} failed: {e}")
+            return Reply(502, json.dumps({'error': str(e)}).encode())
+
+        content_type = upstream.headers.get('Content-Type', 'application/json')
+        reply = Reply(upstream.status_code, upstream.content, content_type)
+        if upstream.status_code == 429 or upstream.status_code >= 500:
+            # Transient: pass through, record nothing so the next run tries again
+            if 'Retry-After' in upstream.headers:
+                reply.headers['Retry-After'] = upstream.headers['Retry-After']
+            return reply
+
+        meta_path, body_path = self._cassette(api, key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(upstream.content)
+        meta_path.write_text(json.dumps({
+            'method': method,
+            'path': path,
+            'query': [(k, v) for k, v in query if k.lower() not in CREDENTIAL_PARAMS],
+            'status': upstream.status_code,
+            'content_type': content_type,
+            'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }, indent=2), encoding='utf-8')
+        log.info(f"Recorded {api} {method} {path} -> {meta_path.name}")
+        return reply
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _serve(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                reply = server.handle(self.command, self.path, body)
+                self.send_response(reply.status)
+                self.send_header('Content-Type', reply.content_type)
+                self.send_header('Content-Length', str(len(reply.body)))
+                for name, value in reply.headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(reply.body)
+
+            do_GET = _serve
+            do_POST = _serve
+
+            def log_message(self, format, *args):
+                log.debug("%s - %s", self.address_string(), format % args)
+
+        return Handler
+
+
+# ===================== CLI ===================== #
+
+def _parse_rate_limits(values: List[str]) -> Dict[str, int]:
+    """'750' applies to every API; 'bea=100' to one."""
+    limits: Dict[str, int] = {}
+    for value in values or []:
+        api, _, n = value.rpartition('=')
+        for name in ([api] if api else UPSTREAMS):
+            if name not in UPSTREAMS:
+                raise argparse.ArgumentTypeError(f"unknown API {name!r}")
+            limits[name] = int(n)
+    return limits
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline record/replay server for the upstream APIs')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--mode', choices=MODES, default='replay')
+    parser.add_argument('--cassette', type=Path, help='Directory of recorded responses')
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--rate-limit', action='append', metavar='[API=]N',
+                        help='Requests per window, for all APIs or one (repeatable)')
+    parser.add_argument('--rate-window', type=float, default=60.0, help='Rate-limit window in seconds')
+    parser.add_argument('--retry-after', type=int, help='Fixed Retry-After seconds on 429')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered 503')
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--total-rows', type=int, default=250)
+    parser.add_argument('--symbols', type=int, default=500, help='Rows in synthetic bulk files')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(levelname)s %(message)s')
+    config = ReplayConfig(
+        mode=args.mode, cassette_dir=args.cassette, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        rate_limits=_parse_rate_limits(args.rate_limit), rate_window=args.rate_window,
+        retry_after=args.retry_after, error_rate=args.error_rate, page_size=args.page_size,
+        total_rows=args.total_rows, symbols=args.symbols, seed=args.seed,
+    )
+    server = ReplayServer(config, args.host, args.port)
+    print("Point the clients at this server with:")
+    for name, value in server.env().items():
+        print(f"  {name}={value}")
+    try:
+        server.start()
+        server._thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
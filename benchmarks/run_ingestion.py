@@ -0,0 +1,411 @@
+"""
+Ingestion Benchmark Suite
+
+Generates deterministic synthetic inputs and runs them through the real
+parse and load paths:
+
+  Case           Input                         Parse path                      Load path
+  bls_alldata    CU reference + AllData files  CUFlatFileParser.parse_data_file  load_reference_tables + load_data
+  fmp_eod_bulk   eod-bulk CSV per trading day  pandas.read_csv (as collected)  BulkPriceCollector.collect_bulk_eod
+  bea_nipa       NIPA GetData JSON             BEAClient.iter_nipa_data        NIPACollector.collect_table_data
+
+HTTP collectors get their fixtures from a requests transport adapter, so the
+request, retry and decode code runs unchanged without network access.
+
+Loads run against a disposable PostgreSQL database (an existing server via
+--pg-url / BENCH_PG_URL, or a temporary local cluster), twice: 'load' into
+empty tables, then 'reload' of the same rows (the upsert/conflict path).
+
+Every stage runs in its own process, so peak RSS is per stage. Results are
+written as JSON (rows/sec, peak RSS, query counts, input digests) and can be
+compared with an earlier run.
+
+Usage:
+    python -m benchmarks.run_ingestion
+    python -m benchmarks.run_ingestion --scale 5 --output before.json
+    python -m benchmarks.run_ingestion --scale 5 --compare before.json
+    python -m benchmarks.run_ingestion --parse-only --cases bls_alldata bea_nipa
+    python -m benchmarks.run_ingestion --pg-url postgresql://postgres@localhost:5432/postgres
+"""
+import argparse
+import json
+import logging
+import multiprocessing as mp
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from io import StringIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.fixtures import (  # noqa: E402
+    FixtureAdapter, build_bea_nipa_response, build_eod_bulk_csv, eod_trading_dates, fixture_digest,
+    write_bls_alldata,
+)
+from benchmarks.postgres import disposable_database, server_version  # noqa: E402
+
+log = logging.getLogger("IngestionBenchmark")
+
+CASES = ['bls_alldata', 'fmp_eod_bulk', 'bea_nipa']
+BEA_TABLE = 'T10105'
+RESULTS_DIR = PROJECT_ROOT / 'benchmarks' / 'results'
+
+# Settings requires these; fixtures are served locally, so no real key is ever sent
+_PLACEHOLDER_ENV = {
+    'FMP_API_KEY': 'benchmark',
+    'FRED_API_KEY': 'benchmark',
+    'BLS_API_KEY': 'benchmark',
+    'BEA_API_KEY': '0' * 36,
+    'CENSUS_API_KEY': 'benchmark',
+    'ENABLE_METRICS': 'False',
+}
+
+
+# ===================== Fixtures ===================== #
+
+def prepare_fixtures(workdir: Path, args) -> Dict[str, Dict[str, Any]]:
+    """Write every selected case's input under workdir; returns per-case input info."""
+    inputs: Dict[str, Dict[str, Any]] = {}
+    scale = args.scale
+
+    if 'bls_alldata' in args.cases:
+        info = write_bls_alldata(workdir / 'bls' / 'cu', int(args.bls_series * scale), args.bls_years, args.seed)
+        info['data_dir'] = str(workdir / 'bls' / 'cu')
+        inputs['bls_alldata'] = info
+
+    if 'fmp_eod_bulk' in args.cases:
+        files, total_bytes, digests, rows = [], 0, [], 0
+        symbols = int(args.eod_symbols * scale)
+        for trade_date in eod_trading_dates(args.eod_days):
+            body = build_eod_bulk_csv(symbols, trade_date, args.seed)
+            path = workdir / 'fmp' / f"eod-bulk-{trade_date.isoformat()}.csv"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(body)
+            files.append({'date': trade_date.isoformat(), 'path': str(path)})
+            total_bytes += len(body)
+            digests.append(fixture_digest(body))
+            rows += symbols
+        inputs['fmp_eod_bulk'] = {
+            'files': files, 'rows': rows, 'bytes': total_bytes, 'digest': fixture_digest(''.join(digests).encode()),
+        }
+
+    if 'bea_nipa' in args.cases:
+        series = int(args.bea_series * scale)
+        body = build_bea_nipa_response(BEA_TABLE, series, args.bea_quarters, args.seed)
+        path = workdir / 'bea' / f"{BEA_TABLE}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(body)
+        inputs['bea_nipa'] = {
+            'path': str(path), 'rows': series * args.bea_quarters, 'bytes': len(body), 'digest': fixture_digest(body),
+        }
+
+    return inputs
+
+
+# ===================== Stages (run in child processes) ===================== #
+
+def _bea_client(path: str):
+    import requests
+    from src.bea.bea_client import BEAClient
+
+    client = BEAClient(os.environ['BEA_API_KEY'], session=requests.Session())
+    # Mounted on the configured base URL, so BEA_BASE_URL overrides do not bypass the fixture
+    client.session.mount(client.base_url, FixtureAdapter(Path(path).read_bytes()))
+    return client
+
+
+def parse_stage(case: str, info: Dict[str, Any]) -> int:
+    """Decode the input through the collector's own parsing code; returns rows."""
+    if case == 'bls_alldata':
+        from src.bls.cu_flat_file_parser import CUFlatFileParser
+        parser = CUFlatFileParser(info['data_dir'])
+        return sum(1 for f in info['data_files'] for _ in parser.parse_data_file(f))
+
+    if case == 'fmp_eod_bulk':
+        import pandas as pd
+        # collect_bulk_eod reads response.text with read_csv before transforming rows
+        return sum(len(pd.read_csv(StringIO(Path(f['path']).read_text()))) for f in info['files'])
+
+    if case == 'bea_nipa':
+        client = _bea_client(info['path'])
+        return sum(1 for _ in client.iter_nipa_data(BEA_TABLE, frequency='Q', year='ALL'))
+
+    raise ValueError(f"Unknown case: {case}")
+
+
+def load_stage(case: str, info: Dict[str, Any], session) -> int:
+    """Run the collector's full load path into the database; returns rows."""
+    if case == 'bls_alldata':
+        from src.bls.cu_flat_file_parser import CUFlatFileParser
+        parser = CUFlatFileParser(info['data_dir'])
+        parser.load_reference_tables(session)
+        parser.load_data(session, data_files=info['data_files'])
+        return info['rows']
+
+    if case == 'fmp_eod_bulk':
+        from src.collectors.bulk_price_collector import BulkPriceCollector
+        from src.config import FMP_ENDPOINTS
+        collector = BulkPriceCollector(session)
+        collector.sleep_sec = 0  # no API pacing against local fixtures
+        loaded = 0
+        for f in info['files']:
+            collector.http_session.mount(FMP_ENDPOINTS['eod_bulk'], FixtureAdapter(Path(f['path']).read_bytes(), 'text/csv'))
+            result = collector.collect_bulk_eod(date.fromisoformat(f['date']))
+            if not result['success']:
+                raise RuntimeError(f"collect_bulk_eod failed for {f['date']}: {result.get('error')}")
+            loaded += result['symbols_inserted']
+        return loaded
+
+    if case == 'bea_nipa':
+        from src.bea.bea_collector import NIPACollector
+        collector = NIPACollector(_bea_client(info['path']), session)
+        return collector.collect_table_data(BEA_TABLE, frequency='Q', year='ALL')['data_points']
+
+    raise ValueError(f"Unknown case: {case}")
+
+
+def _proc_status_mb(field: str) -> Optional[float]:
+    """A memory field of /proc/self/status in MB (Linux only)."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _peak_rss_mb() -> float:
+    # VmHWM starts fresh in the new interpreter; ru_maxrss survives exec and
+    # would report the parent's peak (which holds the generated fixtures)
+    peak = _proc_status_mb('VmHWM')
+    if peak is not None:
+        return peak
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _run_stage(queue, case: str, stage: str, info: Dict[str, Any], db_url: Optional[str], threshold: int):
+    logging.basicConfig(level=logging.WARNING)
+    try:
+        result: Dict[str, Any] = {'case': case, 'stage': stage, 'rss_before_mb': _proc_status_mb('VmRSS')}
+        if stage == 'parse':
+            start = time.perf_counter()
+            rows = parse_stage(case, info)
+            result['seconds'] = time.perf_counter() - start
+        else:
+            from sqlalchemy import create_engine
+            from sqlalchemy.orm import sessionmaker
+            from src.database.query_tracer import trace_queries
+
+            engine = create_engine(db_url)
+            session = sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)()
+            try:
+                with trace_queries(f"{case}:{stage}", repeat_threshold=threshold, engine=engine) as trace:
+                    start = time.perf_counter()
+                    rows = load_stage(case, info, session)
+                    result['seconds'] = time.perf_counter() - start
+            finally:
+                session.close()
+                engine.dispose()
+            result.update({
+                'queries': trace.query_count,
+                'db_seconds': round(trace.total_seconds, 4),
+                'distinct_shapes': len(trace.shapes),
+                'flagged_shapes': [s['shape'] for s in trace.summary()['flagged']],
+            })
+        result['rows'] = rows
+        result['rows_per_sec'] = round(rows / result['seconds'], 1) if result['seconds'] else None
+        result['seconds'] = round(result['seconds'], 4)
+        result['peak_rss_mb'] = round(_peak_rss_mb(), 1)
+        queue.put(result)
+    except Exception as e:
+        log.exception(f"{case} {stage} failed")
+        queue.put({'case': case, 'stage': stage, 'error': f"{type(e).__name__}: {e}"})
+
+
+def run_in_subprocess(case: str, stage: str, info: Dict[str, Any], db_url: Optional[str], threshold: int) -> Dict:
+    """One stage in a fresh interpreter, so peak RSS belongs to that stage alone."""
+    ctx = mp.get_context('spawn')
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_run_stage, args=(queue, case, stage, info, db_url, threshold))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+# ===================== Schema ===================== #
+
+def create_schema(db_url: str, cases: List[str]) -> None:
+    """Create only the tables the selected cases write."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.dialects.postgresql import insert
+
+    engine = create_engine(db_url)
+    try:
+        if 'bls_alldata' in cases:
+            from src.bls.cu_flat_file_parser import BLSPeriodicity, CUArea, CUData, CUItem, CUSeries
+            tables = [m.__table__ for m in (BLSPeriodicity, CUArea, CUItem, CUSeries, CUData)]
+            CUData.metadata.create_all(engine, tables=tables)
+        if 'fmp_eod_bulk' in cases:
+            from src.database.models import PriceDailyBulk
+            PriceDailyBulk.__table__.create(engine, checkfirst=True)
+        if 'bea_nipa' in cases:
+            from src.database.bea_models import NIPAData, NIPASeries, NIPATable
+            NIPATable.metadata.create_all(engine, tables=[NIPATable.__table__, NIPASeries.__table__, NIPAData.__table__])
+            # Series reference the table catalog, normally filled by sync_tables_catalog()
+            with engine.begin() as conn:
+                conn.execute(insert(NIPATable).values(
+                    table_name=BEA_TABLE, table_description='Synthetic benchmark table',
+                    created_at=datetime.now(), updated_at=datetime.now(),
+                ).on_conflict_do_nothing())
+    finally:
+        engine.dispose()
+
+
+# ===================== Reporting ===================== #
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT, capture_output=True, text=True)
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    print(f"{'Case':<14} {'Stage':<7} {'Rows':>10} {'Seconds':>9} {'Rows/s':>11} {'Peak RSS':>9} {'Queries':>8}")
+    print("-" * 74)
+    for r in results:
+        if 'error' in r:
+            print(f"{r['case']:<14} {r['stage']:<7} ERROR {r['error']}")
+            continue
+        queries = r.get('queries', '')
+        print(f"{r['case']:<14} {r['stage']:<7} {r['rows']:>10,} {r['seconds']:>9.2f} "
+              f"{r['rows_per_sec'] or 0:>11,.0f} {r['peak_rss_mb']:>7.0f}MB {queries:>8}")
+        for shape in r.get('flagged_shapes') or []:
+            print(f"{'':<23}repeated: {shape[:60]}")
+
+
+def print_comparison(baseline: Dict[str, Any], current: Dict[str, Any]) -> None:
+    """Per case/stage change in rows/sec, peak RSS and queries against a baseline run."""
+    old = {(r['case'], r['stage']): r for r in baseline['results'] if 'error' not in r}
+    print(f"Compared with {baseline.get('git_commit') or '?'} ({baseline.get('started_at', '')})")
+    print(f"{'Case':<14} {'Stage':<7} {'Rows/s':>23} {'Peak RSS (MB)':>17} {'Queries':>15}")
+    print("-" * 80)
+    for r in current['results']:
+        before = old.get((r['case'], r['stage']))
+        if before is None or 'error' in r:
+            continue
+        if baseline['inputs'].get(r['case'], {}).get('digest') != current['inputs'][r['case']]['digest']:
+            print(f"{r['case']:<14} {r['stage']:<7} inputs differ (different scale or seed), skipped")
+            continue
+        change = (r['rows_per_sec'] / before['rows_per_sec'] - 1) * 100 if before.get('rows_per_sec') else 0
+        queries = f"{before.get('queries', '-')} -> {r.get('queries', '-')}"
+        print(f"{r['case']:<14} {r['stage']:<7} {before['rows_per_sec']:>10,.0f} -> {r['rows_per_sec']:>10,.0f} "
+              f"({change:+.0f}%) {before['peak_rss_mb']:>6.0f} -> {r['peak_rss_mb']:<6.0f} {queries:>15}")
+
+
+# ===================== Main ===================== #
+
+def main():
+    parser = argparse.ArgumentParser(description='Ingestion throughput benchmarks with synthetic fixtures')
+    parser.add_argument('--cases', nargs='+', choices=CASES, default=CASES, help='Cases to run')
+    parser.add_argument('--scale', type=float, default=1.0, help='Multiplier for series/symbol counts')
+    parser.add_argument('--seed', type=int, default=7, help='Fixture random seed')
+    parser.add_argument('--bls-series', type=int, default=2000, help='CU series in the AllData file')
+    parser.add_argument('--bls-years', type=int, default=20, help='Years of monthly data per series')
+    parser.add_argument('--eod-symbols', type=int, default=20000, help='Symbols per eod-bulk CSV')
+    parser.add_argument('--eod-days', type=int, default=2, help='Trading days (one CSV each)')
+    parser.add_argument('--bea-series', type=int, default=400, help='Series in the NIPA table')
+    parser.add_argument('--bea-quarters', type=int, default=200, help='Quarters per series')
+    parser.add_argument('--repeat-threshold', type=int, default=50,
+                        help='Statement shapes repeated more often are reported as N+1')
+    parser.add_argument('--parse-only', action='store_true', help='Skip database loads')
+    parser.add_argument('--pg-url', help='Server to create the disposable database on (default: BENCH_PG_URL '
+                                         'or a temporary local cluster)')
+    parser.add_argument('--keep-db', action='store_true', help='Do not drop the benchmark database')
+    parser.add_argument('--workdir', help='Directory for fixtures (default: a temp dir)')
+    parser.add_argument('--output', help='Results JSON (default: benchmarks/results/ingestion-<time>.json)')
+    parser.add_argument('--compare', help='Earlier results JSON to compare against')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    for key, value in _PLACEHOLDER_ENV.items():
+        os.environ.setdefault(key, value)
+
+    started_at = datetime.now()
+    report: Dict[str, Any] = {
+        'suite': 'ingestion',
+        'started_at': started_at.isoformat(timespec='seconds'),
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {k: v for k, v in vars(args).items() if k not in ('output', 'compare', 'pg_url', 'workdir')},
+        'inputs': {},
+        'results': [],
+    }
+
+    with tempfile.TemporaryDirectory(prefix='finexus_bench_') as tmp:
+        workdir = Path(args.workdir) if args.workdir else Path(tmp)
+        log.info(f"Generating fixtures in {workdir} (scale {args.scale}, seed {args.seed})")
+        inputs = prepare_fixtures(workdir, args)
+        report['inputs'] = {
+            case: {'rows': info['rows'], 'bytes': info['bytes'], 'digest': info['digest']}
+            for case, info in inputs.items()
+        }
+
+        def run(db_url: Optional[str]):
+            for case in args.cases:
+                stages = ['parse'] if args.parse_only else ['parse', 'load', 'reload']
+                for stage in stages:
+                    log.info(f"Running {case} {stage}...")
+                    result = run_in_subprocess(case, stage, inputs[case], db_url, args.repeat_threshold)
+                    result['input_bytes'] = inputs[case]['bytes']
+                    report['results'].append(result)
+
+        if args.parse_only:
+            os.environ.setdefault('DATABASE_URL', 'postgresql://localhost/finexus_bench_unused')
+            report['postgres'] = None
+            run(None)
+        else:
+            with disposable_database(args.pg_url, keep=args.keep_db) as db_url:
+                # Collectors build settings from the environment in each stage process
+                os.environ['DATABASE_URL'] = db_url
+                report['postgres'] = server_version(db_url)
+                create_schema(db_url, args.cases)
+                run(db_url)
+
+    report['wall_seconds'] = round((datetime.now() - started_at).total_seconds(), 1)
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"ingestion-{started_at:%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, default=str))
+
+    print("=" * 80)
+    print(f"Ingestion benchmark  commit {report['git_commit']}  scale {args.scale}  "
+          f"PostgreSQL {report['postgres'] or '-'}")
+    print("=" * 80)
+    print_results(report['results'])
+    if args.compare:
+        print("-" * 80)
+        print_comparison(json.loads(Path(args.compare).read_text()), report)
+    print("=" * 80)
+    print(f"Results written to {output}")
+
+    return 1 if any('error' in r for r in report['results']) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,7 @@ Usage:
 Options:
     --tables TABLE1,TABLE2  Specific tables to backfill (default: all)
     --year YEAR_SPEC        Year specification: ALL, LAST5, LAST10, or comma-separated years (default: ALL)
+    --workers N             Concurrent BEA fetches sharing one rate limiter (default: 1)
     --dry-run               Preview what would be collected without actually collecting
 
 Examples:
@@ -78,6 +79,8 @@ def main():
                         help='Comma-separated list of table names to backfill (e.g., FAAt101,FAAt102)')
     parser.add_argument('--year', type=str, default='ALL',
                         help='Year specification: ALL, LAST5, LAST10, or comma-separated years')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Concurrent BEA fetches (all share one rate limiter)')
     parser.add_argument('--dry-run', action='store_true', help='Preview without collecting')
     args = parser.parse_args()
 
@@ -138,7 +141,8 @@ def main():
             progress = collector.backfill_all_tables(
                 year=args.year,
                 tables=tables,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                max_workers=args.workers,
             )
 
             logger.info("=" * 80)
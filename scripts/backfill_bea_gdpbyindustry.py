@@ -10,6 +10,7 @@ Options:
     --tables TABLE1,TABLE2  Specific table IDs to backfill (default: all)
     --frequency A|Q         Data frequency: Annual or Quarterly (default: A)
     --year YEAR_SPEC        Year specification: ALL, or comma-separated years (default: ALL)
+    --workers N             Concurrent BEA fetches sharing one rate limiter (default: 1)
     --dry-run               Preview what would be collected without actually collecting
 """
 import argparse
@@ -62,6 +63,8 @@ def main():
                         help='Data frequency: A=Annual, Q=Quarterly')
     parser.add_argument('--year', type=str, default='ALL',
                         help='Year specification: ALL or comma-separated years')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Concurrent BEA fetches (all share one rate limiter)')
     parser.add_argument('--dry-run', action='store_true', help='Preview without collecting')
     args = parser.parse_args()
 
@@ -115,7 +118,8 @@ def main():
                 frequency=args.frequency,
                 year=args.year,
                 tables=tables,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                max_workers=args.workers,
             )
 
             logger.info("=" * 80)
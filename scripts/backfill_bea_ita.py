@@ -10,6 +10,7 @@ Options:
     --indicators IND1,IND2  Specific indicators to backfill (default: all)
     --frequency A|QSA|QNSA  Data frequency: Annual, Quarterly SA, or Quarterly NSA (default: A)
     --year YEAR_SPEC        Year specification: ALL, LAST5, LAST10, or comma-separated years (default: ALL)
+    --workers N             Concurrent BEA fetches sharing one rate limiter (default: 1)
     --dry-run               Preview what would be collected without actually collecting
 
 Examples:
@@ -76,6 +77,8 @@ def main():
                         help='Data frequency: A=Annual, QSA=Quarterly SA, QNSA=Quarterly NSA')
     parser.add_argument('--year', type=str, default='ALL',
                         help='Year specification: ALL, LAST5, LAST10, or comma-separated years')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Concurrent BEA fetches (all share one rate limiter)')
     parser.add_argument('--dry-run', action='store_true', help='Preview without collecting')
     args = parser.parse_args()
 
@@ -139,7 +142,8 @@ def main():
                 frequency=args.frequency,
                 year=args.year,
                 indicators=indicators,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                max_workers=args.workers,
             )
 
             logger.info("=" * 80)
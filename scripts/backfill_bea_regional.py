@@ -11,6 +11,7 @@ Options:
     --tables TABLE1,TABLE2  Specific tables to backfill (default: all)
     --geo STATE|COUNTY|MSA  Geographic scope (default: STATE)
     --year YEAR_SPEC        Year specification: ALL, LAST5, LAST10, or years (default: ALL)
+    --workers N             Concurrent BEA fetches sharing one rate limiter (default: 1)
     --dry-run               Preview what would be collected without actually collecting
 
 Common Regional Tables:
@@ -71,6 +72,8 @@ def main():
                         help='Geographic scope: STATE, COUNTY, MSA, or specific FIPS code')
     parser.add_argument('--year', type=str, default='ALL',
                         help='Year specification: ALL, LAST5, LAST10, or comma-separated years')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Concurrent BEA fetches (all share one rate limiter)')
     parser.add_argument('--dry-run', action='store_true', help='Preview without collecting')
     args = parser.parse_args()
 
@@ -120,7 +123,8 @@ def main():
                 geo_fips=args.geo,
                 year=args.year,
                 tables=tables,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                max_workers=args.workers,
             )
 
             logger.info("=" * 80)
@@ -14,8 +14,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database.connection import get_session
 from src.collectors.bulk_price_collector import BulkPriceCollector
-from sqlalchemy import func, select
+from sqlalchemy import func
 from src.database.models import PriceDailyBulk
+from src.utils.price_helpers import find_missing_market_days, get_trading_days
 
 # Create logs directory if needed
 Path('logs').mkdir(exist_ok=True)
@@ -43,17 +44,6 @@ def get_date_range(session) -> tuple:
     return result[0], result[1]
 
 
-def get_existing_dates(session, start_date: date, end_date: date) -> set:
-    """Get all dates that have data in the table within the date range"""
-    stmt = select(PriceDailyBulk.date).distinct().where(
-        PriceDailyBulk.date >= start_date,
-        PriceDailyBulk.date <= end_date
-    )
-
-    result = session.execute(stmt)
-    return {row[0] for row in result}
-
-
 def find_missing_dates(session, max_days: int = 365) -> list:
     """
     Find missing dates in the bulk price data
@@ -78,24 +68,11 @@ def find_missing_dates(session, max_days: int = 365) -> list:
     search_end = min(min_date + timedelta(days=max_days), date.today())
     logger.info(f"Searching for gaps: {min_date} to {search_end}")
 
-    # Get all existing dates in the range
-    existing_dates = get_existing_dates(session, min_date, search_end)
-    logger.info(f"Found {len(existing_dates)} dates with data")
+    # Trading days (weekdays minus exchange holidays) with no bulk rows at all
+    missing_dates = find_missing_market_days(session, min_date, search_end, source='bulk')
 
-    # Generate expected date range (weekdays only - most major exchanges don't trade weekends)
-    # Weekend data is sparse and not worth the API calls for gap-filling
-    missing_dates = []
-    current = min_date
-
-    while current <= search_end:
-        # Only check weekdays (Monday=0 to Friday=4)
-        if current.weekday() < 5:
-            if current not in existing_dates:
-                missing_dates.append(current)
-        current += timedelta(days=1)
-
-    logger.info(f"Found {len(missing_dates)} missing weekdays")
-    return sorted(missing_dates)
+    logger.info(f"Found {len(missing_dates)} missing trading days")
+    return missing_dates
 
 
 def fill_recent_dates(session, collector, dry_run=False):
@@ -120,14 +97,8 @@ def fill_recent_dates(session, collector, dry_run=False):
     latest_bulk_date = max_date_result
     today = date.today()
 
-    # Calculate missing recent dates (weekdays only)
-    missing_recent = []
-    current = latest_bulk_date + timedelta(days=1)
-
-    while current < today:  # Up to yesterday (today's data may not be available yet)
-        if current.weekday() < 5:  # Monday=0 to Friday=4
-            missing_recent.append(current)
-        current += timedelta(days=1)
+    # Trading days after the latest bulk date, up to yesterday (today's data may not be available yet)
+    missing_recent = get_trading_days(session, latest_bulk_date + timedelta(days=1), today - timedelta(days=1))
 
     if not missing_recent:
         logger.info(f" Bulk table is current (latest: {latest_bulk_date})")
@@ -135,7 +106,7 @@ def fill_recent_dates(session, collector, dry_run=False):
 
     logger.info(f" Latest bulk date: {latest_bulk_date}")
     logger.info(f" Today: {today}")
-    logger.info(f" Missing recent dates: {len(missing_recent)} weekdays")
+    logger.info(f" Missing recent dates: {len(missing_recent)} trading days")
 
     for d in missing_recent:
         logger.info(f"    - {d}")
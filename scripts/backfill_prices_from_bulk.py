@@ -6,21 +6,24 @@ For each symbol in prices_daily:
 - If bulk has newer dates, copy those records to prices_daily
 - Maps bulk's adj_close to daily's adj_close (dividend-adjusted)
 - Note: Bulk doesn't have adj_open, adj_high, adj_low (set to NULL)
+
+All symbols are promoted together with one INSERT ... SELECT per date chunk
+(see price_helpers.promote_bulk_prices); existing prices_daily rows are kept.
 """
 import sys
 import argparse
 import logging
 from pathlib import Path
-from datetime import date
-from decimal import Decimal
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database.connection import get_session
+from src.database.query_tracer import traced_unit
+from src.utils import metrics
 from src.database.models import PriceDaily, PriceDailyBulk
-from sqlalchemy import func, select
-from sqlalchemy.dialects.postgresql import insert
+from src.utils.price_helpers import PROMOTE_CHUNK_DAYS, promote_bulk_prices
+from sqlalchemy import func
 
 # Create logs directory if needed
 Path('logs').mkdir(exist_ok=True)
@@ -75,80 +78,7 @@ def get_symbols_to_backfill(session, limit=None):
     return results
 
 
-def get_previous_close(session, symbol, date):
-    """Get the previous trading day's adj_close price for a symbol"""
-    result = session.query(PriceDaily.adj_close)\
-        .filter(PriceDaily.symbol == symbol)\
-        .filter(PriceDaily.date < date)\
-        .order_by(PriceDaily.date.desc())\
-        .first()
-
-    return result[0] if result else None
-
-
-def backfill_symbol(session, symbol, daily_max_date, bulk_max_date, dry_run=False):
-    """
-    Backfill prices for a single symbol from bulk to daily
-
-    Returns:
-        Number of records inserted
-    """
-    # Fetch records from bulk that are newer than daily
-    bulk_records = session.query(PriceDailyBulk)\
-        .filter(PriceDailyBulk.symbol == symbol)\
-        .filter(PriceDailyBulk.date > daily_max_date)\
-        .filter(PriceDailyBulk.date <= bulk_max_date)\
-        .order_by(PriceDailyBulk.date)\
-        .all()
-
-    if not bulk_records:
-        logger.warning(f"  {symbol}: No bulk records found (query issue?)")
-        return 0
-
-    records_to_insert = []
-
-    for bulk_record in bulk_records:
-        # Build record for prices_daily (dividend-adjusted)
-        # Note: Bulk only has adj_close, not adj_open/high/low
-        record = {
-            'symbol': symbol,
-            'date': bulk_record.date,
-            'adj_open': None,  # Bulk doesn't have adj_open
-            'adj_high': None,  # Bulk doesn't have adj_high
-            'adj_low': None,   # Bulk doesn't have adj_low
-            'adj_close': bulk_record.adj_close,
-            'volume': bulk_record.volume
-        }
-
-        records_to_insert.append(record)
-
-    if dry_run:
-        logger.info(f"  {symbol}: Would insert {len(records_to_insert)} records ({bulk_records[0].date} to {bulk_records[-1].date})")
-        return 0
-
-    # Insert records using UPSERT
-    if records_to_insert:
-        stmt = insert(PriceDaily).values(records_to_insert)
-
-        # On conflict, update all fields except primary key
-        stmt = stmt.on_conflict_do_update(
-            index_elements=['symbol', 'date'],
-            set_={
-                'adj_close': stmt.excluded.adj_close,
-                'volume': stmt.excluded.volume
-                # Note: adj_open, adj_high, adj_low remain NULL (bulk doesn't have them)
-            }
-        )
-
-        session.execute(stmt)
-        session.commit()
-
-        logger.info(f"  {symbol}: Inserted {len(records_to_insert)} records ({bulk_records[0].date} to {bulk_records[-1].date})")
-        return len(records_to_insert)
-
-    return 0
-
-
+@traced_unit('backfill_prices_from_bulk')
 def main():
     parser = argparse.ArgumentParser(
         description='Backfill prices_daily from prices_daily_bulk',
@@ -179,6 +109,14 @@ Examples:
         help='Show what would be backfilled without actually doing it'
     )
 
+    parser.add_argument(
+        '--chunk-days',
+        type=int,
+        default=PROMOTE_CHUNK_DAYS,
+        metavar='N',
+        help=f'Calendar days promoted per statement (default: {PROMOTE_CHUNK_DAYS})'
+    )
+
     args = parser.parse_args()
 
     logger.info("="*80)
@@ -206,49 +144,48 @@ Examples:
         if len(symbols_to_backfill) > 10:
             logger.info(f"  ... and {len(symbols_to_backfill) - 10} more symbols")
 
-        if args.dry_run:
-            logger.info(f"\n[DRY RUN] Would backfill the above symbols. Use without --dry-run to actually fill.")
-            return 0
-
-        # Backfill each symbol
+        # Promote every symbol at once, one statement per date chunk
         logger.info(f"\n{'='*80}")
-        logger.info("STARTING BACKFILL")
+        logger.info("[DRY RUN] COUNTING ROWS" if args.dry_run else "STARTING BACKFILL")
         logger.info(f"{'='*80}")
 
-        total_records = 0
-        success_count = 0
-        failed_symbols = []
-
-        for i, (symbol, daily_max, bulk_max) in enumerate(symbols_to_backfill, 1):
-            logger.info(f"\n[{i}/{len(symbols_to_backfill)}] {symbol}")
-
-            try:
-                records = backfill_symbol(session, symbol, daily_max, bulk_max, args.dry_run)
-                total_records += records
-                success_count += 1
-            except Exception as e:
-                logger.error(f"  {symbol}: Failed - {e}")
-                failed_symbols.append(symbol)
-                session.rollback()
+        symbols = [symbol for symbol, _, _ in symbols_to_backfill]
+        try:
+            promoted = promote_bulk_prices(
+                session,
+                symbols,
+                after_latest=True,
+                chunk_days=args.chunk_days,
+                dry_run=args.dry_run
+            )
+        except Exception as e:
+            logger.error(f"Backfill failed: {e}")
+            session.rollback()
+            return 1
+
+        total_records = sum(promoted.values())
 
         # Summary
         logger.info(f"\n{'='*80}")
-        logger.info("BACKFILL COMPLETE")
+        logger.info("DRY RUN COMPLETE" if args.dry_run else "BACKFILL COMPLETE")
         logger.info(f"{'='*80}")
         logger.info(f"Symbols processed: {len(symbols_to_backfill)}")
-        logger.info(f"Successfully backfilled: {success_count}")
-        logger.info(f"Failed: {len(failed_symbols)}")
-        logger.info(f"Total records inserted: {total_records:,}")
+        logger.info(f"Symbols {'to backfill' if args.dry_run else 'backfilled'}: {len(promoted)}")
+        logger.info(f"Total records {'to insert' if args.dry_run else 'inserted'}: {total_records:,}")
 
-        if failed_symbols:
-            logger.warning(f"\nFailed symbols:")
-            for s in failed_symbols:
-                logger.warning(f"  - {s}")
+        for symbol, records in sorted(promoted.items(), key=lambda item: -item[1])[:10]:
+            logger.info(f"  {symbol}: {records:,} records")
+        if len(promoted) > 10:
+            logger.info(f"  ... and {len(promoted) - 10} more symbols")
+
+        if args.dry_run:
+            logger.info(f"\n[DRY RUN] Use without --dry-run to actually fill.")
 
         logger.info(f"{'='*80}")
 
-        return 0 if not failed_symbols else 1
+        return 0
 
 
 if __name__ == "__main__":
+    metrics.export_on_exit('backfill_prices_from_bulk')
     sys.exit(main())
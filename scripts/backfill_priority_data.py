@@ -10,6 +10,8 @@ from pathlib import Path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.database.connection import get_session
+from src.database.query_tracer import traced_unit
+from src.utils import metrics
 from src.database.models import Company
 from src.collectors.company_collector import CompanyCollector
 from src.collectors.financial_collector import FinancialCollector
@@ -128,6 +130,7 @@ def backfill_symbol(session, symbol, collectors, args):
         return False, {'error': str(e)}
 
 
+@traced_unit('backfill_priority_data')
 def main():
     parser = argparse.ArgumentParser(
         description='Backfill historical data for priority companies',
@@ -307,4 +310,5 @@ Examples:
 
 
 if __name__ == "__main__":
+    metrics.export_on_exit('backfill_priority_data')
     sys.exit(main())
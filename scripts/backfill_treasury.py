@@ -112,6 +112,7 @@ def main():
             logger.info(f"Auctions fetched:  {stats['auctions_fetched']}")
             logger.info(f"Auctions inserted: {inserted}")
             logger.info(f"Auctions updated:  {updated}")
+            logger.info(f"Auctions unchanged: {stats['auctions_unchanged']}")
             logger.info(f"API requests:      {stats['api_requests']}")
             logger.info(f"Duration:          {duration:.1f}s")
 
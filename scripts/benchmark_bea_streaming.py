@@ -0,0 +1,125 @@
+"""
+Benchmark: streaming vs. whole-document decoding of BEA GetData responses
+
+Builds a synthetic county-level Regional response (the largest BEA payloads)
+and compares peak Python memory and time for:
+  - json.loads() of the whole body, then extracting Results.Data
+  - StreamedResponse over 64 KB chunks, grouped into upsert-sized batches
+
+The streamed path only ever holds one chunk plus one batch, so its peak
+memory tracks batch size rather than response size.
+
+No API key or database needed.
+
+Usage:
+    python scripts/benchmark_bea_streaming.py
+    python scripts/benchmark_bea_streaming.py --rows 500000 --batch-sizes 1000 5000 20000
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.bea.json_stream import StreamedResponse, iter_batches
+
+CHUNK_SIZE = 64 * 1024
+MB = 1024 * 1024
+
+
+def build_response(rows: int) -> bytes:
+    """Synthetic Regional GetData response with `rows` data records."""
+    data = []
+    counties = max(1, rows // 50)
+    for i in range(rows):
+        fips = f"{(i % counties) + 1000:05d}"
+        data.append({
+            "Code": "CAINC1-1",
+            "GeoFips": fips,
+            "GeoName": f"County {fips}, ST",
+            "TimePeriod": str(1969 + i // counties),
+            "CL_UNIT": "Thousands of dollars",
+            "UNIT_MULT": "3",
+            "DataValue": f"{(i * 7919) % 10_000_000:,}",
+        })
+    doc = {
+        "BEAAPI": {
+            "Request": {"RequestParam": [{"ParameterName": "TABLENAME", "ParameterValue": "CAINC1"}]},
+            "Results": {
+                "Statistic": "Personal income",
+                "UnitOfMeasure": "Thousands of dollars",
+                "PublicTable": "CAINC1 Personal income summary",
+                "Data": data,
+                "Notes": [{"NoteRef": " ", "NoteText": "Last updated: November 14, 2025."}],
+            },
+        }
+    }
+    return json.dumps(doc).encode('utf-8')
+
+
+def chunked(body: bytes, size: int = CHUNK_SIZE):
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+def measure(func):
+    """Run func() and return (result, seconds, peak traced MB)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / MB
+
+
+def run_whole(body: bytes) -> int:
+    """Materialize the full document like response.json() + _extract_data()."""
+    text = b''.join(chunked(body))  # response.content
+    data = json.loads(text)["BEAAPI"]["Results"]["Data"]
+    return len(data)
+
+
+def run_streamed(body: bytes, batch_size: int) -> int:
+    """Decode rows incrementally and hand them over one batch at a time."""
+    count = 0
+    for batch in iter_batches(StreamedResponse(chunked(body)), batch_size):
+        count += len(batch)
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark streaming BEA JSON decoding')
+    parser.add_argument('--rows', type=int, default=300_000, help='Data rows in the synthetic response')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1000, 5000, 20000],
+                        help='Batch sizes for the streamed path')
+    args = parser.parse_args()
+
+    body = build_response(args.rows)
+
+    print("=" * 60)
+    print(f"BEA streaming benchmark: {args.rows:,} rows, {len(body) / MB:.1f} MB body")
+    print("=" * 60)
+    print(f"{'Method':<28} {'Rows':>10} {'Time (s)':>10} {'Peak (MB)':>10}")
+    print("-" * 60)
+
+    rows, elapsed, peak = measure(lambda: run_whole(body))
+    print(f"{'json.loads (whole body)':<28} {rows:>10,} {elapsed:>10.2f} {peak:>10.1f}")
+
+    for batch_size in args.batch_sizes:
+        rows, elapsed, peak = measure(lambda: run_streamed(body, batch_size))
+        label = f"streamed, batch={batch_size:,}"
+        print(f"{label:<28} {rows:>10,} {elapsed:>10.2f} {peak:>10.1f}")
+
+    print("=" * 60)
+    print("Peak excludes the benchmark's own copy of the response body.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Benchmark: chunked concurrent calendar backfill vs. the sequential 90-day loop
+
+Serves the FMP earnings calendar from benchmarks/replay_server.py (fixed
+latency, at most --cap rows per response, as the live endpoint) and backfills
+the same years into two SQLite databases:
+  - Sequential: one collect_range() per 90-day chunk, in order (how
+    collect_historical used to run)
+  - Chunked:    EarningsCalendarCollector.collect_historical: concurrent
+    chunks, capped chunks split in half, completed chunks recorded
+
+Checks:
+  - the chunked backfill stores every row; capped chunks were split
+  - the sequential loop loses the rows beyond the cap
+  - a rerun skips every completed chunk and sends no requests
+  - a failed chunk is not recorded, and the next run fetches only it
+  - the chunked backfill stores more rows per second (it also fetches the
+    rows the sequential loop loses, so compare throughput, not wall time)
+
+No network or database server needed.
+
+Usage:
+    python scripts/benchmark_calendar_backfill.py
+    python scripts/benchmark_calendar_backfill.py --years 10 --latency-ms 500 --workers 8
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.replay_server import ReplayConfig, ReplayServer
+
+for name, value in {'FMP_API_KEY': 'replay', 'FRED_API_KEY': 'replay', 'BLS_API_KEY': 'replay',
+                    'BEA_API_KEY': 'r' * 36, 'CENSUS_API_KEY': 'replay',
+                    'DATABASE_URL': 'sqlite://'}.items():
+    os.environ.setdefault(name, value)
+
+
+def sequential_backfill(collector, start_date: date, end_date: date) -> int:
+    """The pre-chunking loop: one 90-day request after another."""
+    total = 0
+    current_from = start_date
+    while current_from <= end_date:
+        current_to = min(current_from + timedelta(days=89), end_date)
+        result = collector.collect_range(current_from, current_to)
+        total += result['announcements_upserted']
+        current_from = current_to + timedelta(days=1)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the chunked calendar backfill')
+    parser.add_argument('--years', type=int, default=5)
+    parser.add_argument('--rows-per-day', type=int, default=80, help='Announcements per weekday')
+    parser.add_argument('--cap', type=int, default=4000, help='Rows per response before the server truncates')
+    parser.add_argument('--latency-ms', type=float, default=300.0, help='Server latency per response')
+    parser.add_argument('--workers', type=int, default=5)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    server = ReplayServer(ReplayConfig(mode='synthetic', latency_ms=args.latency_ms,
+                                       calendar_rows_per_day=args.rows_per_day, result_cap=args.cap)).start()
+    os.environ.update(server.env())
+
+    # Imported after FMP_BASE_URL is set, so FMP_ENDPOINTS point at the server
+    from src.collectors.earnings_calendar_collector import EarningsCalendarCollector
+    from src.database.models import EarningsCalendar, TableUpdateTracking
+
+    end_date = date(2024, 12, 31)
+    start_date = date(end_date.year - args.years + 1, 1, 1)
+    expected = int(np.busday_count(start_date, end_date + timedelta(days=1))) * args.rows_per_day
+
+    print("=" * 72)
+    print(f"Earnings calendar {start_date} to {end_date}: {expected:,} announcements, "
+          f"{args.latency_ms:.0f}ms latency, cap {args.cap:,}, {args.workers} workers")
+    print("=" * 72)
+
+    def requests_sent() -> int:
+        return server.stats().get('fmp', {}).get('requests', 0)
+
+    def stored(engine) -> int:
+        with engine.connect() as conn:
+            return conn.scalar(select(func.count()).select_from(EarningsCalendar))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = {}
+        for label in ('sequential', 'chunked'):
+            engine = create_engine(f"sqlite:///{Path(tmp) / label}.db")
+            for model in (EarningsCalendar, TableUpdateTracking):
+                model.__table__.create(engine)
+            before = requests_sent()
+            with Session(engine) as session:
+                collector = EarningsCalendarCollector(session)
+                collector.sleep_sec = 0
+                start = time.perf_counter()
+                if label == 'sequential':
+                    sequential_backfill(collector, start_date, end_date)
+                    result = {}
+                else:
+                    result = collector.collect_historical(start_date, end_date, workers=args.workers)
+                elapsed = time.perf_counter() - start
+            runs[label] = {'seconds': elapsed, 'rows': stored(engine), 'requests': requests_sent() - before,
+                           'result': result, 'engine': engine}
+            print(f"{label:<11} {elapsed:>7.2f}s  {runs[label]['requests']:>4} requests  "
+                  f"{runs[label]['rows']:>9,} rows stored")
+
+        # Rerun over the same database: every chunk is settled and recorded
+        engine = runs['chunked']['engine']
+        before = requests_sent()
+        with Session(engine) as session:
+            collector = EarningsCalendarCollector(session)
+            collector.sleep_sec = 0
+            rerun = collector.collect_historical(start_date, end_date, workers=args.workers)
+        rerun_requests = requests_sent() - before
+        print(f"{'rerun':<11} {rerun['chunks_skipped']}/{rerun['chunks_planned']} chunks skipped, "
+              f"{rerun_requests} requests")
+
+        # One chunk fails on the first run; the next run fetches only that chunk
+        class FlakyCollector(EarningsCalendarCollector):
+            failed_once = set()
+
+            def _fetch_range(self, from_date, to_date):
+                if from_date.year == start_date.year + 1 and not self.failed_once:
+                    self.failed_once.add(from_date)
+                    return None
+                return super()._fetch_range(from_date, to_date)
+
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'flaky'}.db")
+        for model in (EarningsCalendar, TableUpdateTracking):
+            model.__table__.create(engine)
+        with Session(engine) as session:
+            flaky = FlakyCollector(session)
+            flaky.sleep_sec = 0
+            first = flaky.collect_historical(start_date, end_date, workers=args.workers)
+            second = flaky.collect_historical(start_date, end_date, workers=args.workers)
+        recovered_rows = stored(engine)
+
+        for run in runs.values():
+            run['engine'].dispose()
+        engine.dispose()
+    server.stop()
+
+    seq, chunked = runs['sequential'], runs['chunked']
+    print("-" * 72)
+    for run in (seq, chunked):
+        run['throughput'] = run['rows'] / run['seconds']
+    print(f"Throughput: {seq['throughput']:,.0f} -> {chunked['throughput']:,.0f} rows/s "
+          f"({chunked['throughput'] / seq['throughput']:.1f}x), "
+          f"{chunked['result']['chunks_split']} chunks split at the cap")
+    print("-" * 72)
+
+    checks = [
+        ("Chunked: every announcement stored", chunked['rows'] == expected),
+        ("Chunked: capped chunks split", chunked['result']['chunks_split'] > 0),
+        ("Sequential: rows beyond the cap lost", seq['rows'] < expected),
+        ("Rerun: every chunk skipped, no requests",
+         rerun['chunks_skipped'] == rerun['chunks_planned'] and rerun_requests == 0),
+        ("Failed chunk retried alone on the next run",
+         first['chunks_failed'] == 1 and second['chunks_skipped'] == second['chunks_planned'] - 1
+         and second['chunks_failed'] == 0 and recovered_rows == expected),
+        ("Chunked backfill: higher throughput", chunked['throughput'] > seq['throughput']),
+    ]
+
+    ok_all = True
+    for label, ok in checks:
+        ok_all = ok_all and ok
+        print(f"{label:<66} {'PASS' if ok else 'FAIL':>5}")
+    print("=" * 72)
+    return 0 if ok_all else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
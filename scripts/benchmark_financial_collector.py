@@ -0,0 +1,237 @@
+"""
+Benchmark: per-symbol financial statement pipeline vs. the sequential loop
+
+Serves statement responses from benchmarks/replay_server.py with a fixed
+latency and collects the same symbols into two SQLite databases:
+  - Sequential: per statement/period, a tracking query, a last-date query,
+    one request, an upsert, a commit, a count query and a tracking commit
+    (how collect_for_symbol used to run)
+  - Pipeline:   FinancialCollector.collect_for_symbol: one tracking query, one
+    last-date query, concurrent requests, one transaction per symbol
+
+Checks:
+  - both databases hold the same statement rows and tracking keys
+  - the pipeline issues fewer queries and one commit per symbol
+  - a statement whose upsert fails is rolled back alone (savepoint) and
+    recorded as an error, the other statements are kept
+  - malformed payloads (an FMP error dict, rows without a date) are recorded
+    as errors for their statement alone, the other statements are kept
+  - per-symbol time drops
+
+No network or database server needed.
+
+Usage:
+    python scripts/benchmark_financial_collector.py
+    python scripts/benchmark_financial_collector.py --symbols 40 --latency-ms 120 --workers 5
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.replay_server import ReplayConfig, ReplayServer
+
+for name, value in {'FMP_API_KEY': 'replay', 'FRED_API_KEY': 'replay', 'BLS_API_KEY': 'replay',
+                    'BEA_API_KEY': 'r' * 36, 'CENSUS_API_KEY': 'replay',
+                    'DATABASE_URL': 'sqlite://'}.items():
+    os.environ.setdefault(name, value)
+
+
+def build_engine(path: Path, models):
+    engine = create_engine(f"sqlite:///{path}")
+
+    # pysqlite: let SQLAlchemy emit BEGIN so SAVEPOINTs nest inside it
+    @event.listens_for(engine, "connect")
+    def _no_implicit_begin(dbapi_conn, _):
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    for model in models:
+        model.__table__.create(engine)
+    return engine
+
+
+def count_commits(engine) -> dict:
+    counter = {'commits': 0}
+
+    @event.listens_for(engine, "commit")
+    def _commit(_):
+        counter['commits'] += 1
+
+    return counter
+
+
+def sequential_collect(collector, symbol: str) -> bool:
+    """The pre-pipeline loop: every step per statement/period, committed one at a time."""
+    success_count = 0
+    for period in collector.PERIODS:
+        for statement_type, model in collector.STATEMENT_MAP.items():
+            job = (statement_type, period)
+            key = collector._tracking_key(statement_type, period)
+            try:
+                if not collector.should_update_symbol(key, symbol, max_age_days=15):
+                    success_count += 1
+                    continue
+                last_dates = collector._get_last_dates(symbol, [job])
+                payload = collector._fetch_statements(symbol, [job], last_dates)[job]
+                df = collector._prepare_statement(symbol, statement_type, period, payload, last_dates.get(job))
+                if df is None:
+                    continue
+                if df.empty:
+                    collector.update_tracking(key, symbol)
+                    success_count += 1
+                    continue
+                inserted, updated = collector._upsert_records(model, df.to_dict('records'), symbol)
+                collector.session.commit()
+                collector.update_tracking(
+                    key, symbol, last_api_date=df['date'].max(),
+                    record_count=collector._get_record_counts(symbol, [job])[job],
+                    next_update_frequency='quarterly',
+                )
+                success_count += 1
+            except Exception as e:
+                collector.record_error(model.__tablename__, symbol, str(e))
+                collector.session.rollback()
+    return success_count > 0
+
+
+def table_rows(engine, models) -> dict:
+    with engine.connect() as conn:
+        return {
+            model.__tablename__: conn.execute(
+                select(model.symbol, model.date, model.period).order_by(model.symbol, model.date, model.period)
+            ).all()
+            for model in models
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the per-symbol financial statement pipeline')
+    parser.add_argument('--symbols', type=int, default=10)
+    parser.add_argument('--latency-ms', type=float, default=80.0, help='Replay server latency per response')
+    parser.add_argument('--workers', type=int, default=5, help='Concurrent statement downloads per symbol')
+    parser.add_argument('--sleep-sec', type=float, default=0.0, help='API_SLEEP_SEC pacing for both runs')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    server = ReplayServer(ReplayConfig(mode='synthetic', latency_ms=args.latency_ms)).start()
+    os.environ.update(server.env())
+
+    # Imported after FMP_BASE_URL is set, so FMP_ENDPOINTS point at the server
+    from src.collectors.financial_collector import FinancialCollector
+    from src.database.models import Company, TableUpdateTracking
+    from src.database.query_tracer import trace_queries
+
+    statement_models = list(FinancialCollector.STATEMENT_MAP.values())
+    models = [Company, TableUpdateTracking] + statement_models
+    symbols = [f"SYM{i:03d}" for i in range(args.symbols)]
+
+    print("=" * 72)
+    print(f"Financial statements: {args.symbols} symbols x 10 statements, "
+          f"{args.latency_ms:.0f}ms latency, {args.workers} workers")
+    print("=" * 72)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label in ('sequential', 'pipeline'):
+            engine = build_engine(Path(tmp) / f"{label}.db", models)
+            commits = count_commits(engine)
+            with Session(engine) as session:
+                collector = FinancialCollector(session)
+                collector.sleep_sec = args.sleep_sec
+                collector.fetch_workers = args.workers
+                collect = (lambda s: sequential_collect(collector, s)) if label == 'sequential' \
+                    else collector.collect_for_symbol
+                with trace_queries(label, repeat_threshold=10 ** 9, engine=engine) as trace:
+                    start = time.perf_counter()
+                    ok = all(collect(s) for s in symbols)
+                    elapsed = time.perf_counter() - start
+                tracked = session.scalar(select(func.count()).select_from(TableUpdateTracking))
+            results[label] = {
+                'ok': ok, 'seconds': elapsed, 'queries': trace.query_count, 'commits': commits['commits'],
+                'rows': table_rows(engine, statement_models), 'tracked': tracked,
+            }
+            engine.dispose()
+            r = results[label]
+            print(f"{label:<11} {elapsed / args.symbols * 1000:>8.1f} ms/symbol  "
+                  f"{r['queries'] / args.symbols:>6.1f} queries/symbol  {r['commits'] / args.symbols:>5.1f} commits/symbol")
+
+        # One statement's upsert fails: its savepoint rolls back, the rest commit
+        class FailingRatios(FinancialCollector):
+            def _upsert_records(self, model, records, symbol):
+                if model.__tablename__ == 'financial_ratios':
+                    raise ValueError("injected failure")
+                return super()._upsert_records(model, records, symbol)
+
+        engine = build_engine(Path(tmp) / "failure.db", models)
+        with Session(engine) as session:
+            collector = FailingRatios(session)
+            collector.sleep_sec = 0
+            partial_ok = collector.collect_for_symbol('FAIL')
+            errors = collector.errors
+        partial = {table: len(rows) for table, rows in table_rows(engine, statement_models).items()}
+        engine.dispose()
+
+        # Malformed payloads: FMP's error dict and rows without a date fail their statement alone
+        class MalformedPayloads(FinancialCollector):
+            def _fetch_statements(self, symbol, jobs, last_dates):
+                payloads = super()._fetch_statements(symbol, jobs, last_dates)
+                payloads[('ratios', 'annual')] = {"Error Message": "Limit Reach. Please upgrade your plan"}
+                payloads[('key_metrics', 'quarter')] = [{"symbol": symbol, "period": "Q1"}]
+                return payloads
+
+        engine = build_engine(Path(tmp) / "malformed.db", models)
+        with Session(engine) as session:
+            collector = MalformedPayloads(session)
+            collector.sleep_sec = 0
+            malformed_ok = collector.collect_for_symbol('BAD')
+            malformed_errors = collector.errors
+        malformed = table_rows(engine, statement_models)
+        engine.dispose()
+    server.stop()
+
+    seq, pipe = results['sequential'], results['pipeline']
+    print("-" * 72)
+    print(f"Speedup: {seq['seconds'] / pipe['seconds']:.1f}x per symbol")
+    print("-" * 72)
+
+    checks = [
+        ("Both runs succeed", seq['ok'] and pipe['ok']),
+        ("Same statement rows and tracking keys", seq['rows'] == pipe['rows'] and seq['tracked'] == pipe['tracked']
+         and all(seq['rows'].values())),
+        ("Pipeline: one commit per symbol", pipe['commits'] == args.symbols),
+        ("Pipeline: fewer queries", pipe['queries'] < seq['queries']),
+        ("Failed upsert rolled back alone and recorded",
+         partial_ok and partial['financial_ratios'] == 0
+         and all(n > 0 for table, n in partial.items() if table != 'financial_ratios')
+         and len(errors) == 2 and all(e['table'] == 'financial_ratios' for e in errors)),
+        ("Malformed payloads recorded alone, other statements kept",
+         malformed_ok and all(malformed.values())
+         and {row.period for row in malformed['financial_ratios']} == {'Q1', 'Q2', 'Q3', 'Q4'}
+         and {row.period for row in malformed['key_metrics']} == {'FY'}
+         and sorted(e['table'] for e in malformed_errors) == ['financial_ratios', 'key_metrics']),
+        ("Pipeline faster per symbol", pipe['seconds'] < seq['seconds']),
+    ]
+
+    ok_all = True
+    for label, ok in checks:
+        ok_all = ok_all and ok
+        print(f"{label:<66} {'PASS' if ok else 'FAIL':>5}")
+    print("=" * 72)
+    return 0 if ok_all else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+"""
+Benchmark: concurrent FRED/FMP fetch pool in FREDCollector.fetch_all()
+
+Starts a local stand-in for fredgraph.csv and the FMP economic-indicators,
+treasury-rates and historical-price-eod endpoints, serving synthetic series
+with per-series latency (a few deliberately slow) and ETag/Last-Modified
+headers, then times fetch_all() with different worker counts.
+
+Every run must produce the same raw_frames. The last runs check:
+  - retry: some series fail with a 503 once and are retried on their own
+  - conditional GET: a second collector sharing the cache directory gets
+    304 Not Modified for every series and rebuilds identical frames
+
+No network or database needed.
+
+Usage:
+    python scripts/benchmark_fred_fetch.py
+    python scripts/benchmark_fred_fetch.py --latency 0.3 --slow-latency 1.5 --workers 1 4 8 16
+"""
+import argparse
+import hashlib
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.collectors.fred_collector import FREDCollector
+
+TENORS = ['month1', 'month2', 'month3', 'month6', 'year1', 'year2',
+          'year3', 'year5', 'year7', 'year10', 'year20', 'year30']
+
+# Fixed so Last-Modified does not change between runs
+LAST_MODIFIED = formatdate(1764547200, usegmt=True)
+
+
+# ===================== Fixture ===================== #
+
+def monthly_dates(months: int) -> list:
+    end = date(2025, 11, 1)
+    out = []
+    y, m = end.year, end.month
+    for _ in range(months):
+        out.append(date(y, m, 1))
+        y, m = (y, m - 1) if m > 1 else (y - 1, 12)
+    return out[::-1]
+
+
+def build_fixture(months: int, days: int, seed: int = 7) -> dict:
+    """Synthetic response bodies keyed by (path, key param)."""
+    rng = random.Random(seed)
+    bodies = {}
+
+    for series_id in FREDCollector.DEFAULT_INDICATORS.values():
+        rows = [f"{d.isoformat()},{rng.uniform(1, 500):.3f}" for d in monthly_dates(months)]
+        bodies[('/graph/fredgraph.csv', series_id)] = "observation_date," + series_id + "\n" + "\n".join(rows) + "\n"
+
+    for fmp_name in FREDCollector.FMP_ECON_SERIES.values():
+        data = [{'date': d.isoformat(), 'value': round(rng.uniform(1, 500), 3)} for d in monthly_dates(months)]
+        bodies[('/stable/economic-indicators', fmp_name)] = json.dumps(data)
+
+    start = date(2025, 11, 28) - timedelta(days=days)
+    trading = [start + timedelta(days=i) for i in range(days) if (start + timedelta(days=i)).weekday() < 5]
+    treasury = [{'date': d.isoformat(), **{t: round(rng.uniform(0.1, 6), 2) for t in TENORS}} for d in trading]
+    bodies[('/stable/treasury-rates', '')] = json.dumps(treasury)
+
+    gspc = [{'date': d.isoformat(), 'close': round(rng.uniform(3000, 6000), 2)} for d in trading]
+    bodies[('/stable/historical-price-eod/full', '^GSPC')] = json.dumps(gspc)
+    return bodies
+
+
+# ===================== Local Stand-in ===================== #
+
+class EconDataStandIn(ThreadingHTTPServer):
+    """
+    Serves fixture bodies on 127.0.0.1 with ETag/Last-Modified validators.
+
+    Attributes:
+        latency: key -> seconds the response takes
+        failures: key -> remaining 503 responses for that key
+        requests_by_status: HTTP status -> count
+        max_in_flight: Highest number of concurrent requests seen
+    """
+
+    daemon_threads = True
+
+    def __init__(self, bodies: dict, latency: dict):
+        super().__init__(('127.0.0.1', 0), _StandInHandler)
+        self.bodies = bodies
+        self.latency = latency
+        self.failures = {}
+        self.requests_by_status = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def reset(self, failures=None):
+        with self.lock:
+            self.failures = dict(failures or {})
+            self.requests_by_status = {}
+            self.max_in_flight = 0
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    server: EconDataStandIn
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        param = (query.get('id') or query.get('name') or query.get('symbol') or [''])[0]
+        key = (url.path, param)
+
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            fail = server.failures.get(key, 0) > 0
+            if fail:
+                server.failures[key] -= 1
+
+        try:
+            time.sleep(server.latency.get(key, 0.0))
+            body = server.bodies.get(key)
+            if fail:
+                return self._send(503, b'{"error": "Service Unavailable"}')
+            if body is None:
+                return self._send(404, b'{"error": "Not Found"}')
+
+            payload = body.encode('utf-8')
+            etag = '"' + hashlib.md5(payload).hexdigest() + '"'
+            if self.headers.get('If-None-Match') == etag:
+                return self._send(304, b'', etag)
+            self._send(200, payload, etag)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _send(self, status: int, payload: bytes, etag: str = None):
+        with self.server.lock:
+            self.server.requests_by_status[status] = self.server.requests_by_status.get(status, 0) + 1
+        self.send_response(status)
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', LAST_MODIFIED)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        if payload:
+            self.wfile.write(payload)
+
+
+# ===================== Benchmark ===================== #
+
+def run(server: EconDataStandIn, workers: int, interval: float, cache_dir: Path = None):
+    """fetch_all() against the stand-in; returns (raw_frames, seconds)."""
+    collector = FREDCollector(
+        fmp_api_key='fixture',
+        max_workers=workers,
+        host_limits={'127.0.0.1': (workers, interval)},
+        cache_dir=cache_dir,
+        fred_base_url=server.base_url,
+        fmp_base_url=server.base_url,
+        backoff=0.1,
+    )
+    start = time.perf_counter()
+    collector.fetch_all()
+    return collector.raw_frames, time.perf_counter() - start
+
+
+def same_frames(a: dict, b: dict) -> bool:
+    if a.keys() != b.keys():
+        return False
+    return all(a[k].reset_index(drop=True).equals(b[k].reset_index(drop=True)) for k in a)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark concurrent FRED/FMP fetching')
+    parser.add_argument('--months', type=int, default=600, help='Monthly observations per series')
+    parser.add_argument('--days', type=int, default=3650, help='Calendar days of Treasury/^GSPC history')
+    parser.add_argument('--latency', type=float, default=0.2, help='Seconds per typical request')
+    parser.add_argument('--slow-latency', type=float, default=1.0, help='Seconds for the slow series')
+    parser.add_argument('--slow', type=int, default=3, help='Number of slow series')
+    parser.add_argument('--interval', type=float, default=0.05, help='Client min seconds between request starts')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8], help='Worker counts to compare')
+    args = parser.parse_args()
+
+    bodies = build_fixture(args.months, args.days)
+    keys = sorted(bodies)
+    rng = random.Random(11)
+    latency = {k: args.latency for k in keys}
+    slow_keys = rng.sample(keys, min(args.slow, len(keys)))
+    for k in slow_keys:
+        latency[k] = args.slow_latency
+
+    server = EconDataStandIn(bodies, latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    sequential_floor = sum(latency.values())
+    print("=" * 70)
+    print(f"FRED/FMP fetch: {len(keys)} series, {args.latency:.2f}s typical, "
+          f"{len(slow_keys)} slow at {args.slow_latency:.2f}s (sum {sequential_floor:.1f}s)")
+    print("=" * 70)
+    print(f"{'Run':<26} {'Time (s)':>9} {'200':>5} {'304':>5} {'503':>5} {'In flight':>10} {'OK':>5}")
+    print("-" * 70)
+
+    baseline_frames = None
+    ok_all = True
+
+    def report(label, frames, elapsed):
+        nonlocal baseline_frames, ok_all
+        if baseline_frames is None:
+            baseline_frames = frames
+        ok = same_frames(frames, baseline_frames) and all(not frames[k].empty for k in frames)
+        ok_all = ok_all and ok
+        s = server.requests_by_status
+        print(f"{label:<26} {elapsed:>9.2f} {s.get(200, 0):>5} {s.get(304, 0):>5} {s.get(503, 0):>5} "
+              f"{server.max_in_flight:>10} {'PASS' if ok else 'FAIL':>5}")
+
+    for workers in args.workers:
+        server.reset()
+        frames, elapsed = run(server, workers, args.interval)
+        report(f"workers={workers}", frames, elapsed)
+
+    top = max(args.workers)
+    server.reset(failures={k: 1 for k in keys[::7]})
+    frames, elapsed = run(server, top, args.interval)
+    report(f"workers={top}, 503s", frames, elapsed)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        server.reset()
+        run(server, top, args.interval, Path(cache_dir))
+        server.reset()
+        frames, elapsed = run(server, top, args.interval, Path(cache_dir))
+        report(f"workers={top}, cached (304)", frames, elapsed)
+        ok_all = ok_all and server.requests_by_status.get(304, 0) == len(keys)
+
+    print("=" * 70)
+    server.shutdown()
+    return 0 if ok_all else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
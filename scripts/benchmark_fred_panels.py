@@ -0,0 +1,135 @@
+"""
+Benchmark: vectorized FREDCollector panels vs. per-series resample + pairwise merges
+
+Fills FREDCollector.raw_frames with synthetic series of mixed frequency
+(daily, weekly, monthly, quarterly) with staggered start dates, gaps and
+missing values, then times:
+  - Merge:      the previous build_monthly_panel/build_quarterly_panel, one
+                _resample() per series folded together with outer merges
+  - Vectorized: the current panels, one long frame, one grouped
+                aggregation by (period end, series) and one pivot per rule
+
+Both must return identical frames (values, dtypes, column and row order).
+
+No network or database needed.
+
+Usage:
+    python scripts/benchmark_fred_panels.py
+    python scripts/benchmark_fred_panels.py --series 10 50 100 200 --years 60 --repeat 5
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.collectors.fred_collector import FREDCollector
+
+FREQUENCIES = ['D', 'W-FRI', 'MS', 'QS']
+AGGREGATIONS = ['last', 'mean', 'max', 'min']
+
+
+def build_raw_frames(series: int, years: int, seed: int = 7) -> dict:
+    """Synthetic raw_frames in FREDCollector's Date/<name> layout."""
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp('2025-11-28')
+    frames = {}
+    for i in range(series):
+        name = f"Series_{i:03d}"
+        freq = FREQUENCIES[i % len(FREQUENCIES)]
+        start = end - pd.DateOffset(years=int(rng.integers(max(1, years // 4), years + 1)))
+        dates = pd.date_range(start, end, freq=freq)
+        if freq == 'D':
+            dates = dates[dates.dayofweek < 5]
+        # Drop a block of observations so some bins inside the range are empty
+        if len(dates) > 40 and i % 3 == 0:
+            cut = int(rng.integers(10, len(dates) - 20))
+            dates = dates[:cut].append(dates[cut + 15:])
+        values = rng.normal(100, 20, len(dates)).round(3)
+        values[rng.random(len(dates)) < 0.02] = np.nan
+        frames[name] = pd.DataFrame({'Date': dates, name: values})
+    return frames
+
+
+def merge_panel(collector: FREDCollector, rule: str, how: str) -> pd.DataFrame:
+    """Previous implementation: per-series _resample folded with outer merges."""
+    frames = []
+    for name, df in collector.raw_frames.items():
+        frames.append(collector._resample(df, name, rule, how))
+    panel = None
+    for f in frames:
+        panel = f if panel is None else panel.merge(f, on="Date", how="outer")
+    if panel is None:
+        return pd.DataFrame(columns=["Date"] + list(collector.raw_frames.keys()))
+    return panel.sort_values("Date").reset_index(drop=True)
+
+
+def timed(fn, repeat: int):
+    """Best wall time over repeat runs; returns (result, seconds)."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def same_panel(a: pd.DataFrame, b: pd.DataFrame) -> bool:
+    try:
+        pd.testing.assert_frame_equal(a, b)
+        return True
+    except AssertionError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark vectorized FRED panel construction')
+    parser.add_argument('--series', type=int, nargs='+', default=[10, 50, 100], help='Series counts to compare')
+    parser.add_argument('--years', type=int, default=40, help='Max years of history per series')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per method (best time kept)')
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print(f"FRED panels: mixed D/W/M/Q series, up to {args.years} years each")
+    print("=" * 78)
+    print(f"{'Series':>6} {'Panel':<10} {'Agg':<5} {'Rows':>6} {'Merge (ms)':>11} {'Vector (ms)':>12} {'Speedup':>8} {'OK':>5}")
+    print("-" * 78)
+
+    ok_all = True
+    for n in args.series:
+        collector = FREDCollector()
+        collector.raw_frames = build_raw_frames(n, args.years)
+
+        for label, rule in [('monthly', 'ME'), ('quarterly', 'QE-DEC')]:
+            for how in AGGREGATIONS:
+                expected, merge_time = timed(lambda: merge_panel(collector, rule, how), args.repeat)
+                actual, vector_time = timed(lambda: collector._build_panel(rule, how), args.repeat)
+                ok = same_panel(actual, expected)
+                ok_all = ok_all and ok
+                print(f"{n:>6} {label:<10} {how:<5} {len(actual):>6} {merge_time * 1000:>11.1f} "
+                      f"{vector_time * 1000:>12.1f} {merge_time / vector_time:>7.1f}x {'PASS' if ok else 'FAIL':>5}")
+
+        # Public entry points use the collector's configured aggregations
+        ok = (same_panel(collector.build_monthly_panel(), merge_panel(collector, 'ME', collector.monthly_agg))
+              and same_panel(collector.build_quarterly_panel(), merge_panel(collector, 'QE-DEC', collector.quarterly_agg)))
+        ok_all = ok_all and ok
+        print(f"{n:>6} {'build_*_panel()':<16} {'':>50} {'PASS' if ok else 'FAIL':>5}")
+        print("-" * 78)
+
+    empty = FREDCollector()
+    ok = same_panel(empty.build_monthly_panel(), merge_panel(empty, 'ME', empty.monthly_agg))
+    ok_all = ok_all and ok
+    print(f"{'Empty raw_frames':<72} {'PASS' if ok else 'FAIL':>5}")
+    print("=" * 78)
+    return 0 if ok_all else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+Benchmark: DAG job orchestrator vs. sequential run_all_jobs
+
+Runs the update_all_data job graph (same names, dependencies and resource
+claims as nightly_jobs()) with sleep-based stand-ins for each collector,
+scaled so the whole run takes a few seconds, and compares:
+  - Sequential: every job one after another (the previous run_all_jobs)
+  - DAG:        JobOrchestrator with the FMP request budget and DB slots
+
+Checks:
+  - every job starts only after its dependencies completed
+  - resource usage never exceeds the budgets
+  - wall time is close to the longest chain the budgets allow, not the sum
+  - a failing job skips its dependents and nothing else
+
+No network or database needed.
+
+Usage:
+    python scripts/benchmark_job_orchestrator.py
+    python scripts/benchmark_job_orchestrator.py --fmp-rpm 300 --db-slots 2 --scale 0.5
+"""
+import argparse
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.jobs.orchestrator import JobOrchestrator, JobRunStatus, JobSpec, ResourcePool
+
+# Relative durations of a typical full run (minutes in production, seconds here)
+DURATIONS = {
+    "Company Profiles": 1.0,
+    "Financial Statements": 3.0,
+    "Daily Prices": 2.0,
+    "Economic Indicators": 0.5,
+    "Analyst Data": 1.5,
+    "Insider/Institutional Data": 1.5,
+}
+
+PROFILES = "Company Profiles"
+DEPENDS_ON = {name: (PROFILES,) for name in DURATIONS if name not in (PROFILES, "Economic Indicators")}
+
+
+class UsageTracker:
+    """Records start/end events and peak resource usage of stand-in jobs."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_use: Dict[str, int] = {}
+        self.peak: Dict[str, int] = {}
+        self.events: List[tuple] = []
+
+    def job(self, name: str, seconds: float, claims: Dict[str, int], fail: bool = False):
+        def run():
+            with self.lock:
+                self.events.append(('start', name, time.perf_counter()))
+                for r, units in claims.items():
+                    self.in_use[r] = self.in_use.get(r, 0) + units
+                    self.peak[r] = max(self.peak.get(r, 0), self.in_use[r])
+            try:
+                time.sleep(seconds)
+                if fail:
+                    raise RuntimeError(f"{name} failed (simulated)")
+                return {'status': 'ok', 'job': name}
+            finally:
+                with self.lock:
+                    for r, units in claims.items():
+                        self.in_use[r] -= units
+                    self.events.append(('end', name, time.perf_counter()))
+        return run
+
+
+def build_jobs(tracker: UsageTracker, scale: float, fmp_claim: Dict[str, int], fail: str = None) -> List[JobSpec]:
+    jobs = []
+    for name, rel in DURATIONS.items():
+        claims = {'db': 1} if name == "Economic Indicators" else fmp_claim
+        jobs.append(JobSpec(
+            name,
+            tracker.job(name, rel * scale, claims, fail=(name == fail)),
+            depends_on=DEPENDS_ON.get(name, ()),
+            resources=claims,
+        ))
+    return jobs
+
+
+def dependencies_respected(tracker: UsageTracker) -> bool:
+    started = {name: t for kind, name, t in tracker.events if kind == 'start'}
+    ended = {name: t for kind, name, t in tracker.events if kind == 'end'}
+    return all(
+        dep in ended and ended[dep] <= started[name]
+        for name, deps in DEPENDS_ON.items() if name in started
+        for dep in deps
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the DAG job orchestrator')
+    parser.add_argument('--fmp-rpm', type=int, default=750, help='FMP requests per minute budget')
+    parser.add_argument('--job-rpm', type=int, default=300, help='FMP requests per minute of one collector')
+    parser.add_argument('--db-slots', type=int, default=4, help='DB connection slots')
+    parser.add_argument('--scale', type=float, default=1.0, help='Seconds per relative duration unit')
+    args = parser.parse_args()
+
+    # The failure check raises on purpose; keep its traceback out of the table
+    logging.getLogger("JobOrchestrator").setLevel(logging.CRITICAL)
+
+    capacities = {'fmp_rpm': args.fmp_rpm, 'db': args.db_slots}
+    fmp_claim = {'fmp_rpm': min(args.job_rpm, args.fmp_rpm), 'db': 1}
+    fmp_parallel = min(args.fmp_rpm // fmp_claim['fmp_rpm'], args.db_slots)
+
+    print("=" * 72)
+    print(f"Job orchestrator: {len(DURATIONS)} jobs, budgets fmp_rpm={args.fmp_rpm} db={args.db_slots} "
+          f"(up to {fmp_parallel} FMP jobs at once)")
+    print("=" * 72)
+
+    # Sequential baseline: the previous run_all_jobs loop
+    tracker = UsageTracker()
+    start = time.perf_counter()
+    for spec in build_jobs(tracker, args.scale, fmp_claim):
+        spec.func()
+    sequential = time.perf_counter() - start
+
+    # DAG run
+    tracker = UsageTracker()
+    orchestrator = JobOrchestrator(build_jobs(tracker, args.scale, fmp_claim), ResourcePool(capacities))
+    report = orchestrator.run()
+
+    print(f"{'Job':<28} {'Status':<10} {'Wait (s)':>9} {'Run (s)':>9}")
+    print("-" * 72)
+    for name, run in report.runs.items():
+        print(f"{name:<28} {run.status:<10} {run.wait:>9.2f} {run.duration:>9.2f}")
+    print("-" * 72)
+    print(f"Critical path: {' -> '.join(report.critical_path)} ({report.critical_path_seconds:.2f}s)")
+
+    # Lower bound with the FMP budget: profiles, then the dependent FMP jobs packed into
+    # fmp_parallel lanes (at least the longest of them)
+    dependents = [DURATIONS[n] * args.scale for n in DEPENDS_ON]
+    bound = DURATIONS[PROFILES] * args.scale + max(max(dependents), sum(dependents) / max(fmp_parallel, 1))
+
+    checks = [
+        ("All jobs completed", all(r.status == JobRunStatus.COMPLETED for r in report.runs.values())),
+        ("Dependencies respected", dependencies_respected(tracker)),
+        ("Budgets never exceeded", all(tracker.peak.get(r, 0) <= cap for r, cap in capacities.items())),
+        (f"Wall {report.wall_seconds:.2f}s < sequential {sequential:.2f}s",
+         report.wall_seconds < sequential),
+        (f"Wall within 25% of budget-bound chain ({bound:.2f}s)", report.wall_seconds <= bound * 1.25),
+    ]
+
+    # Failure: dependents of the failed job are skipped, independent jobs still run
+    tracker = UsageTracker()
+    failed = JobOrchestrator(
+        build_jobs(tracker, args.scale * 0.1, fmp_claim, fail=PROFILES), ResourcePool(capacities)
+    ).run()
+    checks.append(("Failure skips dependents only", (
+        failed.runs[PROFILES].status == JobRunStatus.FAILED
+        and all(failed.runs[n].status == JobRunStatus.SKIPPED for n in DEPENDS_ON)
+        and failed.runs["Economic Indicators"].status == JobRunStatus.COMPLETED
+    )))
+
+    print("-" * 72)
+    print(f"Sequential: {sequential:.2f}s   DAG: {report.wall_seconds:.2f}s   "
+          f"Speedup: {sequential / report.wall_seconds:.1f}x")
+    print("-" * 72)
+    ok_all = True
+    for label, ok in checks:
+        ok_all = ok_all and ok
+        print(f"{label:<66} {'PASS' if ok else 'FAIL':>5}")
+    print("=" * 72)
+    return 0 if ok_all else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+Benchmark: camelCase -> snake_case key transformation on an FMP payload
+
+Builds a 100K-record income-statement payload shaped like FMP's (camelCase
+keys, plus fields the model does not store, and a second schema where a few
+keys are missing) and renames it with:
+  - Regex per key:  the four substitutions for every key of every record
+                    (transform_keys before caching)
+  - Cached per key: camel_to_snake's lru_cache, one lookup per key
+  - KeyMapper:      one rename plan per key set, one dict build per record
+  - KeyMapper(model): the same, dropping keys the model has no column for
+  - DataFrame:      KeyMapper.transform_frame on the payload as a frame
+
+Checks:
+  - every variant produces the old output (model variant: minus extra keys)
+  - one plan per schema is compiled
+  - KeyMapper is faster than per-key conversion
+
+No network or database needed.
+
+Usage:
+    python scripts/benchmark_key_mapper.py
+    python scripts/benchmark_key_mapper.py --records 500000 --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+for name, value in {'FMP_API_KEY': 'bench', 'FRED_API_KEY': 'bench', 'BLS_API_KEY': 'bench',
+                    'BEA_API_KEY': 'b' * 36, 'CENSUS_API_KEY': 'bench',
+                    'DATABASE_URL': 'sqlite://'}.items():
+    os.environ.setdefault(name, value)
+
+from src.database.models import IncomeStatement
+from src.utils.data_transform import KeyMapper, camel_to_snake
+
+# FMP /stable/income-statement fields (link/finalLink are not stored)
+FMP_KEYS = [
+    'date', 'symbol', 'reportedCurrency', 'cik', 'filingDate', 'acceptedDate', 'fiscalYear', 'period',
+    'revenue', 'costOfRevenue', 'grossProfit', 'researchAndDevelopmentExpenses',
+    'generalAndAdministrativeExpenses', 'sellingAndMarketingExpenses',
+    'sellingGeneralAndAdministrativeExpenses', 'otherExpenses', 'operatingExpenses', 'costAndExpenses',
+    'netInterestIncome', 'interestIncome', 'interestExpense', 'depreciationAndAmortization', 'ebitda',
+    'ebit', 'nonOperatingIncomeExcludingInterest', 'operatingIncome', 'totalOtherIncomeExpensesNet',
+    'incomeBeforeTax', 'incomeTaxExpense', 'netIncomeFromContinuingOperations',
+    'netIncomeFromDiscontinuedOperations', 'otherAdjustmentsToNetIncome', 'netIncome',
+    'netIncomeDeductions', 'bottomLineNetIncome', 'eps', 'epsDiluted', 'weightedAverageShsOut',
+    'weightedAverageShsOutDil', 'link', 'finalLink',
+]
+
+
+def build_payload(n: int):
+    """n records; every 10th lacks the link fields (a second schema)."""
+    payload = []
+    for i in range(n):
+        record = {key: float(i + j) for j, key in enumerate(FMP_KEYS)}
+        record.update(date=f"{2024 - i % 20}-12-31", symbol=f"S{i // 20:05d}", period='FY',
+                      reportedCurrency='USD', link='https://example.invalid', finalLink='https://example.invalid')
+        if i % 10 == 0:
+            del record['link'], record['finalLink']
+        payload.append(record)
+    return payload
+
+
+def regex_per_key(records):
+    convert = camel_to_snake.__wrapped__
+    return [{convert(key): value for key, value in record.items()} for record in records]
+
+
+def cached_per_key(records):
+    return [{camel_to_snake(key): value for key, value in record.items()} for record in records]
+
+
+def best_of(repeat: int, func, *args):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark camelCase -> snake_case key transformation')
+    parser.add_argument('--records', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per variant (best is reported)')
+    args = parser.parse_args()
+
+    payload = build_payload(args.records)
+    frame = pd.DataFrame(payload[1:10])  # one schema (with link fields)
+    frame = pd.concat([frame] * (args.records // len(frame)), ignore_index=True)
+
+    print("=" * 72)
+    print(f"{args.records:,} FMP income-statement records, {len(FMP_KEYS)} keys, best of {args.repeat}")
+    print("=" * 72)
+
+    mapper = KeyMapper()
+    model_mapper = KeyMapper(IncomeStatement)
+    frame_mapper = KeyMapper()
+    variants = [
+        ('Regex per key', regex_per_key, payload),
+        ('Cached per key', cached_per_key, payload),
+        ('KeyMapper', mapper.transform_records, payload),
+        ('KeyMapper(model)', model_mapper.transform_records, payload),
+        ('DataFrame (transform_frame)', frame_mapper.transform_frame, frame),
+    ]
+
+    timings, outputs = {}, {}
+    for label, func, data in variants:
+        # The uncached baseline is slow enough that one run is representative
+        seconds, outputs[label] = best_of(1 if func is regex_per_key else args.repeat, func, data)
+        timings[label] = seconds
+        print(f"{label:<30} {seconds * 1000:>9.1f} ms  {args.records / seconds:>12,.0f} records/s  "
+              f"{timings['Regex per key'] / seconds:>5.1f}x")
+
+    expected = outputs['Regex per key']
+    columns = set(IncomeStatement.__table__.columns.keys())
+    print("-" * 72)
+
+    checks = [
+        ("Cached per key matches", outputs['Cached per key'] == expected),
+        ("KeyMapper matches (keys, order and values)",
+         outputs['KeyMapper'] == expected
+         and all(list(a) == list(b) for a, b in zip(outputs['KeyMapper'], expected))),
+        ("KeyMapper(model) keeps only model columns",
+         outputs['KeyMapper(model)'] == [{k: v for k, v in r.items() if k in columns} for r in expected]),
+        ("DataFrame columns match", list(outputs['DataFrame (transform_frame)'].columns) == list(expected[1])),
+        ("One plan per schema", len(mapper._plans) == 2 and len(frame_mapper._plans) == 1),
+        ("KeyMapper faster than per-key conversion",
+         timings['KeyMapper'] < timings['Cached per key'] < timings['Regex per key']),
+    ]
+
+    ok_all = True
+    for label, ok in checks:
+        ok_all = ok_all and ok
+        print(f"{label:<66} {'PASS' if ok else 'FAIL':>5}")
+    print("=" * 72)
+    return 0 if ok_all else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Benchmark: recursive-CTE peer network vs. per-node BFS
+
+Loads a synthetic peer graph (10K symbols by default) into session-local
+TEMP tables named peers_bulk and peer_edges, which shadow the real tables
+for this connection only, then times:
+  - BFS: one get_peers() query per visited symbol (the previous
+    get_peer_network implementation)
+  - CTE: get_peer_graph(), one recursive query per network
+
+Both must return the same symbols at the same depths. The temp tables are
+dropped on commit; real peer data is never read or modified.
+
+Requires a reachable PostgreSQL database (DATABASE_URL).
+
+Usage:
+    python scripts/benchmark_peer_network.py
+    python scripts/benchmark_peer_network.py --symbols 20000 --depths 1 2 3 --roots 20
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Set
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.database.connection import get_session
+from src.utils.peers_helpers import get_peer_graph, get_peer_network, get_peers
+
+
+def build_graph(symbols: int, seed: int = 42) -> Dict[str, list]:
+    """
+    Synthetic peer lists: sectors of ~100 symbols, 8-14 peers each, mostly
+    within the sector with a few links to cross-sector large caps.
+    """
+    rng = random.Random(seed)
+    names = [f"S{i:05d}" for i in range(symbols)]
+    sector_size = 100
+    large_caps = names[::sector_size]
+
+    graph = {}
+    for i, name in enumerate(names):
+        sector = names[(i // sector_size) * sector_size:(i // sector_size + 1) * sector_size]
+        k = rng.randint(8, 14)
+        peers = []
+        while len(peers) < k:
+            peer = rng.choice(large_caps) if rng.random() < 0.15 else rng.choice(sector)
+            if peer != name and peer not in peers:
+                peers.append(peer)
+        graph[name] = peers
+    return graph
+
+
+def load_graph(session: Session, graph: Dict[str, list]):
+    """Create TEMP peers_bulk/peer_edges (dropped on commit) and fill them."""
+    session.execute(text("""
+        CREATE TEMP TABLE peers_bulk (
+            symbol VARCHAR(20) PRIMARY KEY,
+            peers_list TEXT,
+            collected_at TIMESTAMP NOT NULL DEFAULT now()
+        ) ON COMMIT DROP
+    """))
+    session.execute(text("""
+        CREATE TEMP TABLE peer_edges (
+            symbol VARCHAR(20) NOT NULL,
+            peer_symbol VARCHAR(20) NOT NULL,
+            position INTEGER NOT NULL,
+            PRIMARY KEY (symbol, peer_symbol)
+        ) ON COMMIT DROP
+    """))
+
+    session.execute(
+        text("INSERT INTO peers_bulk (symbol, peers_list) VALUES (:symbol, :peers_list)"),
+        [{'symbol': s, 'peers_list': ','.join(p)} for s, p in graph.items()],
+    )
+    session.execute(
+        text("INSERT INTO peer_edges (symbol, peer_symbol, position) VALUES (:symbol, :peer_symbol, :position)"),
+        [
+            {'symbol': s, 'peer_symbol': peer, 'position': pos}
+            for s, peers in graph.items() for pos, peer in enumerate(peers)
+        ],
+    )
+    session.execute(text("CREATE INDEX ON peer_edges (peer_symbol, symbol)"))
+    session.execute(text("ANALYZE peers_bulk"))
+    session.execute(text("ANALYZE peer_edges"))
+
+
+def bfs_peer_network(session: Session, symbol: str, depth: int):
+    """Previous implementation: one get_peers() round trip per visited symbol."""
+    network: Dict[int, Set[str]] = {}
+    visited = {symbol}
+    current_level = {symbol}
+    queries = 0
+
+    for level in range(1, depth + 1):
+        next_level = set()
+        for sym in current_level:
+            queries += 1
+            peers = get_peers(session, sym)
+            if peers:
+                for peer in peers:
+                    if peer not in visited:
+                        next_level.add(peer)
+                        visited.add(peer)
+        if not next_level:
+            break
+        network[level] = next_level
+        current_level = next_level
+
+    return network, queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark recursive-CTE peer network traversal')
+    parser.add_argument('--symbols', type=int, default=10_000, help='Symbols in the synthetic graph')
+    parser.add_argument('--depths', type=int, nargs='+', default=[1, 2, 3], help='Depths to compare')
+    parser.add_argument('--roots', type=int, default=10, help='Starting symbols per depth')
+    args = parser.parse_args()
+
+    graph = build_graph(args.symbols)
+    edges = sum(len(p) for p in graph.values())
+    # Large caps first: they have the widest networks
+    roots = list(graph)[::100][:args.roots]
+
+    with get_session() as session:
+        start = time.perf_counter()
+        load_graph(session, graph)
+        print("=" * 72)
+        print(f"Peer network benchmark: {len(graph):,} symbols, {edges:,} edges "
+              f"(loaded in {time.perf_counter() - start:.1f}s), {len(roots)} roots per depth")
+        print("=" * 72)
+        print(f"{'Depth':>5} {'Avg nodes':>10} {'BFS queries':>12} {'BFS (ms)':>10} {'CTE (ms)':>10} {'Speedup':>8} {'OK':>5}")
+        print("-" * 72)
+
+        ok_all = True
+        for depth in args.depths:
+            nodes = queries = 0
+            bfs_time = cte_time = 0.0
+            ok = True
+
+            for root in roots:
+                t0 = time.perf_counter()
+                expected, n_queries = bfs_peer_network(session, root, depth)
+                t1 = time.perf_counter()
+                actual = get_peer_network(session, root, depth)
+                t2 = time.perf_counter()
+
+                bfs_time += t1 - t0
+                cte_time += t2 - t1
+                queries += n_queries
+                nodes += sum(len(level) for level in actual.values())
+                ok = ok and actual == expected
+
+            ok_all = ok_all and ok
+            n = len(roots)
+            print(f"{depth:>5} {nodes / n:>10.0f} {queries / n:>12.0f} {bfs_time / n * 1000:>10.1f} "
+                  f"{cte_time / n * 1000:>10.1f} {bfs_time / cte_time:>7.1f}x {'PASS' if ok else 'FAIL':>5}")
+
+        graph_result = get_peer_graph(session, roots[0], max(args.depths))
+        print("-" * 72)
+        print(f"get_peer_graph({roots[0]}, depth={max(args.depths)}): "
+              f"{len(graph_result['nodes']):,} nodes, {len(graph_result['edges']):,} edges")
+        print("=" * 72)
+
+    return 0 if ok_all else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""
+Benchmark: unified price view vs. per-symbol regular/bulk fallback
+
+Loads synthetic prices (500 symbols x 1 year by default) into session-local
+TEMP tables named prices_daily and prices_daily_bulk plus a TEMP
+prices_daily_unified view over them, which shadow the real objects for this
+connection only, then times:
+  - Fallback: per symbol, query prices_daily, then prices_daily_bulk for the
+    dates it lacked, merged in Python (the previous get_price_range)
+  - Range:    get_price_range() per symbol over the view (one query each)
+  - Batched:  get_prices() for all symbols (one query)
+
+All three must return the same (symbol, date, close, source) rows. The
+transaction is rolled back at the end; real price data is never read or modified.
+
+Requires a reachable PostgreSQL database (DATABASE_URL).
+
+Usage:
+    python scripts/benchmark_price_queries.py
+    python scripts/benchmark_price_queries.py --symbols 1000 --bulk-symbols 8000 --days 730 --repeat 5
+"""
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.database.connection import get_session
+from src.database.models import PRICES_DAILY_UNIFIED_SELECT, PriceDaily, PriceDailyBulk
+from src.utils.price_helpers import get_price_range, get_prices
+
+
+def load_prices(session: Session, symbols: int, bulk_symbols: int, start: date, end: date, gap_rate: float):
+    """Create TEMP price tables and view, then fill them server-side."""
+    session.execute(text("""
+        CREATE TEMP TABLE prices_daily (
+            symbol VARCHAR(20) NOT NULL,
+            date DATE NOT NULL,
+            adj_open NUMERIC(20, 4), adj_high NUMERIC(20, 4),
+            adj_low NUMERIC(20, 4), adj_close NUMERIC(20, 4),
+            volume BIGINT,
+            created_at TIMESTAMP NOT NULL DEFAULT now(),
+            PRIMARY KEY (symbol, date)
+        )
+    """))
+    session.execute(text("""
+        CREATE TEMP TABLE prices_daily_bulk (
+            symbol VARCHAR(20) NOT NULL,
+            date DATE NOT NULL,
+            open NUMERIC(20, 4), high NUMERIC(20, 4), low NUMERIC(20, 4),
+            close NUMERIC(20, 4), adj_close NUMERIC(20, 4),
+            volume BIGINT,
+            collected_at TIMESTAMP NOT NULL DEFAULT now(),
+            PRIMARY KEY (symbol, date)
+        )
+    """))
+    session.execute(text("SELECT setseed(0.42)"))
+
+    params = {'start': start, 'end': end}
+    # Bulk covers every symbol and weekday; regular covers the tracked symbols with gaps
+    session.execute(text("""
+        INSERT INTO prices_daily_bulk (symbol, date, open, high, low, close, adj_close, volume)
+        SELECT 'S' || lpad(s::text, 5, '0'), d::date,
+               100, 102, 98, 100 + s % 50 + random(), 99 + s % 50 + random(), 1000000 + s
+        FROM generate_series(0, :bulk_symbols - 1) AS s
+        CROSS JOIN generate_series(CAST(:start AS date), CAST(:end AS date), interval '1 day') AS d
+        WHERE extract(isodow FROM d) < 6
+    """), {**params, 'bulk_symbols': bulk_symbols})
+    session.execute(text("""
+        INSERT INTO prices_daily (symbol, date, adj_open, adj_high, adj_low, adj_close, volume)
+        SELECT symbol, date, open - 1, high - 1, low - 1, adj_close, volume
+        FROM prices_daily_bulk
+        WHERE symbol < 'S' || lpad(CAST(:symbols AS text), 5, '0') AND random() >= :gap_rate
+    """), {'symbols': symbols, 'gap_rate': gap_rate})
+
+    session.execute(text("CREATE INDEX ON prices_daily (date)"))
+    session.execute(text("CREATE INDEX ON prices_daily_bulk (date)"))
+    session.execute(text(f"CREATE TEMP VIEW prices_daily_unified AS {PRICES_DAILY_UNIFIED_SELECT}"))
+    session.execute(text("ANALYZE prices_daily"))
+    session.execute(text("ANALYZE prices_daily_bulk"))
+
+
+def fallback_price_range(session: Session, symbol: str, start_date: date, end_date: date) -> list:
+    """Previous get_price_range: regular query, then bulk for the missing dates."""
+    regular = session.query(PriceDaily).filter(
+        PriceDaily.symbol == symbol,
+        PriceDaily.date >= start_date,
+        PriceDaily.date <= end_date
+    ).order_by(PriceDaily.date).all()
+
+    results = [(p.symbol, p.date, float(p.adj_close), 'regular') for p in regular]
+    regular_dates = {p.date for p in regular}
+
+    bulk = session.query(PriceDailyBulk).filter(
+        PriceDailyBulk.symbol == symbol,
+        PriceDailyBulk.date >= start_date,
+        PriceDailyBulk.date <= end_date,
+        ~PriceDailyBulk.date.in_(regular_dates)
+    ).order_by(PriceDailyBulk.date).all()
+
+    results.extend((p.symbol, p.date, float(p.close), 'bulk') for p in bulk)
+    results.sort(key=lambda r: r[1])
+    return results
+
+
+def timed(fn, repeat: int):
+    """Best wall time over repeat runs; returns (result, seconds)."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark unified price view queries')
+    parser.add_argument('--symbols', type=int, default=500, help='Symbols queried (in prices_daily)')
+    parser.add_argument('--bulk-symbols', type=int, default=5000, help='Symbols in prices_daily_bulk')
+    parser.add_argument('--days', type=int, default=365, help='Calendar days queried')
+    parser.add_argument('--gap-rate', type=float, default=0.05,
+                        help='Share of regular rows missing (served from bulk)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per method (best time kept)')
+    args = parser.parse_args()
+
+    end = date(2025, 11, 28)
+    start = end - timedelta(days=args.days - 1)
+    symbols = [f"S{i:05d}" for i in range(args.symbols)]
+
+    with get_session() as session:
+        t0 = time.perf_counter()
+        load_prices(session, args.symbols, max(args.bulk_symbols, args.symbols), start, end, args.gap_rate)
+        regular_rows = session.execute(text("SELECT count(*) FROM prices_daily")).scalar()
+        bulk_rows = session.execute(text("SELECT count(*) FROM prices_daily_bulk")).scalar()
+
+        print("=" * 72)
+        print(f"Price queries: {len(symbols)} symbols x {args.days} days "
+              f"({regular_rows:,} regular / {bulk_rows:,} bulk rows, loaded in {time.perf_counter() - t0:.1f}s)")
+        print("=" * 72)
+
+        expected, fallback_time = timed(
+            lambda: [row for s in symbols for row in fallback_price_range(session, s, start, end)],
+            args.repeat,
+        )
+        ranges, range_time = timed(
+            lambda: [p for s in symbols for p in get_price_range(session, s, start, end)],
+            args.repeat,
+        )
+        df, batched_time = timed(lambda: get_prices(session, symbols, start, end), args.repeat)
+
+        range_rows = [(p['symbol'], p['date'], p['close'], p['source']) for p in ranges]
+        batched_rows = list(zip(df['symbol'], df['date'], df['close'], df['source']))
+
+        print(f"{'Method':<34} {'Queries':>8} {'Rows':>9} {'Time (ms)':>10} {'Speedup':>8} {'OK':>5}")
+        print("-" * 72)
+        ok_all = True
+        for label, queries, rows, elapsed in [
+            ('Fallback (per symbol, 2 queries)', 2 * len(symbols), expected, fallback_time),
+            ('get_price_range (per symbol)', len(symbols), range_rows, range_time),
+            ('get_prices (batched)', 1, batched_rows, batched_time),
+        ]:
+            ok = rows == expected
+            ok_all = ok_all and ok
+            print(f"{label:<34} {queries:>8,} {len(rows):>9,} {elapsed * 1000:>10.1f} "
+                  f"{fallback_time / elapsed:>7.1f}x {'PASS' if ok else 'FAIL':>5}")
+
+        bulk_share = (df['source'] == 'bulk').mean() if len(df) else 0
+        print("-" * 72)
+        print(f"Rows served from bulk: {bulk_share:.1%}")
+        print("=" * 72)
+
+        # Drop the temp tables/view and leave the real tables untouched
+        session.rollback()
+
+    return 0 if ok_all else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+Benchmark: concurrent streamed profile-bulk download vs. the sequential loop
+
+Serves the four FMP profile-bulk CSV parts from benchmarks/replay_server.py
+(fixed latency per response) and loads them into SQLite databases:
+  - Sequential: each part downloaded into memory, parsed, then the next one;
+    all parts concatenated, cleaned and upserted at the end (how
+    CompanyProfileBulkCollector used to run)
+  - Concurrent: CompanyProfileBulkCollector.collect_bulk_company_profiles:
+    parts downloaded at once, streamed to temp files, each loaded in chunks
+    as soon as it arrives
+
+Checks:
+  - both databases hold the same rows (identifier columns aside)
+  - identifiers keep their leading zeros (the old loop parsed them as numbers)
+  - a part whose first attempt is cut off is retried alone and loaded
+  - a part that keeps failing is reported; the other parts stay loaded and
+    tracking is not advanced
+  - the concurrent download is faster
+
+No network or database server needed.
+
+Usage:
+    python scripts/benchmark_profile_bulk_download.py
+    python scripts/benchmark_profile_bulk_download.py --symbols 20000 --latency-ms 1000
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from io import StringIO
+from pathlib import Path
+
+import pandas as pd
+import requests
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.replay_server import ReplayConfig, ReplayServer
+
+for name, value in {'FMP_API_KEY': 'replay', 'FRED_API_KEY': 'replay', 'BLS_API_KEY': 'replay',
+                    'BEA_API_KEY': 'r' * 36, 'CENSUS_API_KEY': 'replay',
+                    'DATABASE_URL': 'sqlite://'}.items():
+    os.environ.setdefault(name, value)
+
+AUDIT_COLUMNS = {'created_at', 'updated_at'}
+
+
+def sequential_load(collector) -> int:
+    """The pre-streaming collect_bulk_company_profiles body."""
+    frames = []
+    for part in collector.PARTS:
+        response = requests.get(collector.endpoint, params={'apikey': collector.api_key, 'part': str(part)},
+                                timeout=collector.timeout)
+        if response.status_code == 200 and response.text.strip():
+            frames.append(pd.read_csv(StringIO(response.text)))
+    df = pd.concat(frames, ignore_index=True)
+    return collector._upsert_records(collector._clean_data(df))
+
+
+def table_snapshot(engine, model) -> pd.DataFrame:
+    columns = [c for c in model.__table__.columns if c.name not in AUDIT_COLUMNS]
+    with engine.connect() as conn:
+        rows = conn.execute(select(*columns).order_by(model.symbol)).all()
+    return pd.DataFrame(rows, columns=[c.name for c in columns])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the concurrent profile-bulk download')
+    parser.add_argument('--symbols', type=int, default=5000, help='Companies per part')
+    parser.add_argument('--latency-ms', type=float, default=500.0, help='Server latency per response')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    server = ReplayServer(ReplayConfig(mode='synthetic', latency_ms=args.latency_ms,
+                                       symbols=args.symbols)).start()
+    os.environ.update(server.env())
+
+    # Imported after FMP_BASE_URL is set, so FMP_ENDPOINTS point at the server
+    from src.collectors.company_profile_bulk_collector import CompanyProfileBulkCollector
+    from src.database.models import CompanyProfileBulk, TableUpdateTracking
+
+    expected = args.symbols * len(CompanyProfileBulkCollector.PARTS)
+
+    print("=" * 72)
+    print(f"Profile bulk: {len(CompanyProfileBulkCollector.PARTS)} parts x {args.symbols:,} companies, "
+          f"{args.latency_ms:.0f}ms latency")
+    print("=" * 72)
+
+    class FlakyCollector(CompanyProfileBulkCollector):
+        """Part 1 drops its first connection; part `dead_part` fails on every attempt."""
+        dead_part = None
+
+        def __init__(self, session):
+            super().__init__(session)
+            self.backoff = 0.01
+            self.attempts = {}
+            real_get = self.http_session.get
+
+            def get(url, params=None, **kwargs):
+                part = int(params['part'])
+                self.attempts[part] = self.attempts.get(part, 0) + 1
+                if part == self.dead_part or (part == 1 and self.attempts[part] == 1):
+                    raise requests.exceptions.ConnectionError(f"part {part}: connection reset")
+                return real_get(url, params=params, **kwargs)
+
+            self.http_session.get = get
+
+    def new_database(path: Path):
+        engine = create_engine(f"sqlite:///{path}")
+        for model in (CompanyProfileBulk, TableUpdateTracking):
+            model.__table__.create(engine)
+        return engine
+
+    def tracked(engine) -> bool:
+        with engine.connect() as conn:
+            return bool(conn.scalar(select(func.count()).select_from(TableUpdateTracking)
+                                    .where(TableUpdateTracking.table_name == 'company_profile_bulk')
+                                    .where(TableUpdateTracking.symbol.is_(None))))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = {}
+        for label in ('sequential', 'concurrent'):
+            engine = new_database(Path(tmp) / f"{label}.db")
+            with Session(engine) as session:
+                collector = CompanyProfileBulkCollector(session)
+                collector.sleep_sec = 0
+                start = time.perf_counter()
+                result = sequential_load(collector) if label == 'sequential' \
+                    else collector.collect_bulk_company_profiles()
+                elapsed = time.perf_counter() - start
+            runs[label] = {'seconds': elapsed, 'result': result,
+                           'rows': table_snapshot(engine, CompanyProfileBulk)}
+            engine.dispose()
+            print(f"{label:<11} {elapsed:>7.2f}s  {expected / elapsed:>10,.0f} rows/s  "
+                  f"{len(runs[label]['rows']):,} rows stored")
+
+        # First attempt at part 1 is cut off: retried alone, every part loads
+        engine = new_database(Path(tmp) / "retry.db")
+        with Session(engine) as session:
+            flaky = FlakyCollector(session)
+            flaky.sleep_sec = 0
+            retried = flaky.collect_bulk_company_profiles()
+            retry_attempts = dict(flaky.attempts)
+        retry_tracked = tracked(engine)
+        engine.dispose()
+
+        # Part 2 never downloads: the other three stay loaded, tracking stays due
+        engine = new_database(Path(tmp) / "failed.db")
+        with Session(engine) as session:
+            flaky = FlakyCollector(session)
+            flaky.sleep_sec = 0
+            flaky.dead_part = 2
+            failed = flaky.collect_bulk_company_profiles()
+        failed_rows = len(table_snapshot(engine, CompanyProfileBulk))
+        failed_tracked = tracked(engine)
+        engine.dispose()
+    server.stop()
+
+    seq, conc = runs['sequential'], runs['concurrent']
+    print(f"{'retry':<11} attempts per part {retry_attempts}, parts loaded {retried['parts_loaded']}")
+    print(f"{'failed':<11} parts loaded {failed['parts_loaded']}, failed {failed['parts_failed']}, "
+          f"{failed_rows:,} rows stored")
+    print("-" * 72)
+    print(f"Speedup: {seq['seconds'] / conc['seconds']:.1f}x")
+    print("-" * 72)
+
+    # The old loop parsed identifiers as numbers (dropping leading zeros); compare the rest
+    compared = [c for c in conc['rows'].columns if c not in CompanyProfileBulkCollector.TEXT_COLUMNS]
+    same = seq['rows'][compared].astype(object).where(seq['rows'][compared].notna(), None).equals(
+        conc['rows'][compared].astype(object).where(conc['rows'][compared].notna(), None))
+    checks = [
+        ("Both loads store every company", len(seq['rows']) == len(conc['rows']) == expected),
+        ("Same rows and values (identifier columns aside)", same),
+        ("Identifiers keep leading zeros (the old loop dropped them)",
+         conc['rows']['cik'].str.len().eq(10).all() and not seq['rows']['cik'].str.len().eq(10).all()),
+        ("Cut-off part retried alone and loaded",
+         retried['success'] and retry_attempts[1] == 2
+         and all(n == 1 for part, n in retry_attempts.items() if part != 1) and retry_tracked),
+        ("Failed part reported, other parts kept, tracking not advanced",
+         not failed['success'] and failed['parts_failed'] == [2] and failed['parts_loaded'] == [0, 1, 3]
+         and failed_rows == expected - args.symbols and not failed_tracked),
+        ("Concurrent download faster", conc['seconds'] < seq['seconds']),
+    ]
+
+    ok_all = True
+    for label, ok in checks:
+        ok_all = ok_all and ok
+        print(f"{label:<66} {'PASS' if ok else 'FAIL':>5}")
+    print("=" * 72)
+    return 0 if ok_all else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+Benchmark: SQL query tracer overhead and N+1 detection
+
+Builds an in-memory SQLite table of prices and runs two versions of the
+same lookup:
+  - Per-row:  one SELECT per symbol (the N+1 pattern)
+  - Batched:  one SELECT ... WHERE symbol IN (...)
+
+Checks:
+  - per-row lookups are flagged with the call site that issued them
+    (strict traces raise NPlusOneError), the batched lookup is not
+  - literals, bound parameters and IN lists of any length share one shape
+  - nested traces both see the inner statements; threads started outside
+    a trace are not recorded
+  - tracing overhead per statement (installed listeners, with and without
+    an active trace)
+
+No network or database server needed.
+
+Usage:
+    python scripts/benchmark_query_tracer.py
+    python scripts/benchmark_query_tracer.py --symbols 500 --threshold 20
+"""
+import argparse
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import bindparam, create_engine, text
+from sqlalchemy.pool import StaticPool
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database.query_tracer import NPlusOneError, install, statement_shape, trace_queries
+
+
+def build_engine(symbols: int):
+    # One shared in-memory database for every connection and thread
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={'check_same_thread': False})
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE prices (symbol TEXT, date TEXT, close REAL)"))
+        conn.execute(
+            text("INSERT INTO prices VALUES (:symbol, :date, :close)"),
+            [{'symbol': f"S{i:04d}", 'date': '2025-11-28', 'close': 100.0 + i} for i in range(symbols)],
+        )
+    return engine
+
+
+def per_row(conn, symbols):
+    return [conn.execute(text("SELECT close FROM prices WHERE symbol = :s"), {'s': s}).scalar() for s in symbols]
+
+
+def batched(conn, symbols):
+    rows = conn.execute(
+        text("SELECT symbol, close FROM prices WHERE symbol IN :symbols").bindparams(
+            bindparam('symbols', expanding=True)
+        ),
+        {'symbols': list(symbols)},
+    ).all()
+    by_symbol = dict(rows)
+    return [by_symbol[s] for s in symbols]
+
+
+def timed(fn, repeat: int = 3) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the SQL query tracer')
+    parser.add_argument('--symbols', type=int, default=2000, help='Rows / per-row lookups')
+    parser.add_argument('--threshold', type=int, default=20, help='Repeat threshold for N+1 flags')
+    args = parser.parse_args()
+
+    # Flag warnings would repeat what the table below shows
+    logging.getLogger("src.database.query_tracer").setLevel(logging.ERROR)
+
+    symbols = [f"S{i:04d}" for i in range(args.symbols)]
+    engine = build_engine(args.symbols)
+    checks = []
+
+    print("=" * 72)
+    print(f"SQL query tracer: {args.symbols} symbols, repeat threshold {args.threshold}")
+    print("=" * 72)
+
+    with engine.connect() as conn:
+        # Overhead: plain engine, listeners installed but idle, active trace
+        plain = timed(lambda: per_row(conn, symbols))
+        install(engine)
+        idle = timed(lambda: per_row(conn, symbols))
+        with trace_queries('overhead', repeat_threshold=10 ** 9, engine=engine):
+            active = timed(lambda: per_row(conn, symbols))
+
+        with trace_queries('per_row', repeat_threshold=args.threshold, engine=engine) as n_plus_one:
+            expected = per_row(conn, symbols)
+        with trace_queries('batched', repeat_threshold=args.threshold, engine=engine) as single:
+            actual = batched(conn, symbols)
+
+        raised = False
+        try:
+            with trace_queries('strict', repeat_threshold=args.threshold, strict=True, engine=engine):
+                per_row(conn, symbols[:args.threshold + 1])
+        except NPlusOneError:
+            raised = True
+
+        with trace_queries('outer', repeat_threshold=args.threshold, engine=engine) as outer:
+            conn.execute(text("SELECT 1")).scalar()
+            with trace_queries('inner', repeat_threshold=args.threshold, engine=engine) as inner:
+                per_row(conn, symbols[:3])
+
+    # A thread started outside any trace does not report into one
+    with trace_queries('isolated', repeat_threshold=args.threshold, engine=engine) as isolated:
+        def worker():
+            with engine.connect() as c:
+                per_row(c, symbols[:5])
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+
+    for trace in (n_plus_one, single):
+        top = trace.repeated[0].count if trace.repeated else 1
+        print(f"{trace.name:<10} {trace.query_count:>6} queries {trace.total_seconds * 1000:>9.1f} ms in DB  "
+              f"top shape x{top:<6} flagged={len(trace.flagged)}")
+    if n_plus_one.flagged:
+        print(f"  call site: {n_plus_one.flagged[0].call_site}")
+    print("-" * 72)
+    per_stmt = 1e6 / args.symbols
+    print(f"Per statement: plain {plain * per_stmt:.1f}us  listeners idle {idle * per_stmt:.1f}us  "
+          f"tracing {active * per_stmt:.1f}us")
+    print("-" * 72)
+
+    shapes = {
+        statement_shape("SELECT close FROM prices WHERE symbol = 'AAPL' AND close > 10.5"),
+        statement_shape("SELECT close FROM prices WHERE symbol = ? AND close > ?"),
+        statement_shape("SELECT close FROM prices\n  WHERE symbol = %(symbol_1)s AND close > %(close_1)s"),
+    }
+    in_lists = {
+        statement_shape("SELECT * FROM prices WHERE symbol IN (?, ?, ?)"),
+        statement_shape("SELECT * FROM prices WHERE symbol IN (%(s_1)s)"),
+    }
+    values = {
+        statement_shape("INSERT INTO prices VALUES (?, ?, ?), (?, ?, ?)"),
+        statement_shape("INSERT INTO prices VALUES (%s, %s, %s)"),
+    }
+
+    checks += [
+        ("Same results per-row and batched", expected == actual),
+        ("Per-row lookups flagged with call site", len(n_plus_one.flagged) == 1
+         and n_plus_one.flagged[0].count == args.symbols
+         and 'benchmark_query_tracer.py' in (n_plus_one.flagged[0].call_site or '')),
+        ("Batched lookup not flagged (1 query)", not single.flagged and single.query_count == 1),
+        ("Strict trace raises NPlusOneError", raised),
+        ("Literals and parameters share a shape", len(shapes) == 1),
+        ("IN lists and VALUES rows collapse", len(in_lists) == 1 and len(values) == 1),
+        ("Nested traces both record", outer.query_count == 4 and inner.query_count == 3),
+        ("Threads outside a trace not recorded", isolated.query_count == 0),
+        ("Idle listeners cost < 25% per statement", idle <= plain * 1.25),
+    ]
+
+    ok_all = True
+    for label, ok in checks:
+        ok_all = ok_all and ok
+        print(f"{label:<66} {'PASS' if ok else 'FAIL':>5}")
+    print("=" * 72)
+    return 0 if ok_all else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Benchmark: every API client against the offline replay server
+
+Starts benchmarks/replay_server.py, points FMP_BASE_URL, FRED_BASE_URL,
+BLS_BASE_URL, BEA_BASE_URL and TREASURY_BASE_URL at it before importing
+src, and drives the real clients through it:
+  - FMP:      concurrent BaseCollector._get calls under a 429 rate limit,
+              and page/limit pagination until an empty page
+  - Treasury: TreasuryClient.iter_pages() with injected 503s
+  - BEA:      BEAClient requests under a 429 rate limit with Retry-After
+  - BLS:      BLSClient.get_many() split into 50-series POSTs
+  - FRED:     FREDCollector fredgraph.csv downloads
+  - Record/replay: a recording server in front of a synthetic one; the
+              cassette replays for a different API key and stores neither
+
+No network or database needed.
+
+Usage:
+    python scripts/benchmark_replay_clients.py
+    python scripts/benchmark_replay_clients.py --requests 200 --fmp-limit 50 --latency-ms 10
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.replay_server import UPSTREAMS, ReplayConfig, ReplayServer
+
+# The server ignores credentials, but settings require them (BEA checks the length)
+for name, value in {'FMP_API_KEY': 'replay', 'FRED_API_KEY': 'replay', 'BLS_API_KEY': 'replay',
+                    'BEA_API_KEY': 'r' * 36, 'CENSUS_API_KEY': 'replay',
+                    'DATABASE_URL': 'sqlite://'}.items():
+    os.environ.setdefault(name, value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Drive the API clients through the replay server')
+    parser.add_argument('--requests', type=int, default=120, help='Concurrent FMP requests')
+    parser.add_argument('--fmp-limit', type=int, default=40, help='FMP requests per second before 429')
+    parser.add_argument('--latency-ms', type=float, default=5.0, help='Server latency per response')
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    config = ReplayConfig(
+        mode='synthetic', latency_ms=args.latency_ms, rate_limits={'fmp': args.fmp_limit, 'bea': 5},
+        rate_window=1.0, retry_after=1, page_size=100, total_rows=950,
+    )
+    server = ReplayServer(config).start()
+    flaky = ReplayServer(ReplayConfig(mode='synthetic', error_rate=0.15, total_rows=950, seed=3)).start()
+    os.environ.update(server.env())
+    os.environ['TREASURY_BASE_URL'] = flaky.env()['TREASURY_BASE_URL']
+
+    # Imported after the base URLs are set, so settings pick them up
+    from sqlalchemy.orm import Session
+    from src.bea.bea_client import BEAClient
+    from src.bls.bls_client import BLSClient
+    from src.collectors.base_collector import BaseCollector
+    from src.collectors.fred_collector import FREDCollector
+    from src.config import FMP_ENDPOINTS, settings
+    from src.treasury.treasury_client import TreasuryClient
+
+    checks = []
+    print("=" * 72)
+    print(f"Replay server {server.url}: latency {args.latency_ms}ms, FMP {args.fmp_limit}/s, BEA 5/s")
+    print("=" * 72)
+
+    # ---------------------- FMP ---------------------- #
+    collector = BaseCollector(Session())
+    collector.sleep_sec = 0
+    collector.backoff = 0.1
+    collector.retries = 8
+    url = FMP_ENDPOINTS['profile']
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.workers) as pool:
+        responses = list(pool.map(lambda i: collector._get(url, {'symbol': f"S{i:04d}"}), range(args.requests)))
+    fmp_seconds = time.perf_counter() - start
+    fmp = server.stats().get('fmp', {})
+    print(f"FMP       {args.requests} requests in {fmp_seconds:.2f}s "
+          f"({args.requests / fmp_seconds:.0f}/s), 429s answered: {fmp.get('throttled', 0)}")
+
+    pages = []
+    page = 0
+    while True:
+        rows = collector._json_safe(collector._get(FMP_ENDPOINTS['insider_trading_search'],
+                                                   {'symbol': 'AAPL', 'page': page, 'limit': 100}))
+        if not rows:
+            break
+        pages.append(len(rows))
+        page += 1
+
+    # ---------------------- Treasury ---------------------- #
+    treasury = TreasuryClient(max_workers=4, min_request_interval=0)
+    start = time.perf_counter()
+    records = [r for page_rows in treasury.iter_pages(TreasuryClient.ENDPOINTS['auctions_query'], page_size=100)
+               for r in page_rows]
+    print(f"Treasury  {len(records)} records in {time.perf_counter() - start:.2f}s, "
+          f"503s injected: {flaky.stats().get('treasury', {}).get('errors', 0)}")
+
+    # ---------------------- BEA ---------------------- #
+    bea = BEAClient(settings.api.bea_api_key)
+    start = time.perf_counter()
+    tables = [bea.get_nipa_data(f"T1010{i % 9}", frequency='Q') for i in range(12)]
+    bea_stats = server.stats().get('bea', {})
+    print(f"BEA       {len(tables)} tables in {time.perf_counter() - start:.2f}s, "
+          f"429s answered: {bea_stats.get('throttled', 0)}")
+
+    # ---------------------- BLS ---------------------- #
+    bls = BLSClient(settings.api.bls_api_key)
+    series = [f"CUUR{i:04d}SA0" for i in range(120)]
+    bls_rows = bls.get_many(series, 2024, 2025)
+    print(f"BLS       {len(bls_rows)} rows from {server.stats()['bls']['requests']} requests")
+
+    # ---------------------- FRED ---------------------- #
+    fred = FREDCollector()
+    csvs = [fred._get_fred_csv(sid) for sid in ('UNRATE', 'CPIAUCSL', 'FEDFUNDS')]
+    print(f"FRED      {sum(1 for c in csvs if c)} CSVs via {fred.fred_base_url}")
+
+    # ---------------------- Record / replay ---------------------- #
+    with tempfile.TemporaryDirectory() as cassette:
+        upstreams = {api: f"{server.url}/{api}" for api in UPSTREAMS}
+        with ReplayServer(ReplayConfig(mode='record', cassette_dir=Path(cassette), upstreams=upstreams)) as recorder:
+            recorded = requests.get(f"{recorder.url}/fmp/stable/ratios",
+                                    params={'symbol': 'MSFT', 'apikey': 'first-secret'}, timeout=10)
+        # Different seed: a synthetic answer would differ from the recorded one
+        with ReplayServer(ReplayConfig(mode='replay', cassette_dir=Path(cassette), seed=99)) as player:
+            replayed = requests.get(f"{player.url}/fmp/stable/ratios",
+                                    params={'symbol': 'MSFT', 'apikey': 'other-secret'}, timeout=10)
+            player_stats = player.stats()['fmp']
+        stored = b''.join(p.read_bytes() for p in Path(cassette).rglob('*') if p.is_file())
+    print("-" * 72)
+
+    checks += [
+        ("Clients use the base-URL settings",
+         all(u.startswith(server.url) for u in (url, bls.base_url, bea.base_url, fred.fred_base_url))
+         and treasury.base_url.startswith(flaky.url)),
+        ("FMP: every request succeeds through 429s", all(r is not None and r.status_code == 200 for r in responses)
+         and fmp.get('throttled', 0) > 0),
+        ("FMP: page/limit pagination ends on an empty page", pages == [100] * 9 + [50]),
+        ("Treasury: all records once, in order, despite 503s",
+         len(records) == 950 and len({r['cusip'] for r in records}) == 950
+         and records == sorted(records, key=lambda r: r['record_date'], reverse=True)),
+        ("BEA: every table through 429 + Retry-After",
+         all(len(t) > 0 for t in tables) and bea_stats.get('throttled', 0) > 0),
+        ("BLS: 120 series x 24 months in 3 requests", len(bls_rows) == 120 * 24
+         and server.stats()['bls']['requests'] == 3),
+        ("FRED: CSVs downloaded", all(c and c.startswith('observation_date') for c in csvs)),
+        ("Record/replay: same body for another key, key not stored",
+         recorded.status_code == 200 and replayed.content == recorded.content
+         and player_stats.get('replayed') == 1 and b'secret' not in stored),
+    ]
+
+    server.stop()
+    flaky.stop()
+
+    ok_all = True
+    for label, ok in checks:
+        ok_all = ok_all and ok
+        print(f"{label:<66} {'PASS' if ok else 'FAIL':>5}")
+    print("=" * 72)
+    return 0 if ok_all else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
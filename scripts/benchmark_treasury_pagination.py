@@ -0,0 +1,236 @@
+"""
+Benchmark: sequential vs. concurrent Fiscal Data pagination
+
+Starts a local stand-in for the Treasury Fiscal Data API that serves
+auctions_query pages from a fixture (synthetic by default, or a JSON file
+captured from the real API) with a configurable per-page latency, then
+times TreasuryClient.iter_pages() with different worker counts.
+
+Every run checks that all records arrive exactly once and in page order.
+The last run makes some pages fail with 503s to exercise resume: only the
+failed page is re-requested and already-delivered pages are not fetched again.
+
+No network or database needed.
+
+Usage:
+    python scripts/benchmark_treasury_pagination.py
+    python scripts/benchmark_treasury_pagination.py --records 20000 --latency 0.5 --workers 1 2 4 8
+    python scripts/benchmark_treasury_pagination.py --fixture auctions_query.json
+
+A fixture file is either a list of records or a saved API response
+({"data": [...], ...}); it is replayed in file order.
+"""
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.treasury.treasury_client import TreasuryClient
+
+ENDPOINT = TreasuryClient.ENDPOINTS['auctions_query']
+TERMS = ['2-Year', '5-Year', '7-Year', '10-Year', '20-Year', '30-Year', '9-Year 10-Month']
+
+
+# ===================== Fixture ===================== #
+
+def build_fixture(records: int) -> list:
+    """Synthetic auctions_query records, newest first like sort=-auction_date."""
+    data = []
+    start = date(2025, 12, 1)
+    for i in range(records):
+        term = TERMS[i % len(TERMS)]
+        data.append({
+            'record_date': (start - timedelta(days=i // 3)).isoformat(),
+            'cusip': f"912{i:06X}",
+            'security_type': 'Bond' if term in ('20-Year', '30-Year') else 'Note',
+            'security_term': term,
+            'auction_date': (start - timedelta(days=i // 3)).isoformat(),
+            'issue_date': (start - timedelta(days=i // 3 - 5)).isoformat(),
+            'offering_amt': str(40_000_000_000 + i),
+            'total_tendered': str(100_000_000_000 + i * 7),
+            'total_accepted': str(40_000_000_000 + i),
+            'bid_to_cover_ratio': '2.50',
+            'high_yield': f"{3 + (i % 200) / 100:.3f}",
+            'int_rate': f"{3 + (i % 200) / 100:.3f}",
+            'high_price': '99.875000',
+        })
+    return data
+
+
+def load_fixture(path: str) -> list:
+    """Records from a JSON file: a list of records or a saved API response."""
+    with open(path, encoding='utf-8') as f:
+        doc = json.load(f)
+    return doc['data'] if isinstance(doc, dict) else doc
+
+
+# ===================== Local Stand-in ===================== #
+
+class FiscalDataStandIn(ThreadingHTTPServer):
+    """
+    Serves fixture records with Fiscal Data paging (page[size], page[number],
+    meta.total-pages) on 127.0.0.1.
+
+    Attributes:
+        latency: Seconds each page request takes
+        failures: page number -> remaining 503 responses for that page
+        page_requests: page number -> times requested
+        max_in_flight: Highest number of concurrent requests seen
+    """
+
+    daemon_threads = True
+
+    def __init__(self, records: list, latency: float):
+        super().__init__(('127.0.0.1', 0), _StandInHandler)
+        self.records = records
+        self.latency = latency
+        self.failures = {}
+        self.page_requests = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def reset(self, failures=None):
+        with self.lock:
+            self.failures = dict(failures or {})
+            self.page_requests = {}
+            self.max_in_flight = 0
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    server: FiscalDataStandIn
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if not url.path.rstrip('/').endswith(ENDPOINT):
+            return self._send(404, {'error': 'Not Found', 'message': url.path})
+
+        query = parse_qs(url.query)
+        size = int(query.get('page[size]', ['100'])[0])
+        number = int(query.get('page[number]', ['1'])[0])
+
+        server = self.server
+        with server.lock:
+            server.page_requests[number] = server.page_requests.get(number, 0) + 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            fail = server.failures.get(number, 0) > 0
+            if fail:
+                server.failures[number] -= 1
+
+        try:
+            time.sleep(server.latency)
+            if fail:
+                return self._send(503, {'error': 'Service Unavailable'})
+
+            total = len(server.records)
+            page = server.records[(number - 1) * size:number * size]
+            self._send(200, {
+                'data': page,
+                'meta': {
+                    'count': len(page),
+                    'total-count': total,
+                    'total-pages': max(1, -(-total // size)),
+                },
+            })
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _send(self, status: int, body: dict):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+# ===================== Benchmark ===================== #
+
+def run(server: FiscalDataStandIn, workers: int, interval: float, page_size: int):
+    """Fetch every page; return (records, seconds)."""
+    client = TreasuryClient(
+        base_url=server.base_url,
+        max_workers=workers,
+        min_request_interval=interval,
+        max_retries=1,
+    )
+    start = time.perf_counter()
+    records = []
+    for page in client.iter_pages(ENDPOINT, {'sort': '-auction_date'}, page_size=page_size):
+        records.extend(page)
+    return records, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark concurrent Fiscal Data pagination')
+    parser.add_argument('--records', type=int, default=10_000, help='Synthetic fixture records')
+    parser.add_argument('--fixture', type=str, help='JSON fixture file instead of synthetic records')
+    parser.add_argument('--page-size', type=int, default=1000, help='Records per page')
+    parser.add_argument('--latency', type=float, default=0.4, help='Seconds per page request')
+    parser.add_argument('--interval', type=float, default=0.2,
+                        help='Client minimum seconds between request starts')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Worker counts to compare')
+    parser.add_argument('--fail-pages', type=int, nargs='*', default=[3, 7],
+                        help='Pages that return 503 once in the resume run')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(name)s - %(levelname)s - %(message)s')
+
+    records = load_fixture(args.fixture) if args.fixture else build_fixture(args.records)
+    server = FiscalDataStandIn(records, args.latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    pages = max(1, -(-len(records) // args.page_size))
+    print("=" * 64)
+    print(f"Fiscal Data pagination: {len(records):,} records, {pages} pages, "
+          f"{args.latency:.2f}s/page, {args.interval:.2f}s rate cap")
+    print("=" * 64)
+    print(f"{'Run':<24} {'Time (s)':>10} {'Requests':>10} {'In flight':>10} {'OK':>5}")
+    print("-" * 64)
+
+    baseline = None
+    ok_all = True
+    runs = [(f"workers={w}", w, None) for w in args.workers]
+    if args.fail_pages:
+        runs.append((f"workers={max(args.workers)}, 503s", max(args.workers),
+                     {p: 1 for p in args.fail_pages if p <= pages}))
+
+    for label, workers, failures in runs:
+        server.reset(failures)
+        fetched, elapsed = run(server, workers, args.interval, args.page_size)
+        ok = fetched == records
+        ok_all = ok_all and ok
+        requests_made = sum(server.page_requests.values())
+        print(f"{label:<24} {elapsed:>10.2f} {requests_made:>10} {server.max_in_flight:>10} "
+              f"{'PASS' if ok else 'FAIL':>5}")
+        if failures is None and workers == 1:
+            baseline = elapsed
+        elif failures is None and baseline:
+            print(f"{'':<24} {baseline / elapsed:>9.1f}x")
+
+    print("=" * 64)
+    server.shutdown()
+    return 0 if ok_all else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
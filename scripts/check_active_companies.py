@@ -26,7 +26,8 @@ def main():
 
     # Fetch data from API
     print("Fetching actively trading companies from FMP...")
-    url = "https://financialmodelingprep.com/stable/actively-trading-list"
+    base_url = os.getenv("FMP_BASE_URL", "https://financialmodelingprep.com")
+    url = f"{base_url}/stable/actively-trading-list"
     params = {"apikey": api_key}
 
     try:
@@ -13,6 +13,8 @@ from datetime import datetime, date, timedelta
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database.connection import get_session
+from src.database.query_tracer import traced_unit
+from src.utils import metrics
 from src.collectors.bulk_price_collector import BulkPriceCollector
 
 # Create logs directory if needed (BEFORE logging setup)
@@ -41,6 +43,7 @@ def parse_date(date_str: str) -> date:
         )
 
 
+@traced_unit('collect_bulk_eod')
 def main():
     parser = argparse.ArgumentParser(
         description='Collect bulk EOD prices from FMP API',
@@ -174,4 +177,5 @@ Examples:
 
 
 if __name__ == "__main__":
+    metrics.export_on_exit('collect_bulk_eod')
     sys.exit(main())
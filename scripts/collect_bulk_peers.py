@@ -49,6 +49,7 @@ def main():
             logger.info("="*80)
             logger.info(f"Symbols received: {result['symbols_received']:,}")
             logger.info(f"Symbols upserted: {result['symbols_inserted']:,}")
+            logger.info(f"Symbols changed:  {result['symbols_changed']:,}")
             logger.info("="*80)
             return 0
         else:
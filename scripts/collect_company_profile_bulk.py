@@ -71,6 +71,7 @@ Examples:
                 logger.info("="*80)
                 logger.info(f"Symbols received: {result['symbols_received']:,}")
                 logger.info(f"Symbols inserted/updated: {result['symbols_inserted']:,}")
+                logger.info(f"Parts loaded: {result['parts_loaded']}")
                 logger.info("="*80)
                 return 0
             else:
@@ -79,6 +80,10 @@ Examples:
                 logger.error("="*80)
                 if 'error' in result:
                     logger.error(f"Error: {result['error']}")
+                if result.get('parts_loaded'):
+                    # Loaded parts are kept; rerun to fetch the failed ones
+                    logger.error(f"Parts loaded: {result['parts_loaded']} "
+                                 f"({result['symbols_inserted']:,} symbols inserted/updated)")
                 logger.error("="*80)
                 return 1
 
@@ -13,6 +13,8 @@ from datetime import datetime, date, timedelta
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database.connection import get_session
+from src.database.query_tracer import traced_unit
+from src.utils import metrics
 from src.collectors.earnings_calendar_collector import EarningsCalendarCollector
 
 # Create logs directory if needed (BEFORE logging setup)
@@ -39,6 +41,7 @@ def parse_date(date_str: str) -> date:
         raise argparse.ArgumentTypeError(f"Invalid date format: {date_str}. Use YYYY-MM-DD")
 
 
+@traced_unit('collect_earnings_calendar')
 def main():
     parser = argparse.ArgumentParser(
         description='Collect earnings calendar data from FMP API',
@@ -59,6 +62,9 @@ Examples:
 
   # Backfill from specific date
   python scripts/collect_earnings_calendar.py --backfill-from 2020-01-01
+
+  # Rerun a backfill: chunks finished by an earlier run are skipped
+  python scripts/collect_earnings_calendar.py --backfill-from 2000-01-01 --workers 8
         """
     )
 
@@ -99,6 +105,19 @@ Examples:
         help='Backfill from specific start date to today'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        metavar='N',
+        help='Concurrent chunk requests during backfill (default: MAX_WORKERS)'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Backfill: refetch chunks completed by earlier runs'
+    )
+
     args = parser.parse_args()
 
     # Validate arguments
@@ -121,6 +140,7 @@ Examples:
 
     with get_session() as session:
         collector = EarningsCalendarCollector(session)
+        collector.force_refill = args.force
 
         # Determine collection mode
         if args.from_date and args.to_date:
@@ -148,10 +168,11 @@ Examples:
             start_date = date.today() - timedelta(days=args.backfill_days)
             end_date = date.today()
 
-            result = collector.collect_historical(start_date, end_date)
+            result = collector.collect_historical(start_date, end_date, workers=args.workers)
 
             logger.info(f"\n{'='*80}")
             logger.info(f"[COMPLETED] Backfill finished")
+            logger.info(f"  Chunks skipped (already complete): {result['chunks_skipped']}/{result['chunks_planned']}")
             logger.info(f"  Chunks successful: {result['chunks_successful']}/{result['chunks_processed']}")
             logger.info(f"  Total announcements: {result['total_announcements']:,}")
             logger.info(f"{'='*80}")
@@ -160,10 +181,11 @@ Examples:
         elif args.backfill_from:
             # Backfill from specific date
             logger.info(f"Mode: Backfill from {args.backfill_from}")
-            result = collector.collect_historical(args.backfill_from, date.today())
+            result = collector.collect_historical(args.backfill_from, date.today(), workers=args.workers)
 
             logger.info(f"\n{'='*80}")
             logger.info(f"[COMPLETED] Backfill finished")
+            logger.info(f"  Chunks skipped (already complete): {result['chunks_skipped']}/{result['chunks_planned']}")
             logger.info(f"  Chunks successful: {result['chunks_successful']}/{result['chunks_processed']}")
             logger.info(f"  Total announcements: {result['total_announcements']:,}")
             logger.info(f"{'='*80}")
@@ -192,4 +214,5 @@ Examples:
 
 
 if __name__ == "__main__":
+    metrics.export_on_exit('collect_earnings_calendar')
     sys.exit(main())
@@ -43,6 +43,10 @@ def main():
         print(f"Failed: {failed_count}")
         print(f"Records inserted: {collector.records_inserted:,}")
         print(f"{'='*80}")
+        print("THROUGHPUT BY STAGE")
+        for stage, s in collector.stage_timer.summary().items():
+            print(f"  {stage:<8} {s['rows']:>12,} rows {s['seconds']:>9.2f}s {s['rows_per_sec'] or 0:>12,.0f} rows/s")
+        print(f"{'='*80}")
 
         return 0 if failed_count == 0 else 1
 
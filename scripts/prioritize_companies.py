@@ -15,7 +15,7 @@ from src.config import settings
 
 def fetch_actively_trading_list():
     """Fetch actively trading companies from FMP API"""
-    url = "https://financialmodelingprep.com/stable/actively-trading-list"
+    url = f"{settings.endpoints.fmp_base_url}/stable/actively-trading-list"
     api_key = settings.api.fmp_api_key
     params = {"apikey": api_key}
 
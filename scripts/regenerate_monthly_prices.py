@@ -6,6 +6,9 @@ Useful for:
 - Fixing monthly price gaps after bulk daily backfills
 - Ensuring monthly data consistency
 - One-time cleanup or periodic maintenance
+
+Symbols are rolled up in batches, one SQL statement per batch
+(see PriceCollector.rollup_monthly_prices).
 """
 import sys
 import argparse
@@ -42,13 +45,15 @@ def get_all_symbols(session):
     return [r[0] for r in results]
 
 
-def regenerate_all(limit=None, symbols_list=None):
+def regenerate_all(limit=None, symbols_list=None, batch_size=500, touched_only=False):
     """
     Regenerate monthly prices for all symbols
 
     Args:
         limit: Maximum number of symbols to process (for testing)
         symbols_list: Optional specific list of symbols to process
+        batch_size: Symbols per rollup statement
+        touched_only: Only recompute months with daily rows added since the last rollup
 
     Returns:
         Exit code (0 = success, 1 = partial failure)
@@ -77,35 +82,37 @@ def regenerate_all(limit=None, symbols_list=None):
         # Initialize collector
         collector = PriceCollector(session)
 
-        # Process each symbol
+        # Process symbols in batches
         logger.info(f"\n{'='*80}")
-        logger.info("PROCESSING SYMBOLS")
+        logger.info(f"PROCESSING SYMBOLS ({'touched months' if touched_only else 'all months'}, "
+                    f"{batch_size} symbols per batch)")
         logger.info(f"{'='*80}\n")
 
         success_count = 0
+        months_written = 0
         failed_symbols = []
 
-        for i, symbol in enumerate(symbols, 1):
+        for start in range(0, len(symbols), batch_size):
+            batch = symbols[start:start + batch_size]
             try:
-                logger.info(f"[{i}/{len(symbols)}] {symbol}")
-                collector._generate_monthly_prices(symbol)
-                success_count += 1
+                months = collector.rollup_monthly_prices(batch, touched_only=touched_only)
+                months_written += months
+                success_count += len(batch)
+                logger.info(f"[{start + len(batch)}/{len(symbols)}] {len(batch)} symbols: "
+                            f"{months:,} monthly prices")
 
             except Exception as e:
-                logger.error(f"   {symbol}: Failed - {e}")
-                failed_symbols.append(symbol)
+                logger.error(f"   Batch {batch[0]}..{batch[-1]}: Failed - {e}")
+                failed_symbols.extend(batch)
                 session.rollback()
 
-            # Progress indicator every 100 symbols
-            if i % 100 == 0:
-                logger.info(f"\n  Progress: {i}/{len(symbols)} ({i/len(symbols)*100:.1f}%)\n")
-
         # Summary
         logger.info(f"\n{'='*80}")
         logger.info("REGENERATION COMPLETE")
         logger.info(f"{'='*80}")
         logger.info(f"Total symbols: {len(symbols):,}")
         logger.info(f"Successfully processed: {success_count:,}")
+        logger.info(f"Monthly prices written: {months_written:,}")
         logger.info(f"Failed: {len(failed_symbols)}")
 
         if failed_symbols:
@@ -135,6 +142,9 @@ Examples:
   # Regenerate specific symbols
   python scripts/regenerate_monthly_prices.py --symbols AAPL,MSFT,GOOGL
 
+  # Only months with daily prices added since the last run (e.g. after backfill_prices_from_bulk.py)
+  python scripts/regenerate_monthly_prices.py --touched-only
+
   # Read symbols from file
   python scripts/regenerate_monthly_prices.py --symbols-file data/priority_lists/priority1_active_in_db.txt
         """
@@ -159,6 +169,20 @@ Examples:
         help='File containing symbols (one per line or CSV)'
     )
 
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=500,
+        metavar='N',
+        help='Symbols per rollup statement (default: 500)'
+    )
+
+    parser.add_argument(
+        '--touched-only',
+        action='store_true',
+        help='Only recompute months with daily prices added since the last rollup'
+    )
+
     args = parser.parse_args()
 
     # Parse symbols if provided
@@ -195,7 +219,7 @@ Examples:
 
         logger.info(f"Loaded {len(symbols_list)} symbols from {symbols_file.name}")
 
-    return regenerate_all(args.limit, symbols_list)
+    return regenerate_all(args.limit, symbols_list, args.batch_size, args.touched_only)
 
 
 if __name__ == "__main__":
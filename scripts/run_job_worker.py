@@ -0,0 +1,84 @@
+"""
+Run Collection Job Workers
+
+Starts worker processes that execute jobs queued by the admin API
+(BEA backfills/updates, Treasury auction collection, BLS survey updates).
+Jobs survive restarts of both the API and the workers: a job whose worker
+dies is re-queued once its heartbeat goes stale.
+
+Usage:
+    python scripts/run_job_worker.py [options]
+
+Options:
+    --processes N       Number of worker processes (default: 2)
+    --job-types T ...   Only run these job types (e.g. bea.nipa treasury.auction_update)
+    --poll-interval S   Seconds between queue polls when idle (default: 5)
+    --once              Run at most one job in this process, then exit
+
+Examples:
+    # Two workers for everything
+    python scripts/run_job_worker.py
+
+    # A dedicated BLS worker
+    python scripts/run_job_worker.py --processes 1 --job-types bls.survey_update
+
+    # List queued jobs via the admin API
+    curl http://localhost:8000/api/v1/jobs?status=queued
+"""
+import argparse
+import io
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.jobs.job_queue import JOB_HANDLERS
+from src.jobs.job_worker import JobWorker, load_handlers, run_worker_pool
+
+# Create logs directory
+Path('logs').mkdir(exist_ok=True)
+
+# Setup logging with UTF-8 encoding
+utf8_stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('logs/job_worker.log', encoding='utf-8'),
+        logging.StreamHandler(utf8_stdout)
+    ]
+)
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run collection job workers')
+    parser.add_argument('--processes', type=int, default=2, help='Number of worker processes')
+    parser.add_argument('--job-types', nargs='+', help='Only run these job types')
+    parser.add_argument('--poll-interval', type=float, default=5.0, help='Seconds between polls when idle')
+    parser.add_argument('--once', action='store_true', help='Run at most one job, then exit')
+    args = parser.parse_args()
+
+    load_handlers()
+
+    unknown = [t for t in (args.job_types or []) if t not in JOB_HANDLERS]
+    if unknown:
+        logger.error(f"Unknown job types: {', '.join(unknown)}. Known: {', '.join(sorted(JOB_HANDLERS))}")
+        return 1
+
+    if args.once:
+        ran = JobWorker(job_types=args.job_types).run_once()
+        logger.info("Ran one job" if ran else "No runnable jobs")
+        return 0
+
+    logger.info(f"Job types: {', '.join(args.job_types or sorted(JOB_HANDLERS))}")
+    run_worker_pool(processes=args.processes, job_types=args.job_types, poll_interval=args.poll_interval)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database.connection import get_session
+from src.utils import metrics
 from src.collectors.economic_collector import EconomicCollector
 
 # Create logs directory if needed (BEFORE logging setup)
@@ -50,6 +51,7 @@ def update_economic_data():
 def main():
     """Run scheduler"""
     logger.info("Starting FinExus scheduler...")
+    metrics.start_metrics_server()
 
     # Schedule economic data update daily at 8:00 AM
     schedule.every().day.at("08:00").do(update_economic_data)
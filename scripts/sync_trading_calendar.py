@@ -0,0 +1,46 @@
+"""
+Sync Exchange Trading Calendar
+
+Writes NYSE closures (rule-based holidays plus special closures) into the
+trading_calendar table used by the price gap finders. The migration seeds
+1990-2035; run this to extend the range or after adding a special closure.
+
+Usage:
+    python scripts/sync_trading_calendar.py [--start-year 1990] [--end-year 2040]
+"""
+import argparse
+import logging
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database.connection import get_session
+from src.utils.trading_calendar import sync_trading_calendar
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sync NYSE closures into trading_calendar')
+    parser.add_argument('--start-year', type=int, default=1990, help='First year (default: 1990)')
+    parser.add_argument('--end-year', type=int, default=date.today().year + 10,
+                        help='Last year (default: ten years ahead)')
+    args = parser.parse_args()
+
+    with get_session() as session:
+        count = sync_trading_calendar(session, args.start_year, args.end_year)
+
+    logger.info(f"Wrote {count} closures for {args.start_year}-{args.end_year}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""
+Test: BEA rate limiter pacing simulation
+
+Drives BEARateLimiter with a fake clock and a set of simulated concurrent
+workers, then replays every request/response to check that no 60-second
+window ever exceeds BEA's limits (100 requests, 100 MB, 30 errors).
+
+Also checks that BEAFetchPipeline writes every result in the calling thread
+and stops early when the error handler asks it to.
+
+No API key or database needed.
+
+Usage:
+    python scripts/test_bea_rate_limiter.py
+"""
+import heapq
+import random
+import sys
+import threading
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.bea.rate_limiter import BEARateLimiter
+from src.bea.fetch_pipeline import BEAFetchPipeline, FetchTask
+
+MB = 1024 * 1024
+WINDOW = 60.0
+
+
+class FakeClock:
+    """Discrete-event clock: sleep() advances time and fires scheduled events."""
+
+    def __init__(self):
+        self.now = 0.0
+        self._events = []
+        self._seq = 0
+
+    def time(self) -> float:
+        return self.now
+
+    def schedule(self, at: float, callback):
+        self._seq += 1
+        heapq.heappush(self._events, (at, self._seq, callback))
+
+    def sleep(self, seconds: float):
+        self.advance_to(self.now + seconds)
+
+    def advance_to(self, target: float):
+        while self._events and self._events[0][0] <= target:
+            at, _, callback = heapq.heappop(self._events)
+            self.now = max(self.now, at)
+            callback()
+        self.now = max(self.now, target)
+
+    def next_event_time(self):
+        return self._events[0][0] if self._events else None
+
+
+def simulate(total_requests, workers, latency, response_bytes, error_rate, seed=0, **limiter_kwargs):
+    """
+    Run `total_requests` requests through `workers` simulated concurrent callers.
+
+    Returns:
+        (request start times, list of (completion time, bytes, is_error), end time)
+    """
+    rng = random.Random(seed)
+    clock = FakeClock()
+    limiter = BEARateLimiter(clock=clock.time, sleep=clock.sleep, **limiter_kwargs)
+
+    starts = []
+    completions = []
+    idle_workers = list(range(workers))
+    remaining = total_requests
+
+    def complete(permit, size, is_error, worker):
+        limiter.release(permit, byte_count=size, is_error=is_error)
+        completions.append((clock.now, size, is_error))
+        idle_workers.append(worker)
+
+    while remaining or clock.next_event_time() is not None:
+        if remaining and idle_workers:
+            worker = idle_workers.pop()
+            permit = limiter.acquire()  # may sleep, firing other workers' completions
+            starts.append(clock.now)
+            remaining -= 1
+
+            size = rng.randint(*response_bytes)
+            is_error = rng.random() < error_rate
+            done_at = clock.now + rng.uniform(*latency)
+            clock.schedule(done_at, lambda p=permit, s=size, e=is_error, w=worker: complete(p, s, e, w))
+        else:
+            clock.advance_to(clock.next_event_time())
+
+    return starts, completions, clock.now
+
+
+def max_in_window(times_and_values):
+    """Largest sum of values over any (t - 60, t] window, checked at every event time."""
+    events = sorted(times_and_values)
+    best = 0
+    lo = 0
+    running = 0
+    for t, value in events:
+        running += value
+        while events[lo][0] <= t - WINDOW:
+            running -= events[lo][1]
+            lo += 1
+        best = max(best, running)
+    return best
+
+
+def check_limits(starts, completions, max_requests=100, max_mb=100, max_errors=30):
+    peak_requests = max_in_window([(t, 1) for t in starts])
+    peak_bytes = max_in_window([(t, b) for t, b, _ in completions])
+    peak_errors = max_in_window([(t, 1) for t, _, e in completions if e])
+
+    assert peak_requests <= max_requests, f"requests/min peaked at {peak_requests}"
+    assert peak_bytes <= max_mb * MB, f"data/min peaked at {peak_bytes / MB:.1f} MB"
+    assert peak_errors <= max_errors, f"errors/min peaked at {peak_errors}"
+    return peak_requests, peak_bytes / MB, peak_errors
+
+
+def test_request_limit():
+    """Small fast responses: request rate is the binding limit."""
+    starts, completions, end = simulate(
+        total_requests=500, workers=8, latency=(0.2, 1.5),
+        response_bytes=(10_000, 200_000), error_rate=0.0,
+    )
+    peaks = check_limits(starts, completions)
+    assert peaks[0] == 100, "limiter should use the full request budget"
+    # 500 requests at 100/min cannot finish in under 4 minutes
+    assert end >= 4 * WINDOW
+    return peaks, end
+
+
+def test_data_volume_limit():
+    """Large responses: data volume is the binding limit."""
+    starts, completions, end = simulate(
+        total_requests=60, workers=6, latency=(1.0, 4.0),
+        response_bytes=(8 * MB, 20 * MB), error_rate=0.0,
+        bytes_estimate=20 * MB,
+    )
+    peaks = check_limits(starts, completions)
+    assert peaks[0] < 100, "request limit should not be the binding one"
+    return peaks, end
+
+
+def test_error_limit():
+    """Flaky upstream: errors/min must stay under the lockout threshold."""
+    starts, completions, end = simulate(
+        total_requests=400, workers=10, latency=(0.1, 0.8),
+        response_bytes=(1_000, 50_000), error_rate=0.5,
+    )
+    peaks = check_limits(starts, completions)
+    assert peaks[2] >= 25, "error budget should be nearly used, not starved"
+    return peaks, end
+
+
+def test_pause_blocks_all_callers():
+    """pause() (HTTP 429 Retry-After) holds back every caller sharing the limiter."""
+    clock = FakeClock()
+    limiter = BEARateLimiter(clock=clock.time, sleep=clock.sleep)
+
+    permit = limiter.acquire()
+    limiter.release(permit, byte_count=1000, is_error=True)
+    limiter.pause(30)
+
+    limiter.acquire()
+    assert clock.now >= 30, f"acquire returned at t={clock.now} during pause"
+    return clock.now
+
+
+def test_pipeline_single_writer():
+    """Results are written by the calling thread; an error handler can stop the run."""
+    caller = threading.current_thread()
+    writer_threads = set()
+    written = []
+
+    def fetch(i):
+        if i == 7:
+            raise RuntimeError("boom")
+        return i * i
+
+    def write(task, result):
+        writer_threads.add(threading.current_thread())
+        written.append((task.key, result))
+
+    tasks = [FetchTask(key=i, fetch=lambda i=i: fetch(i)) for i in range(20)]
+
+    completed = BEAFetchPipeline(max_workers=4).run(tasks, write, on_error=lambda t, e: True)
+    assert completed
+    assert writer_threads == {caller}
+    assert sorted(written) == [(i, i * i) for i in range(20) if i != 7]
+
+    written.clear()
+    completed = BEAFetchPipeline(max_workers=2, max_pending=2).run(tasks, write, on_error=lambda t, e: False)
+    assert not completed
+    assert all(key != 7 for key, _ in written)
+    assert len(written) < 19
+    return len(written)
+
+
+def main():
+    tests = [
+        test_request_limit,
+        test_data_volume_limit,
+        test_error_limit,
+        test_pause_blocks_all_callers,
+        test_pipeline_single_writer,
+    ]
+    failed = 0
+
+    print("=" * 60)
+    print("BEA rate limiter pacing simulation")
+    print("=" * 60)
+
+    for test in tests:
+        try:
+            result = test()
+            print(f"PASS  {test.__name__}: {result}")
+        except AssertionError as e:
+            failed += 1
+            print(f"FAIL  {test.__name__}: {e}")
+
+    print("=" * 60)
+    print(f"{len(tests) - failed}/{len(tests)} passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
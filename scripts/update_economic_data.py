@@ -11,6 +11,8 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database.connection import get_session
+from src.database.query_tracer import traced_unit
+from src.utils import metrics
 from src.collectors.economic_collector import EconomicCollector
 
 # Create logs directory if needed (BEFORE logging setup)
@@ -34,6 +36,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@traced_unit('update_economic_data')
 def main():
     """Run economic data update"""
     logger.info("=" * 80)
@@ -74,4 +77,5 @@ def main():
 
 
 if __name__ == "__main__":
+    metrics.export_on_exit('update_economic_data')
     sys.exit(main())
@@ -170,6 +170,7 @@ def main():
                 logger.info(f"Auctions fetched: {stats['auctions_fetched']}")
                 logger.info(f"Auctions inserted: {inserted}")
                 logger.info(f"Auctions updated: {updated}")
+                logger.info(f"Auctions unchanged: {stats['auctions_unchanged']}")
 
                 # Update freshness
                 from src.database.treasury_models import TreasuryAuction
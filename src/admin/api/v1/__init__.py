@@ -4,6 +4,7 @@ from fastapi import APIRouter
 from src.admin.api.v1 import freshness, quota, actions, cu_explorer, la_explorer, ce_explorer, ln_explorer
 from src.admin.api.v1 import bea_dashboard, bea_explorer, bea_actions, bea_sentinel
 from src.admin.api.v1 import treasury_dashboard, treasury_actions, treasury_explorer
+from src.admin.api.v1 import jobs
 
 # Create main API router
 api_router = APIRouter()
@@ -96,3 +97,10 @@ api_router.include_router(
     prefix="/treasury/explorer",
     tags=["treasury-explorer"],
 )
+
+# Collection job queue (BEA / Treasury / BLS background jobs)
+api_router.include_router(
+    jobs.router,
+    prefix="/jobs",
+    tags=["jobs"],
+)
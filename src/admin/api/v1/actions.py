@@ -3,14 +3,14 @@ BLS Actions API Endpoints
 
 Endpoints for triggering BLS operations:
 - Check freshness (compare BLS API with database)
-- Execute updates (soft or force)
+- Execute updates (soft or force), queued as jobs for the job workers
 - View update cycle status
 """
 import sys
 from pathlib import Path
 from typing import Optional, List
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 
@@ -22,6 +22,7 @@ from src.admin.core.database import get_db
 from src.database.bls_tracking_models import BLSUpdateCycle, BLSAPIUsageLog
 from src.bls.bls_client import BLSClient
 from src.bls import update_manager
+from src.bls import bls_jobs
 from src.bls import freshness_checker
 from src.config import settings
 
@@ -187,7 +188,6 @@ async def check_freshness(
 async def trigger_update(
     survey_code: str,
     request: UpdateTriggerRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -207,8 +207,8 @@ async def trigger_update(
     # Check current status
     status = update_manager.get_survey_status(db, survey_code)
 
-    # Check if update is already running
-    if status.get('is_running'):
+    # Check if update is already running (or queued)
+    if status.get('is_running') or bls_jobs.is_running(survey_code):
         return UpdateTriggerResponse(
             survey_code=survey_code,
             status="already_running",
@@ -253,67 +253,24 @@ async def trigger_update(
                 detail="No API quota remaining today. Please try again tomorrow."
             )
 
-    # Determine which API key and user agent to use
-    api_key_to_use = request.api_key if using_custom_key else settings.api.bls_api_key
-    user_agent_to_use = request.user_agent if (using_custom_key and request.user_agent) else None
-
-    # Capture values for background task (avoid closure issues)
-    _survey_code = survey_code
-    _force = request.force
-    _max_requests = max_requests
-    _using_custom_key = using_custom_key
-    _api_key = api_key_to_use
-    _user_agent = user_agent_to_use
-
-    # Execute update in background
-    def run_update():
-        """Run survey update in background"""
-        from src.database.connection import get_session
-
-        key_info = "custom key" if _using_custom_key else "system key"
-        agent_info = f", custom user-agent" if _user_agent else ""
-        print(f"[Actions] Starting {'force ' if _force else ''}update for {_survey_code} (max {_max_requests} requests, {key_info}{agent_info})")
-
-        try:
-            # Create a new database session for background task
-            with get_session() as bg_session:
-                # Create BLS client with appropriate key and user agent
-                client_kwargs = {"api_key": _api_key}
-                if _user_agent:
-                    client_kwargs["user_agent"] = _user_agent
-                client = BLSClient(**client_kwargs)
-
-                # Define progress callback
-                def progress_callback(progress):
-                    print(f"[Actions] {_survey_code} progress: {progress.series_updated}/{progress.total_series} series")
-
-                # Run the update (skip logging if using custom key)
-                result = update_manager.update_survey(
-                    survey_code=_survey_code,
-                    session=bg_session,
-                    client=client,
-                    force=_force,
-                    max_quota=_max_requests,
-                    progress_callback=progress_callback,
-                    skip_usage_logging=_using_custom_key
-                )
-
-                status_msg = "completed" if result.completed else "paused (session quota reached)"
-                print(f"[Actions] Update {status_msg} for {_survey_code}")
-                print(f"[Actions] Results: {result.series_updated} series, {result.observations_added} observations, {result.requests_used} requests")
-
-                if result.errors:
-                    print(f"[Actions] Errors encountered: {len(result.errors)}")
-                    for err in result.errors[:5]:
-                        print(f"[Actions]   - {err[:100]}")
-
-        except Exception as e:
-            print(f"[Actions] Exception running update for {_survey_code}: {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
+    # Queue the update; a job worker runs it (custom key/user agent travel with the job)
+    job_id = bls_jobs.enqueue_survey_update(
+        survey_code,
+        force=request.force,
+        max_requests=max_requests,
+        api_key=request.api_key if using_custom_key else None,
+        user_agent=request.user_agent if using_custom_key else None,
+    )
 
-    # Add to background tasks
-    background_tasks.add_task(run_update)
+    if job_id is None:
+        return UpdateTriggerResponse(
+            survey_code=survey_code,
+            status="already_running",
+            message=f"An update job for {survey_code} is already queued or running",
+            cycle_id=status['cycle_id'],
+            series_total=status['total_series'],
+            series_remaining=series_remaining
+        )
 
     # Get cycle ID (will be created by update_survey)
     # For now, return the current one or indicate new will be created
@@ -322,7 +279,7 @@ async def trigger_update(
     return UpdateTriggerResponse(
         survey_code=survey_code,
         status="started",
-        message=f"{'Force update' if request.force else 'Update'} started for {survey_code}",
+        message=f"{'Force update' if request.force else 'Update'} queued for {survey_code} (job {job_id})",
         cycle_id=cycle_id,
         series_total=status['total_series'],
         series_remaining=series_remaining
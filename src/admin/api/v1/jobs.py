@@ -0,0 +1,135 @@
+"""
+Collection Job Endpoints
+
+API endpoints for inspecting and controlling jobs in the collection job queue
+(BEA, Treasury and BLS collection runs executed by the job workers).
+
+Author: FinExus Data Collector
+Created: 2025-12-04
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel
+
+from src.database.job_models import CollectionJob
+from src.jobs.job_queue import SECRET_PARAMS, job_queue
+
+router = APIRouter()
+
+# Job parameters never echoed back by the API (while the job is active)
+REDACTED_PARAMS = SECRET_PARAMS
+
+
+# ==================== Response Models ==================== #
+
+class JobResponse(BaseModel):
+    """A collection job"""
+    job_id: int
+    job_type: str
+    status: str
+    params: Dict[str, Any]
+    concurrency_key: Optional[str] = None
+    attempts: int
+    max_attempts: int
+    cancel_requested: bool
+    run_id: Optional[int] = None
+    worker_id: Optional[str] = None
+    progress: Optional[Dict[str, Any]] = None
+    result: Optional[Dict[str, Any]] = None
+    error_message: Optional[str] = None
+    run_after: Optional[datetime] = None
+    heartbeat_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+
+class JobActionResponse(BaseModel):
+    """Response for cancel/retry requests"""
+    success: bool
+    message: str
+    status: Optional[str] = None
+
+
+def _to_response(job: CollectionJob) -> JobResponse:
+    params = {
+        k: ("***" if k in REDACTED_PARAMS and v else v)
+        for k, v in (job.params or {}).items()
+    }
+    return JobResponse(
+        job_id=job.job_id,
+        job_type=job.job_type,
+        status=job.status,
+        params=params,
+        concurrency_key=job.concurrency_key,
+        attempts=job.attempts,
+        max_attempts=job.max_attempts,
+        cancel_requested=job.cancel_requested,
+        run_id=job.run_id,
+        worker_id=job.worker_id,
+        progress=job.progress,
+        result=job.result,
+        error_message=job.error_message,
+        run_after=job.run_after,
+        heartbeat_at=job.heartbeat_at,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
+    )
+
+
+# ==================== Endpoints ==================== #
+
+@router.get("", response_model=List[JobResponse])
+async def list_jobs(
+    status: Optional[str] = Query(None, description="queued, running, completed, failed, cancelled"),
+    job_type: Optional[str] = Query(None, description="Job type prefix, e.g. 'bea.' or 'treasury.'"),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """
+    List recent jobs, newest first.
+    """
+    return [_to_response(job) for job in job_queue.list_jobs(status, job_type, limit)]
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: int):
+    """
+    Get a single job with its latest progress.
+    """
+    job = job_queue.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return _to_response(job)
+
+
+@router.post("/{job_id}/cancel", response_model=JobActionResponse)
+async def cancel_job(job_id: int):
+    """
+    Cancel a job.
+
+    Queued jobs are cancelled immediately; running jobs stop at their next
+    progress checkpoint (e.g. after the current table).
+    """
+    status = job_queue.cancel(job_id)
+    if status is None:
+        return JobActionResponse(success=False, message=f"Job {job_id} is not queued or running")
+
+    if status == "cancelled":
+        return JobActionResponse(success=True, message=f"Job {job_id} cancelled", status=status)
+    return JobActionResponse(
+        success=True,
+        message=f"Cancellation requested; job {job_id} stops at its next checkpoint",
+        status=status,
+    )
+
+
+@router.post("/{job_id}/retry", response_model=JobActionResponse)
+async def retry_job(job_id: int):
+    """
+    Re-queue a failed or cancelled job for one more attempt.
+    """
+    if not job_queue.retry(job_id):
+        return JobActionResponse(success=False, message=f"Job {job_id} is not failed or cancelled")
+    return JobActionResponse(success=True, message=f"Job {job_id} re-queued", status="queued")
@@ -16,6 +16,9 @@ from contextlib import asynccontextmanager
 
 from src.admin import __version__
 from src.admin.api.v1 import api_router
+from src.config import settings
+from src.database.query_tracer import QueryTraceMiddleware
+from src.utils import metrics
 
 
 @asynccontextmanager
@@ -51,6 +54,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Route latency metrics (labelled by route template), scraped from /metrics
+app.add_middleware(metrics.RouteMetricsMiddleware)
+metrics_app = metrics.asgi_metrics_app()
+if metrics_app is not None:
+    app.mount("/metrics", metrics_app)
+
+# Per-request SQL query counts and N+1 warnings (SQL_TRACE=True)
+if settings.database.trace_queries:
+    app.add_middleware(QueryTraceMiddleware)
+
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
 
@@ -5,10 +5,11 @@ A robust client for the BEA Data Retrieval API.
 Docs: https://apps.bea.gov/api/_pdf/bea_web_service_api_user_guide.pdf
 
 Key features:
-  - Rate limiting (100 requests/min, 100MB data/min, 30 errors/min)
+  - Rate limiting (100 requests/min, 100MB data/min, 30 errors/min), shared across threads
   - Automatic retry with exponential backoff
   - Support for all BEA API methods
   - NIPA and Regional dataset helpers
+  - Streaming row decoding (iter_data) for very large GetData responses
 
 Author: FinExus Data Collector
 Created: 2025-11-26
@@ -16,10 +17,15 @@ Created: 2025-11-26
 from __future__ import annotations
 import time
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 from datetime import datetime, UTC
 import requests
 
+from src.bea.json_stream import StreamedResponse
+from src.bea.rate_limiter import BEARateLimiter
+from src.config import settings
+from src.utils import metrics
+
 log = logging.getLogger("BEAClient")
 
 
@@ -50,6 +56,7 @@ class BEAClient:
     """
 
     BASE_URL = "https://apps.bea.gov/api/data"
+    STREAM_CHUNK_SIZE = 64 * 1024
 
     # Rate limits per BEA documentation
     MAX_REQUESTS_PER_MINUTE = 100
@@ -64,6 +71,8 @@ class BEAClient:
         timeout: int = 60,
         max_retries: int = 5,
         user_agent: str = "Finexus-BEAClient/1.0",
+        rate_limiter: Optional[BEARateLimiter] = None,
+        base_url: Optional[str] = None,
     ):
         """
         Initialize BEA API client.
@@ -74,6 +83,8 @@ class BEAClient:
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts for failed requests
             user_agent: User agent string for requests
+            rate_limiter: Optional limiter shared with other clients/threads using the same key
+            base_url: Override the API base URL (default: settings BEA_BASE_URL)
         """
         if not api_key or len(api_key) != 36:
             raise ValueError("BEA API key must be 36 characters")
@@ -81,13 +92,17 @@ class BEAClient:
         self.api_key = api_key
         self.session = session or requests.Session()
         self.session.headers.update({"User-Agent": user_agent})
+        metrics.instrument_http_session(self.session, "bea")
+        self.base_url = (base_url or settings.endpoints.bea_base_url).rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
 
-        # Rate limiting tracking
-        self._request_times: List[float] = []
-        self._error_times: List[float] = []
-        self._data_bytes: List[tuple[float, int]] = []  # (timestamp, bytes)
+        # Rate limiting (thread-safe, so one client can serve concurrent fetches)
+        self.rate_limiter = rate_limiter or BEARateLimiter(
+            max_requests_per_minute=self.MAX_REQUESTS_PER_MINUTE,
+            max_data_mb_per_minute=self.MAX_DATA_MB_PER_MINUTE,
+            max_errors_per_minute=self.MAX_ERRORS_PER_MINUTE,
+        )
 
     # ===================== Core API Methods ===================== #
 
@@ -168,6 +183,22 @@ class BEAClient:
         """
         return self._request("GetData", DatasetName=dataset_name, **params)
 
+    def iter_data(self, dataset_name: str, **params) -> Iterator[Dict[str, Any]]:
+        """
+        Stream data rows from a BEA dataset without loading the whole response.
+
+        Rows are decoded incrementally from Results.Data as bytes arrive, so
+        memory stays flat even for county-level "ALL" year requests.
+
+        Args:
+            dataset_name: Name of dataset
+            **params: Dataset-specific parameters
+
+        Yields:
+            Data records, in response order
+        """
+        return self._request_rows("GetData", DatasetName=dataset_name, **params)
+
     # ===================== NIPA Helpers ===================== #
 
     def get_nipa_tables(self) -> List[Dict[str, Any]]:
@@ -202,6 +233,27 @@ class BEAClient:
             ShowMillions=show_millons,
         )
 
+    def iter_nipa_data(
+        self,
+        table_name: str,
+        frequency: str = "A",
+        year: str = "ALL",
+        show_millons: str = "N",
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream NIPA data rows (see get_nipa_data for arguments).
+
+        Yields:
+            NIPA data records
+        """
+        return self.iter_data(
+            "NIPA",
+            TableName=table_name,
+            Frequency=frequency,
+            Year=year,
+            ShowMillions=show_millons,
+        )
+
     def get_nipa_data_years(
         self,
         table_name: str,
@@ -302,6 +354,27 @@ class BEAClient:
             Year=year,
         )
 
+    def iter_regional_data(
+        self,
+        table_name: str,
+        line_code: Union[int, str],
+        geo_fips: str = "STATE",
+        year: str = "ALL",
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream Regional data rows (see get_regional_data for arguments).
+
+        Yields:
+            Regional data records
+        """
+        return self.iter_data(
+            "Regional",
+            TableName=table_name,
+            LineCode=str(line_code),
+            GeoFips=geo_fips,
+            Year=year,
+        )
+
     def get_regional_data_years(
         self,
         table_name: str,
@@ -592,6 +665,13 @@ class BEAClient:
 
     # ===================== Request Handling ===================== #
 
+    def _acquire_permit(self):
+        """Block until the shared limiter admits a request, recording the wait."""
+        start = time.monotonic()
+        permit = self.rate_limiter.acquire()
+        metrics.observe_rate_limit_wait("bea", time.monotonic() - start)
+        return permit
+
     def _request(self, method: str, **params) -> Dict[str, Any]:
         """
         Make a request to the BEA API with rate limiting and retries.
@@ -603,48 +683,40 @@ class BEAClient:
         Returns:
             JSON response from API
         """
-        # Check rate limits before making request
-        self._check_rate_limits()
-
-        # Build request parameters
-        request_params = {
-            "UserID": self.api_key,
-            "method": method,
-            "ResultFormat": "JSON",
-            **params,
-        }
-
-        # Remove None values
-        request_params = {k: v for k, v in request_params.items() if v is not None}
+        request_params = self._build_params(method, **params)
 
         backoff = 1.0
         last_error = None
 
         for attempt in range(1, self.max_retries + 1):
-            try:
-                self._record_request()
+            # Blocks until the shared limiter admits another request
+            permit = self._acquire_permit()
+            byte_count = 0
+            is_error = False
+            retry_sleep = 0.0
 
+            try:
                 response = self.session.get(
-                    self.BASE_URL,
+                    self.base_url,
                     params=request_params,
                     timeout=self.timeout,
                 )
 
                 # Track data volume
-                content_length = len(response.content)
-                self._record_data_bytes(content_length)
+                byte_count = len(response.content)
 
                 # Handle HTTP 429 (rate limit)
                 if response.status_code == 429:
                     retry_after = int(response.headers.get("Retry-After", 60))
-                    self._record_error()
+                    is_error = True
+                    # Pause every thread sharing the limiter, not just this one
+                    self.rate_limiter.pause(retry_after)
                     log.warning(f"Rate limited. Waiting {retry_after}s before retry.")
-                    time.sleep(retry_after)
                     continue
 
                 # Handle server errors
                 if response.status_code >= 500:
-                    self._record_error()
+                    is_error = True
                     raise _RetryableError(f"Server error {response.status_code}")
 
                 response.raise_for_status()
@@ -652,11 +724,9 @@ class BEAClient:
                 data = response.json()
 
                 # Check for API-level errors
-                beaapi = data.get("BEAAPI", {})
-                if "Error" in beaapi:
-                    error = beaapi["Error"]
-                    error_msg = error.get("ErrorMessage", str(error))
-                    self._record_error()
+                error_msg = _api_error_message(data)
+                if error_msg:
+                    is_error = True
                     raise BEAAPIError(f"BEA API Error: {error_msg}")
 
                 return data
@@ -666,9 +736,8 @@ class BEAClient:
                 if attempt == self.max_retries:
                     raise BEAAPIError(f"Max retries exceeded: {e}") from e
 
-                sleep_time = backoff + _jitter(0.1, 0.5)
-                log.warning(f"{e}; retry {attempt}/{self.max_retries} in {sleep_time:.1f}s")
-                time.sleep(sleep_time)
+                retry_sleep = backoff + _jitter(0.1, 0.5)
+                log.warning(f"{e}; retry {attempt}/{self.max_retries} in {retry_sleep:.1f}s")
                 backoff = min(60, backoff * 2)
 
             except requests.RequestException as e:
@@ -676,80 +745,129 @@ class BEAClient:
                 if attempt == self.max_retries:
                     raise BEAAPIError(f"Request failed: {e}") from e
 
-                sleep_time = backoff + _jitter(0.1, 0.5)
+                retry_sleep = backoff + _jitter(0.1, 0.5)
                 log.warning(f"Network error: {e}; retry {attempt}/{self.max_retries}")
-                time.sleep(sleep_time)
                 backoff = min(60, backoff * 2)
 
+            finally:
+                self.rate_limiter.release(permit, byte_count=byte_count, is_error=is_error)
+
+            # Back off only after the permit is released, so other workers keep its slot
+            if retry_sleep:
+                metrics.rate_limited_sleep("bea", retry_sleep)
+
         raise BEAAPIError(f"Request failed after {self.max_retries} attempts: {last_error}")
 
-    # ===================== Rate Limiting ===================== #
-
-    def _check_rate_limits(self):
-        """Check and enforce rate limits before making a request."""
-        now = time.time()
-        minute_ago = now - 60
-
-        # Clean old entries
-        self._request_times = [t for t in self._request_times if t > minute_ago]
-        self._error_times = [t for t in self._error_times if t > minute_ago]
-        self._data_bytes = [(t, b) for t, b in self._data_bytes if t > minute_ago]
-
-        # Check request rate
-        if len(self._request_times) >= self.MAX_REQUESTS_PER_MINUTE:
-            wait_time = self._request_times[0] + 60 - now
-            if wait_time > 0:
-                log.info(f"Rate limit: waiting {wait_time:.1f}s (requests)")
-                time.sleep(wait_time + 0.1)
-
-        # Check error rate
-        if len(self._error_times) >= self.MAX_ERRORS_PER_MINUTE:
-            wait_time = self._error_times[0] + 60 - now
-            if wait_time > 0:
-                log.warning(f"Error rate limit: waiting {wait_time:.1f}s")
-                time.sleep(wait_time + 0.1)
-
-        # Check data volume
-        total_bytes = sum(b for _, b in self._data_bytes)
-        max_bytes = self.MAX_DATA_MB_PER_MINUTE * 1024 * 1024
-        if total_bytes >= max_bytes:
-            oldest_time = min(t for t, _ in self._data_bytes)
-            wait_time = oldest_time + 60 - now
-            if wait_time > 0:
-                log.info(f"Data rate limit: waiting {wait_time:.1f}s")
-                time.sleep(wait_time + 0.1)
-
-    def _record_request(self):
-        """Record a request timestamp for rate limiting."""
-        self._request_times.append(time.time())
-
-    def _record_error(self):
-        """Record an error timestamp for rate limiting."""
-        self._error_times.append(time.time())
-
-    def _record_data_bytes(self, byte_count: int):
-        """Record data volume for rate limiting."""
-        self._data_bytes.append((time.time(), byte_count))
+    def _request_rows(self, method: str, **params) -> Iterator[Dict[str, Any]]:
+        """
+        Make a streaming request and yield Results.Data rows as they are decoded.
+
+        Retries follow _request(), but only until the first row has been
+        yielded; an interruption after that raises BEAAPIError because the
+        caller has already consumed part of the response.
+
+        Args:
+            method: API method name
+            **params: Additional parameters
+
+        Yields:
+            Data records from the response
+        """
+        request_params = self._build_params(method, **params)
+
+        backoff = 1.0
+        last_error = None
+
+        for attempt in range(1, self.max_retries + 1):
+            permit = self._acquire_permit()
+            stream: Optional[StreamedResponse] = None
+            is_error = False
+            retry_sleep = 0.0
+
+            try:
+                with self.session.get(
+                    self.base_url,
+                    params=request_params,
+                    timeout=self.timeout,
+                    stream=True,
+                ) as response:
+                    # Handle HTTP 429 (rate limit)
+                    if response.status_code == 429:
+                        retry_after = int(response.headers.get("Retry-After", 60))
+                        is_error = True
+                        self.rate_limiter.pause(retry_after)
+                        log.warning(f"Rate limited. Waiting {retry_after}s before retry.")
+                        continue
+
+                    # Handle server errors
+                    if response.status_code >= 500:
+                        is_error = True
+                        raise _RetryableError(f"Server error {response.status_code}")
+
+                    response.raise_for_status()
+
+                    stream = StreamedResponse(response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE))
+                    try:
+                        yield from stream
+                    except ValueError as e:
+                        is_error = True
+                        raise BEAAPIError(f"Invalid JSON in BEA response: {e}") from e
+
+                    # Errors come back in the envelope (no Data array)
+                    error_msg = _api_error_message(stream.envelope or {})
+                    if error_msg:
+                        is_error = True
+                        raise BEAAPIError(f"BEA API Error: {error_msg}")
+                    return
+
+            except _RetryableError as e:
+                last_error = e
+                if attempt == self.max_retries:
+                    raise BEAAPIError(f"Max retries exceeded: {e}") from e
+
+                retry_sleep = backoff + _jitter(0.1, 0.5)
+                log.warning(f"{e}; retry {attempt}/{self.max_retries} in {retry_sleep:.1f}s")
+                backoff = min(60, backoff * 2)
+
+            except requests.RequestException as e:
+                last_error = e
+                if stream is not None and stream.rows_yielded:
+                    raise BEAAPIError(
+                        f"Response interrupted after {stream.rows_yielded} rows: {e}"
+                    ) from e
+                if attempt == self.max_retries:
+                    raise BEAAPIError(f"Request failed: {e}") from e
+
+                retry_sleep = backoff + _jitter(0.1, 0.5)
+                log.warning(f"Network error: {e}; retry {attempt}/{self.max_retries}")
+                backoff = min(60, backoff * 2)
+
+            finally:
+                byte_count = stream.bytes_read if stream is not None else 0
+                self.rate_limiter.release(permit, byte_count=byte_count, is_error=is_error)
+
+            if retry_sleep:
+                metrics.rate_limited_sleep("bea", retry_sleep)
+
+        raise BEAAPIError(f"Request failed after {self.max_retries} attempts: {last_error}")
+
+    def _build_params(self, method: str, **params) -> Dict[str, Any]:
+        """Build query parameters for a BEA API call."""
+        request_params = {
+            "UserID": self.api_key,
+            "method": method,
+            "ResultFormat": "JSON",
+            **params,
+        }
+
+        # Remove None values
+        return {k: v for k, v in request_params.items() if v is not None}
 
     # ===================== Utility Methods ===================== #
 
     def get_request_stats(self) -> Dict[str, Any]:
         """Get current rate limiting statistics."""
-        now = time.time()
-        minute_ago = now - 60
-
-        recent_requests = [t for t in self._request_times if t > minute_ago]
-        recent_errors = [t for t in self._error_times if t > minute_ago]
-        recent_bytes = sum(b for t, b in self._data_bytes if t > minute_ago)
-
-        return {
-            "requests_last_minute": len(recent_requests),
-            "errors_last_minute": len(recent_errors),
-            "data_mb_last_minute": recent_bytes / (1024 * 1024),
-            "requests_remaining": self.MAX_REQUESTS_PER_MINUTE - len(recent_requests),
-            "errors_remaining": self.MAX_ERRORS_PER_MINUTE - len(recent_errors),
-            "data_mb_remaining": self.MAX_DATA_MB_PER_MINUTE - (recent_bytes / (1024 * 1024)),
-        }
+        return self.rate_limiter.get_stats()
 
 
 # ===================== Exceptions ===================== #
@@ -766,6 +884,15 @@ class _RetryableError(Exception):
 
 # ===================== Helpers ===================== #
 
+def _api_error_message(data: Dict[str, Any]) -> Optional[str]:
+    """Return the BEA API-level error message in a response, if any."""
+    beaapi = data.get("BEAAPI", {})
+    if "Error" in beaapi:
+        error = beaapi["Error"]
+        return error.get("ErrorMessage", str(error))
+    return None
+
+
 def _jitter(min_val: float, max_val: float) -> float:
     """Add random jitter to prevent thundering herd."""
     import random
@@ -8,7 +8,8 @@ Author: FinExus Data Collector
 Created: 2025-11-26
 """
 from datetime import datetime, date, UTC
-from typing import Any, Dict, List, Optional, Callable
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Callable
 from decimal import Decimal
 import logging
 
@@ -17,6 +18,8 @@ from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from src.bea.bea_client import BEAClient, BEAAPIError
+from src.bea.fetch_pipeline import BEAFetchPipeline, FetchTask
+from src.bea.json_stream import iter_batches
 from src.database.bea_models import (
     BEADataset, NIPATable, NIPASeries, NIPAData,
     RegionalTable, RegionalLineCode, RegionalGeoFips, RegionalData,
@@ -31,6 +34,10 @@ from src.database.bea_tracking_models import (
 
 log = logging.getLogger("BEACollector")
 
+# Rows per multi-row upsert when storing NIPA/Regional data
+# (kept well under PostgreSQL's 65535 bind parameter limit)
+STORE_BATCH_SIZE = 5000
+
 
 # ===================== Year Specification Helper ===================== #
 
@@ -61,6 +68,11 @@ def convert_year_spec(year_spec: str) -> str:
     return year_spec
 
 
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether a fetch error means BEA is rate limiting us (stop instead of continuing)."""
+    return isinstance(error, BEAAPIError) and ('rate' in str(error).lower() or '429' in str(error))
+
+
 # ===================== Progress Tracking ===================== #
 
 class CollectionProgress:
@@ -254,6 +266,8 @@ class NIPACollector:
         """
         Collect data for a single NIPA table.
 
+        Rows are streamed from the response straight into batched upserts.
+
         Args:
             table_name: NIPA table name (e.g., 'T10101')
             frequency: 'A' (annual), 'Q' (quarterly), 'M' (monthly)
@@ -263,6 +277,32 @@ class NIPACollector:
         Returns:
             Dict with 'series_count' and 'data_points' counts
         """
+        rows = self.iter_table_data(table_name, frequency, year)
+
+        if progress:
+            progress.api_requests += 1
+
+        return self.store_table_data(table_name, rows, progress)
+
+    def fetch_table_data(
+        self,
+        table_name: str,
+        frequency: str = 'A',
+        year: str = 'ALL'
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch data rows for a single NIPA table without touching the database.
+
+        Safe to call from fetch pipeline worker threads.
+
+        Args:
+            table_name: NIPA table name (e.g., 'T10101')
+            frequency: 'A' (annual), 'Q' (quarterly), 'M' (monthly)
+            year: Year specification ('ALL', 'LAST5', 'LAST10', or comma-separated)
+
+        Returns:
+            List of data records
+        """
         # Convert year specification to actual years
         actual_year = convert_year_spec(year)
         log.info(f"Collecting NIPA table {table_name} ({frequency}, {actual_year})...")
@@ -272,41 +312,112 @@ class NIPACollector:
             frequency=frequency,
             year=actual_year,
         )
+        return self.client._extract_data(result)
 
-        if progress:
-            progress.api_requests += 1
+    def iter_table_data(
+        self,
+        table_name: str,
+        frequency: str = 'A',
+        year: str = 'ALL'
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream data rows for a single NIPA table as they are decoded.
 
-        data = self.client._extract_data(result)
+        The request is only made once iteration starts, so the rows must be
+        consumed in the thread that stores them.
 
-        if not data:
-            log.warning(f"No data returned for NIPA table {table_name}")
-            return {'series_count': 0, 'data_points': 0}
+        Args:
+            table_name: NIPA table name (e.g., 'T10101')
+            frequency: 'A' (annual), 'Q' (quarterly), 'M' (monthly)
+            year: Year specification ('ALL', 'LAST5', 'LAST10', or comma-separated)
+
+        Yields:
+            Data records
+        """
+        actual_year = convert_year_spec(year)
+        log.info(f"Collecting NIPA table {table_name} ({frequency}, {actual_year}), streaming...")
+
+        yield from self.client.iter_nipa_data(
+            table_name=table_name,
+            frequency=frequency,
+            year=actual_year,
+        )
+
+    def store_table_data(
+        self,
+        table_name: str,
+        data: Iterable[Dict[str, Any]],
+        progress: Optional[CollectionProgress] = None,
+        batch_size: int = STORE_BATCH_SIZE
+    ) -> Dict[str, int]:
+        """
+        Upsert NIPA rows (series and data points) for one table.
+
+        Rows are written in multi-row INSERT ... ON CONFLICT batches, so a
+        streamed response never has to be held in memory as a whole.
+
+        Args:
+            table_name: NIPA table name
+            data: Data records from fetch_table_data() or iter_table_data()
+            progress: Optional progress tracker
+            batch_size: Rows per upsert statement
 
+        Returns:
+            Dict with 'series_count' and 'data_points' counts
+        """
         now = datetime.now(UTC)
         series_seen = set()
         data_points = 0
 
-        for row in data:
-            series_code = row.get('SeriesCode', '')
-            if not series_code:
-                continue
+        for batch in iter_batches(data, batch_size):
+            new_series: Dict[str, Dict[str, Any]] = {}
+            points: Dict[tuple, Dict[str, Any]] = {}
+
+            for row in batch:
+                series_code = row.get('SeriesCode', '')
+                if not series_code:
+                    continue
+
+                if series_code not in series_seen:
+                    series_seen.add(series_code)
+                    new_series[series_code] = {
+                        'series_code': series_code,
+                        'table_name': table_name,
+                        'line_number': int(row.get('LineNumber', 0)),
+                        'line_description': row.get('LineDescription', ''),
+                        'metric_name': row.get('METRIC_NAME', ''),
+                        'cl_unit': row.get('CL_UNIT', ''),
+                        'unit_mult': int(row.get('UNIT_MULT', 0)) if row.get('UNIT_MULT') else None,
+                        'is_active': True,
+                        'created_at': now,
+                        'updated_at': now,
+                    }
 
-            # Upsert series if not seen yet
-            if series_code not in series_seen:
-                series_seen.add(series_code)
+                # Parse time period
+                time_period = row.get('TimePeriod', '')
 
-                stmt = insert(NIPASeries).values(
-                    series_code=series_code,
-                    table_name=table_name,
-                    line_number=int(row.get('LineNumber', 0)),
-                    line_description=row.get('LineDescription', ''),
-                    metric_name=row.get('METRIC_NAME', ''),
-                    cl_unit=row.get('CL_UNIT', ''),
-                    unit_mult=int(row.get('UNIT_MULT', 0)) if row.get('UNIT_MULT') else None,
-                    is_active=True,
-                    created_at=now,
-                    updated_at=now,
-                )
+                # Parse value
+                value_str = row.get('DataValue', '')
+                try:
+                    # Handle values with commas
+                    value = Decimal(value_str.replace(',', '')) if value_str and value_str not in ('', 'ND', '(ND)') else None
+                except:
+                    value = None
+
+                # A statement may not touch the same row twice; the last occurrence wins
+                points[(series_code, time_period)] = {
+                    'series_code': series_code,
+                    'time_period': time_period,
+                    'value': value,
+                    'note_ref': row.get('NoteRef', ''),
+                    'created_at': now,
+                    'updated_at': now,
+                }
+                data_points += 1
+
+            # Series first, so data points never reference a missing series
+            if new_series:
+                stmt = insert(NIPASeries).values(list(new_series.values()))
                 stmt = stmt.on_conflict_do_update(
                     index_elements=['series_code'],
                     set_={
@@ -319,36 +430,21 @@ class NIPACollector:
                 )
                 self.session.execute(stmt)
 
-            # Parse time period
-            time_period = row.get('TimePeriod', '')
-
-            # Parse value
-            value_str = row.get('DataValue', '')
-            try:
-                # Handle values with commas
-                value = Decimal(value_str.replace(',', '')) if value_str and value_str not in ('', 'ND', '(ND)') else None
-            except:
-                value = None
+            if points:
+                stmt = insert(NIPAData).values(list(points.values()))
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['series_code', 'time_period'],
+                    set_={
+                        'value': stmt.excluded.value,
+                        'note_ref': stmt.excluded.note_ref,
+                        'updated_at': now,
+                    }
+                )
+                self.session.execute(stmt)
 
-            # Upsert data point
-            stmt = insert(NIPAData).values(
-                series_code=series_code,
-                time_period=time_period,
-                value=value,
-                note_ref=row.get('NoteRef', ''),
-                created_at=now,
-                updated_at=now,
-            )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=['series_code', 'time_period'],
-                set_={
-                    'value': stmt.excluded.value,
-                    'note_ref': stmt.excluded.note_ref,
-                    'updated_at': now,
-                }
-            )
-            self.session.execute(stmt)
-            data_points += 1
+        if not data_points:
+            log.warning(f"No data returned for NIPA table {table_name}")
+            return {'series_count': 0, 'data_points': 0}
 
         self.session.commit()
 
@@ -365,7 +461,8 @@ class NIPACollector:
         year: str = 'ALL',
         tables: Optional[List[str]] = None,
         progress_callback: Optional[Callable[[CollectionProgress], None]] = None,
-        run_id: Optional[int] = None
+        run_id: Optional[int] = None,
+        max_workers: int = 1
     ) -> CollectionProgress:
         """
         Backfill all NIPA tables (or specified subset).
@@ -376,6 +473,7 @@ class NIPACollector:
             tables: Optional list of specific tables to backfill
             progress_callback: Optional callback for progress updates
             run_id: Optional existing run_id (if called from task_runner)
+            max_workers: Number of tables fetched concurrently (writes stay in this thread)
 
         Returns:
             CollectionProgress with results
@@ -420,21 +518,29 @@ class NIPACollector:
         skip_archival = year != 'ALL'
         archival_suffixes = ('A', 'B', 'C', 'D', 'E')
 
-        log.info(f"Starting NIPA backfill for {len(table_list)} tables ({frequency}, {year})...")
+        log.info(f"Starting NIPA backfill for {len(table_list)} tables ({frequency}, {year}, "
+                 f"workers={max_workers})...")
+
+        # One worker streams each response into the writer; several workers
+        # fetch whole responses so they can overlap
+        fetch_table = self.iter_table_data if max_workers <= 1 else self.fetch_table_data
 
+        fetch_tasks = []
         for table_name in table_list:
             # Skip archival tables when using recent years
             if skip_archival and table_name and table_name[-1] in archival_suffixes:
                 log.debug(f"Skipping archival table {table_name} (year={year})")
                 continue
+            fetch_tasks.append(FetchTask(
+                key=table_name,
+                fetch=partial(fetch_table, table_name, frequency, year),
+            ))
 
+        def write(task: FetchTask, data: Iterable[Dict[str, Any]]) -> bool:
+            table_name = task.key
+            progress.api_requests += 1
             try:
-                stats = self.collect_table_data(
-                    table_name=table_name,
-                    frequency=frequency,
-                    year=year,
-                    progress=progress,
-                )
+                stats = self.store_table_data(table_name, data, progress)
                 progress.tables_processed += 1
 
                 # Update table status
@@ -444,14 +550,9 @@ class NIPACollector:
                     progress_callback(progress)
 
             except BEAAPIError as e:
-                error_msg = f"Table {table_name}: {str(e)}"
-                log.error(error_msg)
-                progress.errors.append(error_msg)
-
-                # Check if rate limited
-                if 'rate' in str(e).lower() or '429' in str(e):
-                    log.warning("Rate limited, stopping collection")
-                    break
+                # Streamed responses fail while being stored
+                self.session.rollback()
+                return on_error(task, e)
 
             except Exception as e:
                 error_msg = f"Table {table_name}: {str(e)}"
@@ -459,6 +560,20 @@ class NIPACollector:
                 progress.errors.append(error_msg)
                 self.session.rollback()
 
+            return True
+
+        def on_error(task: FetchTask, e: Exception) -> bool:
+            error_msg = f"Table {task.key}: {str(e)}"
+            log.error(error_msg)
+            progress.errors.append(error_msg)
+
+            if is_rate_limit_error(e):
+                log.warning("Rate limited, stopping collection")
+                return False
+            return True
+
+        BEAFetchPipeline(max_workers).run(fetch_tasks, write, on_error)
+
         progress.end_time = datetime.now(UTC)
 
         # Complete collection run
@@ -714,6 +829,8 @@ class RegionalCollector:
         """
         Collect data for a Regional table/line_code combination.
 
+        Rows are streamed from the response straight into batched upserts.
+
         Args:
             table_name: Regional table name
             line_code: Line code for specific statistic
@@ -724,6 +841,34 @@ class RegionalCollector:
         Returns:
             Dict with 'data_points' count
         """
+        rows = self.iter_table_data(table_name, line_code, geo_fips, year)
+
+        if progress:
+            progress.api_requests += 1
+
+        return self.store_table_data(table_name, line_code, rows, progress)
+
+    def fetch_table_data(
+        self,
+        table_name: str,
+        line_code: int,
+        geo_fips: str = 'STATE',
+        year: str = 'ALL'
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch data rows for a Regional table/line_code without touching the database.
+
+        Safe to call from fetch pipeline worker threads.
+
+        Args:
+            table_name: Regional table name
+            line_code: Line code for specific statistic
+            geo_fips: Geographic scope ('STATE', 'COUNTY', 'MSA', or specific FIPS)
+            year: Year specification
+
+        Returns:
+            List of data records
+        """
         # Convert year specification to actual years
         actual_year = convert_year_spec(year)
         log.info(f"Collecting Regional {table_name}, line {line_code}, geo {geo_fips}, year {actual_year}...")
@@ -734,37 +879,132 @@ class RegionalCollector:
             geo_fips=geo_fips,
             year=actual_year,
         )
+        return self.client._extract_data(result)
 
-        if progress:
-            progress.api_requests += 1
+    def iter_table_data(
+        self,
+        table_name: str,
+        line_code: int,
+        geo_fips: str = 'STATE',
+        year: str = 'ALL'
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream data rows for a Regional table/line_code as they are decoded.
 
-        data = self.client._extract_data(result)
+        County-level requests with all years are the largest BEA responses;
+        streaming keeps memory flat regardless of response size. The request
+        is only made once iteration starts.
 
-        if not data:
-            log.warning(f"No data returned for {table_name}/{line_code}/{geo_fips}")
-            return {'data_points': 0}
+        Args:
+            table_name: Regional table name
+            line_code: Line code for specific statistic
+            geo_fips: Geographic scope ('STATE', 'COUNTY', 'MSA', or specific FIPS)
+            year: Year specification
+
+        Yields:
+            Data records
+        """
+        actual_year = convert_year_spec(year)
+        log.info(f"Collecting Regional {table_name}, line {line_code}, geo {geo_fips}, "
+                 f"year {actual_year}, streaming...")
+
+        yield from self.client.iter_regional_data(
+            table_name=table_name,
+            line_code=line_code,
+            geo_fips=geo_fips,
+            year=actual_year,
+        )
+
+    def store_table_data(
+        self,
+        table_name: str,
+        line_code: int,
+        data: Iterable[Dict[str, Any]],
+        progress: Optional[CollectionProgress] = None,
+        batch_size: int = STORE_BATCH_SIZE
+    ) -> Dict[str, int]:
+        """
+        Upsert Regional rows for one table/line_code.
+
+        Rows are written in multi-row INSERT ... ON CONFLICT batches, so a
+        streamed response never has to be held in memory as a whole.
+
+        Args:
+            table_name: Regional table name
+            line_code: Line code the rows belong to
+            data: Data records from fetch_table_data() or iter_table_data()
+            progress: Optional progress tracker
+            batch_size: Rows per upsert statement
 
+        Returns:
+            Dict with 'data_points' count
+        """
         now = datetime.now(UTC)
         data_points = 0
         geo_fips_seen = set()
+        line_code_stored = False
+
+        for batch in iter_batches(data, batch_size):
+            new_geo_fips: Dict[str, Dict[str, Any]] = {}
+            points: Dict[tuple, Dict[str, Any]] = {}
+
+            for row in batch:
+                row_geo_fips = row.get('GeoFips', '')
+                if not row_geo_fips:
+                    continue
+
+                # Ensure geo FIPS exists in reference table
+                if row_geo_fips not in geo_fips_seen:
+                    geo_fips_seen.add(row_geo_fips)
+                    new_geo_fips[row_geo_fips] = {
+                        'geo_fips': row_geo_fips,
+                        'geo_name': row.get('GeoName', ''),
+                        'geo_type': self._classify_geo_fips(row_geo_fips),
+                        'created_at': now,
+                        'updated_at': now,
+                    }
 
-        for row in data:
-            row_geo_fips = row.get('GeoFips', '')
-            if not row_geo_fips:
-                continue
+                # Ensure line code exists (described by the first row)
+                if not line_code_stored:
+                    line_code_stored = True
+                    stmt = insert(RegionalLineCode).values(
+                        table_name=table_name,
+                        line_code=line_code,
+                        line_description=row.get('Description', ''),
+                        cl_unit=row.get('CL_UNIT', ''),
+                        unit_mult=int(row.get('UNIT_MULT', 0)) if row.get('UNIT_MULT') else None,
+                        created_at=now,
+                    )
+                    stmt = stmt.on_conflict_do_nothing()
+                    self.session.execute(stmt)
 
-            # Ensure geo FIPS exists in reference table
-            if row_geo_fips not in geo_fips_seen:
-                geo_fips_seen.add(row_geo_fips)
-                geo_type = self._classify_geo_fips(row_geo_fips)
+                # Parse time period (year)
+                time_period = row.get('TimePeriod', '')
 
-                stmt = insert(RegionalGeoFips).values(
-                    geo_fips=row_geo_fips,
-                    geo_name=row.get('GeoName', ''),
-                    geo_type=geo_type,
-                    created_at=now,
-                    updated_at=now,
-                )
+                # Parse value
+                value_str = row.get('DataValue', '')
+                try:
+                    value = Decimal(value_str.replace(',', '')) if value_str and value_str not in ('', 'NA', '(NA)', '(D)') else None
+                except:
+                    value = None
+
+                # A statement may not touch the same row twice; the last occurrence wins
+                points[(row_geo_fips, time_period)] = {
+                    'table_name': table_name,
+                    'line_code': line_code,
+                    'geo_fips': row_geo_fips,
+                    'time_period': time_period,
+                    'value': value,
+                    'cl_unit': row.get('CL_UNIT', ''),
+                    'unit_mult': int(row.get('UNIT_MULT', 0)) if row.get('UNIT_MULT') else None,
+                    'note_ref': row.get('NoteRef', ''),
+                    'created_at': now,
+                    'updated_at': now,
+                }
+                data_points += 1
+
+            if new_geo_fips:
+                stmt = insert(RegionalGeoFips).values(list(new_geo_fips.values()))
                 stmt = stmt.on_conflict_do_update(
                     index_elements=['geo_fips'],
                     set_={
@@ -774,53 +1014,23 @@ class RegionalCollector:
                 )
                 self.session.execute(stmt)
 
-            # Ensure line code exists
-            stmt = insert(RegionalLineCode).values(
-                table_name=table_name,
-                line_code=line_code,
-                line_description=row.get('Description', ''),
-                cl_unit=row.get('CL_UNIT', ''),
-                unit_mult=int(row.get('UNIT_MULT', 0)) if row.get('UNIT_MULT') else None,
-                created_at=now,
-            )
-            stmt = stmt.on_conflict_do_nothing()
-            self.session.execute(stmt)
-
-            # Parse time period (year)
-            time_period = row.get('TimePeriod', '')
-
-            # Parse value
-            value_str = row.get('DataValue', '')
-            try:
-                value = Decimal(value_str.replace(',', '')) if value_str and value_str not in ('', 'NA', '(NA)', '(D)') else None
-            except:
-                value = None
+            if points:
+                stmt = insert(RegionalData).values(list(points.values()))
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=['table_name', 'line_code', 'geo_fips', 'time_period'],
+                    set_={
+                        'value': stmt.excluded.value,
+                        'cl_unit': stmt.excluded.cl_unit,
+                        'unit_mult': stmt.excluded.unit_mult,
+                        'note_ref': stmt.excluded.note_ref,
+                        'updated_at': now,
+                    }
+                )
+                self.session.execute(stmt)
 
-            # Upsert data point
-            stmt = insert(RegionalData).values(
-                table_name=table_name,
-                line_code=line_code,
-                geo_fips=row_geo_fips,
-                time_period=time_period,
-                value=value,
-                cl_unit=row.get('CL_UNIT', ''),
-                unit_mult=int(row.get('UNIT_MULT', 0)) if row.get('UNIT_MULT') else None,
-                note_ref=row.get('NoteRef', ''),
-                created_at=now,
-                updated_at=now,
-            )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=['table_name', 'line_code', 'geo_fips', 'time_period'],
-                set_={
-                    'value': stmt.excluded.value,
-                    'cl_unit': stmt.excluded.cl_unit,
-                    'unit_mult': stmt.excluded.unit_mult,
-                    'note_ref': stmt.excluded.note_ref,
-                    'updated_at': now,
-                }
-            )
-            self.session.execute(stmt)
-            data_points += 1
+        if not data_points:
+            log.warning(f"No data returned for {table_name}/{line_code}")
+            return {'data_points': 0}
 
         self.session.commit()
 
@@ -835,7 +1045,8 @@ class RegionalCollector:
         table_name: str,
         geo_fips: str = 'STATE',
         year: str = 'ALL',
-        progress: Optional[CollectionProgress] = None
+        progress: Optional[CollectionProgress] = None,
+        max_workers: int = 1
     ) -> Dict[str, int]:
         """
         Backfill all line codes for a Regional table.
@@ -845,6 +1056,7 @@ class RegionalCollector:
             geo_fips: Geographic scope
             year: Year specification
             progress: Optional progress tracker
+            max_workers: Number of line codes fetched concurrently (writes stay in this thread)
 
         Returns:
             Dict with 'line_codes' and 'data_points' counts
@@ -859,26 +1071,54 @@ class RegionalCollector:
         line_codes = [lc[0] for lc in line_codes]
 
         total_points = 0
+        rate_limit_error: Optional[Exception] = None
 
-        for line_code in line_codes:
-            try:
-                stats = self.collect_table_data(
-                    table_name=table_name,
-                    line_code=line_code,
-                    geo_fips=geo_fips,
-                    year=year,
-                    progress=progress,
-                )
-                total_points += stats['data_points']
+        # One worker streams each response into the writer; several workers
+        # fetch whole responses so they can overlap
+        fetch_line = self.iter_table_data if max_workers <= 1 else self.fetch_table_data
 
+        def write(task: FetchTask, data: Iterable[Dict[str, Any]]) -> bool:
+            nonlocal total_points
+            if progress:
+                progress.api_requests += 1
+            try:
+                stats = self.store_table_data(table_name, task.key, data, progress)
             except BEAAPIError as e:
-                log.error(f"Error collecting {table_name}/{line_code}: {e}")
-                if progress:
-                    progress.errors.append(f"{table_name}/{line_code}: {str(e)}")
+                # Streamed responses fail while being stored
+                self.session.rollback()
+                return on_error(task, e)
+            total_points += stats['data_points']
+            return True
 
-                # Check if rate limited
-                if 'rate' in str(e).lower() or '429' in str(e):
-                    raise
+        def on_error(task: FetchTask, e: Exception) -> bool:
+            nonlocal rate_limit_error
+            if not isinstance(e, BEAAPIError):
+                raise e
+
+            log.error(f"Error collecting {table_name}/{task.key}: {e}")
+            if progress:
+                progress.errors.append(f"{table_name}/{task.key}: {str(e)}")
+
+            # Check if rate limited
+            if is_rate_limit_error(e):
+                rate_limit_error = e
+                return False
+            return True
+
+        BEAFetchPipeline(max_workers).run(
+            [
+                FetchTask(
+                    key=line_code,
+                    fetch=partial(fetch_line, table_name, line_code, geo_fips, year),
+                )
+                for line_code in line_codes
+            ],
+            write,
+            on_error,
+        )
+
+        if rate_limit_error:
+            raise rate_limit_error
 
         return {'line_codes': len(line_codes), 'data_points': total_points}
 
@@ -888,7 +1128,8 @@ class RegionalCollector:
         year: str = 'ALL',
         tables: Optional[List[str]] = None,
         progress_callback: Optional[Callable[[CollectionProgress], None]] = None,
-        run_id: Optional[int] = None
+        run_id: Optional[int] = None,
+        max_workers: int = 1
     ) -> CollectionProgress:
         """
         Backfill all Regional tables (or specified subset).
@@ -899,6 +1140,7 @@ class RegionalCollector:
             tables: Optional list of specific tables
             progress_callback: Optional callback for progress updates
             run_id: Optional existing run_id (if called from task_runner)
+            max_workers: Number of line codes fetched concurrently per table
 
         Returns:
             CollectionProgress with results
@@ -932,7 +1174,8 @@ class RegionalCollector:
                 tables_filter=tables
             )
 
-        log.info(f"Starting Regional backfill for {len(table_list)} tables (geo={geo_fips}, {year})...")
+        log.info(f"Starting Regional backfill for {len(table_list)} tables (geo={geo_fips}, {year}, "
+                 f"workers={max_workers})...")
 
         for table_name in table_list:
             try:
@@ -941,6 +1184,7 @@ class RegionalCollector:
                     geo_fips=geo_fips,
                     year=year,
                     progress=progress,
+                    max_workers=max_workers,
                 )
                 progress.tables_processed += 1
 
@@ -955,7 +1199,7 @@ class RegionalCollector:
                 log.error(error_msg)
                 progress.errors.append(error_msg)
 
-                if 'rate' in str(e).lower() or '429' in str(e):
+                if is_rate_limit_error(e):
                     log.warning("Rate limited, stopping collection")
                     break
 
@@ -1188,6 +1432,34 @@ class GDPByIndustryCollector:
         Returns:
             Dict with 'industries_count' and 'data_points' counts
         """
+        data = self.fetch_table_data(table_id, frequency, year, industry)
+
+        if progress:
+            progress.api_requests += 1
+
+        return self.store_table_data(table_id, frequency, data, progress)
+
+    def fetch_table_data(
+        self,
+        table_id: int,
+        frequency: str = 'A',
+        year: str = 'ALL',
+        industry: str = 'ALL'
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch data rows for a single GDP by Industry table without touching the database.
+
+        Safe to call from fetch pipeline worker threads.
+
+        Args:
+            table_id: Table ID
+            frequency: 'A' (annual) or 'Q' (quarterly)
+            year: Year specification ('ALL' or comma-separated years)
+            industry: Industry code ('ALL' or comma-separated codes)
+
+        Returns:
+            List of data records
+        """
         # Convert year specification to actual years
         actual_year = convert_year_spec(year)
         log.info(f"Collecting GDP by Industry table {table_id} ({frequency}, {actual_year})...")
@@ -1198,12 +1470,27 @@ class GDPByIndustryCollector:
             year=actual_year,
             industry=industry,
         )
+        return self.client._extract_data(result)
 
-        if progress:
-            progress.api_requests += 1
+    def store_table_data(
+        self,
+        table_id: int,
+        frequency: str,
+        data: List[Dict[str, Any]],
+        progress: Optional[CollectionProgress] = None
+    ) -> Dict[str, int]:
+        """
+        Upsert fetched GDP by Industry rows for one table.
 
-        data = self.client._extract_data(result)
+        Args:
+            table_id: Table ID
+            frequency: 'A' (annual) or 'Q' (quarterly)
+            data: Data records from fetch_table_data()
+            progress: Optional progress tracker
 
+        Returns:
+            Dict with 'industries_count' and 'data_points' counts
+        """
         if not data:
             log.warning(f"No data returned for GDP by Industry table {table_id}")
             return {'industries_count': 0, 'data_points': 0}
@@ -1323,7 +1610,8 @@ class GDPByIndustryCollector:
         year: str = 'ALL',
         tables: Optional[List[int]] = None,
         progress_callback: Optional[Callable[[CollectionProgress], None]] = None,
-        run_id: Optional[int] = None
+        run_id: Optional[int] = None,
+        max_workers: int = 1
     ) -> CollectionProgress:
         """
         Backfill all GDP by Industry tables (or specified subset).
@@ -1334,6 +1622,7 @@ class GDPByIndustryCollector:
             tables: Optional list of specific table IDs to backfill
             progress_callback: Optional callback for progress updates
             run_id: Optional existing run_id (if called from task_runner)
+            max_workers: Number of tables fetched concurrently (writes stay in this thread)
 
         Returns:
             CollectionProgress with results
@@ -1368,25 +1657,27 @@ class GDPByIndustryCollector:
                 tables_filter=[str(t) for t in tables] if tables else None
             )
 
-        log.info(f"Starting GDP by Industry backfill for {len(table_list)} tables ({frequency}, {year})...")
+        log.info(f"Starting GDP by Industry backfill for {len(table_list)} tables ({frequency}, {year}, "
+                 f"workers={max_workers})...")
 
-        for table_id in table_list:
-            try:
-                # Check if table supports the requested frequency
-                if frequency == 'Q':
-                    table_info = self.session.query(GDPByIndustryTable).filter(
-                        GDPByIndustryTable.table_id == table_id
-                    ).first()
-                    if table_info and not table_info.has_quarterly:
-                        log.debug(f"Skipping table {table_id}: does not support quarterly data")
-                        continue
+        # Check which tables support the requested frequency before fetching
+        if frequency == 'Q':
+            no_quarterly = {
+                r[0] for r in self.session.query(GDPByIndustryTable.table_id).filter(
+                    GDPByIndustryTable.table_id.in_(table_list),
+                    GDPByIndustryTable.has_quarterly == False
+                ).all()
+            }
+            for table_id in table_list:
+                if table_id in no_quarterly:
+                    log.debug(f"Skipping table {table_id}: does not support quarterly data")
+            table_list = [t for t in table_list if t not in no_quarterly]
 
-                stats = self.collect_table_data(
-                    table_id=table_id,
-                    frequency=frequency,
-                    year=year,
-                    progress=progress,
-                )
+        def write(task: FetchTask, data: List[Dict[str, Any]]):
+            table_id = task.key
+            progress.api_requests += 1
+            try:
+                stats = self.store_table_data(table_id, frequency, data, progress)
                 progress.tables_processed += 1
 
                 # Update table status
@@ -1395,22 +1686,32 @@ class GDPByIndustryCollector:
                 if progress_callback:
                     progress_callback(progress)
 
-            except BEAAPIError as e:
-                error_msg = f"Table {table_id}: {str(e)}"
-                log.error(error_msg)
-                progress.errors.append(error_msg)
-
-                # Check if rate limited
-                if 'rate' in str(e).lower() or '429' in str(e):
-                    log.warning("Rate limited, stopping collection")
-                    break
-
             except Exception as e:
                 error_msg = f"Table {table_id}: {str(e)}"
                 log.error(error_msg)
                 progress.errors.append(error_msg)
                 self.session.rollback()
 
+        def on_error(task: FetchTask, e: Exception) -> bool:
+            error_msg = f"Table {task.key}: {str(e)}"
+            log.error(error_msg)
+            progress.errors.append(error_msg)
+
+            # Check if rate limited
+            if is_rate_limit_error(e):
+                log.warning("Rate limited, stopping collection")
+                return False
+            return True
+
+        BEAFetchPipeline(max_workers).run(
+            [
+                FetchTask(key=table_id, fetch=partial(self.fetch_table_data, table_id, frequency, year))
+                for table_id in table_list
+            ],
+            write,
+            on_error,
+        )
+
         progress.end_time = datetime.now(UTC)
 
         # Complete collection run
@@ -1655,14 +1956,38 @@ class ITACollector:
         Returns:
             Dict with collection statistics
         """
-        from src.database.bea_models import ITAData
+        data = self.fetch_indicator_data(indicator_code, frequency, year)
+
+        if progress:
+            progress.api_requests += 1
+
+        return self.store_indicator_data(indicator_code, frequency, data, progress)
+
+    def fetch_indicator_data(
+        self,
+        indicator_code: str,
+        frequency: str = 'A',
+        year: str = 'ALL',
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch data rows for an ITA indicator without touching the database.
+
+        Safe to call from fetch pipeline worker threads.
+
+        Args:
+            indicator_code: Indicator code (e.g., 'BalGds')
+            frequency: 'A', 'QSA', or 'QNSA'
+            year: Year specification
 
+        Returns:
+            List of data records
+        """
         year_param = convert_year_spec(year)
 
         log.info(f"Collecting ITA {indicator_code}, freq {frequency}, year {year_param}...")
 
         try:
-            data = self.client.get_ita_data_by_indicator(
+            return self.client.get_ita_data_by_indicator(
                 indicator=indicator_code,
                 frequency=frequency,
                 year=year_param,
@@ -1671,8 +1996,26 @@ class ITACollector:
             log.error(f"ITA indicator {indicator_code}: {e}")
             raise
 
-        if progress:
-            progress.api_requests += 1
+    def store_indicator_data(
+        self,
+        indicator_code: str,
+        frequency: str,
+        data: List[Dict[str, Any]],
+        progress: Optional[CollectionProgress] = None,
+    ) -> Dict[str, int]:
+        """
+        Upsert fetched ITA rows for one indicator.
+
+        Args:
+            indicator_code: Indicator code
+            frequency: 'A', 'QSA', or 'QNSA'
+            data: Data records from fetch_indicator_data()
+            progress: Optional progress tracker
+
+        Returns:
+            Dict with collection statistics
+        """
+        from src.database.bea_models import ITAData
 
         if not data:
             log.warning(f"No data returned for indicator {indicator_code}")
@@ -1779,7 +2122,8 @@ class ITACollector:
         year: str = 'ALL',
         indicators: Optional[List[str]] = None,
         progress_callback: Optional[Callable[[CollectionProgress], None]] = None,
-        run_id: Optional[int] = None
+        run_id: Optional[int] = None,
+        max_workers: int = 1
     ) -> CollectionProgress:
         """
         Backfill all ITA indicators (or specified subset).
@@ -1790,6 +2134,7 @@ class ITACollector:
             indicators: Optional list of specific indicators to backfill
             progress_callback: Optional callback for progress updates
             run_id: Optional existing run_id (if called from task_runner)
+            max_workers: Number of indicators fetched concurrently (writes stay in this thread)
 
         Returns:
             CollectionProgress with results
@@ -1822,38 +2167,46 @@ class ITACollector:
                 tables_filter=indicators
             )
 
-        log.info(f"Starting ITA backfill for {len(indicator_list)} indicators ({frequency}, {year})...")
+        log.info(f"Starting ITA backfill for {len(indicator_list)} indicators ({frequency}, {year}, "
+                 f"workers={max_workers})...")
 
-        for indicator_code in indicator_list:
+        def write(task: FetchTask, data: List[Dict[str, Any]]):
+            indicator_code = task.key
+            progress.api_requests += 1
             try:
-                stats = self.collect_indicator_data(
-                    indicator_code=indicator_code,
-                    frequency=frequency,
-                    year=year,
-                    progress=progress,
-                )
+                stats = self.store_indicator_data(indicator_code, frequency, data, progress)
                 progress.tables_processed += 1
                 progress.series_processed += stats.get('areas_count', 0)
 
                 if progress_callback:
                     progress_callback(progress)
 
-            except BEAAPIError as e:
-                error_msg = f"Indicator {indicator_code}: {str(e)}"
-                log.error(error_msg)
-                progress.errors.append(error_msg)
-
-                # Check if rate limited
-                if 'rate' in str(e).lower() or '429' in str(e):
-                    log.warning("Rate limited, stopping collection")
-                    break
-
             except Exception as e:
                 error_msg = f"Indicator {indicator_code}: {str(e)}"
                 log.error(error_msg)
                 progress.errors.append(error_msg)
                 self.session.rollback()
 
+        def on_error(task: FetchTask, e: Exception) -> bool:
+            error_msg = f"Indicator {task.key}: {str(e)}"
+            log.error(error_msg)
+            progress.errors.append(error_msg)
+
+            # Check if rate limited
+            if is_rate_limit_error(e):
+                log.warning("Rate limited, stopping collection")
+                return False
+            return True
+
+        BEAFetchPipeline(max_workers).run(
+            [
+                FetchTask(key=code, fetch=partial(self.fetch_indicator_data, code, frequency, year))
+                for code in indicator_list
+            ],
+            write,
+            on_error,
+        )
+
         progress.end_time = datetime.now(UTC)
 
         # Complete collection run
@@ -1994,15 +2347,8 @@ class FixedAssetsCollector:
         Note:
             Fixed Assets only supports annual data.
         """
-        # Convert year specification to actual years
-        actual_year = convert_year_spec(year)
-        log.info(f"Collecting Fixed Assets {table_name}, year {actual_year}...")
-
         try:
-            result = self.client.get_fixedassets_data(
-                table_name=table_name,
-                year=actual_year,
-            )
+            data = self.fetch_table_data(table_name, year)
         except BEAAPIError as e:
             log.error(f"Table {table_name}: {e}")
             if progress:
@@ -2012,8 +2358,48 @@ class FixedAssetsCollector:
         if progress:
             progress.api_requests += 1
 
-        data = self.client._extract_data(result)
+        return self.store_table_data(table_name, data, progress)
+
+    def fetch_table_data(self, table_name: str, year: str = 'ALL') -> List[Dict[str, Any]]:
+        """
+        Fetch data rows for a single Fixed Assets table without touching the database.
+
+        Safe to call from fetch pipeline worker threads.
+
+        Args:
+            table_name: Fixed Assets table name (e.g., 'FAAt201')
+            year: Year specification ('ALL', 'LAST5', 'LAST10', or comma-separated)
+
+        Returns:
+            List of data records
+        """
+        # Convert year specification to actual years
+        actual_year = convert_year_spec(year)
+        log.info(f"Collecting Fixed Assets {table_name}, year {actual_year}...")
+
+        result = self.client.get_fixedassets_data(
+            table_name=table_name,
+            year=actual_year,
+        )
+        return self.client._extract_data(result)
+
+    def store_table_data(
+        self,
+        table_name: str,
+        data: List[Dict[str, Any]],
+        progress: Optional[CollectionProgress] = None
+    ) -> Dict[str, int]:
+        """
+        Upsert fetched Fixed Assets rows (series and data points) for one table.
+
+        Args:
+            table_name: Fixed Assets table name
+            data: Data records from fetch_table_data()
+            progress: Optional progress tracker
 
+        Returns:
+            Dict with 'series_count' and 'data_points' counts
+        """
         if not data:
             log.warning(f"No data returned for Fixed Assets table {table_name}")
             return {'series_count': 0, 'data_points': 0}
@@ -2100,7 +2486,8 @@ class FixedAssetsCollector:
         year: str = 'ALL',
         tables: Optional[List[str]] = None,
         progress_callback: Optional[Callable[[CollectionProgress], None]] = None,
-        run_id: Optional[int] = None
+        run_id: Optional[int] = None,
+        max_workers: int = 1
     ) -> CollectionProgress:
         """
         Backfill all Fixed Assets tables (or specified subset).
@@ -2110,6 +2497,7 @@ class FixedAssetsCollector:
             tables: Optional list of specific tables to backfill
             progress_callback: Optional callback for progress updates
             run_id: Optional existing run_id (if called from task_runner)
+            max_workers: Number of tables fetched concurrently (writes stay in this thread)
 
         Returns:
             CollectionProgress with results
@@ -2142,15 +2530,14 @@ class FixedAssetsCollector:
                 tables_filter=tables
             )
 
-        log.info(f"Starting Fixed Assets backfill for {len(table_list)} tables (year={year})...")
+        log.info(f"Starting Fixed Assets backfill for {len(table_list)} tables (year={year}, "
+                 f"workers={max_workers})...")
 
-        for table_name in table_list:
+        def write(task: FetchTask, data: List[Dict[str, Any]]):
+            table_name = task.key
+            progress.api_requests += 1
             try:
-                stats = self.collect_table_data(
-                    table_name=table_name,
-                    year=year,
-                    progress=progress,
-                )
+                stats = self.store_table_data(table_name, data, progress)
                 progress.tables_processed += 1
 
                 # Update table status
@@ -2162,6 +2549,21 @@ class FixedAssetsCollector:
             except Exception as e:
                 log.error(f"Error collecting {table_name}: {e}")
                 progress.errors.append(f"{table_name}: {str(e)}")
+                self.session.rollback()
+
+        def on_error(task: FetchTask, e: Exception) -> bool:
+            log.error(f"Table {task.key}: {e}")
+            progress.errors.append(f"{task.key}: {str(e)}")
+            return not is_rate_limit_error(e)
+
+        BEAFetchPipeline(max_workers).run(
+            [
+                FetchTask(key=table_name, fetch=partial(self.fetch_table_data, table_name, year))
+                for table_name in table_list
+            ],
+            write,
+            on_error,
+        )
 
         # Update freshness tracking
         self._update_freshness(progress)
@@ -0,0 +1,124 @@
+"""
+BEA Fetch Pipeline
+
+Runs BEA GetData calls on a small thread pool while a single writer (the
+calling thread, which owns the SQLAlchemy session) stores each response as
+it arrives. All fetch threads share the BEAClient's rate limiter, so BEA's
+requests/data/errors-per-minute limits hold no matter how many workers run.
+
+Usage:
+    pipeline = BEAFetchPipeline(max_workers=4)
+    pipeline.run(
+        tasks=[FetchTask(key=name, fetch=partial(fetch_table, name)) for name in tables],
+        write=lambda task, data: store_table(task.key, data),
+        on_error=lambda task, exc: handle_error(task.key, exc),  # False stops the run
+    )
+
+Author: FinExus Data Collector
+Created: 2025-12-02
+"""
+from __future__ import annotations
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional
+
+log = logging.getLogger("BEAFetchPipeline")
+
+
+@dataclass
+class FetchTask:
+    """One unit of fetch work (e.g. a table or a table/line code pair)."""
+    key: Any
+    fetch: Callable[[], Any]
+
+
+class BEAFetchPipeline:
+    """
+    Concurrent fetch stage feeding a single writer stage.
+
+    At most `max_workers` fetches run at once and at most `max_pending`
+    fetched-but-unwritten responses are held, so memory stays bounded even
+    when the writer is slower than the network.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: Optional[int] = None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            max_workers: Number of concurrent fetch threads
+            max_pending: Maximum fetches submitted but not yet written (default: 2 x workers)
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(self.max_workers, max_pending or self.max_workers * 2)
+
+    def run(
+        self,
+        tasks: Iterable[FetchTask],
+        write: Callable[[FetchTask, Any], Optional[bool]],
+        on_error: Optional[Callable[[FetchTask, Exception], bool]] = None,
+    ) -> bool:
+        """
+        Fetch all tasks concurrently and write results in the calling thread.
+
+        Args:
+            tasks: Fetch tasks to run
+            write: Called with (task, result) in the calling thread for each success;
+                   returning False stops the run
+            on_error: Called with (task, exception) for each failed fetch; returning
+                      False stops the run (e.g. when BEA starts rate limiting).
+                      Without a handler, the first error is re-raised.
+
+        Returns:
+            True if every task was processed, False if the run was stopped early
+        """
+        task_iter = iter(tasks)
+        pending: Dict[Future, FetchTask] = {}
+        stopped = False
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bea-fetch") as pool:
+
+            def submit_more():
+                while not stopped and len(pending) < self.max_pending:
+                    task = next(task_iter, None)
+                    if task is None:
+                        return
+                    pending[pool.submit(task.fetch)] = task
+
+            submit_more()
+
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        task = pending.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            if on_error is None:
+                                raise
+                            if not on_error(task, e):
+                                stopped = True
+                            continue
+
+                        if write(task, result) is False:
+                            stopped = True
+
+                    if stopped:
+                        # Drop queued fetches; ones already running finish but are discarded
+                        for future in pending:
+                            future.cancel()
+                        pending.clear()
+                        log.warning("Fetch pipeline stopped early")
+                        break
+
+                    submit_more()
+
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        return not stopped
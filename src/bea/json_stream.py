@@ -0,0 +1,216 @@
+"""
+Incremental JSON decoding for BEA GetData responses
+
+BEA wraps data rows as BEAAPI.Results.Data (or BEAAPI.Results[0].Data for
+GDPbyIndustry). County-level Regional and long NIPA histories can be hundreds
+of MB, so instead of response.json() this module scans the byte stream, yields
+each element of the first "Data" array as soon as it is complete, and keeps
+only the small envelope around it (Request, Dimensions, Notes, Error) for a
+final json.loads().
+
+Only the standard library is used: the envelope is scanned character by
+character (it is small), while each data row is decoded with
+json.JSONDecoder.raw_decode.
+
+Author: FinExus Data Collector
+Created: 2025-12-03
+"""
+from __future__ import annotations
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+DATA_KEYS = ('"Data"', '"data"')
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+class StreamedResponse:
+    """
+    Iterate data rows from a chunked BEA JSON response.
+
+    Usage:
+        stream = StreamedResponse(response.iter_content(chunk_size=65536))
+        for row in stream:
+            ...
+        envelope = stream.envelope   # full document with "Data": [] (after iteration)
+    """
+
+    def __init__(self, chunks: Iterable[bytes], encoding: str = 'utf-8'):
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        self._exhausted = False
+
+        self.bytes_read = 0
+        self.rows_yielded = 0
+        self.envelope: Optional[Dict[str, Any]] = None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        head, buf = self._scan_to_data_array()
+
+        if buf is None:
+            # No Data array (e.g. an error response); head holds the whole document
+            self.envelope = json.loads(head) if head.strip() else {}
+            return
+
+        pos = 0
+        while True:
+            # Skip separators between elements
+            while True:
+                while pos < len(buf) and (buf[pos] in _WHITESPACE or buf[pos] == ','):
+                    pos += 1
+                if pos < len(buf):
+                    break
+                buf, pos = self._read_more(buf, pos)
+                if buf is None:
+                    raise ValueError("Malformed or truncated BEA response inside Data array")
+
+            if buf[pos] == ']':
+                pos += 1
+                break
+
+            try:
+                row, end = _decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # Element split across chunks: read more and retry from the same position
+                more, pos = self._read_more(buf, pos)
+                if more is None:
+                    raise ValueError("Malformed or truncated BEA response inside Data array")
+                buf = more
+                continue
+
+            pos = end
+            self.rows_yielded += 1
+            yield row
+
+            # Drop consumed text so the buffer stays around one chunk in size
+            if pos > 65536:
+                buf, pos = buf[pos:], 0
+
+        tail = buf[pos:] + self._read_rest()
+        self.envelope = json.loads(head + '[]' + tail)
+
+    # ===================== Internals ===================== #
+
+    def _next_text(self) -> Optional[str]:
+        """Next decoded text chunk, or None when the stream is exhausted."""
+        while not self._exhausted:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._exhausted = True
+                return self._text_decoder.decode(b'', final=True) or None
+            if not chunk:
+                continue
+            self.bytes_read += len(chunk)
+            text = self._text_decoder.decode(chunk)
+            if text:
+                return text
+        return None
+
+    def _read_more(self, buf: str, pos: int):
+        """Append the next chunk to the unconsumed part of buf. Returns (buf, 0) or (None, pos)."""
+        text = self._next_text()
+        if text is None:
+            return None, pos
+        return buf[pos:] + text, 0
+
+    def _read_rest(self) -> str:
+        parts = []
+        while True:
+            text = self._next_text()
+            if text is None:
+                return ''.join(parts)
+            parts.append(text)
+
+    def _scan_to_data_array(self):
+        """
+        Scan the envelope up to the opening bracket of the first "Data" array.
+
+        Returns:
+            (head, buf): head is the text up to and including the "Data": key,
+            buf is the remaining text starting just after '['. buf is None if
+            the document has no Data array, in which case head is the whole document.
+        """
+        head_parts = []
+        buf = ''
+        pos = 0
+        in_string = False
+        escape = False
+        string_start = -1
+        pending_key: Optional[str] = None  # last completed string, if it may be a key
+
+        while True:
+            if pos >= len(buf):
+                head_parts.append(buf)
+                text = self._next_text()
+                if text is None:
+                    return ''.join(head_parts), None
+                # Keep an unfinished string token in the new buffer so it can be matched
+                if in_string and string_start >= 0:
+                    carry = head_parts.pop()[string_start:]
+                    head_parts.append(buf[:string_start])
+                    buf = carry + text
+                    pos = len(carry)
+                    string_start = 0
+                else:
+                    buf = text
+                    pos = 0
+                continue
+
+            ch = buf[pos]
+
+            if in_string:
+                if escape:
+                    escape = False
+                elif ch == '\\':
+                    escape = True
+                elif ch == '"':
+                    in_string = False
+                    pending_key = buf[string_start:pos + 1]
+                    string_start = -1
+                pos += 1
+                continue
+
+            if ch == '"':
+                in_string = True
+                string_start = pos
+                pending_key = None
+            elif ch == ':':
+                if pending_key in DATA_KEYS:
+                    # Look ahead for '[' (possibly after whitespace / in the next chunk)
+                    look = pos + 1
+                    while True:
+                        while look < len(buf) and buf[look] in _WHITESPACE:
+                            look += 1
+                        if look < len(buf):
+                            break
+                        text = self._next_text()
+                        if text is None:
+                            return ''.join(head_parts) + buf, None
+                        buf += text
+                    if buf[look] == '[':
+                        head_parts.append(buf[:pos + 1])
+                        return ''.join(head_parts), buf[look + 1:]
+                pending_key = None
+            elif ch not in _WHITESPACE:
+                pending_key = None
+
+            pos += 1
+
+
+def iter_json_rows(chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    """Convenience wrapper: yield Data rows from chunked JSON, discarding the envelope."""
+    yield from StreamedResponse(chunks)
+
+
+def iter_batches(rows: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Group a row iterator into lists of at most batch_size rows."""
+    batch: List[Dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
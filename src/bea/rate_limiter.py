@@ -0,0 +1,213 @@
+"""
+BEA Rate Limiter
+
+Thread-safe sliding-window limiter shared by every thread that talks to the
+BEA API through one BEAClient (or several clients handed the same limiter).
+
+BEA enforces three per-minute limits per UserID and locks the key out for an
+hour when any of them is exceeded:
+  - 100 requests per minute
+  - 100 MB of response data per minute
+  - 30 errors per minute
+
+Request counts are known before a call is made, but response sizes and errors
+are only known afterwards. To keep concurrent callers under the data and error
+limits, each admitted request holds a reservation until it is released:
+  - one potential error (so in-flight requests can never push errors over)
+  - an estimated response size (at least the largest response in the window)
+
+The data limit therefore holds as long as responses are no larger than that
+estimate; datasets with very large responses should pass a bigger
+bytes_estimate.
+
+Author: FinExus Data Collector
+Created: 2025-12-02
+"""
+from __future__ import annotations
+import threading
+import time
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Tuple
+
+log = logging.getLogger("BEARateLimiter")
+
+
+@dataclass
+class RatePermit:
+    """An admitted request; must be passed back to BEARateLimiter.release()."""
+    issued_at: float
+    reserved_bytes: int
+
+
+class BEARateLimiter:
+    """
+    Sliding-window limiter for BEA requests, data volume and errors.
+
+    Usage:
+        limiter = BEARateLimiter()
+
+        permit = limiter.acquire()          # blocks until all windows allow it
+        try:
+            response = session.get(...)
+            limiter.release(permit, byte_count=len(response.content))
+        except Exception:
+            limiter.release(permit, is_error=True)
+            raise
+
+    The clock and sleep functions can be injected so pacing can be simulated
+    without waiting in real time.
+    """
+
+    WINDOW_SECONDS = 60.0
+    # Extra wait past the window edge so clock skew/rounding never lands on the boundary
+    SAFETY_MARGIN = 0.1
+
+    def __init__(
+        self,
+        max_requests_per_minute: int = 100,
+        max_data_mb_per_minute: int = 100,
+        max_errors_per_minute: int = 30,
+        bytes_estimate: int = 1024 * 1024,
+        poll_interval: float = 0.25,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_requests_per_minute: Request limit per sliding minute
+            max_data_mb_per_minute: Response data limit (MB) per sliding minute
+            max_errors_per_minute: Error limit per sliding minute
+            bytes_estimate: Minimum bytes reserved per in-flight request (raised to the
+                            largest response seen in the window)
+            poll_interval: Seconds to wait when blocked only by in-flight reservations
+            clock: Monotonic time source (seconds)
+            sleep: Sleep function used while waiting for capacity
+        """
+        self.max_requests = max_requests_per_minute
+        self.max_bytes = max_data_mb_per_minute * 1024 * 1024
+        self.max_errors = max_errors_per_minute
+        self.poll_interval = poll_interval
+        self._clock = clock
+        self._sleep = sleep
+
+        self._lock = threading.Lock()
+        self._request_times: Deque[float] = deque()
+        self._error_times: Deque[float] = deque()
+        self._data_bytes: Deque[Tuple[float, int]] = deque()  # (timestamp, bytes)
+        self._window_bytes = 0
+
+        self._in_flight = 0
+        self._reserved_bytes = 0
+        self._bytes_estimate = bytes_estimate
+        self._paused_until = 0.0
+
+    # ===================== Public API ===================== #
+
+    def acquire(self) -> RatePermit:
+        """
+        Block until a request can be issued without breaking any limit.
+
+        Returns:
+            RatePermit to hand back to release() once the response is in
+        """
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._prune(now)
+                wait_time, reason = self._wait_time(now)
+
+                if wait_time <= 0:
+                    reserved = self._reservation()
+                    self._request_times.append(now)
+                    self._in_flight += 1
+                    self._reserved_bytes += reserved
+                    return RatePermit(issued_at=now, reserved_bytes=reserved)
+
+            log.debug(f"Rate limit: waiting {wait_time:.2f}s ({reason})")
+            self._sleep(wait_time)
+
+    def release(self, permit: RatePermit, byte_count: int = 0, is_error: bool = False):
+        """
+        Settle an admitted request.
+
+        Args:
+            permit: Permit returned by acquire()
+            byte_count: Size of the response body in bytes
+            is_error: Whether the request counts as an error for BEA
+        """
+        with self._lock:
+            now = self._clock()
+            self._in_flight -= 1
+            self._reserved_bytes -= permit.reserved_bytes
+
+            if byte_count:
+                self._data_bytes.append((now, byte_count))
+                self._window_bytes += byte_count
+
+            if is_error:
+                self._error_times.append(now)
+
+    def pause(self, seconds: float):
+        """Stop admitting requests for all callers (e.g. after HTTP 429 Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get current rate limiting statistics."""
+        with self._lock:
+            self._prune(self._clock())
+            data_mb = self._window_bytes / (1024 * 1024)
+            return {
+                "requests_last_minute": len(self._request_times),
+                "errors_last_minute": len(self._error_times),
+                "data_mb_last_minute": data_mb,
+                "requests_remaining": self.max_requests - len(self._request_times),
+                "errors_remaining": self.max_errors - len(self._error_times),
+                "data_mb_remaining": self.max_bytes / (1024 * 1024) - data_mb,
+                "in_flight": self._in_flight,
+            }
+
+    # ===================== Internals ===================== #
+
+    def _prune(self, now: float):
+        """Drop entries that have left the sliding window."""
+        cutoff = now - self.WINDOW_SECONDS
+
+        while self._request_times and self._request_times[0] <= cutoff:
+            self._request_times.popleft()
+        while self._error_times and self._error_times[0] <= cutoff:
+            self._error_times.popleft()
+        while self._data_bytes and self._data_bytes[0][0] <= cutoff:
+            _, byte_count = self._data_bytes.popleft()
+            self._window_bytes -= byte_count
+
+    def _reservation(self) -> int:
+        """Bytes to reserve for the next request: the estimate, or the largest response in the window."""
+        largest = max((b for _, b in self._data_bytes), default=0)
+        return min(max(largest, self._bytes_estimate), self.max_bytes)
+
+    def _wait_time(self, now: float) -> Tuple[float, str]:
+        """Return (seconds to wait, reason) before the next request may start."""
+        if self._paused_until > now:
+            return self._paused_until - now, "paused"
+
+        if len(self._request_times) >= self.max_requests:
+            return self._request_times[0] + self.WINDOW_SECONDS - now + self.SAFETY_MARGIN, "requests"
+
+        # Every in-flight request may still turn into an error
+        if len(self._error_times) + self._in_flight >= self.max_errors:
+            if self._in_flight == 0:
+                return self._error_times[0] + self.WINDOW_SECONDS - now + self.SAFETY_MARGIN, "errors"
+            return self.poll_interval, "errors (in flight)"
+
+        reserve = self._reservation()
+        if self._window_bytes + self._reserved_bytes + reserve > self.max_bytes:
+            if self._in_flight == 0 and self._data_bytes:
+                return self._data_bytes[0][0] + self.WINDOW_SECONDS - now + self.SAFETY_MARGIN, "data volume"
+            return self.poll_interval, "data volume (in flight)"
+
+        return 0.0, ""
@@ -1,28 +1,48 @@
 """
-BEA Background Task Runner
+BEA Background Tasks
 
-Simple thread-based background task executor for BEA data collection.
-Tracks running tasks and prevents duplicate runs.
+Queues BEA data collection as jobs in the collection job queue
+(src/jobs/job_queue.py) and provides the handlers that job workers run.
+Nothing here starts threads in the API process: BEATaskRunner.start_*()
+records a collection run, enqueues a job and returns the run_id.
+
+One active job per dataset is enforced by the queue's concurrency keys.
+"all" also excludes the single-dataset jobs it covers: enqueueing takes a
+transaction-scoped advisory lock before checking for those, so the check
+and the insert are atomic. Both rules hold across API restarts and
+multiple admin instances.
 
 Author: FinExus Data Collector
 Created: 2025-11-27
 """
-import threading
+import json
 import logging
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List
 from datetime import datetime, UTC
 from enum import Enum
 
+from sqlalchemy import func, literal, select
 from sqlalchemy.orm import Session
 
 from src.bea.bea_client import BEAClient
 from src.bea.bea_collector import NIPACollector, RegionalCollector, GDPByIndustryCollector, ITACollector, FixedAssetsCollector, CollectionProgress, SentinelManager
-from src.database.bea_tracking_models import BEACollectionRun, BEADatasetFreshness
+from src.database.bea_tracking_models import BEACollectionRun
 from src.database.connection import get_session
+from src.jobs.job_queue import (
+    JobCancelled, JobContext, PermanentJobError, job_queue, register_job_handler
+)
 from src.config import settings
 
 log = logging.getLogger("BEATaskRunner")
 
+DATASETS = ("NIPA", "Regional", "GDPbyIndustry", "ITA", "FixedAssets")
+
+# Datasets covered by the legacy "update all" task
+UPDATE_ALL_DATASETS = ("NIPA", "Regional", "GDPbyIndustry")
+
+# pg_advisory_xact_lock name serializing BEA enqueues (check + insert)
+ENQUEUE_LOCK = "bea.enqueue"
+
 
 class TaskStatus(str, Enum):
     QUEUED = "queued"
@@ -32,58 +52,41 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+def concurrency_key(dataset_name: str) -> str:
+    """Queue concurrency key for a BEA dataset (or 'all')."""
+    return f"BEA:{dataset_name}"
+
+
+def conflicting_keys(dataset_name: str) -> set:
+    """Concurrency keys whose active jobs overlap a job for this dataset (or 'all')."""
+    keys = {concurrency_key(dataset_name)}
+    if dataset_name == "all":
+        keys.update(concurrency_key(d) for d in UPDATE_ALL_DATASETS)
+    elif dataset_name in UPDATE_ALL_DATASETS:
+        keys.add(concurrency_key("all"))
+    return keys
+
+
 class BEATaskRunner:
     """
-    Singleton task runner for BEA background operations.
+    Enqueues BEA collection jobs.
 
-    Ensures only one task runs at a time per dataset to prevent
+    Ensures only one task is queued or running per dataset to prevent
     conflicts and rate limit issues.
     """
-    _instance = None
-    _lock = threading.Lock()
-
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-
-    def __init__(self):
-        if self._initialized:
-            return
-
-        self._running_tasks: Dict[str, threading.Thread] = {}
-        self._task_lock = threading.Lock()
-        self._initialized = True
 
     def is_running(self, dataset_name: str) -> bool:
-        """Check if a task is currently running for a dataset."""
-        with self._task_lock:
-            thread = self._running_tasks.get(dataset_name)
-            if thread is None:
-                return False
-            if not thread.is_alive():
-                del self._running_tasks[dataset_name]
-                return False
-            return True
+        """Check if a job is queued or running for a dataset (or one overlapping it)."""
+        return bool(job_queue.active_keys(conflicting_keys(dataset_name)))
 
     def get_running_tasks(self) -> Dict[str, bool]:
         """Get status of all datasets."""
-        with self._task_lock:
-            # Clean up dead threads
-            dead = [k for k, v in self._running_tasks.items() if not v.is_alive()]
-            for k in dead:
-                del self._running_tasks[k]
-
-            return {
-                "NIPA": "NIPA" in self._running_tasks,
-                "Regional": "Regional" in self._running_tasks,
-                "GDPbyIndustry": "GDPbyIndustry" in self._running_tasks,
-                "ITA": "ITA" in self._running_tasks,
-                "FixedAssets": "FixedAssets" in self._running_tasks,
-            }
+        active = job_queue.active_keys([concurrency_key(d) for d in DATASETS + ("all",)])
+        update_all = concurrency_key("all") in active
+        return {
+            dataset: concurrency_key(dataset) in active or (update_all and dataset in UPDATE_ALL_DATASETS)
+            for dataset in DATASETS
+        }
 
     def start_nipa_backfill(
         self,
@@ -92,35 +95,17 @@ class BEATaskRunner:
         tables: Optional[list] = None,
     ) -> Optional[int]:
         """
-        Start NIPA backfill in background thread.
+        Queue a NIPA backfill.
 
         Returns:
-            run_id if started, None if already running
+            run_id if queued, None if already running
         """
-        if self.is_running("NIPA"):
-            log.warning("NIPA task already running")
-            return None
-
-        # Create run record first
-        run_id = self._create_run_record(
-            "NIPA", "backfill",
-            frequency=frequency,
-            year_spec=year,
-            tables_filter=tables
+        return self._enqueue(
+            "NIPA", "backfill", "bea.nipa",
+            {"frequency": frequency, "year": year, "tables": tables},
+            frequency=frequency, year_spec=year, tables_filter=tables,
         )
 
-        def task():
-            self._run_nipa_backfill(run_id, frequency, year, tables)
-
-        thread = threading.Thread(target=task, daemon=True)
-
-        with self._task_lock:
-            self._running_tasks["NIPA"] = thread
-
-        thread.start()
-        log.info(f"Started NIPA backfill task (run_id={run_id})")
-        return run_id
-
     def start_regional_backfill(
         self,
         geo_fips: str = "STATE",
@@ -128,35 +113,17 @@ class BEATaskRunner:
         tables: Optional[list] = None,
     ) -> Optional[int]:
         """
-        Start Regional backfill in background thread.
+        Queue a Regional backfill.
 
         Returns:
-            run_id if started, None if already running
+            run_id if queued, None if already running
         """
-        if self.is_running("Regional"):
-            log.warning("Regional task already running")
-            return None
-
-        # Create run record first
-        run_id = self._create_run_record(
-            "Regional", "backfill",
-            geo_scope=geo_fips,
-            year_spec=year,
-            tables_filter=tables
+        return self._enqueue(
+            "Regional", "backfill", "bea.regional",
+            {"geo_fips": geo_fips, "year": year, "tables": tables},
+            geo_scope=geo_fips, year_spec=year, tables_filter=tables,
         )
 
-        def task():
-            self._run_regional_backfill(run_id, geo_fips, year, tables)
-
-        thread = threading.Thread(target=task, daemon=True)
-
-        with self._task_lock:
-            self._running_tasks["Regional"] = thread
-
-        thread.start()
-        log.info(f"Started Regional backfill task (run_id={run_id})")
-        return run_id
-
     def start_gdpbyindustry_backfill(
         self,
         frequency: str = "A",
@@ -164,35 +131,17 @@ class BEATaskRunner:
         tables: Optional[list] = None,
     ) -> Optional[int]:
         """
-        Start GDP by Industry backfill in background thread.
+        Queue a GDP by Industry backfill.
 
         Returns:
-            run_id if started, None if already running
+            run_id if queued, None if already running
         """
-        if self.is_running("GDPbyIndustry"):
-            log.warning("GDPbyIndustry task already running")
-            return None
-
-        # Create run record first
-        run_id = self._create_run_record(
-            "GDPbyIndustry", "backfill",
-            frequency=frequency,
-            year_spec=year,
-            tables_filter=tables
+        return self._enqueue(
+            "GDPbyIndustry", "backfill", "bea.gdpbyindustry",
+            {"frequency": frequency, "year": year, "tables": tables},
+            frequency=frequency, year_spec=year, tables_filter=tables,
         )
 
-        def task():
-            self._run_gdpbyindustry_backfill(run_id, frequency, year, tables)
-
-        thread = threading.Thread(target=task, daemon=True)
-
-        with self._task_lock:
-            self._running_tasks["GDPbyIndustry"] = thread
-
-        thread.start()
-        log.info(f"Started GDPbyIndustry backfill task (run_id={run_id})")
-        return run_id
-
     def start_update(
         self,
         dataset: str = "all",
@@ -200,7 +149,7 @@ class BEATaskRunner:
         force: bool = False,
     ) -> Optional[int]:
         """
-        Start incremental update in background thread.
+        Queue an incremental update of priority tables.
 
         Args:
             dataset: "NIPA", "Regional", "GDPbyIndustry", or "all"
@@ -208,40 +157,16 @@ class BEATaskRunner:
             force: Force update even if recently updated
 
         Returns:
-            run_id if started, None if already running
+            run_id if queued, None if already running
         """
-        # Check if requested dataset(s) are already running
-        if dataset == "all":
-            if self.is_running("NIPA") or self.is_running("Regional") or self.is_running("GDPbyIndustry"):
-                log.warning("Cannot start update - task already running")
-                return None
-        elif self.is_running(dataset):
-            log.warning(f"{dataset} task already running")
-            return None
-
-        run_id = self._create_run_record(
-            dataset, "update",
-            year_spec=year
+        # "all" must not overlap a running single-dataset job (and vice versa);
+        # _enqueue checks that under the enqueue lock
+        return self._enqueue(
+            dataset, "update", "bea.update",
+            {"dataset": dataset, "year": year, "force": force},
+            year_spec=year,
         )
 
-        def task():
-            self._run_update(run_id, dataset, year, force)
-
-        thread = threading.Thread(target=task, daemon=True)
-
-        # Mark all as running if "all"
-        with self._task_lock:
-            if dataset == "all":
-                self._running_tasks["NIPA"] = thread
-                self._running_tasks["Regional"] = thread
-                self._running_tasks["GDPbyIndustry"] = thread
-            else:
-                self._running_tasks[dataset] = thread
-
-        thread.start()
-        log.info(f"Started update task for {dataset} (run_id={run_id})")
-        return run_id
-
     def start_nipa_update(
         self,
         frequency: str = "A",
@@ -249,7 +174,7 @@ class BEATaskRunner:
         tables: Optional[list] = None,
     ) -> Optional[int]:
         """
-        Start NIPA update (not backfill) in background thread.
+        Queue a NIPA update (not backfill).
 
         Args:
             frequency: 'A', 'Q', or 'M'
@@ -257,32 +182,14 @@ class BEATaskRunner:
             tables: Optional list of specific tables
 
         Returns:
-            run_id if started, None if already running
+            run_id if queued, None if already running
         """
-        if self.is_running("NIPA"):
-            log.warning("NIPA task already running")
-            return None
-
-        # Create run record with run_type='update'
-        run_id = self._create_run_record(
-            "NIPA", "update",
-            frequency=frequency,
-            year_spec=year,
-            tables_filter=tables
+        return self._enqueue(
+            "NIPA", "update", "bea.nipa",
+            {"frequency": frequency, "year": year, "tables": tables},
+            frequency=frequency, year_spec=year, tables_filter=tables,
         )
 
-        def task():
-            self._run_nipa_backfill(run_id, frequency, year, tables)
-
-        thread = threading.Thread(target=task, daemon=True)
-
-        with self._task_lock:
-            self._running_tasks["NIPA"] = thread
-
-        thread.start()
-        log.info(f"Started NIPA update task (run_id={run_id})")
-        return run_id
-
     def start_regional_update(
         self,
         geo_fips: str = "STATE",
@@ -290,7 +197,7 @@ class BEATaskRunner:
         tables: Optional[list] = None,
     ) -> Optional[int]:
         """
-        Start Regional update (not backfill) in background thread.
+        Queue a Regional update (not backfill).
 
         Args:
             geo_fips: Geographic scope ('STATE', 'COUNTY', 'MSA')
@@ -298,32 +205,14 @@ class BEATaskRunner:
             tables: Optional list of specific tables
 
         Returns:
-            run_id if started, None if already running
+            run_id if queued, None if already running
         """
-        if self.is_running("Regional"):
-            log.warning("Regional task already running")
-            return None
-
-        # Create run record with run_type='update'
-        run_id = self._create_run_record(
-            "Regional", "update",
-            geo_scope=geo_fips,
-            year_spec=year,
-            tables_filter=tables
+        return self._enqueue(
+            "Regional", "update", "bea.regional",
+            {"geo_fips": geo_fips, "year": year, "tables": tables},
+            geo_scope=geo_fips, year_spec=year, tables_filter=tables,
         )
 
-        def task():
-            self._run_regional_backfill(run_id, geo_fips, year, tables)
-
-        thread = threading.Thread(target=task, daemon=True)
-
-        with self._task_lock:
-            self._running_tasks["Regional"] = thread
-
-        thread.start()
-        log.info(f"Started Regional update task (run_id={run_id})")
-        return run_id
-
     def start_gdpbyindustry_update(
         self,
         frequency: str = "A",
@@ -331,7 +220,7 @@ class BEATaskRunner:
         tables: Optional[list] = None,
     ) -> Optional[int]:
         """
-        Start GDP by Industry update (not backfill) in background thread.
+        Queue a GDP by Industry update (not backfill).
 
         Args:
             frequency: 'A' or 'Q'
@@ -339,32 +228,14 @@ class BEATaskRunner:
             tables: Optional list of specific table IDs
 
         Returns:
-            run_id if started, None if already running
+            run_id if queued, None if already running
         """
-        if self.is_running("GDPbyIndustry"):
-            log.warning("GDPbyIndustry task already running")
-            return None
-
-        # Create run record with run_type='update'
-        run_id = self._create_run_record(
-            "GDPbyIndustry", "update",
-            frequency=frequency,
-            year_spec=year,
-            tables_filter=tables
+        return self._enqueue(
+            "GDPbyIndustry", "update", "bea.gdpbyindustry",
+            {"frequency": frequency, "year": year, "tables": tables},
+            frequency=frequency, year_spec=year, tables_filter=tables,
         )
 
-        def task():
-            self._run_gdpbyindustry_backfill(run_id, frequency, year, tables)
-
-        thread = threading.Thread(target=task, daemon=True)
-
-        with self._task_lock:
-            self._running_tasks["GDPbyIndustry"] = thread
-
-        thread.start()
-        log.info(f"Started GDPbyIndustry update task (run_id={run_id})")
-        return run_id
-
     def start_ita_backfill(
         self,
         frequency: str = "A",
@@ -372,7 +243,7 @@ class BEATaskRunner:
         indicators: Optional[list] = None,
     ) -> Optional[int]:
         """
-        Start ITA (International Transactions) backfill in background thread.
+        Queue an ITA (International Transactions) backfill.
 
         Args:
             frequency: 'A' (annual), 'QSA' (quarterly seasonally adjusted), 'QNSA' (quarterly not seasonally adjusted)
@@ -380,32 +251,15 @@ class BEATaskRunner:
             indicators: Optional list of specific indicator codes
 
         Returns:
-            run_id if started, None if already running
+            run_id if queued, None if already running
         """
-        if self.is_running("ITA"):
-            log.warning("ITA task already running")
-            return None
-
-        # Create run record first
-        run_id = self._create_run_record(
-            "ITA", "backfill",
-            frequency=frequency,
-            year_spec=year,
-            tables_filter=indicators  # Using tables_filter for indicators
+        return self._enqueue(
+            "ITA", "backfill", "bea.ita",
+            {"frequency": frequency, "year": year, "indicators": indicators},
+            frequency=frequency, year_spec=year,
+            tables_filter=indicators,  # Using tables_filter for indicators
         )
 
-        def task():
-            self._run_ita_backfill(run_id, frequency, year, indicators)
-
-        thread = threading.Thread(target=task, daemon=True)
-
-        with self._task_lock:
-            self._running_tasks["ITA"] = thread
-
-        thread.start()
-        log.info(f"Started ITA backfill task (run_id={run_id})")
-        return run_id
-
     def start_ita_update(
         self,
         frequency: str = "A",
@@ -413,7 +267,7 @@ class BEATaskRunner:
         indicators: Optional[list] = None,
     ) -> Optional[int]:
         """
-        Start ITA (International Transactions) update in background thread.
+        Queue an ITA (International Transactions) update.
 
         Args:
             frequency: 'A' (annual), 'QSA' (quarterly seasonally adjusted), 'QNSA' (quarterly not seasonally adjusted)
@@ -421,454 +275,326 @@ class BEATaskRunner:
             indicators: Optional list of specific indicator codes
 
         Returns:
-            run_id if started, None if already running
+            run_id if queued, None if already running
         """
-        if self.is_running("ITA"):
-            log.warning("ITA task already running")
-            return None
-
-        # Create run record with run_type='update'
-        run_id = self._create_run_record(
-            "ITA", "update",
-            frequency=frequency,
-            year_spec=year,
-            tables_filter=indicators
+        return self._enqueue(
+            "ITA", "update", "bea.ita",
+            {"frequency": frequency, "year": year, "indicators": indicators},
+            frequency=frequency, year_spec=year, tables_filter=indicators,
         )
 
-        def task():
-            self._run_ita_backfill(run_id, frequency, year, indicators)
-
-        thread = threading.Thread(target=task, daemon=True)
-
-        with self._task_lock:
-            self._running_tasks["ITA"] = thread
-
-        thread.start()
-        log.info(f"Started ITA update task (run_id={run_id})")
-        return run_id
-
     def start_fixedassets_backfill(
         self,
         year: str = "ALL",
         tables: Optional[list] = None,
     ) -> Optional[int]:
         """
-        Start Fixed Assets backfill in background thread.
+        Queue a Fixed Assets backfill.
 
         Args:
             year: Year specification ('ALL', 'LAST5', 'LAST10', specific year)
             tables: Optional list of specific table names
 
         Returns:
-            run_id if started, None if already running
+            run_id if queued, None if already running
 
         Note:
             Fixed Assets only supports annual data.
         """
-        if self.is_running("FixedAssets"):
-            log.warning("FixedAssets task already running")
-            return None
-
-        # Create run record first
-        run_id = self._create_run_record(
-            "FixedAssets", "backfill",
+        return self._enqueue(
+            "FixedAssets", "backfill", "bea.fixedassets",
+            {"year": year, "tables": tables},
             frequency="A",  # Fixed Assets is annual only
-            year_spec=year,
-            tables_filter=tables
+            year_spec=year, tables_filter=tables,
         )
 
-        def task():
-            self._run_fixedassets_backfill(run_id, year, tables)
-
-        thread = threading.Thread(target=task, daemon=True)
-
-        with self._task_lock:
-            self._running_tasks["FixedAssets"] = thread
-
-        thread.start()
-        log.info(f"Started FixedAssets backfill task (run_id={run_id})")
-        return run_id
-
     def start_fixedassets_update(
         self,
         year: str = "LAST5",
         tables: Optional[list] = None,
     ) -> Optional[int]:
         """
-        Start Fixed Assets update in background thread.
+        Queue a Fixed Assets update.
 
         Args:
             year: Year specification
             tables: Optional list of specific table names
 
         Returns:
-            run_id if started, None if already running
+            run_id if queued, None if already running
         """
-        if self.is_running("FixedAssets"):
-            log.warning("FixedAssets task already running")
-            return None
-
-        # Create run record with run_type='update'
-        run_id = self._create_run_record(
-            "FixedAssets", "update",
-            frequency="A",
-            year_spec=year,
-            tables_filter=tables
+        return self._enqueue(
+            "FixedAssets", "update", "bea.fixedassets",
+            {"year": year, "tables": tables},
+            frequency="A", year_spec=year, tables_filter=tables,
         )
 
-        def task():
-            self._run_fixedassets_backfill(run_id, year, tables)
-
-        thread = threading.Thread(target=task, daemon=True)
-
-        with self._task_lock:
-            self._running_tasks["FixedAssets"] = thread
-
-        thread.start()
-        log.info(f"Started FixedAssets update task (run_id={run_id})")
-        return run_id
-
     # ==================== Internal Methods ==================== #
 
-    def _create_run_record(
+    def _enqueue(
         self,
         dataset_name: str,
         run_type: str,
-        frequency: Optional[str] = None,
-        geo_scope: Optional[str] = None,
-        year_spec: Optional[str] = None,
-        tables_filter: Optional[list] = None,
-    ) -> int:
-        """Create a collection run record in the database."""
-        import json
+        job_type: str,
+        params: Dict[str, Any],
+        **run_fields,
+    ) -> Optional[int]:
+        """
+        Create the run record and its job in one transaction; None if the dataset is busy.
 
+        The advisory lock is held until commit, so two admin instances cannot
+        both pass the overlap check (e.g. "all" vs "NIPA", different
+        concurrency keys) and enqueue.
+        """
         with get_session() as session:
-            run = BEACollectionRun(
-                dataset_name=dataset_name,
-                run_type=run_type,
-                frequency=frequency,
-                geo_scope=geo_scope,
-                year_spec=year_spec,
-                started_at=datetime.now(UTC),
-                status=TaskStatus.QUEUED,
-                tables_filter=json.dumps(tables_filter) if tables_filter else None,
+            session.execute(select(func.pg_advisory_xact_lock(func.hashtext(literal(ENQUEUE_LOCK)))))
+            if job_queue.active_keys(conflicting_keys(dataset_name), session=session):
+                session.rollback()
+                log.warning(f"{dataset_name} task already running")
+                return None
+
+            run = _new_run_record(session, dataset_name, run_type, **run_fields)
+
+            job_id = job_queue.enqueue(
+                job_type,
+                params,
+                concurrency_key=concurrency_key(dataset_name),
+                run_id=run.run_id,
+                session=session,
             )
-            session.add(run)
+            if job_id is None:
+                session.rollback()
+                log.warning(f"{dataset_name} task already running")
+                return None
+
             session.commit()
+            log.info(f"Queued {dataset_name} {run_type} job {job_id} (run_id={run.run_id})")
             return run.run_id
 
-    def _update_run_status(
-        self,
-        run_id: int,
-        status: str,
-        progress: Optional[CollectionProgress] = None,
-        error_message: Optional[str] = None,
-    ):
-        """Update a collection run record."""
-        with get_session() as session:
-            run = session.query(BEACollectionRun).filter(
-                BEACollectionRun.run_id == run_id
-            ).first()
 
-            if run:
-                run.status = status
+# ==================== Run Records ==================== #
+
+def _new_run_record(
+    session: Session,
+    dataset_name: str,
+    run_type: str,
+    frequency: Optional[str] = None,
+    geo_scope: Optional[str] = None,
+    year_spec: Optional[str] = None,
+    tables_filter: Optional[list] = None,
+) -> BEACollectionRun:
+    """Add a queued collection run record (flushed, not committed)."""
+    run = BEACollectionRun(
+        dataset_name=dataset_name,
+        run_type=run_type,
+        frequency=frequency,
+        geo_scope=geo_scope,
+        year_spec=year_spec,
+        started_at=datetime.now(UTC),
+        status=TaskStatus.QUEUED,
+        tables_filter=json.dumps(tables_filter) if tables_filter else None,
+    )
+    session.add(run)
+    session.flush()
+    return run
+
+
+def _update_run_status(
+    run_id: int,
+    status: str,
+    progress: Optional[CollectionProgress] = None,
+    error_message: Optional[str] = None,
+):
+    """Update a collection run record."""
+    with get_session() as session:
+        run = session.query(BEACollectionRun).filter(
+            BEACollectionRun.run_id == run_id
+        ).first()
+
+        if run:
+            run.status = status
+
+            if status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED):
+                run.completed_at = datetime.now(UTC)
+
+            if progress:
+                run.tables_processed = progress.tables_processed
+                run.series_processed = progress.series_processed
+                run.data_points_inserted = progress.data_points_inserted
+                run.data_points_updated = progress.data_points_updated
+                run.api_requests_made = progress.api_requests
+
+            if error_message:
+                run.error_message = error_message
 
-                if status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
-                    run.completed_at = datetime.now(UTC)
+            session.commit()
 
-                if progress:
-                    run.tables_processed = progress.tables_processed
-                    run.series_processed = progress.series_processed
-                    run.data_points_inserted = progress.data_points_inserted
-                    run.data_points_updated = progress.data_points_updated
-                    run.api_requests_made = progress.api_requests
 
-                if error_message:
-                    run.error_message = error_message
+def _get_client() -> BEAClient:
+    """Get a BEA API client."""
+    api_key = settings.api.bea_api_key
+    if not api_key or len(api_key) != 36:
+        raise PermanentJobError("Invalid or missing BEA_API_KEY")
+    return BEAClient(api_key=api_key)
 
-                session.commit()
 
-    def _get_client(self) -> BEAClient:
-        """Get a BEA API client."""
-        api_key = settings.api.bea_api_key
-        if not api_key or len(api_key) != 36:
-            raise ValueError("Invalid or missing BEA_API_KEY")
-        return BEAClient(api_key=api_key)
+def _progress_reporter(ctx: JobContext) -> Callable[[CollectionProgress], None]:
+    """Collector progress callback: update the run record and the job (honours cancel)."""
+    def report(progress: CollectionProgress):
+        _update_run_status(ctx.run_id, TaskStatus.RUNNING, progress)
+        ctx.report(progress.to_dict())
+    return report
 
-    def _run_nipa_backfill(
-        self,
-        run_id: int,
-        frequency: str,
-        year: str,
-        tables: Optional[list],
-    ):
-        """Execute NIPA backfill (runs in background thread)."""
-        try:
-            self._update_run_status(run_id, TaskStatus.RUNNING)
-
-            client = self._get_client()
-
-            with get_session() as session:
-                collector = NIPACollector(client, session)
-
-                # Pass run_id to collector so it uses existing record (no duplicate)
-                progress = collector.backfill_all_tables(
-                    frequency=frequency,
-                    year=year,
-                    tables=tables,
-                    progress_callback=lambda p: self._update_run_status(run_id, TaskStatus.RUNNING, p),
-                    run_id=run_id
-                )
-
-                status = TaskStatus.COMPLETED if not progress.errors else TaskStatus.FAILED
-                error_msg = "; ".join(progress.errors[:5]) if progress.errors else None
-                self._update_run_status(run_id, status, progress, error_msg)
-
-                # Sync sentinels after successful update
-                if status == TaskStatus.COMPLETED:
-                    sentinel_manager = SentinelManager(client, session)
-                    sentinel_manager.sync_sentinels_from_data('NIPA')
-
-                log.info(f"NIPA backfill completed: {progress.data_points_inserted} data points")
-
-        except Exception as e:
-            log.error(f"NIPA backfill failed: {e}", exc_info=True)
-            self._update_run_status(run_id, TaskStatus.FAILED, error_message=str(e))
-
-        finally:
-            with self._task_lock:
-                self._running_tasks.pop("NIPA", None)
-
-    def _run_regional_backfill(
-        self,
-        run_id: int,
-        geo_fips: str,
-        year: str,
-        tables: Optional[list],
-    ):
-        """Execute Regional backfill (runs in background thread)."""
-        try:
-            self._update_run_status(run_id, TaskStatus.RUNNING)
-
-            client = self._get_client()
-
-            with get_session() as session:
-                collector = RegionalCollector(client, session)
-
-                # Pass run_id to collector so it uses existing record (no duplicate)
-                progress = collector.backfill_all_tables(
-                    geo_fips=geo_fips,
-                    year=year,
-                    tables=tables,
-                    progress_callback=lambda p: self._update_run_status(run_id, TaskStatus.RUNNING, p),
-                    run_id=run_id
-                )
-
-                status = TaskStatus.COMPLETED if not progress.errors else TaskStatus.FAILED
-                error_msg = "; ".join(progress.errors[:5]) if progress.errors else None
-                self._update_run_status(run_id, status, progress, error_msg)
-
-                # Sync sentinels after successful update
-                if status == TaskStatus.COMPLETED:
-                    sentinel_manager = SentinelManager(client, session)
-                    sentinel_manager.sync_sentinels_from_data('Regional')
-
-                log.info(f"Regional backfill completed: {progress.data_points_inserted} data points")
-
-        except Exception as e:
-            log.error(f"Regional backfill failed: {e}", exc_info=True)
-            self._update_run_status(run_id, TaskStatus.FAILED, error_message=str(e))
-
-        finally:
-            with self._task_lock:
-                self._running_tasks.pop("Regional", None)
-
-    def _run_gdpbyindustry_backfill(
-        self,
-        run_id: int,
-        frequency: str,
-        year: str,
-        tables: Optional[list],
-    ):
-        """Execute GDP by Industry backfill (runs in background thread)."""
-        try:
-            self._update_run_status(run_id, TaskStatus.RUNNING)
-
-            client = self._get_client()
-
-            with get_session() as session:
-                collector = GDPByIndustryCollector(client, session)
-
-                # Pass run_id to collector so it uses existing record (no duplicate)
-                progress = collector.backfill_all_tables(
-                    frequency=frequency,
-                    year=year,
-                    tables=tables,
-                    progress_callback=lambda p: self._update_run_status(run_id, TaskStatus.RUNNING, p),
-                    run_id=run_id
-                )
-
-                status = TaskStatus.COMPLETED if not progress.errors else TaskStatus.FAILED
-                error_msg = "; ".join(progress.errors[:5]) if progress.errors else None
-                self._update_run_status(run_id, status, progress, error_msg)
-
-                # Sync sentinels after successful update
-                if status == TaskStatus.COMPLETED:
-                    sentinel_manager = SentinelManager(client, session)
-                    sentinel_manager.sync_sentinels_from_data('GDPbyIndustry')
-
-                log.info(f"GDPbyIndustry backfill completed: {progress.data_points_inserted} data points")
-
-        except Exception as e:
-            log.error(f"GDPbyIndustry backfill failed: {e}", exc_info=True)
-            self._update_run_status(run_id, TaskStatus.FAILED, error_message=str(e))
-
-        finally:
-            with self._task_lock:
-                self._running_tasks.pop("GDPbyIndustry", None)
-
-    def _run_ita_backfill(
-        self,
-        run_id: int,
-        frequency: str,
-        year: str,
-        indicators: Optional[list],
-    ):
-        """Execute ITA backfill (runs in background thread)."""
-        try:
-            self._update_run_status(run_id, TaskStatus.RUNNING)
-
-            client = self._get_client()
-
-            with get_session() as session:
-                collector = ITACollector(client, session)
-
-                # Pass run_id to collector so it uses existing record (no duplicate)
-                progress = collector.backfill_all_indicators(
-                    frequency=frequency,
-                    year=year,
-                    indicators=indicators,
-                    progress_callback=lambda p: self._update_run_status(run_id, TaskStatus.RUNNING, p),
-                    run_id=run_id
-                )
-
-                status = TaskStatus.COMPLETED if not progress.errors else TaskStatus.FAILED
-                error_msg = "; ".join(progress.errors[:5]) if progress.errors else None
-                self._update_run_status(run_id, status, progress, error_msg)
-
-                # Sync sentinels after successful update
-                if status == TaskStatus.COMPLETED:
-                    sentinel_manager = SentinelManager(client, session)
-                    sentinel_manager.sync_sentinels_from_data('ITA')
-
-                log.info(f"ITA backfill completed: {progress.data_points_inserted} data points")
-
-        except Exception as e:
-            log.error(f"ITA backfill failed: {e}", exc_info=True)
-            self._update_run_status(run_id, TaskStatus.FAILED, error_message=str(e))
-
-        finally:
-            with self._task_lock:
-                self._running_tasks.pop("ITA", None)
-
-    def _run_fixedassets_backfill(
-        self,
-        run_id: int,
-        year: str,
-        tables: Optional[list],
-    ):
-        """Execute Fixed Assets backfill (runs in background thread)."""
-        try:
-            self._update_run_status(run_id, TaskStatus.RUNNING)
-
-            client = self._get_client()
-
-            with get_session() as session:
-                collector = FixedAssetsCollector(client, session)
-
-                # Pass run_id to collector so it uses existing record (no duplicate)
-                progress = collector.backfill_all_tables(
-                    year=year,
-                    tables=tables,
-                    progress_callback=lambda p: self._update_run_status(run_id, TaskStatus.RUNNING, p),
-                    run_id=run_id
-                )
-
-                status = TaskStatus.COMPLETED if not progress.errors else TaskStatus.FAILED
-                error_msg = "; ".join(progress.errors[:5]) if progress.errors else None
-                self._update_run_status(run_id, status, progress, error_msg)
-
-                log.info(f"FixedAssets backfill completed: {progress.data_points_inserted} data points")
-
-        except Exception as e:
-            log.error(f"FixedAssets backfill failed: {e}", exc_info=True)
-            self._update_run_status(run_id, TaskStatus.FAILED, error_message=str(e))
-
-        finally:
-            with self._task_lock:
-                self._running_tasks.pop("FixedAssets", None)
-
-    def _run_update(
-        self,
-        run_id: int,
-        dataset: str,
-        year: str,
-        force: bool,
-    ):
-        """Execute incremental update (runs in background thread)."""
-        try:
-            self._update_run_status(run_id, TaskStatus.RUNNING)
-
-            client = self._get_client()
-            total_points = 0
-            errors = []
-
-            with get_session() as session:
-                if dataset in ("NIPA", "all"):
-                    try:
-                        collector = NIPACollector(client, session)
-                        # Pass run_id to collector so it uses existing record (no duplicate)
-                        progress = collector.backfill_all_tables(
-                            frequency="A",
-                            year=year,
-                            run_id=run_id
-                        )
-                        total_points += progress.data_points_inserted
-                        errors.extend(progress.errors)
-                    except Exception as e:
-                        errors.append(f"NIPA: {str(e)}")
-
-                if dataset in ("Regional", "all"):
-                    try:
-                        collector = RegionalCollector(client, session)
-                        # Only update priority tables for incremental
-                        # Pass run_id to collector so it uses existing record (no duplicate)
-                        progress = collector.backfill_all_tables(
-                            geo_fips="STATE",
-                            year=year,
-                            tables=["SAGDP1", "CAINC1", "SAINC1"],
-                            run_id=run_id
-                        )
-                        total_points += progress.data_points_inserted
-                        errors.extend(progress.errors)
-                    except Exception as e:
-                        errors.append(f"Regional: {str(e)}")
-
-                if dataset in ("GDPbyIndustry", "all"):
-                    try:
-                        collector = GDPByIndustryCollector(client, session)
-                        # Only update priority tables for incremental (Value Added, Contributions, Real Value Added)
-                        # Pass run_id to collector so it uses existing record (no duplicate)
-                        progress = collector.backfill_all_tables(
-                            frequency="A",
-                            year=year,
-                            tables=[1, 5, 6],
-                            run_id=run_id
-                        )
-                        total_points += progress.data_points_inserted
-                        errors.extend(progress.errors)
-                    except Exception as e:
-                        errors.append(f"GDPbyIndustry: {str(e)}")
+
+def _run_collection(
+    ctx: JobContext,
+    dataset_name: str,
+    collect: Callable[[BEAClient, Session], CollectionProgress],
+    sync_sentinels: bool = True,
+) -> Dict[str, Any]:
+    """
+    Shared job body: mark the run running, collect, settle the run record.
+
+    Failures re-raise so the queue can retry; the run record stays 'queued'
+    until the last attempt.
+    """
+    run_id = ctx.run_id
+    try:
+        _update_run_status(run_id, TaskStatus.RUNNING)
+
+        client = _get_client()
+
+        with get_session() as session:
+            progress = collect(client, session)
+
+            status = TaskStatus.COMPLETED if not progress.errors else TaskStatus.FAILED
+            error_msg = "; ".join(progress.errors[:5]) if progress.errors else None
+            _update_run_status(run_id, status, progress, error_msg)
+
+            # Sync sentinels after successful update
+            if sync_sentinels and status == TaskStatus.COMPLETED:
+                sentinel_manager = SentinelManager(client, session)
+                sentinel_manager.sync_sentinels_from_data(dataset_name)
+
+            log.info(f"{dataset_name} collection completed: {progress.data_points_inserted} data points")
+            return progress.to_dict()
+
+    except JobCancelled:
+        log.info(f"{dataset_name} collection cancelled (run_id={run_id})")
+        _update_run_status(run_id, TaskStatus.CANCELLED, error_message="Cancelled")
+        raise
+
+    except Exception as e:
+        log.error(f"{dataset_name} collection failed: {e}", exc_info=True)
+        final = ctx.is_last_attempt or isinstance(e, PermanentJobError)
+        _update_run_status(run_id, TaskStatus.FAILED if final else TaskStatus.QUEUED, error_message=str(e))
+        raise
+
+
+# ==================== Job Handlers ==================== #
+
+@register_job_handler("bea.nipa")
+def run_nipa_job(ctx: JobContext) -> Dict[str, Any]:
+    """Execute a NIPA backfill/update."""
+    p = ctx.params
+    return _run_collection(ctx, "NIPA", lambda client, session: NIPACollector(client, session).backfill_all_tables(
+        frequency=p.get("frequency", "A"),
+        year=p.get("year", "ALL"),
+        tables=p.get("tables"),
+        progress_callback=_progress_reporter(ctx),
+        # Pass run_id to collector so it uses existing record (no duplicate)
+        run_id=ctx.run_id,
+    ))
+
+
+@register_job_handler("bea.regional")
+def run_regional_job(ctx: JobContext) -> Dict[str, Any]:
+    """Execute a Regional backfill/update."""
+    p = ctx.params
+    return _run_collection(ctx, "Regional", lambda client, session: RegionalCollector(client, session).backfill_all_tables(
+        geo_fips=p.get("geo_fips", "STATE"),
+        year=p.get("year", "ALL"),
+        tables=p.get("tables"),
+        progress_callback=_progress_reporter(ctx),
+        run_id=ctx.run_id,
+    ))
+
+
+@register_job_handler("bea.gdpbyindustry")
+def run_gdpbyindustry_job(ctx: JobContext) -> Dict[str, Any]:
+    """Execute a GDP by Industry backfill/update."""
+    p = ctx.params
+    return _run_collection(ctx, "GDPbyIndustry", lambda client, session: GDPByIndustryCollector(client, session).backfill_all_tables(
+        frequency=p.get("frequency", "A"),
+        year=p.get("year", "ALL"),
+        tables=p.get("tables"),
+        progress_callback=_progress_reporter(ctx),
+        run_id=ctx.run_id,
+    ))
+
+
+@register_job_handler("bea.ita")
+def run_ita_job(ctx: JobContext) -> Dict[str, Any]:
+    """Execute an ITA backfill/update."""
+    p = ctx.params
+    return _run_collection(ctx, "ITA", lambda client, session: ITACollector(client, session).backfill_all_indicators(
+        frequency=p.get("frequency", "A"),
+        year=p.get("year", "ALL"),
+        indicators=p.get("indicators"),
+        progress_callback=_progress_reporter(ctx),
+        run_id=ctx.run_id,
+    ))
+
+
+@register_job_handler("bea.fixedassets")
+def run_fixedassets_job(ctx: JobContext) -> Dict[str, Any]:
+    """Execute a Fixed Assets backfill/update."""
+    p = ctx.params
+    return _run_collection(ctx, "FixedAssets", lambda client, session: FixedAssetsCollector(client, session).backfill_all_tables(
+        year=p.get("year", "ALL"),
+        tables=p.get("tables"),
+        progress_callback=_progress_reporter(ctx),
+        run_id=ctx.run_id,
+    ), sync_sentinels=False)
+
+
+@register_job_handler("bea.update")
+def run_update_job(ctx: JobContext) -> Dict[str, Any]:
+    """Execute an incremental update of priority tables for one dataset or all."""
+    dataset = ctx.params.get("dataset", "all")
+    year = ctx.params.get("year", "LAST5")
+    run_id = ctx.run_id
+
+    # (dataset, collector class, backfill kwargs) - only priority tables for incremental
+    plan = [
+        ("NIPA", NIPACollector, {"frequency": "A"}),
+        ("Regional", RegionalCollector, {"geo_fips": "STATE", "tables": ["SAGDP1", "CAINC1", "SAINC1"]}),
+        # Value Added, Contributions, Real Value Added
+        ("GDPbyIndustry", GDPByIndustryCollector, {"frequency": "A", "tables": [1, 5, 6]}),
+    ]
+
+    try:
+        _update_run_status(run_id, TaskStatus.RUNNING)
+
+        client = _get_client()
+        total_points = 0
+        errors: List[str] = []
+
+        with get_session() as session:
+            for name, collector_cls, kwargs in plan:
+                if dataset not in (name, "all"):
+                    continue
+                ctx.check_cancelled()
+                try:
+                    # Pass run_id to collector so it uses existing record (no duplicate)
+                    progress = collector_cls(client, session).backfill_all_tables(
+                        year=year, run_id=run_id, **kwargs
+                    )
+                    total_points += progress.data_points_inserted
+                    errors.extend(progress.errors)
+                except Exception as e:
+                    errors.append(f"{name}: {str(e)}")
+                ctx.report({"data_points_inserted": total_points, "errors": len(errors)})
 
             # Create a summary progress
             summary = CollectionProgress(dataset, "update")
@@ -877,30 +603,28 @@ class BEATaskRunner:
 
             status = TaskStatus.COMPLETED if not errors else TaskStatus.FAILED
             error_msg = "; ".join(errors[:5]) if errors else None
-            self._update_run_status(run_id, status, summary, error_msg)
+            _update_run_status(run_id, status, summary, error_msg)
 
             # Sync sentinels after successful update
             if status == TaskStatus.COMPLETED:
                 sentinel_manager = SentinelManager(client, session)
-                if dataset in ("NIPA", "all"):
-                    sentinel_manager.sync_sentinels_from_data('NIPA')
-                if dataset in ("Regional", "all"):
-                    sentinel_manager.sync_sentinels_from_data('Regional')
-                if dataset in ("GDPbyIndustry", "all"):
-                    sentinel_manager.sync_sentinels_from_data('GDPbyIndustry')
+                for name, _, _ in plan:
+                    if dataset in (name, "all"):
+                        sentinel_manager.sync_sentinels_from_data(name)
 
-            log.info(f"Update completed: {total_points} data points")
+        log.info(f"Update completed: {total_points} data points")
+        return summary.to_dict()
 
-        except Exception as e:
-            log.error(f"Update failed: {e}", exc_info=True)
-            self._update_run_status(run_id, TaskStatus.FAILED, error_message=str(e))
+    except JobCancelled:
+        _update_run_status(run_id, TaskStatus.CANCELLED, error_message="Cancelled")
+        raise
 
-        finally:
-            with self._task_lock:
-                self._running_tasks.pop("NIPA", None)
-                self._running_tasks.pop("Regional", None)
-                self._running_tasks.pop("GDPbyIndustry", None)
+    except Exception as e:
+        log.error(f"Update failed: {e}", exc_info=True)
+        final = ctx.is_last_attempt or isinstance(e, PermanentJobError)
+        _update_run_status(run_id, TaskStatus.FAILED if final else TaskStatus.QUEUED, error_message=str(e))
+        raise
 
 
-# Global singleton instance
+# Global instance used by the admin API
 task_runner = BEATaskRunner()
@@ -6,6 +6,14 @@ import logging
 from typing import Iterable, List, Dict, Any, Optional, Generator, Tuple
 import requests
 
+try:
+    from src.config import settings
+    from src.utils import metrics
+except ImportError:
+    # Standalone BLS scripts put src/ itself on sys.path; they run without metrics
+    settings = None
+    metrics = None
+
 log = logging.getLogger("BLSClient")
 logging.basicConfig(level=logging.INFO)
 
@@ -50,10 +58,16 @@ class BLSClient:
         window_seconds: int = WINDOW_SECONDS,
         timeout: int = 60,
         user_agent: str = "Finexus-BLSClient/1.0 (+contact: wanfaliang88@gmail.com)",
+        base_url: Optional[str] = None,
     ):
         self.api_key = api_key
+        # BLS_BASE_URL (settings) points the client at a local stand-in
+        default_url = settings.endpoints.bls_base_url if settings else self.BASE_URL
+        self.base_url = (base_url or default_url).rstrip("/")
         self.session = session or requests.Session()
         self.session.headers.update({"User-Agent": user_agent})
+        if metrics:
+            metrics.instrument_http_session(self.session, "bls")
         self.timeout = timeout
 
         # naive sliding-window throttle
@@ -66,7 +80,7 @@ class BLSClient:
         self, series_id: str, calculations: bool = False, as_dataframe: bool = False
     ):
         """Fetch the most recent observation for a single series."""
-        url = f"{self.BASE_URL}{self.TIMESERIES_ENDPOINT}{series_id}?latest=true"
+        url = f"{self.base_url}{self.TIMESERIES_ENDPOINT}{series_id}?latest=true"
         params = {"latest": "true"}
         if self.api_key:
             params["registrationkey"] = self.api_key
@@ -133,7 +147,7 @@ class BLSClient:
             if self.api_key:
                 body["registrationkey"] = self.api_key
 
-            url = f"{self.BASE_URL}{self.TIMESERIES_ENDPOINT}"
+            url = f"{self.base_url}{self.TIMESERIES_ENDPOINT}"
             data = self._request_json("POST", url, json=_drop_nones(body))
             rows = self._parse_timeseries_payload(data)
             all_rows.extend(rows)
@@ -181,19 +195,19 @@ class BLSClient:
         """
         Top 25 popular series overall, or for a given survey (e.g., 'cu', 'ce', 'la', etc.).
         """
-        url = f"{self.BASE_URL}{self.POPULAR_ENDPOINT}"
+        url = f"{self.base_url}{self.POPULAR_ENDPOINT}"
         if survey:
             url += f"/{survey}"
         return self._request_json("GET", url)
 
     def surveys(self) -> Dict[str, Any]:
         """List all BLS surveys and metadata."""
-        url = f"{self.BASE_URL}{self.SURVEYS_ENDPOINT}"
+        url = f"{self.base_url}{self.SURVEYS_ENDPOINT}"
         return self._request_json("GET", url)
 
     def survey(self, abbr: str) -> Dict[str, Any]:
         """Metadata for a single survey by abbreviation (e.g., 'cu', 'ce', 'la')."""
-        url = f"{self.BASE_URL}{self.SURVEYS_ENDPOINT}/{abbr}"
+        url = f"{self.base_url}{self.SURVEYS_ENDPOINT}/{abbr}"
         return self._request_json("GET", url)
 
     # ---------------------- Internals ---------------------- #
@@ -227,7 +241,7 @@ class BLSClient:
                     raise
                 sleep_for = backoff + _jitter(0.2, 0.8)
                 log.warning(f"{e}; retrying in {sleep_for:.2f}s (attempt {attempt}/{max_tries})")
-                time.sleep(sleep_for)
+                _wait(sleep_for)
                 backoff = min(max_backoff, backoff * 2)
             except requests.HTTPError as e:
                 # Non-retryable 4xx (other than 429) should surface
@@ -238,7 +252,7 @@ class BLSClient:
                     raise _BLSAPIError(f"Network error: {e}") from e
                 sleep_for = backoff + _jitter(0.2, 0.8)
                 log.warning(f"Network error {e}; retrying in {sleep_for:.2f}s (attempt {attempt}/{max_tries})")
-                time.sleep(sleep_for)
+                _wait(sleep_for)
                 backoff = min(max_backoff, backoff * 2)
 
         raise _BLSAPIError("Unreachable")  # defensive
@@ -255,7 +269,7 @@ class BLSClient:
             # Sleep until we fall below the threshold
             sleep_for = self._req_timestamps[0] + self._window_sec - now
             if sleep_for > 0:
-                time.sleep(sleep_for + 0.01)
+                _wait(sleep_for + 0.01)
         self._req_timestamps.append(time.time())
 
     def _parse_timeseries_payload(self, payload: dict) -> list[dict]:
@@ -372,6 +386,13 @@ def _join_footnotes(notes: Any) -> Optional[str]:
         return "; ".join(texts) if texts else None
     return str(notes)
 
+def _wait(seconds: float) -> None:
+    """Sleep for throttling/backoff, recorded as a rate-limit wait."""
+    if metrics:
+        metrics.rate_limited_sleep("bls", seconds)
+    else:
+        time.sleep(seconds)
+
 def _jitter(a: float, b: float) -> float:
     import random
     return random.uniform(a, b)
@@ -0,0 +1,131 @@
+"""
+BLS Collection Jobs
+
+Enqueue helper and job queue handler for BLS survey updates. The admin API
+calls enqueue_survey_update(); job workers run the handler.
+
+Author: FinExus Data Collector
+Created: 2025-12-04
+"""
+import logging
+from typing import Any, Dict, Optional
+
+from src.bls.bls_client import BLSClient
+from src.bls import update_manager
+from src.config import settings
+from src.database.connection import get_session
+from src.jobs.job_queue import JobContext, PermanentJobError, job_queue, register_job_handler
+
+log = logging.getLogger("BLSJobs")
+
+# Daily BLS API limit for the system key
+DAILY_API_LIMIT = 500
+
+
+def concurrency_key(survey_code: str) -> str:
+    """Queue concurrency key for a BLS survey."""
+    return f"BLS:{survey_code.upper()}"
+
+
+def is_running(survey_code: str) -> bool:
+    """Whether an update job for the survey is queued or running."""
+    return bool(job_queue.active_keys([concurrency_key(survey_code)]))
+
+
+def enqueue_survey_update(
+    survey_code: str,
+    force: bool = False,
+    max_requests: Optional[int] = None,
+    api_key: Optional[str] = None,
+    user_agent: Optional[str] = None,
+) -> Optional[int]:
+    """
+    Queue a survey update.
+
+    A custom api_key is stored with the job so the worker can use it; it is
+    redacted from job listings and removed from the row once the job
+    completes, fails or is cancelled.
+
+    Args:
+        survey_code: BLS survey code (e.g., 'CU')
+        force: Start a new update cycle instead of resuming the current one
+        max_requests: Maximum API requests for this job
+        api_key: Optional custom BLS API key (skips quota tracking)
+        user_agent: Optional User-Agent matching the custom key's registration
+
+    Returns:
+        job_id, or None if an update for the survey is already active
+    """
+    return job_queue.enqueue(
+        "bls.survey_update",
+        {
+            "survey_code": survey_code.upper(),
+            "force": force,
+            "max_requests": max_requests,
+            "custom_key": bool(api_key),
+            "api_key": api_key,
+            "user_agent": user_agent,
+        },
+        concurrency_key=concurrency_key(survey_code),
+        # Retries resume the cycle, so a couple of attempts is enough
+        max_attempts=2,
+    )
+
+
+@register_job_handler("bls.survey_update")
+def run_survey_update(ctx: JobContext) -> Dict[str, Any]:
+    """Run (or resume) an update cycle for one survey."""
+    p = ctx.params
+    survey_code = p["survey_code"]
+    custom_key = p.get("api_key")
+    using_custom_key = bool(p.get("custom_key") or custom_key)
+    if using_custom_key and not custom_key:
+        # Retried after the job ended: its key was cleared and is not replaced by the system key
+        raise PermanentJobError("Custom BLS API key no longer stored; queue a new update with the key")
+
+    api_key = custom_key or settings.api.bls_api_key
+    if not api_key:
+        raise PermanentJobError("BLS API key not configured")
+
+    client_kwargs = {"api_key": api_key}
+    if using_custom_key and p.get("user_agent"):
+        client_kwargs["user_agent"] = p["user_agent"]
+    client = BLSClient(**client_kwargs)
+
+    # A retry continues the cycle the first attempt started instead of forcing a new one
+    force = p.get("force", False) and ctx.attempt == 1
+
+    with get_session() as session:
+        max_requests = p.get("max_requests")
+        if using_custom_key:
+            max_requests = max_requests or DAILY_API_LIMIT
+        else:
+            # Re-check quota at run time: earlier attempts or other jobs may have used it
+            remaining = update_manager.get_remaining_quota(session, DAILY_API_LIMIT)
+            max_requests = min(max_requests, remaining) if max_requests else remaining
+            if max_requests <= 0:
+                raise PermanentJobError("No BLS API quota remaining today")
+
+        log.info(f"Starting {'force ' if force else ''}update for {survey_code} "
+                 f"(max {max_requests} requests, {'custom' if using_custom_key else 'system'} key)")
+
+        def progress_callback(progress):
+            ctx.report(progress.to_dict())
+
+        result = update_manager.update_survey(
+            survey_code=survey_code,
+            session=session,
+            client=client,
+            force=force,
+            max_quota=max_requests,
+            progress_callback=progress_callback,
+            skip_usage_logging=using_custom_key,
+        )
+
+    status_msg = "completed" if result.completed else "paused (session quota reached)"
+    log.info(f"Update {status_msg} for {survey_code}: {result.series_updated} series, "
+             f"{result.observations_added} observations, {result.requests_used} requests")
+    for err in result.errors[:5]:
+        log.warning(f"{survey_code}: {err[:100]}")
+
+    return result.to_dict()
@@ -392,8 +392,8 @@ def update_survey(
         progress.end_time = datetime.now()
         session.commit()
 
-    except Exception as e:
-        # Mark cycle as not running on error
+    except BaseException as e:
+        # Mark cycle as not running on error (or job cancellation / interrupt)
         cycle.is_running = False
         session.commit()
 
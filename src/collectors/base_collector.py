@@ -7,6 +7,7 @@ Provides common functionality for all data collectors including:
 - Update tracking
 """
 import time
+import threading
 from datetime import datetime, date, timedelta
 from typing import Optional, Dict, List, Any
 import logging
@@ -17,6 +18,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
 from src.config import settings, FMP_ENDPOINTS
+from src.utils import metrics
 from src.database.models import (
     Company, TableUpdateTracking, DataCollectionLog
 )
@@ -44,6 +46,15 @@ class BaseCollector:
         
         self.http_session = requests.Session()
         self.http_session.headers.update({"User-Agent": "FinancialCollector/1.0"})
+        metrics.instrument_http_session(self.http_session, 'fmp')
+
+        # Request starts are spaced sleep_sec apart across every thread using
+        # this collector, so concurrent fetches keep a sequential run's rate
+        self._pace_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+        # Label rows this session writes with the collector (see DatabaseConnection)
+        self.session.info['collector'] = self.__class__.__name__
 
         # Tracking
         self.run_id: Optional[int] = None
@@ -195,6 +206,7 @@ class BaseCollector:
         
         for attempt in range(self.retries):
             try:
+                self._wait_for_request_slot()
                 response = self.http_session.get(
                     url, 
                     params=params, 
@@ -202,8 +214,6 @@ class BaseCollector:
                 )
                 
                 if response.status_code == 200:
-                    if self.sleep_sec:
-                        time.sleep(self.sleep_sec)
                     return response
                 
                 # Retry on specific error codes
@@ -213,7 +223,7 @@ class BaseCollector:
                         f"API returned {response.status_code}, "
                         f"retrying in {wait_time}s (attempt {attempt + 1}/{self.retries})"
                     )
-                    time.sleep(wait_time)
+                    metrics.rate_limited_sleep('fmp', wait_time)
                     continue
                 
                 # Other errors - don't retry
@@ -229,6 +239,16 @@ class BaseCollector:
         
         return None
     
+    def _wait_for_request_slot(self):
+        """Block until this thread may start a request (sleep_sec after the previous start)."""
+        if not self.sleep_sec:
+            return
+        with self._pace_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_at)
+            self._next_request_at = start + self.sleep_sec
+        metrics.rate_limited_sleep('fmp', start - now)
+
     def _json_safe(self, response: Optional[requests.Response]) -> Optional[Any]:
         """
         Safely extract JSON from response
@@ -262,15 +282,16 @@ class BaseCollector:
             return pd.DataFrame()
         
         if isinstance(data, pd.DataFrame):
-            return data
-        
-        if isinstance(data, list):
-            return pd.DataFrame(data)
-        
-        if isinstance(data, dict):
-            return pd.DataFrame([data])
-        
-        return pd.DataFrame()
+            df = data
+        elif isinstance(data, list):
+            df = pd.DataFrame(data)
+        elif isinstance(data, dict):
+            df = pd.DataFrame([data])
+        else:
+            return pd.DataFrame()
+
+        metrics.record_rows_parsed(self.__class__.__name__, self.get_table_name(), len(df))
+        return df
     
     def should_update_symbol(
         self,
@@ -298,6 +319,11 @@ class BaseCollector:
             .filter(TableUpdateTracking.symbol == symbol)\
             .first()
 
+        return self._tracking_due(tracking, max_age_days)
+
+    @staticmethod
+    def _tracking_due(tracking: Optional[TableUpdateTracking], max_age_days: Optional[int] = None) -> bool:
+        """Whether a tracking row (None = never updated) is due for an update."""
         if not tracking:
             # Never updated before
             return True
@@ -357,7 +383,27 @@ class BaseCollector:
             .filter(TableUpdateTracking.table_name == table_name)\
             .filter(TableUpdateTracking.symbol == symbol)\
             .first()
-        
+
+        self._apply_tracking(
+            tracking, table_name, symbol, last_api_date, record_count, next_update_frequency
+        )
+        self.session.commit()
+
+    def _apply_tracking(
+        self,
+        tracking: Optional[TableUpdateTracking],
+        table_name: str,
+        symbol: str,
+        last_api_date: Optional[date] = None,
+        record_count: Optional[int] = None,
+        next_update_frequency: Optional[str] = None
+    ) -> TableUpdateTracking:
+        """
+        Stage a tracking update (no commit); creates the row when tracking is None
+
+        Returns:
+            The added or updated tracking row
+        """
         if not tracking:
             tracking = TableUpdateTracking(
                 table_name=table_name,
@@ -381,8 +427,8 @@ class BaseCollector:
         if next_update_frequency:
             tracking.update_frequency = next_update_frequency # type: ignore
             tracking.next_update_due = self._calculate_next_update(next_update_frequency) # type: ignore
-        
-        self.session.commit()
+
+        return tracking
     
     def record_error(
         self,
@@ -1,18 +1,21 @@
 """
 Bulk Financial Statements Collector
 Loads income statements, balance sheets, and cash flows from bulk CSV files
+(column-oriented; COPY-merged on PostgreSQL, see src/database/bulk_load.py)
 """
 import logging
 import re
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 import pandas as pd
 from sqlalchemy.dialects.postgresql import insert
 
 from src.collectors.base_collector import BaseCollector
+from src.database.bulk_load import StageTimer, coerce_to_model, copy_merge, frame_records
 from src.database.models import IncomeStatement, BalanceSheet, CashFlow
-from src.utils.data_transform import transform_batch, transform_keys
+from src.utils import metrics
+from src.utils.data_transform import KeyMapper
 from src.utils.bulk_utils import get_bulk_data_path, list_bulk_files
 
 logger = logging.getLogger(__name__)
@@ -27,6 +30,13 @@ class BulkFinancialCollector(BaseCollector):
         'cash_flow_statement': CashFlow
     }
 
+    PK_COLUMNS = ['symbol', 'date', 'period']
+
+    def __init__(self, session):
+        super().__init__(session)
+        # Per-stage rows/seconds summed over every file processed
+        self.stage_timer = StageTimer()
+
     def get_table_name(self) -> str:
         return "financial_statements"
 
@@ -55,6 +65,11 @@ class BulkFinancialCollector(BaseCollector):
         """
         Process a bulk financial statement CSV file
 
+        Column-oriented: columns are renamed once per file, cast to the
+        table's types per column, and the whole file is COPY-merged into the
+        statement table in one transaction. Throughput of each stage (read,
+        rename, coerce, merge) is logged and added to self.stage_timer.
+
         Args:
             file_path: Path to the CSV file
 
@@ -70,51 +85,31 @@ class BulkFinancialCollector(BaseCollector):
 
             year, statement_type, period = parsed
             model = self.STATEMENT_MAP[statement_type]
-            table_name = model.__tablename__
 
             logger.info(f"Processing {statement_type} for {year} {period}")
             logger.info(f"File: {file_path.name}")
 
-            # Read CSV
-            df = pd.read_csv(file_path)
-            logger.info(f"Loaded {len(df):,} records from CSV")
-
-            # Skip rows with null symbols
-            initial_count = len(df)
-            df = df[df['symbol'].notna()]
-            if len(df) < initial_count:
-                logger.warning(f"Skipped {initial_count - len(df)} rows with null symbols")
-
+            timer = StageTimer()
+            df = self.prepare_bulk_frame(file_path, model, timer)
             if df.empty:
                 logger.warning("No valid records to process")
                 return False
 
-            # Transform column names from camelCase to snake_case
-            records = df.to_dict('records')
-            transformed_records = transform_batch(records, transform_keys)
-
-            # Create dataframe with transformed columns
-            df = pd.DataFrame(transformed_records)
-
-            # Data type conversions
-            self._convert_data_types(df)
-
-            # Prepare records for insertion
-            records = df.to_dict('records')
-
-            # Insert in batches
-            batch_size = 1000
-            total_inserted = 0
-
-            for i in range(0, len(records), batch_size):
-                batch = records[i:i + batch_size]
-                inserted = self._upsert_batch(batch, model)
-                total_inserted += inserted
-
-                if (i + batch_size) % 5000 == 0:
-                    logger.info(f"Processed {i + batch_size:,} / {len(records):,} records...")
+            try:
+                total_inserted = copy_merge(self.session, model, df, conflict_columns=self.PK_COLUMNS)
+                self.session.commit()
+            except Exception as e:
+                self.session.rollback()
+                logger.warning(f"Bulk merge failed ({str(e)[:200]}), retrying in batches of 1,000")
+                records = frame_records(df)
+                total_inserted = sum(
+                    self._upsert_batch(records[i:i + 1000], model) for i in range(0, len(records), 1000)
+                )
+            timer.lap('merge', total_inserted)
 
             logger.info(f"✓ Completed {statement_type} {year} {period}: {total_inserted:,} records")
+            logger.info(f"Throughput {file_path.name}: {timer.report()}")
+            self.stage_timer.merge(timer)
             self.records_inserted += total_inserted
 
             return True
@@ -123,22 +118,43 @@ class BulkFinancialCollector(BaseCollector):
             logger.error(f"Error processing bulk financial file: {e}")
             raise
 
-    def _convert_data_types(self, df: pd.DataFrame):
-        """Convert data types to match database schema"""
-        # Convert date columns
-        if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
-            df['date'] = df['date'].apply(lambda x: x.date() if pd.notna(x) else None)
-
-        if 'filing_date' in df.columns:
-            df['filing_date'] = pd.to_datetime(df['filing_date'], errors='coerce')
-            df['filing_date'] = df['filing_date'].apply(lambda x: x.date() if pd.notna(x) else None)
+    def prepare_bulk_frame(self, file_path: Path, model: Any, timer: Optional[StageTimer] = None) -> pd.DataFrame:
+        """
+        Read a bulk CSV into a frame ready to merge into model's table
 
-        if 'accepted_date' in df.columns:
-            df['accepted_date'] = pd.to_datetime(df['accepted_date'], errors='coerce')
+        Args:
+            file_path: Path to the CSV file
+            model: Statement model the file loads into
+            timer: Records the read, rename and coerce stages
 
-        # Replace NaN with None for nullable columns
-        df = df.where(pd.notna(df), None)
+        Returns:
+            Model columns cast to their types, one row per (symbol, date, period)
+        """
+        timer = timer or StageTimer()
+
+        # Read CSV
+        df = pd.read_csv(file_path, low_memory=False)
+        timer.lap('read', len(df))
+        logger.info(f"Loaded {len(df):,} records from CSV")
+
+        # Skip rows with null symbols
+        initial_count = len(df)
+        df = df[df['symbol'].notna()]
+        if len(df) < initial_count:
+            logger.warning(f"Skipped {initial_count - len(df)} rows with null symbols")
+
+        # Transform column names from camelCase to snake_case (one plan per file)
+        df = KeyMapper(model).transform_frame(df)
+        timer.lap('rename', len(df))
+
+        # Data type conversions, vectorized per column
+        df = coerce_to_model(df, model, label=file_path.name)
+        df = df.dropna(subset=self.PK_COLUMNS)
+        # One row per key, or the merge would update a row twice
+        df = df.drop_duplicates(subset=self.PK_COLUMNS, keep='last')
+        timer.lap('coerce', len(df))
+        metrics.record_rows_parsed(self.__class__.__name__, model.__tablename__, len(df))
+        return df
 
     def _upsert_batch(self, records: list, model) -> int:
         """
@@ -159,7 +175,7 @@ class BulkFinancialCollector(BaseCollector):
 
             # Define update dictionary for conflict resolution
             # Update all fields except primary key and timestamps
-            pk_columns = ['symbol', 'date', 'period']
+            pk_columns = self.PK_COLUMNS
             update_dict = {
                 col.name: col
                 for col in stmt.excluded
@@ -2,6 +2,7 @@
 Bulk Stock Peers Collector
 Fetches peer relationships for ALL global symbols from FMP bulk API
 Stores in peers_bulk table (no validation, no foreign keys)
+and one row per (symbol, peer) pair in peer_edges
 Override approach: replaces old peer data with latest
 """
 import logging
@@ -9,13 +10,19 @@ from io import StringIO
 from typing import Dict
 
 import pandas as pd
+from sqlalchemy import case, func
 from sqlalchemy.dialects.postgresql import insert
 
 from src.collectors.base_collector import BaseCollector
-from src.database.models import PeersBulk
+from src.config import FMP_ENDPOINTS
+from src.database.models import PeersBulk, PeerEdge
+from src.utils.peer_graph import peer_graph
 
 logger = logging.getLogger(__name__)
 
+# Edge rows per INSERT (3 bind parameters each)
+EDGE_INSERT_BATCH_SIZE = 5000
+
 
 class BulkPeersCollector(BaseCollector):
     """Collector for bulk stock peers - unvalidated peer relationships"""
@@ -39,6 +46,7 @@ class BulkPeersCollector(BaseCollector):
             {
                 'symbols_received': int,
                 'symbols_inserted': int,
+                'symbols_changed': int,   # new or with a different peers list
                 'success': bool
             }
         """
@@ -49,7 +57,7 @@ class BulkPeersCollector(BaseCollector):
         try:
             # Fetch bulk data (CSV format)
             logger.info("Fetching bulk peers data from FMP API...")
-            url = "https://financialmodelingprep.com/stable/peers-bulk"
+            url = FMP_ENDPOINTS['peers_bulk']
             params = {}
 
             response = self._get(url, params)
@@ -62,6 +70,7 @@ class BulkPeersCollector(BaseCollector):
                 return {
                     'symbols_received': 0,
                     'symbols_inserted': 0,
+                    'symbols_changed': 0,
                     'success': False
                 }
 
@@ -73,6 +82,7 @@ class BulkPeersCollector(BaseCollector):
                 return {
                     'symbols_received': 0,
                     'symbols_inserted': 0,
+                    'symbols_changed': 0,
                     'success': False
                 }
 
@@ -116,22 +126,29 @@ class BulkPeersCollector(BaseCollector):
                 return {
                     'symbols_received': symbols_received,
                     'symbols_inserted': 0,
+                    'symbols_changed': 0,
                     'success': False
                 }
 
             # Batch upsert all records (override old data)
             logger.info(f"Upserting {len(records):,} records into database...")
-            inserted = self._batch_upsert(records)
+            inserted, changed = self._batch_upsert(records)
+
+            # Refresh this process's peer graph if something already loaded it
+            if changed and peer_graph.is_loaded:
+                peer_graph.refresh(self.session)
 
             logger.info("="*80)
             logger.info("[SUCCESS] BULK PEERS COLLECTION COMPLETE")
             logger.info(f"  Symbols received: {symbols_received:,}")
             logger.info(f"  Symbols upserted: {inserted:,}")
+            logger.info(f"  Symbols changed:  {changed:,}")
             logger.info("="*80)
 
             return {
                 'symbols_received': symbols_received,
                 'symbols_inserted': inserted,
+                'symbols_changed': changed,
                 'success': True
             }
 
@@ -142,44 +159,41 @@ class BulkPeersCollector(BaseCollector):
             return {
                 'symbols_received': 0,
                 'symbols_inserted': 0,
+                'symbols_changed': 0,
                 'success': False,
                 'error': str(e)
             }
 
     def _batch_upsert(self, records: list) -> int:
         """
-        Batch upsert records into peers_bulk
+        Batch upsert records into peers_bulk and rewrite their peer_edges
+
+        Each batch's peers_bulk rows and edges are committed together, so the
+        two tables never disagree about a symbol.
 
         Args:
             records: List of peer record dictionaries
 
         Returns:
-            Number of records inserted/updated
+            Tuple of (records inserted/updated, records new or changed)
         """
         if not records:
-            return 0
+            return 0, 0
 
         # Insert in batches to avoid memory issues
         # Using 1000 instead of 10000 to keep error messages manageable
         batch_size = 1000
         total_upserted = 0
+        total_changed = 0
 
         for i in range(0, len(records), batch_size):
             batch = records[i:i+batch_size]
 
             try:
-                stmt = insert(PeersBulk).values(batch)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=['symbol'],
-                    set_={
-                        'peers_list': stmt.excluded.peers_list,
-                        'collected_at': stmt.excluded.collected_at
-                    }
-                )
-
-                self.session.execute(stmt)
+                changed = self._upsert_batch(batch)
                 self.session.commit()  # Commit successful batch immediately
                 total_upserted += len(batch)
+                total_changed += changed
 
                 # Log progress for large batches
                 if len(records) > batch_size:
@@ -194,24 +208,92 @@ class BulkPeersCollector(BaseCollector):
                 logger.warning(f"Attempting individual inserts for batch {i}-{i+len(batch)}...")
                 for idx, record in enumerate(batch):
                     try:
-                        single_stmt = insert(PeersBulk).values([record])
-                        single_stmt = single_stmt.on_conflict_do_update(
-                            index_elements=['symbol'],
-                            set_={
-                                'peers_list': single_stmt.excluded.peers_list,
-                                'collected_at': single_stmt.excluded.collected_at
-                            }
-                        )
-                        self.session.execute(single_stmt)
+                        changed = self._upsert_batch([record])
                         self.session.commit()
                         total_upserted += 1
+                        total_changed += changed
                     except Exception as single_error:
                         logger.error(f"Failed to insert record: {record.get('symbol')} - {single_error}")
                         self.session.rollback()
                         # Skip this record and continue
 
         # All commits happen in the loop above
-        return total_upserted
+        return total_upserted, total_changed
+
+    def _upsert_batch(self, batch: list) -> int:
+        """
+        Upsert peers_bulk rows and replace edges of changed symbols (caller commits)
+
+        last_updated is only moved for new symbols and symbols whose peers_list
+        changed; those are the only ones whose edges are rewritten.
+
+        Args:
+            batch: Peer record dictionaries with unique symbols
+
+        Returns:
+            Number of symbols that were new or changed
+        """
+        stmt = insert(PeersBulk).values(batch)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['symbol'],
+            set_={
+                'peers_list': stmt.excluded.peers_list,
+                'collected_at': stmt.excluded.collected_at,
+                'last_updated': case(
+                    (PeersBulk.peers_list.is_distinct_from(stmt.excluded.peers_list), func.now()),
+                    else_=PeersBulk.last_updated
+                ),
+            }
+        ).returning(
+            # now() is the transaction start, so this is true exactly for rows touched above
+            PeersBulk.symbol, PeersBulk.last_updated == func.now()
+        )
+        changed = [symbol for symbol, is_changed in self.session.execute(stmt) if is_changed]
+        if not changed:
+            return 0
+
+        self.session.query(PeerEdge).filter(
+            PeerEdge.symbol.in_(changed)
+        ).delete(synchronize_session=False)
+
+        changed_set = set(changed)
+        edges = [
+            edge for record in batch if record['symbol'] in changed_set
+            for edge in self._edge_rows(record)
+        ]
+        for j in range(0, len(edges), EDGE_INSERT_BATCH_SIZE):
+            self.session.execute(insert(PeerEdge).values(edges[j:j+EDGE_INSERT_BATCH_SIZE]))
+
+        return len(changed)
+
+    @staticmethod
+    def _edge_rows(record: dict) -> list:
+        """
+        Split a record's peers_list into peer_edges rows
+
+        Args:
+            record: Peer record dictionary
+
+        Returns:
+            List of edge dictionaries, one per distinct peer, in list order
+        """
+        if not record.get('peers_list'):
+            return []
+
+        edges = []
+        seen = set()
+        for peer in record['peers_list'].split(','):
+            peer = peer.strip()
+            # Skip blanks, repeats and values too long to be a symbol
+            if not peer or peer in seen or len(peer) > 20:
+                continue
+            seen.add(peer)
+            edges.append({
+                'symbol': record['symbol'],
+                'peer_symbol': peer,
+                'position': len(edges),
+            })
+        return edges
 
 
 if __name__ == "__main__":
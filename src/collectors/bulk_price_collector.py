@@ -12,6 +12,7 @@ import pandas as pd
 from sqlalchemy.dialects.postgresql import insert
 
 from src.collectors.base_collector import BaseCollector
+from src.config import FMP_ENDPOINTS
 from src.database.models import PriceDailyBulk
 
 logger = logging.getLogger(__name__)
@@ -60,7 +61,7 @@ class BulkPriceCollector(BaseCollector):
         try:
             # Fetch bulk data (CSV format)
             logger.info(f"Fetching bulk EOD data for {date_str}...")
-            url = "https://financialmodelingprep.com/stable/eod-bulk"
+            url = FMP_ENDPOINTS['eod_bulk']
             params = {'date': date_str}
 
             response = self._get(url, params)
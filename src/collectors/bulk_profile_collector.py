@@ -11,7 +11,7 @@ from sqlalchemy.dialects.postgresql import insert
 
 from src.collectors.base_collector import BaseCollector
 from src.database.models import Company
-from src.utils.data_transform import transform_batch, transform_keys
+from src.utils.data_transform import KeyMapper
 from src.utils.bulk_utils import get_bulk_data_path, list_bulk_files
 
 logger = logging.getLogger(__name__)
@@ -90,11 +90,7 @@ class BulkProfileCollector(BaseCollector):
                 return False
 
             # Transform column names from camelCase to snake_case
-            records = df.to_dict('records')
-            transformed_records = transform_batch(records, transform_keys)
-
-            # Create dataframe with transformed columns
-            df = pd.DataFrame(transformed_records)
+            df = KeyMapper().transform_frame(df)
 
             # Data type conversions
             df = self._convert_data_types(df)
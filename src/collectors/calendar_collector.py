@@ -0,0 +1,230 @@
+"""
+Calendar Collector Base
+Shared date-range backfill for the FMP calendar endpoints (from/to queries):
+chunks are fetched concurrently, split when they hit the result cap, and
+recorded in table_update_tracking so a rerun skips finished chunks
+"""
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.collectors.base_collector import BaseCollector
+from src.config import FMP_ENDPOINTS, settings
+from src.database.models import TableUpdateTracking
+
+logger = logging.getLogger(__name__)
+
+# Chunks are aligned to this date so their boundaries (and tracking keys) are
+# the same on every run, whatever the requested start date
+CHUNK_EPOCH = date(1970, 1, 1)
+
+
+class ChunkedCalendarCollector(BaseCollector):
+    """
+    Base for collectors of FMP calendars queried by date range
+
+    Subclasses set endpoint and item_name and implement _store_rows().
+    """
+
+    endpoint: str = ''              # FMP_ENDPOINTS key
+    item_name: str = 'rows'         # Result keys: '<item>_upserted', 'total_<item>'
+    max_range_days: int = 90        # API limit per request
+    result_cap: int = 4000          # API returns at most this many rows per request
+    settled_after_days: int = 30    # Chunks ending this long ago are not refetched
+
+    def __init__(self, session):
+        super().__init__(session)
+        self.fetch_workers = max(1, settings.data_collection.max_workers)
+
+    @property
+    def chunk_tracking_table(self) -> str:
+        """table_update_tracking.table_name for completed backfill chunks"""
+        return f"{self.get_table_name()}_chunks"
+
+    def _store_rows(self, data: List[Dict[str, Any]]) -> int:
+        """Parse one API response and upsert it; returns rows upserted"""
+        raise NotImplementedError
+
+    def _fetch_range(self, from_date: date, to_date: date) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch one date range (safe to call from worker threads)
+
+        Returns:
+            Rows (possibly empty), or None if the request failed
+        """
+        params = {
+            'from': from_date.strftime('%Y-%m-%d'),
+            'to': to_date.strftime('%Y-%m-%d')
+        }
+        data = self._json_safe(self._get(FMP_ENDPOINTS[self.endpoint], params))
+        if data is None or not isinstance(data, list):
+            return None
+        return data
+
+    # ===================== Backfill ===================== #
+
+    def plan_chunks(self, start_date: date, end_date: date) -> List[Tuple[date, date]]:
+        """
+        Split a date range into request-sized chunks on a fixed grid
+
+        Args:
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive)
+
+        Returns:
+            (from, to) pairs of at most max_range_days days, aligned to CHUNK_EPOCH
+        """
+        chunks = []
+        offset = (start_date - CHUNK_EPOCH).days % self.max_range_days
+        current_from = start_date
+        current_to = start_date + timedelta(days=self.max_range_days - 1 - offset)
+        while current_from <= end_date:
+            chunks.append((current_from, min(current_to, end_date)))
+            current_from = current_to + timedelta(days=1)
+            current_to = current_from + timedelta(days=self.max_range_days - 1)
+        return chunks
+
+    @staticmethod
+    def chunk_key(chunk: Tuple[date, date]) -> str:
+        """Tracking symbol for a chunk, e.g. '20240101-20240330'"""
+        return f"{chunk[0]:%Y%m%d}-{chunk[1]:%Y%m%d}"
+
+    def collect_historical(
+        self,
+        start_date: date,
+        end_date: Optional[date] = None,
+        workers: Optional[int] = None
+    ) -> dict:
+        """
+        Backfill historical calendar data
+
+        Chunks are fetched concurrently (all requests share this collector's
+        API_SLEEP_SEC pacing) and upserted as they arrive. A chunk that comes
+        back with result_cap rows was truncated by the API, so it is split in
+        half and both halves are fetched instead. Completed chunks are
+        recorded in table_update_tracking; a rerun skips them unless they end
+        within settled_after_days of today or force_refill is set.
+
+        Args:
+            start_date: Earliest date to fetch
+            end_date: Latest date to fetch (defaults to today)
+            workers: Concurrent requests (defaults to MAX_WORKERS)
+
+        Returns:
+            Dictionary with summary results
+        """
+        if end_date is None:
+            end_date = date.today()
+        workers = max(1, workers or self.fetch_workers)
+        total_key = f"total_{self.item_name}"
+
+        logger.info("="*80)
+        logger.info(f"HISTORICAL BACKFILL: {self.get_table_name()}")
+        logger.info(f"From {start_date} to {end_date} ({workers} workers)")
+        logger.info("="*80)
+
+        chunks = self.plan_chunks(start_date, end_date)
+        done = self._completed_chunks(chunks)
+        pending = [c for c in chunks if self.chunk_key(c) not in done]
+
+        results = {
+            'start_date': start_date,
+            'end_date': end_date,
+            'chunks_planned': len(chunks),
+            'chunks_skipped': len(chunks) - len(pending),
+            'chunks_processed': 0,
+            'chunks_successful': 0,
+            'chunks_failed': 0,
+            'chunks_split': 0,
+            total_key: 0
+        }
+        logger.info(f"{len(chunks)} chunks planned, {results['chunks_skipped']} already complete")
+
+        # Planned chunk -> requests still open, rows upserted, whether any piece failed
+        state = {chunk: {'open': 1, 'rows': 0, 'failed': False} for chunk in pending}
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="calendar-fetch") as pool:
+            futures = {pool.submit(self._fetch_range, *chunk): (chunk, chunk) for chunk in pending}
+
+            while futures:
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    chunk, (from_date, to_date) = futures.pop(future)
+                    progress = state[chunk]
+                    progress['open'] -= 1
+                    data = future.result()
+
+                    if data is not None and len(data) >= self.result_cap and from_date < to_date:
+                        # Truncated by the API: fetch both halves instead
+                        mid = from_date + timedelta(days=(to_date - from_date).days // 2)
+                        logger.info(f"{from_date} to {to_date} hit the {self.result_cap:,}-row cap, splitting")
+                        for piece in ((from_date, mid), (mid + timedelta(days=1), to_date)):
+                            futures[pool.submit(self._fetch_range, *piece)] = (chunk, piece)
+                        progress['open'] += 2
+                        results['chunks_split'] += 1
+                        continue
+
+                    results['chunks_processed'] += 1
+                    try:
+                        if data is None:
+                            raise RuntimeError("request failed")
+                        if len(data) >= self.result_cap:
+                            logger.warning(f"{from_date} returned {len(data):,} rows (the API cap); "
+                                           f"rows beyond it are missing")
+                        upserted = self._store_rows(data) if data else 0
+                        progress['rows'] += upserted
+                        results[total_key] += upserted
+                        results['chunks_successful'] += 1
+                        logger.info(f"Chunk {from_date} to {to_date}: {upserted:,} {self.item_name}")
+                    except Exception as e:
+                        logger.error(f"Chunk {from_date} to {to_date} failed: {e}")
+                        progress['failed'] = True
+                        results['chunks_failed'] += 1
+                        self.record_error(self.chunk_tracking_table, self.chunk_key(chunk), str(e))
+
+                    if progress['open'] == 0 and not progress['failed']:
+                        self._mark_chunk_complete(chunk, progress['rows'])
+
+        logger.info(f"\n{'='*80}")
+        logger.info("HISTORICAL BACKFILL COMPLETE")
+        logger.info(f"  Chunks planned: {results['chunks_planned']} ({results['chunks_skipped']} skipped)")
+        logger.info(f"  Requests: {results['chunks_processed']} ({results['chunks_split']} splits)")
+        logger.info(f"  Successful: {results['chunks_successful']}")
+        logger.info(f"  Failed: {results['chunks_failed']}")
+        logger.info(f"  Total {self.item_name}: {results[total_key]:,}")
+        logger.info(f"{'='*80}")
+
+        return results
+
+    def _is_settled(self, chunk: Tuple[date, date]) -> bool:
+        """Whether a chunk ended long enough ago that its rows no longer change"""
+        return chunk[1] < date.today() - timedelta(days=self.settled_after_days)
+
+    def _completed_chunks(self, chunks: List[Tuple[date, date]]) -> set:
+        """Keys of settled chunks a previous run finished; recent chunks are always due"""
+        settled = [self.chunk_key(c) for c in chunks if self._is_settled(c)]
+        if self.force_refill or not settled:
+            return set()
+        rows = self.session.query(TableUpdateTracking)\
+            .filter(TableUpdateTracking.table_name == self.chunk_tracking_table)\
+            .filter(TableUpdateTracking.symbol.in_(settled))\
+            .all()
+        return {row.symbol for row in rows if row.next_update_due is None and not row.consecutive_errors}
+
+    def _mark_chunk_complete(self, chunk: Tuple[date, date], rows: int):
+        """Record a finished chunk; only settled chunks are skipped by later runs"""
+        settled = self._is_settled(chunk)
+        key = self.chunk_key(chunk)
+        tracking = self.session.query(TableUpdateTracking)\
+            .filter(TableUpdateTracking.table_name == self.chunk_tracking_table)\
+            .filter(TableUpdateTracking.symbol == key)\
+            .first()
+        tracking = self._apply_tracking(
+            tracking, self.chunk_tracking_table, key,
+            last_api_date=chunk[1], record_count=rows
+        )
+        # Recent chunks stay due (refetched on every run) until they settle
+        tracking.update_frequency = None if settled else 'daily' # type: ignore
+        tracking.next_update_due = None if settled else datetime.now() # type: ignore
+        self.session.commit()
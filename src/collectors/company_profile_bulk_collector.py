@@ -1,19 +1,26 @@
 """
 Company Profile Bulk Collector
 Fetches company profile data for all companies from FMP bulk API (CSV)
-Downloads data in 4 parts (part=0,1,2,3) and combines them
+Downloads the 4 parts (part=0,1,2,3) concurrently and loads each part in
+chunks as soon as it has arrived
 """
 import logging
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Optional
+
 import requests
 import pandas as pd
-from io import StringIO
-from typing import Dict, List
 
 from sqlalchemy.dialects.postgresql import insert
 
 from src.collectors.base_collector import BaseCollector
 from src.database.models import CompanyProfileBulk
 from src.config import settings, FMP_ENDPOINTS
+from src.utils import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -21,9 +28,19 @@ logger = logging.getLogger(__name__)
 class CompanyProfileBulkCollector(BaseCollector):
     """Collector for Company Profile bulk data"""
 
+    PARTS = (0, 1, 2, 3)
+
+    # Rows parsed, cleaned and upserted at a time
+    CHUNK_ROWS = 20000
+
+    # Identifier columns read as text so codes keep leading zeros and every
+    # chunk gets the same dtype
+    TEXT_COLUMNS = ('cik', 'isin', 'cusip', 'zip', 'phone')
+
     def __init__(self, session):
         super().__init__(session)
         self.endpoint = FMP_ENDPOINTS['company_profile_bulk']
+        self.download_workers = max(1, min(len(self.PARTS), settings.data_collection.max_workers))
 
     def get_table_name(self) -> str:
         return "company_profile_bulk"
@@ -31,7 +48,13 @@ class CompanyProfileBulkCollector(BaseCollector):
     def collect_bulk_company_profiles(self) -> Dict:
         """
         Collect Company Profile data for all companies from bulk CSV API
-        Downloads data in 4 parts (part=0,1,2,3) and combines them
+
+        All parts download at once, each streamed to a temporary file with
+        its own retries; whichever part finishes first is parsed and upserted
+        in CHUNK_ROWS chunks while the others are still downloading. A part
+        that fails after its retries is recorded as an error without
+        discarding the parts already loaded; tracking is only advanced when
+        every part loaded, so the next run is still due.
 
         Returns:
             Dictionary with collection results
@@ -40,64 +63,80 @@ class CompanyProfileBulkCollector(BaseCollector):
         logger.info("COLLECTING COMPANY PROFILE BULK DATA")
         logger.info("="*80)
 
+        symbols_received = 0
+        inserted = 0
+        loaded_parts = []
+        failed_parts = []
+        download_dir = Path(tempfile.mkdtemp(prefix="profile_bulk_"))
+
         try:
-            # Download all 4 parts
-            all_dataframes = []
-            parts = [0, 1, 2, 3]
-
-            for part in parts:
-                logger.info(f"Downloading part {part}/3...")
-                df_part = self._download_part(part)
-
-                if df_part is not None and not df_part.empty:
-                    all_dataframes.append(df_part)
-                    logger.info(f"  Part {part}: {len(df_part):,} symbols")
-                else:
-                    logger.warning(f"  Part {part}: No data returned")
-
-            if not all_dataframes:
-                logger.warning("No data returned from any part")
+            with ThreadPoolExecutor(max_workers=self.download_workers,
+                                    thread_name_prefix="profile-bulk") as pool:
+                futures = {pool.submit(self._download_part, part, download_dir): part for part in self.PARTS}
+
+                for future in as_completed(futures):
+                    part = futures[future]
+                    path = future.result()
+                    if path is None:
+                        failed_parts.append(part)
+                        self.record_error('company_profile_bulk', f"part_{part}", "download failed")
+                        continue
+
+                    try:
+                        received, part_inserted = self._load_part(part, path)
+                    except Exception as e:
+                        logger.error(f"  Part {part}: load failed: {e}")
+                        self.session.rollback()
+                        failed_parts.append(part)
+                        self.record_error('company_profile_bulk', f"part_{part}", str(e))
+                        continue
+                    finally:
+                        path.unlink(missing_ok=True)
+
+                    symbols_received += received
+                    inserted += part_inserted
+                    loaded_parts.append(part)
+
+            self.records_inserted += inserted
+
+            if not loaded_parts:
+                logger.warning("No data loaded from any part")
                 return {
                     'success': False,
                     'symbols_received': 0,
                     'symbols_inserted': 0,
+                    'parts_loaded': [],
+                    'parts_failed': sorted(failed_parts),
                     'error': 'No data from API'
                 }
 
-            # Combine all parts
-            logger.info("Combining all parts...")
-            df = pd.concat(all_dataframes, ignore_index=True)
-            symbols_received = len(df)
-            logger.info(f"Total symbols received: {symbols_received:,}")
-            logger.info(f"CSV columns: {len(df.columns)}")
-
-            # Clean and transform data
-            df_clean = self._clean_data(df)
-            logger.info(f"Cleaned data: {len(df_clean):,} valid records")
-
-            # Insert into database
-            inserted = self._upsert_records(df_clean)
-            self.records_inserted += inserted
-
-            # Update tracking
-            self.update_tracking(
-                'company_profile_bulk',
-                symbol=None,  # Global bulk data
-                record_count=self.session.query(CompanyProfileBulk).count(),
-                next_update_frequency='daily'
-            )
+            if not failed_parts:
+                self.update_tracking(
+                    'company_profile_bulk',
+                    symbol=None,  # Global bulk data
+                    record_count=self.session.query(CompanyProfileBulk).count(),
+                    next_update_frequency='daily'
+                )
 
             logger.info("="*80)
-            logger.info(f"✓ BULK COMPANY PROFILE COLLECTION COMPLETE")
+            logger.info(f"✓ BULK COMPANY PROFILE COLLECTION {'COMPLETE' if not failed_parts else 'PARTIAL'}")
+            logger.info(f"  Parts loaded: {sorted(loaded_parts)}")
+            if failed_parts:
+                logger.warning(f"  Parts failed: {sorted(failed_parts)}")
             logger.info(f"  Symbols received: {symbols_received:,}")
             logger.info(f"  Symbols inserted/updated: {inserted:,}")
             logger.info("="*80)
 
-            return {
-                'success': True,
+            result = {
+                'success': not failed_parts,
                 'symbols_received': symbols_received,
-                'symbols_inserted': inserted
+                'symbols_inserted': inserted,
+                'parts_loaded': sorted(loaded_parts),
+                'parts_failed': sorted(failed_parts)
             }
+            if failed_parts:
+                result['error'] = f"Parts failed: {sorted(failed_parts)}"
+            return result
 
         except Exception as e:
             logger.error(f"Error collecting bulk company profiles: {e}")
@@ -105,45 +144,94 @@ class CompanyProfileBulkCollector(BaseCollector):
             self.record_error('company_profile_bulk', 'ALL', str(e))
             return {
                 'success': False,
-                'symbols_received': 0,
-                'symbols_inserted': 0,
+                'symbols_received': symbols_received,
+                'symbols_inserted': inserted,
+                'parts_loaded': sorted(loaded_parts),
+                'parts_failed': sorted(failed_parts),
                 'error': str(e)
             }
+        finally:
+            shutil.rmtree(download_dir, ignore_errors=True)
 
-    def _download_part(self, part: int) -> pd.DataFrame:
+    def _download_part(self, part: int, download_dir: Path) -> Optional[Path]:
         """
-        Download a single part of the company profile bulk data
+        Stream one part of the company profile bulk CSV to a file (worker thread)
+
+        Retries 429/5xx responses and interrupted transfers with exponential
+        backoff; each attempt restarts this part only.
 
         Args:
             part: Part number (0, 1, 2, or 3)
+            download_dir: Directory for the downloaded file
 
         Returns:
-            DataFrame with company profiles
+            Path to the CSV, or None if every attempt failed
         """
-        try:
-            params = {
-                'apikey': settings.api.fmp_api_key,
-                'part': str(part)
-            }
-            response = requests.get(
-                self.endpoint,
-                params=params,
-                timeout=settings.api.timeout
-            )
-
-            if response.status_code != 200:
-                logger.error(f"Part {part}: API request failed with status {response.status_code}")
-                return None
+        path = download_dir / f"profile_bulk_part{part}.csv"
+        params = {
+            'apikey': self.api_key,
+            'part': str(part)
+        }
 
-            # Parse CSV directly from response text
-            csv_data = StringIO(response.text)
-            df = pd.read_csv(csv_data)
+        for attempt in range(self.retries):
+            try:
+                self._wait_for_request_slot()
+                logger.info(f"Downloading part {part}/{len(self.PARTS) - 1}...")
+                with self.http_session.get(self.endpoint, params=params,
+                                           timeout=self.timeout, stream=True) as response:
+                    if response.status_code in (429, 500, 502, 503, 504):
+                        wait_time = self.backoff * (2 ** attempt)
+                        logger.warning(
+                            f"Part {part}: API returned {response.status_code}, "
+                            f"retrying in {wait_time}s (attempt {attempt + 1}/{self.retries})"
+                        )
+                        metrics.rate_limited_sleep('fmp', wait_time)
+                        continue
+                    if response.status_code != 200:
+                        logger.error(f"Part {part}: API request failed with status {response.status_code}")
+                        return None
+
+                    with open(path, 'wb') as f:
+                        for block in response.iter_content(chunk_size=1 << 20):
+                            f.write(block)
+                return path
+
+            except (requests.exceptions.RequestException, OSError) as e:
+                wait_time = self.backoff * (2 ** attempt)
+                logger.warning(f"Part {part}: download interrupted ({e}), "
+                               f"retrying in {wait_time}s (attempt {attempt + 1}/{self.retries})")
+                path.unlink(missing_ok=True)
+                time.sleep(wait_time)
+
+        logger.error(f"Part {part}: giving up after {self.retries} attempts")
+        return None
+
+    def _load_part(self, part: int, path: Path) -> tuple:
+        """
+        Parse a downloaded part in CHUNK_ROWS chunks and upsert each chunk
 
-            return df
+        Args:
+            part: Part number (for logging)
+            path: Downloaded CSV
 
-        except Exception as e:
-            logger.error(f"Error downloading part {part}: {e}")
-            return None
+        Returns:
+            (rows received, records inserted/updated)
+        """
+        received = 0
+        inserted = 0
+        try:
+            chunks = pd.read_csv(path, chunksize=self.CHUNK_ROWS,
+                                 dtype={col: str for col in self.TEXT_COLUMNS})
+            for chunk in chunks:
+                received += len(chunk)
+                df_clean = self._clean_data(chunk)
+                inserted += self._upsert_records(df_clean)
+        except pd.errors.EmptyDataError:
+            logger.warning(f"  Part {part}: No data returned")
+            return 0, 0
+
+        logger.info(f"  Part {part}: {received:,} symbols, {inserted:,} inserted/updated")
+        return received, inserted
 
     def _clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -309,28 +397,28 @@ class CompanyProfileBulkCollector(BaseCollector):
 
         logger.info(f"Inserting {total_records:,} records...")
 
+        # UPSERT: insert or update on conflict; compiled once, executed per batch
+        stmt = insert(CompanyProfileBulk.__table__)
+
+        # Get all columns except primary key and metadata
+        update_columns = {
+            col: getattr(stmt.excluded, col)
+            for col in df.columns
+            if col not in ['symbol', 'created_at']
+        }
+        update_columns['updated_at'] = stmt.excluded.updated_at
+
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['symbol'],
+            set_=update_columns
+        )
+
         # Process in batches
         for i in range(0, total_records, batch_size):
             batch = sanitized_records[i:i + batch_size]
 
             try:
-                # UPSERT: insert or update on conflict
-                stmt = insert(CompanyProfileBulk).values(batch)
-
-                # Get all columns except primary key and metadata
-                update_columns = {
-                    col: getattr(stmt.excluded, col)
-                    for col in df.columns
-                    if col not in ['symbol', 'created_at']
-                }
-                update_columns['updated_at'] = stmt.excluded.updated_at
-
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=['symbol'],
-                    set_=update_columns
-                )
-
-                self.session.execute(stmt)
+                self.session.execute(stmt, batch)
                 self.session.commit()
 
                 total_inserted += len(batch)
@@ -4,23 +4,25 @@ Collects earnings announcements calendar from FMP API
 Tracks upcoming earnings dates with estimated and actual EPS/revenue
 """
 import logging
-from datetime import datetime, date, timedelta
-from typing import Optional
+from datetime import date, timedelta
 
+import numpy as np
 import pandas as pd
 from sqlalchemy.dialects.postgresql import insert
 
-from src.collectors.base_collector import BaseCollector
+from src.collectors.calendar_collector import ChunkedCalendarCollector
 from src.database.models import EarningsCalendar
-from src.config import FMP_ENDPOINTS
-from src.utils.data_transform import transform_keys
+from src.utils.data_transform import transform_batch
 
 logger = logging.getLogger(__name__)
 
 
-class EarningsCalendarCollector(BaseCollector):
+class EarningsCalendarCollector(ChunkedCalendarCollector):
     """Collector for earnings calendar events"""
 
+    endpoint = 'earnings_calendar'
+    item_name = 'announcements'
+
     def get_table_name(self) -> str:
         return "earnings_calendar"
 
@@ -64,14 +66,7 @@ class EarningsCalendarCollector(BaseCollector):
 
         try:
             # Fetch from API
-            url = FMP_ENDPOINTS['earnings_calendar']
-            params = {
-                'from': from_date.strftime('%Y-%m-%d'),
-                'to': to_date.strftime('%Y-%m-%d')
-            }
-
-            response = self._get(url, params)
-            data = self._json_safe(response)
+            data = self._fetch_range(from_date, to_date)
 
             if not data:
                 logger.warning(f"No earnings data returned for {from_date} to {to_date}")
@@ -83,44 +78,11 @@ class EarningsCalendarCollector(BaseCollector):
                     'success': False
                 }
 
-            # Convert to DataFrame
-            df = pd.DataFrame(data)
-            announcements_received = len(df)
+            announcements_received = len(data)
             logger.info(f"Received {announcements_received:,} earnings announcements")
 
-            if df.empty:
-                return {
-                    'from_date': from_date,
-                    'to_date': to_date,
-                    'announcements_received': 0,
-                    'announcements_upserted': 0,
-                    'success': True
-                }
-
-            # Parse dates
-            df['date'] = pd.to_datetime(df['date'], errors='coerce').dt.date
-            if 'lastUpdated' in df.columns:
-                df['last_updated'] = pd.to_datetime(df['lastUpdated'], errors='coerce').dt.date
-
-            # Drop duplicates on primary key (API sometimes returns duplicates)
-            # Keep the last occurrence (most recent data)
-            before_dedup = len(df)
-            df = df.drop_duplicates(subset=['symbol', 'date'], keep='last')
-            if len(df) < before_dedup:
-                logger.warning(f"Removed {before_dedup - len(df)} duplicate (symbol, date) pairs")
-
-            # Clean NaN/inf values BEFORE to_dict() - critical for PostgreSQL
-            import numpy as np
-            df = df.replace({np.nan: None, np.inf: None, -np.inf: None})
-
-            # Convert to records
-            records = df.to_dict('records')
-
-            # Transform camelCase keys to snake_case (API returns camelCase)
-            records = [transform_keys(record) for record in records]
-
             # Upsert all records
-            announcements_upserted = self._upsert_announcements(records)
+            announcements_upserted = self._store_rows(data)
 
             logger.info(f"Successfully upserted {announcements_upserted:,} announcements")
 
@@ -143,69 +105,42 @@ class EarningsCalendarCollector(BaseCollector):
                 'error': str(e)
             }
 
-    def collect_historical(self, start_date: date, end_date: Optional[date] = None) -> dict:
+    def _store_rows(self, data: list) -> int:
         """
-        Backfill historical earnings calendar data
-
-        Fetches data in 90-day chunks from start_date to end_date
+        Parse an earnings calendar response and upsert it
 
         Args:
-            start_date: Earliest date to fetch
-            end_date: Latest date to fetch (defaults to today)
+            data: Announcements as returned by the API (camelCase keys)
 
         Returns:
-            Dictionary with summary results
+            Number of records upserted
         """
-        if end_date is None:
-            end_date = date.today()
-
-        logger.info(f"="*80)
-        logger.info(f"HISTORICAL BACKFILL: Earnings Calendar")
-        logger.info(f"From {start_date} to {end_date}")
-        logger.info(f"="*80)
-
-        total_days = (end_date - start_date).days
-        logger.info(f"Total date range: {total_days} days")
-
-        results = {
-            'start_date': start_date,
-            'end_date': end_date,
-            'chunks_processed': 0,
-            'chunks_successful': 0,
-            'chunks_failed': 0,
-            'total_announcements': 0
-        }
-
-        # Fetch in 90-day chunks
-        current_from = start_date
-        chunk_size = 90
-
-        while current_from <= end_date:
-            current_to = min(current_from + timedelta(days=chunk_size - 1), end_date)
+        df = pd.DataFrame(data)
+        if df.empty:
+            return 0
 
-            logger.info(f"\nProcessing chunk: {current_from} to {current_to}")
+        # Parse dates
+        df['date'] = pd.to_datetime(df['date'], errors='coerce').dt.date
+        if 'lastUpdated' in df.columns:
+            df['last_updated'] = pd.to_datetime(df['lastUpdated'], errors='coerce').dt.date
 
-            result = self.collect_range(current_from, current_to)
+        # Drop duplicates on primary key (API sometimes returns duplicates)
+        # Keep the last occurrence (most recent data)
+        before_dedup = len(df)
+        df = df.drop_duplicates(subset=['symbol', 'date'], keep='last')
+        if len(df) < before_dedup:
+            logger.warning(f"Removed {before_dedup - len(df)} duplicate (symbol, date) pairs")
 
-            results['chunks_processed'] += 1
-            if result['success']:
-                results['chunks_successful'] += 1
-                results['total_announcements'] += result['announcements_upserted']
-            else:
-                results['chunks_failed'] += 1
+        # Clean NaN/inf values BEFORE to_dict() - critical for PostgreSQL
+        df = df.replace({np.nan: None, np.inf: None, -np.inf: None})
 
-            # Move to next chunk
-            current_from = current_to + timedelta(days=1)
+        # Convert to records
+        records = df.to_dict('records')
 
-        logger.info(f"\n{'='*80}")
-        logger.info(f"HISTORICAL BACKFILL COMPLETE")
-        logger.info(f"  Chunks processed: {results['chunks_processed']}")
-        logger.info(f"  Successful: {results['chunks_successful']}")
-        logger.info(f"  Failed: {results['chunks_failed']}")
-        logger.info(f"  Total announcements: {results['total_announcements']:,}")
-        logger.info(f"{'='*80}")
+        # Transform camelCase keys to snake_case (API returns camelCase)
+        records = transform_batch(records)
 
-        return results
+        return self._upsert_announcements(records)
 
     def _upsert_announcements(self, records: list) -> int:
         """
@@ -225,7 +160,7 @@ class EarningsCalendarCollector(BaseCollector):
             return 0
 
         try:
-            stmt = insert(EarningsCalendar).values(records)
+            stmt = insert(EarningsCalendar.__table__)
 
             # On conflict (same symbol+date), update all fields
             stmt = stmt.on_conflict_do_update(
@@ -240,7 +175,8 @@ class EarningsCalendarCollector(BaseCollector):
                 }
             )
 
-            self.session.execute(stmt)
+            # Core executemany: one compiled statement, sent as multi-row VALUES batches
+            self.session.execute(stmt, records)
             self.session.commit()
 
             return len(records)
@@ -4,23 +4,25 @@ Collects economic data releases calendar from FMP API
 Tracks upcoming events and historical releases with estimates and actual values
 """
 import logging
-from datetime import datetime, date, timedelta
-from typing import Optional
+from datetime import date, timedelta
 
+import numpy as np
 import pandas as pd
 from sqlalchemy.dialects.postgresql import insert
 
-from src.collectors.base_collector import BaseCollector
+from src.collectors.calendar_collector import ChunkedCalendarCollector
 from src.database.models import EconomicCalendar
-from src.config import FMP_ENDPOINTS
-from src.utils.data_transform import transform_keys
+from src.utils.data_transform import transform_batch
 
 logger = logging.getLogger(__name__)
 
 
-class EconomicCalendarCollector(BaseCollector):
+class EconomicCalendarCollector(ChunkedCalendarCollector):
     """Collector for economic calendar events"""
 
+    endpoint = 'economic_calendar'
+    item_name = 'events'
+
     def get_table_name(self) -> str:
         return "economic_calendar"
 
@@ -71,14 +73,7 @@ class EconomicCalendarCollector(BaseCollector):
 
         try:
             # Fetch from API
-            url = FMP_ENDPOINTS['economic_calendar']
-            params = {
-                'from': from_date.strftime('%Y-%m-%d'),
-                'to': to_date.strftime('%Y-%m-%d')
-            }
-
-            response = self._get(url, params)
-            data = self._json_safe(response)
+            data = self._fetch_range(from_date, to_date)
 
             if not data:
                 logger.warning(f"No economic calendar data returned for {from_date} to {to_date}")
@@ -90,35 +85,11 @@ class EconomicCalendarCollector(BaseCollector):
                     'success': False
                 }
 
-            # Convert to DataFrame
-            df = pd.DataFrame(data)
-            events_received = len(df)
+            events_received = len(data)
             logger.info(f"Received {events_received:,} economic events")
 
-            if df.empty:
-                return {
-                    'from_date': from_date,
-                    'to_date': to_date,
-                    'events_received': 0,
-                    'events_upserted': 0,
-                    'success': True
-                }
-
-            # Parse date as datetime (includes time component)
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
-
-            # Clean NaN/inf values BEFORE to_dict() - critical for PostgreSQL
-            import numpy as np
-            df = df.replace({np.nan: None, np.inf: None, -np.inf: None})
-
-            # Convert to records
-            records = df.to_dict('records')
-
-            # Transform camelCase keys to snake_case (API returns camelCase)
-            records = [transform_keys(record) for record in records]
-
             # Upsert all records
-            events_upserted = self._upsert_events(records)
+            events_upserted = self._store_rows(data)
 
             logger.info(f"Successfully upserted {events_upserted:,} events")
 
@@ -141,69 +112,33 @@ class EconomicCalendarCollector(BaseCollector):
                 'error': str(e)
             }
 
-    def collect_historical(self, start_date: date, end_date: Optional[date] = None) -> dict:
+    def _store_rows(self, data: list) -> int:
         """
-        Backfill historical economic calendar data
-
-        Fetches data in 90-day chunks from start_date to end_date
+        Parse an economic calendar response and upsert it
 
         Args:
-            start_date: Earliest date to fetch
-            end_date: Latest date to fetch (defaults to today)
+            data: Events as returned by the API (camelCase keys)
 
         Returns:
-            Dictionary with summary results
+            Number of records upserted
         """
-        if end_date is None:
-            end_date = date.today()
-
-        logger.info(f"="*80)
-        logger.info(f"HISTORICAL BACKFILL: Economic Calendar")
-        logger.info(f"From {start_date} to {end_date}")
-        logger.info(f"="*80)
-
-        total_days = (end_date - start_date).days
-        logger.info(f"Total date range: {total_days} days")
-
-        results = {
-            'start_date': start_date,
-            'end_date': end_date,
-            'chunks_processed': 0,
-            'chunks_successful': 0,
-            'chunks_failed': 0,
-            'total_events': 0
-        }
-
-        # Fetch in 90-day chunks
-        current_from = start_date
-        chunk_size = 90
-
-        while current_from <= end_date:
-            current_to = min(current_from + timedelta(days=chunk_size - 1), end_date)
-
-            logger.info(f"\nProcessing chunk: {current_from} to {current_to}")
+        df = pd.DataFrame(data)
+        if df.empty:
+            return 0
 
-            result = self.collect_range(current_from, current_to)
+        # Parse date as datetime (includes time component)
+        df['date'] = pd.to_datetime(df['date'], errors='coerce')
 
-            results['chunks_processed'] += 1
-            if result['success']:
-                results['chunks_successful'] += 1
-                results['total_events'] += result['events_upserted']
-            else:
-                results['chunks_failed'] += 1
+        # Clean NaN/inf values BEFORE to_dict() - critical for PostgreSQL
+        df = df.replace({np.nan: None, np.inf: None, -np.inf: None})
 
-            # Move to next chunk
-            current_from = current_to + timedelta(days=1)
+        # Convert to records
+        records = df.to_dict('records')
 
-        logger.info(f"\n{'='*80}")
-        logger.info(f"HISTORICAL BACKFILL COMPLETE")
-        logger.info(f"  Chunks processed: {results['chunks_processed']}")
-        logger.info(f"  Successful: {results['chunks_successful']}")
-        logger.info(f"  Failed: {results['chunks_failed']}")
-        logger.info(f"  Total events: {results['total_events']:,}")
-        logger.info(f"{'='*80}")
+        # Transform camelCase keys to snake_case (API returns camelCase)
+        records = transform_batch(records)
 
-        return results
+        return self._upsert_events(records)
 
     def _upsert_events(self, records: list) -> int:
         """
@@ -223,7 +158,7 @@ class EconomicCalendarCollector(BaseCollector):
             return 0
 
         try:
-            stmt = insert(EconomicCalendar).values(records)
+            stmt = insert(EconomicCalendar.__table__)
 
             # On conflict (same date+country+event), update all fields
             stmt = stmt.on_conflict_do_update(
@@ -241,7 +176,8 @@ class EconomicCalendarCollector(BaseCollector):
                 }
             )
 
-            self.session.execute(stmt)
+            # Core executemany: one compiled statement, sent as multi-row VALUES batches
+            self.session.execute(stmt, records)
             self.session.commit()
 
             return len(records)
@@ -2,11 +2,14 @@
 Economic Data Collector - FRED and FMP economic indicators
 Integrates with FREDCollector to fetch data and saves to database
 """
+import hashlib
 import logging
 from datetime import datetime, date
+from pathlib import Path
 from typing import Optional, Dict, List
 
 import pandas as pd
+from sqlalchemy import update
 from sqlalchemy.dialects.postgresql import insert
 
 from src.collectors.base_collector import BaseCollector
@@ -19,6 +22,16 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# ETag/Last-Modified cache so unchanged FRED/FMP series come back as 304s
+HTTP_CACHE_DIR = Path('data/http_cache/fred')
+
+# Values are stored as Numeric(20, 6); compare and hash at that precision
+VALUE_DECIMALS = 6
+
+# Period frequencies matching FREDCollector's 'ME' / 'QE-DEC' resample rules
+MONTHLY_PERIOD = 'M'
+QUARTERLY_PERIOD = 'Q-DEC'
+
 
 class EconomicCollector(BaseCollector):
     """Collector for economic indicators from FRED and FMP"""
@@ -46,12 +59,18 @@ class EconomicCollector(BaseCollector):
             logger.info("Starting economic data collection...")
 
             # Initialize FRED collector
-            self.fred_collector = FREDCollector(fmp_api_key=self.fmp_api_key)
+            self.fred_collector = FREDCollector(fmp_api_key=self.fmp_api_key, cache_dir=HTTP_CACHE_DIR)
 
             # Fetch all data from FRED and FMP
             logger.info("Fetching data from FRED and FMP APIs...")
             self.fred_collector.fetch_all()
 
+            statuses = list(self.fred_collector.fetch_status.values())
+            logger.info(
+                f"Fetched {len(statuses)} series: {statuses.count('ok')} downloaded, "
+                f"{statuses.count('not_modified')} not modified, {statuses.count('failed')} failed"
+            )
+
             if not self.fred_collector.raw_frames:
                 logger.warning("No economic data fetched")
                 return False
@@ -59,14 +78,18 @@ class EconomicCollector(BaseCollector):
             # Save indicator metadata
             self._save_indicator_metadata()
 
-            # Save raw data
-            self._save_raw_data()
+            # Compare fetched series with stored hashes/observations
+            changes = self._detect_changes()
 
-            # Generate and save monthly aggregations
-            self._save_monthly_aggregations()
+            # Save new and revised raw observations
+            self._save_raw_data(changes)
 
-            # Generate and save quarterly aggregations
-            self._save_quarterly_aggregations()
+            # Recompute monthly/quarterly aggregations for affected periods only
+            self._save_monthly_aggregations(changes)
+            self._save_quarterly_aggregations(changes)
+
+            # Record hashes last, so a failed run is retried next time
+            self._save_series_state(changes)
 
             # Update tracking
             self.update_tracking(
@@ -167,62 +190,173 @@ class EconomicCollector(BaseCollector):
             self.session.rollback()
             raise
 
-    def _save_raw_data(self) -> None:
-        """Save raw time series data to economic_data_raw table"""
+    # ===================== Change Detection ===================== #
+
+    def _series_frame(self, indicator_code: str, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Normalize a fetched frame to ['date', 'value'] (one row per date, sorted)."""
+        if df.empty or 'Date' not in df.columns:
+            return None
+
+        # Get value column (should be the indicator_code)
+        if indicator_code not in df.columns:
+            logger.warning(f"Value column {indicator_code} not found for {indicator_code}")
+            return None
+
+        frame = pd.DataFrame({
+            'date': pd.to_datetime(df['Date'], errors='coerce'),
+            'value': pd.to_numeric(df[indicator_code], errors='coerce').round(VALUE_DECIMALS),
+        }).dropna(subset=['date'])
+
+        # Drop duplicates on date (keep last occurrence)
+        frame = frame.drop_duplicates(subset=['date'], keep='last').sort_values('date')
+        frame['date'] = frame['date'].dt.date
+        return frame.reset_index(drop=True)
+
+    @staticmethod
+    def _content_hash(frame: pd.DataFrame) -> str:
+        """SHA-256 of a normalized series at stored precision."""
+        values = frame['value'].map(lambda v: '' if pd.isna(v) else f"{v:.{VALUE_DECIMALS}f}")
+        payload = '\n'.join(f"{d.isoformat()},{v}" for d, v in zip(frame['date'], values))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _detect_changes(self) -> Dict[str, Dict]:
+        """
+        Find new and revised observations per series
+
+        Series whose content hash matches the stored one are skipped without
+        touching their rows. For the others, observations after the stored
+        last_observation_date are new; earlier ones are compared with the
+        stored values and count as revised when they differ.
+
+        Returns:
+            Dictionary mapping indicator_code to
+            {'frame', 'new_dates', 'revised_dates', 'content_hash', 'last_date'}
+            for changed series only
+        """
+        stored = {
+            code: (content_hash, last_date)
+            for code, content_hash, last_date in self.session.query(
+                EconomicIndicator.indicator_code,
+                EconomicIndicator.content_hash,
+                EconomicIndicator.last_observation_date
+            )
+        }
+
+        changes = {}
+        unchanged = 0
+
+        for indicator_code, df in self.fred_collector.raw_frames.items(): # type: ignore
+            frame = self._series_frame(indicator_code, df)
+            if frame is None or frame.empty:
+                continue
+
+            content_hash = self._content_hash(frame)
+            stored_hash, stored_last = stored.get(indicator_code, (None, None))
+            if content_hash == stored_hash and not self.force_refill:
+                unchanged += 1
+                continue
+
+            existing_query = self.session.query(EconomicDataRaw.date, EconomicDataRaw.value).filter(
+                EconomicDataRaw.indicator_code == indicator_code
+            )
+            if stored_last and not self.force_refill:
+                existing_query = existing_query.filter(EconomicDataRaw.date <= stored_last)
+            existing = {
+                d: (round(float(v), VALUE_DECIMALS) if v is not None else None)
+                for d, v in existing_query
+            }
+
+            new_dates, revised_dates = [], []
+            for d, v in zip(frame['date'], frame['value']):
+                value = None if pd.isna(v) else float(v)
+                if d not in existing:
+                    new_dates.append(d)
+                elif existing[d] != value or self.force_refill:
+                    revised_dates.append(d)
+
+            if new_dates or revised_dates:
+                logger.info(f"  {indicator_code}: {len(new_dates)} new, {len(revised_dates)} revised")
+
+            changes[indicator_code] = {
+                'frame': frame,
+                'new_dates': new_dates,
+                'revised_dates': revised_dates,
+                'content_hash': content_hash,
+                'last_date': frame['date'].iloc[-1],
+            }
+
+        total_new = sum(len(c['new_dates']) for c in changes.values())
+        total_revised = sum(len(c['revised_dates']) for c in changes.values())
+        logger.info(
+            f"✓ Change detection: {len(changes)} series changed ({total_new} new, "
+            f"{total_revised} revised observations), {unchanged} unchanged"
+        )
+        return changes
+
+    def _save_series_state(self, changes: Dict[str, Dict]) -> None:
+        """Store content hash and last observation date for changed series"""
         try:
-            all_records = []
+            for indicator_code, change in changes.items():
+                self.session.execute(
+                    update(EconomicIndicator)
+                    .where(EconomicIndicator.indicator_code == indicator_code)
+                    .values(content_hash=change['content_hash'], last_observation_date=change['last_date'])
+                )
+            self.session.commit()
 
-            for indicator_code, df in self.fred_collector.raw_frames.items(): # type: ignore
-                if df.empty or 'Date' not in df.columns:
-                    continue
+        except Exception as e:
+            logger.error(f"Error saving series state: {e}")
+            self.session.rollback()
+            raise
 
-                # Ensure Date column is datetime
-                df = df.copy()
-                df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-                df = df.dropna(subset=['Date'])
+    # ===================== Saving ===================== #
 
-                # Convert to date (not datetime)
-                df['date'] = df['Date'].dt.date
+    def _upsert_values(self, model, records: List[Dict]) -> int:
+        """Upsert (indicator_code, date, value) records in batches"""
+        batch_size = 10000
+        total = 0
 
-                # Get value column (should be the indicator_code)
-                value_col = indicator_code
-                if value_col not in df.columns:
-                    logger.warning(f"Value column {value_col} not found for {indicator_code}")
-                    continue
+        for i in range(0, len(records), batch_size):
+            batch = records[i:i+batch_size]
 
-                # Drop duplicates on date (keep last occurrence)
-                df = df.drop_duplicates(subset=['date'], keep='last')
+            stmt = insert(model).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['indicator_code', 'date'],
+                set_={'value': stmt.excluded.value}
+            )
 
-                # Create records
-                for _, row in df.iterrows():
-                    all_records.append({
-                        'indicator_code': indicator_code,
-                        'date': row['date'],
-                        'value': float(row[value_col]) if pd.notna(row[value_col]) else None,
-                        'created_at': datetime.now()
-                    })
+            self.session.execute(stmt)
+            total += len(batch)
 
-            if not all_records:
-                logger.warning("No raw data records to save")
-                return
+        self.session.commit()
+        return total
 
-            # Insert in batches to avoid memory issues
-            batch_size = 10000
-            total_inserted = 0
+    def _save_raw_data(self, changes: Dict[str, Dict]) -> None:
+        """Save new and revised observations to economic_data_raw table"""
+        try:
+            all_records = []
+            now = datetime.now()
 
-            for i in range(0, len(all_records), batch_size):
-                batch = all_records[i:i+batch_size]
+            for indicator_code, change in changes.items():
+                touched = set(change['new_dates']) | set(change['revised_dates'])
+                if not touched:
+                    continue
 
-                stmt = insert(EconomicDataRaw).values(batch)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=['indicator_code', 'date'],
-                    set_={'value': stmt.excluded.value}
-                )
+                frame = change['frame']
+                for d, v in zip(frame['date'], frame['value']):
+                    if d in touched:
+                        all_records.append({
+                            'indicator_code': indicator_code,
+                            'date': d,
+                            'value': float(v) if pd.notna(v) else None,
+                            'created_at': now
+                        })
 
-                self.session.execute(stmt)
-                total_inserted += len(batch)
+            if not all_records:
+                logger.info("✓ No new or revised raw data points")
+                return
 
-            self.session.commit()
+            total_inserted = self._upsert_values(EconomicDataRaw, all_records)
             self.records_inserted += total_inserted
 
             logger.info(f"✓ Saved {total_inserted} raw data points")
@@ -232,60 +366,58 @@ class EconomicCollector(BaseCollector):
             self.session.rollback()
             raise
 
-    def _save_monthly_aggregations(self) -> None:
-        """Generate and save monthly aggregations"""
-        try:
-            monthly_panel = self.fred_collector.build_monthly_panel() # type: ignore
-
-            if monthly_panel.empty:
-                logger.warning("No monthly panel data to save")
-                return
+    def _period_records(self, changes: Dict[str, Dict], period_freq: str, how: str) -> List[Dict]:
+        """
+        Aggregate each changed series over the periods its new/revised
+        observations fall in; other periods are left as stored
 
-            # Convert wide to long format
-            all_records = []
+        Args:
+            changes: Output of _detect_changes
+            period_freq: Pandas period frequency (MONTHLY_PERIOD or QUARTERLY_PERIOD)
+            how: 'last'|'mean'|'max'|'min' (FREDCollector aggregation)
 
-            for col in monthly_panel.columns:
-                if col == 'Date':
-                    continue
+        Returns:
+            Records keyed by period-end date
+        """
+        if how not in ('last', 'mean', 'max', 'min'):
+            raise ValueError(f"Unsupported aggregation: {how}")
 
-                df_long = monthly_panel[['Date', col]].copy()
-                df_long = df_long.dropna(subset=[col])
-                df_long['indicator_code'] = col
-                df_long['value'] = df_long[col]
-                df_long['date'] = pd.to_datetime(df_long['Date']).dt.date
+        records = []
+        now = datetime.now()
 
-                # Drop duplicates on date
-                df_long = df_long.drop_duplicates(subset=['date'], keep='last')
+        for indicator_code, change in changes.items():
+            touched = change['new_dates'] + change['revised_dates']
+            if not touched:
+                continue
 
-                for _, row in df_long.iterrows():
-                    all_records.append({
-                        'indicator_code': row['indicator_code'],
-                        'date': row['date'],
-                        'value': float(row['value']) if pd.notna(row['value']) else None,
-                        'created_at': datetime.now()
-                    })
+            frame = change['frame']
+            periods = pd.PeriodIndex(pd.to_datetime(frame['date']), freq=period_freq)
+            affected = set(pd.PeriodIndex(pd.to_datetime(pd.Series(touched)), freq=period_freq))
 
-            if not all_records:
-                logger.warning("No monthly records to save")
-                return
+            mask = periods.isin(list(affected))
+            values = frame.loc[mask, 'value']
+            aggregated = getattr(values.groupby(periods[mask]), how)().dropna()
 
-            # Insert in batches
-            batch_size = 10000
-            total_inserted = 0
+            for period, value in aggregated.items():
+                records.append({
+                    'indicator_code': indicator_code,
+                    'date': period.end_time.date(),
+                    'value': float(value),
+                    'created_at': now
+                })
 
-            for i in range(0, len(all_records), batch_size):
-                batch = all_records[i:i+batch_size]
+        return records
 
-                stmt = insert(EconomicDataMonthly).values(batch)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=['indicator_code', 'date'],
-                    set_={'value': stmt.excluded.value}
-                )
+    def _save_monthly_aggregations(self, changes: Dict[str, Dict]) -> None:
+        """Recompute and save monthly aggregations for affected months"""
+        try:
+            records = self._period_records(changes, MONTHLY_PERIOD, self.fred_collector.monthly_agg) # type: ignore
 
-                self.session.execute(stmt)
-                total_inserted += len(batch)
+            if not records:
+                logger.info("✓ No monthly aggregations affected")
+                return
 
-            self.session.commit()
+            total_inserted = self._upsert_values(EconomicDataMonthly, records)
             self.records_inserted += total_inserted
 
             logger.info(f"✓ Saved {total_inserted} monthly aggregations")
@@ -295,60 +427,16 @@ class EconomicCollector(BaseCollector):
             self.session.rollback()
             raise
 
-    def _save_quarterly_aggregations(self) -> None:
-        """Generate and save quarterly aggregations"""
+    def _save_quarterly_aggregations(self, changes: Dict[str, Dict]) -> None:
+        """Recompute and save quarterly aggregations for affected quarters"""
         try:
-            quarterly_panel = self.fred_collector.build_quarterly_panel() # type: ignore
+            records = self._period_records(changes, QUARTERLY_PERIOD, self.fred_collector.quarterly_agg) # type: ignore
 
-            if quarterly_panel.empty:
-                logger.warning("No quarterly panel data to save")
+            if not records:
+                logger.info("✓ No quarterly aggregations affected")
                 return
 
-            # Convert wide to long format
-            all_records = []
-
-            for col in quarterly_panel.columns:
-                if col == 'Date':
-                    continue
-
-                df_long = quarterly_panel[['Date', col]].copy()
-                df_long = df_long.dropna(subset=[col])
-                df_long['indicator_code'] = col
-                df_long['value'] = df_long[col]
-                df_long['date'] = pd.to_datetime(df_long['Date']).dt.date
-
-                # Drop duplicates on date
-                df_long = df_long.drop_duplicates(subset=['date'], keep='last')
-
-                for _, row in df_long.iterrows():
-                    all_records.append({
-                        'indicator_code': row['indicator_code'],
-                        'date': row['date'],
-                        'value': float(row['value']) if pd.notna(row['value']) else None,
-                        'created_at': datetime.now()
-                    })
-
-            if not all_records:
-                logger.warning("No quarterly records to save")
-                return
-
-            # Insert in batches
-            batch_size = 10000
-            total_inserted = 0
-
-            for i in range(0, len(all_records), batch_size):
-                batch = all_records[i:i+batch_size]
-
-                stmt = insert(EconomicDataQuarterly).values(batch)
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=['indicator_code', 'date'],
-                    set_={'value': stmt.excluded.value}
-                )
-
-                self.session.execute(stmt)
-                total_inserted += len(batch)
-
-            self.session.commit()
+            total_inserted = self._upsert_values(EconomicDataQuarterly, records)
             self.records_inserted += total_inserted
 
             logger.info(f"✓ Saved {total_inserted} quarterly aggregations")
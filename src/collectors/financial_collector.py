@@ -3,18 +3,19 @@ Financial Statements Collector
 Handles: Income Statements, Balance Sheets, Cash Flows, Ratios, Key Metrics
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Optional, List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
-from sqlalchemy import desc
+from sqlalchemy import func, literal, select, union_all
 from sqlalchemy.dialects.postgresql import insert
 
 from src.collectors.base_collector import BaseCollector
-from src.config import FMP_ENDPOINTS
+from src.config import FMP_ENDPOINTS, settings
 from src.database.models import (
     IncomeStatement, BalanceSheet, CashFlow,
-    FinancialRatio, KeyMetric
+    FinancialRatio, KeyMetric, TableUpdateTracking
 )
 from src.utils.data_transform import transform_batch, transform_keys
 
@@ -32,67 +33,205 @@ class FinancialCollector(BaseCollector):
         'key_metrics': KeyMetric
     }
     
+    # API period -> stored period values
+    PERIODS = {
+        'annual': ['FY'],
+        'quarter': ['Q1', 'Q2', 'Q3', 'Q4'],
+    }
+
+    def __init__(self, session):
+        super().__init__(session)
+        # Statement downloads in flight per symbol (request starts stay paced by sleep_sec)
+        self.fetch_workers = max(1, settings.data_collection.max_workers)
+
     def get_table_name(self) -> str:
         return "financial_statements"
     
     def collect_for_symbol(self, symbol: str) -> bool:
-        """Collect all financial data for a symbol (both annual and quarterly)"""
+        """
+        Collect all financial data for a symbol (both annual and quarterly)
+
+        One pipeline per symbol: tracking rows and last dates for every
+        statement/period are read in one query each, the due statements are
+        downloaded concurrently, and all upserts plus tracking updates are
+        committed in a single transaction. Each statement is prepared and
+        written under its own error handling (upserts inside a savepoint), so
+        one malformed payload or failed upsert is recorded without losing the
+        rest.
+        """
         # Skip indices - they don't have financial statements
         if self.is_index_symbol(symbol):
             logger.info(f"Skipping financial data for index {symbol}")
             return True
 
+        jobs = [(statement_type, period) for period in self.PERIODS for statement_type in self.STATEMENT_MAP]
+        tracking = self._get_tracking_rows(symbol, [self._tracking_key(t, p) for t, p in jobs])
+
         success_count = 0
+        due = []
+        for statement_type, period in jobs:
+            key = self._tracking_key(statement_type, period)
+            if self.force_refill or self._tracking_due(tracking.get(key), max_age_days=15):
+                due.append((statement_type, period))
+            else:
+                logger.info(f"{key} for {symbol} is up to date")
+                success_count += 1
+        if not due:
+            return True
 
-        # Collect both annual and quarterly data
-        for period in ['annual', 'quarter']:
-            for statement_type, model in self.STATEMENT_MAP.items():
+        # In force refill mode, ignore last_date to fetch all data
+        last_dates = {} if self.force_refill else self._get_last_dates(symbol, due)
+        payloads = self._fetch_statements(symbol, due, last_dates)
+
+        failures = []
+        try:
+            written = {}
+            for statement_type, period in due:
+                model = self.STATEMENT_MAP[statement_type]
+                key = self._tracking_key(statement_type, period)
                 try:
-                    if self._collect_statement(symbol, statement_type, model, period):
+                    df = self._prepare_statement(
+                        symbol, statement_type, period, payloads.get((statement_type, period)),
+                        last_dates.get((statement_type, period))
+                    )
+                    if df is None:
+                        continue
+                    if df.empty:
+                        logger.info(f"No new records for {symbol} {statement_type} ({period})")
+                        tracking[key] = self._apply_tracking(tracking.get(key), key, symbol)
                         success_count += 1
+                        continue
+                    with self.session.begin_nested():
+                        inserted, updated = self._upsert_records(model, df.to_dict('records'), symbol)
                 except Exception as e:
                     logger.error(f"Error collecting {statement_type} ({period}) for {symbol}: {e}")
-                    self.record_error(model.__tablename__, symbol, str(e))
-                    # Rollback to prevent cascade failures in subsequent statement types
-                    self.session.rollback()
+                    failures.append((model.__tablename__, str(e)))
+                    continue
+                self.records_inserted += inserted
+                self.records_updated += updated
+                written[(statement_type, period)] = (df['date'].max(), inserted, updated)
+
+            record_counts = self._get_record_counts(symbol, list(written))
+            for (statement_type, period), (latest_date, inserted, updated) in written.items():
+                key = self._tracking_key(statement_type, period)
+                tracking[key] = self._apply_tracking(
+                    tracking.get(key), key, symbol,
+                    last_api_date=latest_date,
+                    record_count=record_counts.get((statement_type, period), 0),
+                    next_update_frequency='quarterly'
+                )
+                logger.info(
+                    f"✓ {symbol} {self.STATEMENT_MAP[statement_type].__tablename__} ({period}): "
+                    f"{inserted} inserted, {updated} updated"
+                )
+                success_count += 1
+
+            self.session.commit()
+        except Exception as e:
+            logger.error(f"Error writing financial data for {symbol}: {e}")
+            self.session.rollback()
+            failures.append((self.get_table_name(), str(e)))
+            success_count = 0
+
+        for table_name, message in failures:
+            self.record_error(table_name, symbol, message)
 
         return success_count > 0
-    
-    def _collect_statement(self, symbol: str, statement_type: str, model: Any, period: str = 'annual') -> bool:
-        """Collect specific statement type for a symbol with given period (annual or quarter)"""
-        table_name = model.__tablename__
-
-        # Create a unique tracking key that includes period
-        tracking_key = f"{table_name}_{period}"
-
-        if not self.should_update_symbol(tracking_key, symbol, max_age_days=15):
-            logger.info(f"{table_name} ({period}) for {symbol} is up to date")
-            return True
-
-        # In force refill mode, ignore last_date to fetch all data
-        last_date = None if self.force_refill else self._get_last_date_for_table(model, symbol, period)
-
-        # Set limit based on period type for consistent years of history
-        if period == 'annual':
-            limit = 10 if last_date else 50  # 50 years initially, 10 on update
-        elif period == 'quarter':
-            limit = 40 if last_date else 200  # 50 years initially (200 quarters), 40 on update (10 years)
-        else:
-            limit = 50  # fallback
-
-        url = FMP_ENDPOINTS[statement_type]
-        params = {
-            'symbol': symbol,
-            'period': period,
-            'limit': limit
-        }
-        
-        response = self._get(url, params)
-        data = self._json_safe(response)
 
+    @staticmethod
+    def _tracking_key(statement_type: str, period: str) -> str:
+        """Tracking key per table and period, e.g. 'income_statements_quarter'."""
+        return f"{FinancialCollector.STATEMENT_MAP[statement_type].__tablename__}_{period}"
+
+    def _get_tracking_rows(self, symbol: str, keys: List[str]) -> Dict[str, TableUpdateTracking]:
+        """Tracking rows for a symbol's keys in one query; missing keys are absent."""
+        rows = self.session.query(TableUpdateTracking)\
+            .filter(TableUpdateTracking.symbol == symbol)\
+            .filter(TableUpdateTracking.table_name.in_(keys))\
+            .all()
+        return {row.table_name: row for row in rows}
+
+    def _period_selects(self, symbol: str, jobs: List[Tuple[str, str]], aggregate: Callable[[Any], Any]):
+        """UNION ALL of one aggregate per (statement_type, period), labelled by both."""
+        selects = []
+        for statement_type, period in jobs:
+            model = self.STATEMENT_MAP[statement_type]
+            selects.append(
+                select(
+                    literal(statement_type).label('statement_type'),
+                    literal(period).label('period'),
+                    aggregate(model).label('value'),
+                )
+                .where(model.symbol == symbol)
+                .where(model.period.in_(self.PERIODS[period]))
+            )
+        return union_all(*selects)
+
+    def _get_last_dates(self, symbol: str, jobs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], date]:
+        """Most recent stored date per (statement_type, period), in one query."""
+        if not jobs:
+            return {}
+        rows = self.session.execute(self._period_selects(symbol, jobs, lambda model: func.max(model.date)))
+        return {(row.statement_type, row.period): row.value for row in rows if row.value is not None}
+
+    def _get_record_counts(self, symbol: str, jobs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+        """Stored rows per (statement_type, period), in one query."""
+        if not jobs:
+            return {}
+        rows = self.session.execute(self._period_selects(symbol, jobs, lambda model: func.count()))
+        return {(row.statement_type, row.period): row.value for row in rows}
+
+    def _fetch_statements(
+        self,
+        symbol: str,
+        jobs: List[Tuple[str, str]],
+        last_dates: Dict[Tuple[str, str], date],
+    ) -> Dict[Tuple[str, str], Optional[Any]]:
+        """Download the statements concurrently; HTTP only, the DB session stays on this thread."""
+        def fetch(job: Tuple[str, str]) -> Optional[Any]:
+            statement_type, period = job
+            has_history = job in last_dates
+            # Set limit based on period type for consistent years of history
+            if period == 'annual':
+                limit = 10 if has_history else 50  # 50 years initially, 10 on update
+            else:
+                limit = 40 if has_history else 200  # 50 years initially (200 quarters), 40 on update (10 years)
+            params = {
+                'symbol': symbol,
+                'period': period,
+                'limit': limit
+            }
+            return self._json_safe(self._get(FMP_ENDPOINTS[statement_type], params))
+
+        workers = min(self.fetch_workers, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="financial-fetch") as pool:
+            futures = {job: pool.submit(fetch, job) for job in jobs}
+            results = {}
+            for job, future in futures.items():
+                try:
+                    results[job] = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching {job[0]} ({job[1]}) for {symbol}: {e}")
+                    results[job] = None
+        return results
+
+    def _prepare_statement(
+        self,
+        symbol: str,
+        statement_type: str,
+        period: str,
+        data: Optional[Any],
+        last_date: Optional[date],
+    ) -> Optional[pd.DataFrame]:
+        """
+        Rows to write for one statement: new dates only, deduplicated
+
+        Returns:
+            DataFrame (empty when nothing is new), or None when the API returned nothing
+        """
         if not data:
             logger.warning(f"No data returned for {symbol} {statement_type}")
-            return False
+            return None
 
         # Transform API data from camelCase to snake_case
         transformed_data = transform_batch(data, transform_keys)
@@ -100,19 +239,16 @@ class FinancialCollector(BaseCollector):
         df = self._to_dataframe(transformed_data)
         if df.empty:
             logger.warning(f"Empty dataframe for {symbol} {statement_type} ({period})")
-            return False
+            return None
 
+        df['date'] = pd.to_datetime(df['date'], errors='coerce').dt.date
         if last_date:
-            df['date'] = pd.to_datetime(df['date'], errors='coerce').dt.date
             df = df[df['date'] > last_date]
 
         if df.empty:
-            logger.info(f"No new records for {symbol} {statement_type} ({period})")
-            self.update_tracking(tracking_key, symbol)
-            return True
+            return df
 
         # The API already returns a 'period' field, no need to add it
-        # Just ensure date conversion
 
         # Drop duplicates on primary key to avoid "cannot affect row a second time" error
         # Keep the last occurrence (most recent data)
@@ -120,48 +256,10 @@ class FinancialCollector(BaseCollector):
         df = df.drop_duplicates(subset=['date', 'period'], keep='last')
         if len(df) < before_dedup:
             logger.warning(f"Removed {before_dedup - len(df)} duplicate (date, period) pairs for {symbol}")
-
-        records = df.to_dict('records')
-        inserted, updated = self._upsert_records(model, records, symbol)
-
-        self.records_inserted += inserted
-        self.records_updated += updated
-
-        latest_date = df['date'].max()
-
-        # Count records for the correct period type
-        count_query = self.session.query(model).filter(model.symbol == symbol)
-        if period == 'annual':
-            count_query = count_query.filter(model.period == 'FY')
-        elif period == 'quarter':
-            count_query = count_query.filter(model.period.in_(['Q1', 'Q2', 'Q3', 'Q4']))
-        record_count = count_query.count()
-
-        self.update_tracking(
-            tracking_key, symbol,
-            last_api_date=latest_date,
-            record_count=record_count,
-            next_update_frequency='quarterly'
-        )
-
-        logger.info(f"✓ {symbol} {table_name} ({period}): {inserted} inserted, {updated} updated")
-        return True
-    
-    def _get_last_date_for_table(self, model: Any, symbol: str, period: str = 'annual') -> Optional[date]:
-        """Get the most recent date for a symbol in a table for a specific period"""
-        # API uses 'annual' or 'quarter', but DB stores 'FY', 'Q1', 'Q2', 'Q3', 'Q4'
-        query = self.session.query(model.date).filter(model.symbol == symbol)
-
-        if period == 'annual':
-            query = query.filter(model.period == 'FY')
-        elif period == 'quarter':
-            query = query.filter(model.period.in_(['Q1', 'Q2', 'Q3', 'Q4']))
-
-        result = query.order_by(desc(model.date)).first()
-        return result[0] if result else None
+        return df
     
     def _upsert_records(self, model: Any, records: List[Dict], symbol: str) -> tuple:
-        """Upsert records using PostgreSQL ON CONFLICT"""
+        """Upsert records using PostgreSQL ON CONFLICT (the caller commits)"""
         if not records:
             return (0, 0)
 
@@ -191,7 +289,6 @@ class FinancialCollector(BaseCollector):
             set_=update_dict
         )
         
-        result = self.session.execute(stmt)
-        self.session.commit()
-        
+        self.session.execute(stmt)
+
         return (len(records), 0)
@@ -1,14 +1,49 @@
 # fred_collector.py — Finalized with FMP enrichment, QC, and Meta sheet
 
 import os
+import json
 import time
+import hashlib
+import threading
 from pathlib import Path
 from io import StringIO
 from datetime import datetime
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+from src.config import settings
+from src.utils import metrics
+
+
+class _HostLimiter:
+    """Caps concurrent requests and request starts per second for one host."""
+
+    def __init__(self, max_concurrent: int, min_interval: float, client: str = "other"):
+        self.client = client
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrent))
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+        self.min_interval = min_interval
+
+    def __enter__(self):
+        start = time.monotonic()
+        self._slots.acquire()
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.min_interval
+        if wait > 0:
+            time.sleep(wait)
+        metrics.observe_rate_limit_wait(self.client, time.monotonic() - start)
+        return self
+
+    def __exit__(self, *exc):
+        self._slots.release()
 
 
 class FREDCollector:
@@ -88,6 +123,13 @@ class FREDCollector:
     EXPORT_FILE_DIR: str = "economics"
     FILENAME_BASE: str = "fred_full_history"
 
+    # host -> (max concurrent requests, min seconds between request starts)
+    DEFAULT_HOST_LIMITS: Dict[str, Tuple[int, float]] = {
+        "fred.stlouisfed.org": (4, 0.05),         # polite to FRED
+        "financialmodelingprep.com": (6, 0.0),
+    }
+    FALLBACK_HOST_LIMIT: Tuple[int, float] = (4, 0.0)
+
     def __init__(
         self,
         indicators: Optional[Dict[str, str]] = None,
@@ -97,7 +139,12 @@ class FREDCollector:
         retries: int = 3,
         backoff: float = 0.8,
         fmp_api_key: Optional[str] = None,
-        export_dir: Path = Path("economics")
+        export_dir: Path = Path("economics"),
+        max_workers: int = 8,
+        host_limits: Optional[Dict[str, Tuple[int, float]]] = None,
+        cache_dir: Optional[Path] = None,
+        fred_base_url: Optional[str] = None,
+        fmp_base_url: Optional[str] = None
     ):
         self.indicators = indicators.copy() if indicators else self.DEFAULT_INDICATORS.copy()
         self.export_dir = export_dir
@@ -111,8 +158,30 @@ class FREDCollector:
         self.fmp_api_key = fmp_api_key
         self.fmp_from = "1900-01-01"  # internal default for full span
 
+        # FRED_BASE_URL / FMP_BASE_URL settings unless given
+        self.fred_base_url = (fred_base_url or settings.endpoints.fred_base_url).rstrip("/")
+        self.fmp_base_url = (fmp_base_url or settings.endpoints.fmp_base_url).rstrip("/")
+
+        # Concurrent fetch pool: bounded workers, per-host caps, conditional GET
+        self.max_workers = max(1, max_workers)
+        self.host_limits = {**self.DEFAULT_HOST_LIMITS, **(host_limits or {})}
+        self._limiters: Dict[str, _HostLimiter] = {}
+        self._limiters_lock = threading.Lock()
+
+        # url -> {'etag', 'last_modified', 'body'}; persisted per URL when cache_dir is set
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._http_cache: Dict[str, dict] = {}
+        self._http_cache_lock = threading.Lock()
+
+        # fetch_status[key] = 'ok' | 'not_modified' | 'failed' for the last fetch_all()
+        self.fetch_status: Dict[str, str] = {}
+
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "FREDCollector/1.1"})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        metrics.instrument_http_session(self.session, self._client_label)
 
         # raw_frames[name] = DataFrame with columns ['Date', name]
         self.raw_frames: Dict[str, pd.DataFrame] = {}
@@ -122,21 +191,93 @@ class FREDCollector:
 
     # ------------------------- HTTP helpers -------------------------
 
-    def _get_fred_csv(self, series_id: str) -> Optional[str]:
-        """Download full-history CSV for a single FRED series via fredgraph.csv."""
-        url = f"https://fred.stlouisfed.org/graph/fredgraph.csv?id={series_id}"
+    def _client_label(self, url: str) -> str:
+        """Metrics label for a request URL: 'fred' or 'fmp'."""
+        host = urlsplit(url).hostname
+        return "fred" if host == urlsplit(self.fred_base_url).hostname else "fmp"
+
+    def _limiter(self, url: str) -> _HostLimiter:
+        host = urlsplit(url).hostname or ""
+        with self._limiters_lock:
+            if host not in self._limiters:
+                limit = self.host_limits.get(host, self.FALLBACK_HOST_LIMIT)
+                self._limiters[host] = _HostLimiter(*limit, client=self._client_label(url))
+            return self._limiters[host]
+
+    def _cache_key(self, url: str, params: Optional[dict]) -> str:
+        # API keys are left out so cache files never contain them
+        query = sorted((k, str(v)) for k, v in (params or {}).items() if k != "apikey")
+        return hashlib.sha1(json.dumps([url, query]).encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[dict]:
+        with self._http_cache_lock:
+            entry = self._http_cache.get(key)
+        if entry is None and self.cache_dir is not None:
+            path = self.cache_dir / f"{key}.json"
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return None
+            with self._http_cache_lock:
+                self._http_cache[key] = entry
+        return entry
+
+    def _cache_put(self, key: str, response: requests.Response) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        entry = {"etag": etag, "last_modified": last_modified, "body": response.text}
+        with self._http_cache_lock:
+            self._http_cache[key] = entry
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_dir / f"{key}.json.tmp"
+            tmp.write_text(json.dumps(entry), encoding="utf-8")
+            tmp.replace(self.cache_dir / f"{key}.json")
+
+    def _get_text(self, url: str, params: Optional[dict] = None, status_key: Optional[str] = None) -> Optional[str]:
+        """
+        GET with per-host limits, retries with backoff, and conditional GET:
+        a cached ETag/Last-Modified is sent and a 304 returns the cached body.
+        """
+        key = self._cache_key(url, params)
+        cached = self._cache_get(key)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        status = "failed"
+        body = None
         for i in range(self.retries):
             try:
-                r = self.session.get(url, timeout=self.timeout)
+                with self._limiter(url):
+                    r = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+                if r.status_code == 304 and cached:
+                    status, body = "not_modified", cached["body"]
+                    break
                 if r.status_code == 200 and r.text.strip():
-                    return r.text
+                    self._cache_put(key, r)
+                    status, body = "ok", r.text
+                    break
                 if r.status_code in (429, 500, 502, 503, 504):
-                    time.sleep(self.backoff * (2 ** i))
+                    metrics.rate_limited_sleep(self._client_label(url), self.backoff * (2 ** i))
                     continue
                 break
             except Exception:
-                time.sleep(self.backoff * (2 ** i))
-        return None
+                metrics.rate_limited_sleep(self._client_label(url), self.backoff * (2 ** i))
+
+        if status_key:
+            self.fetch_status[status_key] = status
+        return body
+
+    def _get_fred_csv(self, series_id: str) -> Optional[str]:
+        """Download full-history CSV for a single FRED series via fredgraph.csv."""
+        url = f"{self.fred_base_url}/graph/fredgraph.csv"
+        return self._get_text(url, {"id": series_id}, status_key=series_id)
 
     def _get_fmp_json(self, url: str, params: dict) -> Optional[dict]:
         """Generic FMP GET returning JSON dict/list, or None."""
@@ -144,18 +285,16 @@ class FREDCollector:
             return None
         p = params.copy()
         p["apikey"] = self.fmp_api_key
-        for i in range(self.retries):
-            try:
-                r = self.session.get(url, params=p, timeout=self.timeout)
-                if r.status_code == 200:
-                    return r.json()
-                if r.status_code in (429, 500, 502, 503, 504):
-                    time.sleep(self.backoff * (2 ** i))
-                    continue
-                break
-            except Exception:
-                time.sleep(self.backoff * (2 ** i))
-        return None
+        status_key = urlsplit(url).path.rsplit("/", 1)[-1] + "".join(
+            f":{v}" for k, v in sorted(params.items()) if k != "from"
+        )
+        text = self._get_text(url, p, status_key=status_key)
+        if text is None:
+            return None
+        try:
+            return json.loads(text)
+        except ValueError:
+            return None
 
     # ---------------------- FMP econ/treasury helpers ----------------------
 
@@ -166,7 +305,7 @@ class FREDCollector:
         """
         if not self.fmp_api_key:
             return None
-        url = "https://financialmodelingprep.com/stable/economic-indicators"
+        url = f"{self.fmp_base_url}/stable/economic-indicators"
         params = {"name": fmp_name, "from": self.fmp_from}
         data = self._get_fmp_json(url, params)
         if not data or not isinstance(data, list):
@@ -198,7 +337,7 @@ class FREDCollector:
         """
         if not self.fmp_api_key:
             return None
-        url = "https://financialmodelingprep.com/stable/treasury-rates"
+        url = f"{self.fmp_base_url}/stable/treasury-rates"
         params = {"from": self.fmp_from}
         data = self._get_fmp_json(url, params)
         if not data or not isinstance(data, list):
@@ -225,7 +364,7 @@ class FREDCollector:
         """
         if not self.fmp_api_key:
             return None
-        url = "https://financialmodelingprep.com/stable/historical-price-eod/full"
+        url = f"{self.fmp_base_url}/stable/historical-price-eod/full"
         params = {"symbol": symbol, "from": self.fmp_from}
         data = self._get_fmp_json(url, params)
         if not data:
@@ -264,17 +403,13 @@ class FREDCollector:
         out = out.dropna(subset=["Value"])
         return out
 
-    def _augment_sp500_with_fmp(self) -> None:
+    def _merge_sp500_from_fmp(self, fmp: Optional[pd.DataFrame]) -> None:
         """
-        Extend/patch S&P_500_Index series using FMP '^GSPC' adjClose (or close).
+        Extend/patch S&P_500_Index series with fetched FMP '^GSPC' adjClose (or close).
         Keeps FRED as primary; uses FMP to fill gaps and extend earlier history.
         """
-        if not self.fmp_api_key:
-            return
-
         base_name = "S&P_500_Index"
         base = self.raw_frames.get(base_name, pd.DataFrame(columns=["Date", base_name])).copy()
-        fmp = self._get_fmp_index_prices("^GSPC")
         if fmp is None or fmp.empty:
             return
 
@@ -293,35 +428,73 @@ class FREDCollector:
 
     # ---------------------- Fetch & prepare raw ----------------------
 
+    def _fetch_fred_frame(self, friendly_name: str, series_id: str) -> pd.DataFrame:
+        """Download and parse one FRED series into ['Date', friendly_name]."""
+        csv_text = self._get_fred_csv(series_id)
+        if not csv_text:
+            return pd.DataFrame(columns=["Date", friendly_name])
+        df = pd.read_csv(StringIO(csv_text))
+        df.columns = ["Date", friendly_name]
+        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+        df = df.dropna(subset=["Date"]).sort_values("Date").reset_index(drop=True)
+        df[friendly_name] = pd.to_numeric(df[friendly_name], errors="coerce")
+        return df
+
+    def _run_fetches(self, tasks: Dict[str, Callable[[], object]]) -> Dict[str, object]:
+        """
+        Run independent downloads on a bounded thread pool.
+        Per-host limits are applied inside _get_text; a failed task yields None.
+        """
+        results: Dict[str, object] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fred-fetch") as pool:
+            futures = {key: pool.submit(fn) for key, fn in tasks.items()}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    print(f"⚠️ Fetch failed for {key}: {e}")
+                    results[key] = None
+        return results
+
     def fetch_all(self) -> None:
         """
         Fetch all FRED series; enrich with FMP econ & Treasuries; compute spreads; augment S&P.
         Each frame has columns: ['Date', <friendly_name>] and Date is datetime64[ns].
+
+        All downloads run concurrently (max_workers, per-host limits); the
+        merge steps below run once every download has finished.
         """
-        # 1) FRED baseline
+        self.fetch_status = {}
+
+        # 1) Download everything at once: FRED baseline, FMP econ extras, Treasuries, ^GSPC
+        tasks: Dict[str, Callable[[], object]] = {}
         for friendly_name, series_id in self.indicators.items():
-            csv_text = self._get_fred_csv(series_id)
-            time.sleep(0.05)  # polite to FRED; FMP has no sleep
-            if not csv_text:
-                self.raw_frames[friendly_name] = pd.DataFrame(columns=["Date", friendly_name])
-                continue
-            df = pd.read_csv(StringIO(csv_text))
-            df.columns = ["Date", friendly_name]
-            df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-            df = df.dropna(subset=["Date"]).sort_values("Date").reset_index(drop=True)
-            df[friendly_name] = pd.to_numeric(df[friendly_name], errors="coerce")
-            self.raw_frames[friendly_name] = df
+            tasks[f"fred:{friendly_name}"] = lambda f=friendly_name, s=series_id: self._fetch_fred_frame(f, s)
+        for friendly, fmp_name in self.FMP_ECON_SERIES.items():
+            if friendly not in self.indicators:
+                tasks[f"fmp:{friendly}"] = lambda n=fmp_name, f=friendly: self._get_fmp_econ(n, f)
+        if self.fmp_api_key:
+            tasks["treasury"] = self._get_fmp_treasury
+            tasks["gspc"] = lambda: self._get_fmp_index_prices("^GSPC")
+
+        results = self._run_fetches(tasks)
+
+        for friendly_name in self.indicators:
+            df = results.get(f"fred:{friendly_name}")
+            self.raw_frames[friendly_name] = df if df is not None else pd.DataFrame(columns=["Date", friendly_name])
 
         # 2) Extra FMP economic indicators (add only if not already present)
         for friendly, fmp_name in self.FMP_ECON_SERIES.items():
             if friendly in self.raw_frames and not self.raw_frames[friendly].empty:
                 continue
-            fdf = self._get_fmp_econ(fmp_name, friendly)
+            key = f"fmp:{friendly}"
+            # Names shared with FRED are only fetched from FMP when FRED came back empty
+            fdf = results[key] if key in results else self._get_fmp_econ(fmp_name, friendly)
             if fdf is not None and not fdf.empty:
                 self.raw_frames[friendly] = fdf
 
         # 3) Treasuries from FMP — fill & extend; add missing tenors
-        tdf = self._get_fmp_treasury()
+        tdf = results.get("treasury")
         tenor_map = {
             "month1": "Treasury_1M",
             "month2": "Treasury_2M",
@@ -402,7 +575,7 @@ class FREDCollector:
                 self.raw_frames["Yield_Curve_10Y_2Y"] = m[["Date", "Yield_Curve_10Y_2Y"]].dropna()
 
         # 5) Augment S&P 500 coverage with FMP (^GSPC) while keeping FRED primary
-        self._augment_sp500_with_fmp()
+        self._merge_sp500_from_fmp(results.get("gspc"))
 
     # ---------------------- Resampling helpers ----------------------
 
@@ -429,27 +602,70 @@ class FREDCollector:
         out.columns = ["Date", col]
         return out
 
-    def build_monthly_panel(self) -> pd.DataFrame:
+    def _stack_series(self) -> pd.DataFrame:
+        """
+        All raw_frames in one long frame: Date, Series, Value (numeric).
+        Series is categorical in raw_frames order so panels keep that column order.
+        """
+        names = list(self.raw_frames.keys())
         frames = []
         for name, df in self.raw_frames.items():
-            frames.append(self._resample(df, name, "ME", self.monthly_agg))
-        panel = None
-        for f in frames:
-            panel = f if panel is None else panel.merge(f, on="Date", how="outer")
-        if panel is None:
-            return pd.DataFrame(columns=["Date"] + list(self.raw_frames.keys()))
-        return panel.sort_values("Date").reset_index(drop=True)
+            if df is None or df.empty or name not in df.columns:
+                continue
+            frames.append(pd.DataFrame({
+                "Date": df["Date"].to_numpy(),
+                "Series": name,
+                "Value": df[name].to_numpy(),
+            }))
+        if not frames:
+            return pd.DataFrame(columns=["Date", "Series", "Value"])
+        long = pd.concat(frames, ignore_index=True)
+        long["Date"] = pd.to_datetime(long["Date"])
+        long["Series"] = pd.Categorical(long["Series"], categories=names)
+        long["Value"] = pd.to_numeric(long["Value"], errors="coerce")
+        return long
+
+    # Panel resample rules -> period frequencies used to label bins
+    _PANEL_PERIODS = {"ME": "M", "QE-DEC": "Q-DEC"}
+
+    def _build_panel(self, rule: str, how: str) -> pd.DataFrame:
+        """
+        Wide Date x Series panel from one grouped aggregation and one pivot.
+        Matches per-series _resample + outer merges: each series is binned over
+        its own date range (empty bins inside it are NaN), and the Date column
+        is the union of those ranges.
+        """
+        if how not in ("last", "mean", "max", "min"):
+            raise ValueError(f"Unsupported aggregation: {how}")
+        rule = "ME" if rule == "M" else ("QE-DEC" if rule == "Q" else rule)
+        if rule not in self._PANEL_PERIODS:
+            raise ValueError(f"Unsupported panel rule: {rule}")
+        names = list(self.raw_frames.keys())
+        long = self._stack_series().dropna(subset=["Date"])
+        if long.empty:
+            return pd.DataFrame(columns=["Date"] + names)
+
+        # Period-end label per observation (what resample would bin it to)
+        long["Bin"] = long["Date"].dt.to_period(self._PANEL_PERIODS[rule]).dt.end_time.dt.normalize()
+        binned = long.groupby(["Bin", "Series"], observed=True, sort=False)["Value"].agg(how)
+        panel = binned.unstack("Series").reindex(columns=names)
+
+        # Keep every bin inside at least one series' range
+        spans = long.groupby("Series", observed=True)["Bin"].agg(["min", "max"])
+        bins = pd.date_range(spans["min"].min(), spans["max"].max(), freq=rule)
+        covered = ((bins.values[:, None] >= spans["min"].values[None, :])
+                   & (bins.values[:, None] <= spans["max"].values[None, :])).any(axis=1)
+        panel = panel.reindex(bins[covered])
+
+        panel.columns = list(panel.columns)
+        panel = panel.rename_axis("Date").reset_index()
+        return panel
+
+    def build_monthly_panel(self) -> pd.DataFrame:
+        return self._build_panel("ME", self.monthly_agg)
 
     def build_quarterly_panel(self) -> pd.DataFrame:
-        frames = []
-        for name, df in self.raw_frames.items():
-            frames.append(self._resample(df, name, "QE-DEC", self.quarterly_agg))
-        panel = None
-        for f in frames:
-            panel = f if panel is None else panel.merge(f, on="Date", how="outer")
-        if panel is None:
-            return pd.DataFrame(columns=["Date"] + list(self.raw_frames.keys()))
-        return panel.sort_values("Date").reset_index(drop=True)
+        return self._build_panel("QE-DEC", self.quarterly_agg)
 
     # --------------------------- Export helpers ----------------------------
 
@@ -4,15 +4,77 @@ from datetime import date, datetime, timedelta
 from typing import Optional, List
 
 import pandas as pd
+from sqlalchemy import text
 from sqlalchemy.dialects.postgresql import insert
 
 from src.collectors.base_collector import BaseCollector
 from src.config import FMP_ENDPOINTS, settings
-from src.database.models import PriceDaily, PriceMonthly, Company
+from src.database.models import PriceDaily, Company
 from src.utils.data_transform import transform_batch, transform_keys
 
 logger = logging.getLogger(__name__)
 
+# Daily rows created this long before a symbol's last rollup still count as new,
+# so a daily insert that committed after the rollup started is not missed
+MONTHLY_ROLLUP_OVERLAP = '5 minutes'
+
+# Month-end rows from prices_daily: first open, high/low extremes, last close
+# (DISTINCT ON per month) and total volume, for the months selected in `months`.
+# Months are keyed by calendar month-end, matching existing prices_monthly rows.
+MONTHLY_ROLLUP_SQL = """
+    WITH months AS (
+        SELECT DISTINCT d.symbol, date_trunc('month', d.date)::date AS month
+        FROM prices_daily d
+        {watermark_join}
+        WHERE {symbol_filter}
+    ),
+    daily AS (
+        SELECT d.symbol, m.month, d.date, d.adj_open, d.adj_high, d.adj_low, d.adj_close, d.volume
+        FROM months m
+        JOIN prices_daily d
+          ON d.symbol = m.symbol
+         AND d.date >= m.month
+         AND d.date < m.month + interval '1 month'
+    ),
+    last_close AS (
+        SELECT DISTINCT ON (symbol, month) symbol, month, adj_close
+        FROM daily
+        WHERE adj_close IS NOT NULL
+        ORDER BY symbol, month, date DESC
+    ),
+    ohlv AS (
+        SELECT symbol, month,
+               (array_agg(adj_open ORDER BY date) FILTER (WHERE adj_open IS NOT NULL))[1] AS adj_open,
+               max(adj_high) AS adj_high,
+               min(adj_low) AS adj_low,
+               sum(volume) AS volume
+        FROM daily
+        GROUP BY symbol, month
+    )
+    INSERT INTO prices_monthly (symbol, date, adj_open, adj_high, adj_low, adj_close, volume, created_at, updated_at)
+    SELECT o.symbol, (o.month + interval '1 month - 1 day')::date,
+           o.adj_open, o.adj_high, o.adj_low, c.adj_close, o.volume, now(), now()
+    FROM ohlv o
+    LEFT JOIN last_close c ON c.symbol = o.symbol AND c.month = o.month
+    ON CONFLICT (symbol, date) DO UPDATE SET
+        adj_open = excluded.adj_open,
+        adj_high = excluded.adj_high,
+        adj_low = excluded.adj_low,
+        adj_close = excluded.adj_close,
+        volume = excluded.volume,
+        updated_at = excluded.updated_at
+"""
+
+# Limits `months` to those with daily rows created since the symbol's last rollup
+_TOUCHED_MONTHS_JOIN = """
+        LEFT JOIN (
+            SELECT symbol, max(updated_at) AS rolled_up_at
+            FROM prices_monthly
+            {symbol_filter}
+            GROUP BY symbol
+        ) w ON w.symbol = d.symbol
+"""
+
 
 class PriceCollector(BaseCollector):
     """Collector for price data"""
@@ -118,55 +180,46 @@ class PriceCollector(BaseCollector):
         return len(records)
     
     def _generate_monthly_prices(self, symbol: str):
-        """Generate month-end prices from daily prices"""
-        daily_prices = self.session.query(PriceDaily)\
-            .filter(PriceDaily.symbol == symbol)\
-            .order_by(PriceDaily.date).all()
-        
-        if not daily_prices:
-            return
-        
-        df = pd.DataFrame([{
-            'symbol': p.symbol, 'date': p.date, 'adj_open': p.adj_open,
-            'adj_high': p.adj_high, 'adj_low': p.adj_low, 'adj_close': p.adj_close,
-            'volume': p.volume
-        } for p in daily_prices])
-
-        df['date'] = pd.to_datetime(df['date'])
-        df.set_index('date', inplace=True)
-        monthly = df.resample('ME').last().reset_index()
-        monthly['date'] = monthly['date'].dt.date
-
-        records = monthly.to_dict('records')
-        if records:
-            # Convert numpy types to Python types to ensure sanitization works
-            for record in records:
-                # Explicitly ensure symbol is present (pandas resample might drop it)
-                record['symbol'] = symbol
-
-                for key, value in record.items():
-                    if key == 'symbol':  # Skip symbol field, already set
-                        continue
-                    if pd.notna(value):  # Skip NaN/None
-                        if hasattr(value, 'item'):  # numpy scalar
-                            record[key] = value.item()  # Convert numpy to Python type
-                    else:
-                        record[key] = None  # Ensure NaN becomes None
-
-            # Sanitize records to prevent BigInteger overflow
-            sanitized_records = [self.sanitize_record(r, PriceMonthly, symbol) for r in records] # type: ignore
-
-            stmt = insert(PriceMonthly).values(sanitized_records)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=['symbol', 'date'],
-                set_={'adj_open': stmt.excluded.adj_open, 'adj_high': stmt.excluded.adj_high,
-                      'adj_low': stmt.excluded.adj_low, 'adj_close': stmt.excluded.adj_close,
-                      'volume': stmt.excluded.volume}
+        """Generate month-end prices from daily prices (months touched since the last rollup)"""
+        months = self.rollup_monthly_prices([symbol], touched_only=not self.force_refill)
+        if months:
+            logger.info(f" Generated {months} monthly prices for {symbol}")
+
+    def rollup_monthly_prices(self, symbols: Optional[List[str]] = None, touched_only: bool = True) -> int:
+        """
+        Recompute prices_monthly from prices_daily in one SQL statement
+
+        Args:
+            symbols: Symbols to roll up (default: every symbol in prices_daily)
+            touched_only: Only recompute months with daily rows created since
+                the symbol's last rollup (all months for symbols never rolled up)
+
+        Returns:
+            Number of monthly rows written
+        """
+        params = {}
+        symbol_filter = "TRUE"
+        if symbols is not None:
+            if not symbols:
+                return 0
+            params['symbols'] = list(symbols)
+            symbol_filter = "d.symbol = ANY(CAST(:symbols AS varchar[]))"
+
+        watermark_join = ""
+        if touched_only:
+            watermark_join = _TOUCHED_MONTHS_JOIN.format(
+                symbol_filter="WHERE symbol = ANY(CAST(:symbols AS varchar[]))" if symbols is not None else ""
             )
-            self.session.execute(stmt)
-            self.session.commit()
-            logger.info(f" Generated {len(sanitized_records)} monthly prices for {symbol}")
-    
+            symbol_filter += (
+                f" AND (w.rolled_up_at IS NULL"
+                f" OR d.created_at > w.rolled_up_at - interval '{MONTHLY_ROLLUP_OVERLAP}')"
+            )
+
+        sql = MONTHLY_ROLLUP_SQL.format(watermark_join=watermark_join, symbol_filter=symbol_filter)
+        result = self.session.execute(text(sql), params)
+        self.session.commit()
+        return result.rowcount
+
     def _get_index_name(self, symbol: str) -> str:
         """Map index symbol to name"""
         index_map = {
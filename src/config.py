@@ -15,6 +15,11 @@ class DatabaseSettings(BaseSettings):
     echo: bool = Field(False, alias='DB_ECHO')
     pool_pre_ping: bool = True
     pool_recycle: int = 3600
+
+    # Opt-in SQL tracing per unit of work (src/database/query_tracer.py)
+    trace_queries: bool = Field(False, alias='SQL_TRACE')
+    trace_repeat_threshold: int = Field(20, alias='SQL_TRACE_REPEAT_THRESHOLD')
+    trace_slowest: int = Field(5, alias='SQL_TRACE_SLOWEST')
     
     model_config = SettingsConfigDict(env_file='.env', extra='ignore')
 
@@ -32,6 +37,26 @@ class APISettings(BaseSettings):
     retries: int = Field(3, alias='API_RETRIES')
     backoff: float = Field(0.7, alias='API_BACKOFF')
 
+    # FMP plan limit shared by concurrently running collection jobs
+    fmp_requests_per_minute: int = Field(750, alias='FMP_REQUESTS_PER_MINUTE')
+
+    model_config = SettingsConfigDict(env_file='.env', extra='ignore')
+
+
+class EndpointSettings(BaseSettings):
+    """
+    API base URLs; override to point every client at a local stand-in such as
+    benchmarks/replay_server.py. Kept apart from APISettings so reading them
+    (and importing this module) does not require any API key.
+    """
+    fmp_base_url: str = Field('https://financialmodelingprep.com', alias='FMP_BASE_URL')
+    fred_base_url: str = Field('https://fred.stlouisfed.org', alias='FRED_BASE_URL')
+    bls_base_url: str = Field('https://api.bls.gov/publicAPI/v2', alias='BLS_BASE_URL')
+    bea_base_url: str = Field('https://apps.bea.gov/api/data', alias='BEA_BASE_URL')
+    treasury_base_url: str = Field(
+        'https://api.fiscaldata.treasury.gov/services/api/fiscal_service', alias='TREASURY_BASE_URL'
+    )
+
     model_config = SettingsConfigDict(env_file='.env', extra='ignore')
 
 
@@ -62,6 +87,9 @@ class ScheduleSettings(BaseSettings):
     schedule_economic: str = Field('0 8 * * *', alias='SCHEDULE_ECONOMIC')
     schedule_analyst: str = Field('0 10 * * *', alias='SCHEDULE_ANALYST')
     schedule_insider: str = Field('0 11 * * *', alias='SCHEDULE_INSIDER')
+
+    # DB connection slots available to concurrently running collection jobs
+    job_db_slots: int = Field(4, alias='JOB_DB_SLOTS')
     
     model_config = SettingsConfigDict(env_file='.env', extra='ignore')
 
@@ -78,6 +106,10 @@ class MonitoringSettings(BaseSettings):
     """Monitoring and metrics configuration"""
     enable_metrics: bool = Field(True, alias='ENABLE_METRICS')
     metrics_port: int = Field(9090, alias='METRICS_PORT')
+
+    # Short-lived scripts export on exit: Pushgateway if set, else textfile if set
+    metrics_pushgateway_url: Optional[str] = Field(None, alias='METRICS_PUSHGATEWAY_URL')
+    metrics_textfile_dir: Optional[str] = Field(None, alias='METRICS_TEXTFILE_DIR')
     
     model_config = SettingsConfigDict(env_file='.env', extra='ignore')
 
@@ -113,6 +145,7 @@ class Settings:
     """Centralized settings manager"""
     _database: Optional[DatabaseSettings] = None
     _api: Optional[APISettings] = None
+    _endpoints: Optional[EndpointSettings] = None
     _data_collection: Optional[DataCollectionSettings] = None
     _schedule: Optional[ScheduleSettings] = None
     _validation: Optional[ValidationSettings] = None
@@ -130,6 +163,12 @@ class Settings:
         if self._api is None:
             self._api = APISettings() # type: ignore
         return self._api
+
+    @property
+    def endpoints(self) -> EndpointSettings:
+        if self._endpoints is None:
+            self._endpoints = EndpointSettings()
+        return self._endpoints
     
     @property
     def data_collection(self) -> DataCollectionSettings:
@@ -166,32 +205,35 @@ class Settings:
 settings = Settings()
 
 # API Endpoints
+_FMP = settings.endpoints.fmp_base_url.rstrip("/")
 FMP_ENDPOINTS = {
-    "profile": "https://financialmodelingprep.com/stable/profile",
-    "income_statement": "https://financialmodelingprep.com/stable/income-statement",
-    "balance_sheet": "https://financialmodelingprep.com/stable/balance-sheet-statement",
-    "cash_flow": "https://financialmodelingprep.com/stable/cash-flow-statement",
-    "ratios": "https://financialmodelingprep.com/stable/ratios",
-    "key_metrics": "https://financialmodelingprep.com/stable/key-metrics",
-    "enterprise_values": "https://financialmodelingprep.com/stable/enterprise-values",
-    "employee_history": "https://financialmodelingprep.com/stable/historical-employee-count",
-    "prices_full": "https://financialmodelingprep.com/stable/historical-price-eod/dividend-adjusted",
-    "analyst_estimates": "https://financialmodelingprep.com/stable/analyst-estimates",
-    "price_target_consensus": "https://financialmodelingprep.com/stable/price-target-consensus",
-    "insider_trading_search": "https://financialmodelingprep.com/stable/insider-trading/search",
-    "institutional_ownership_summary": "https://financialmodelingprep.com/stable/institutional-ownership/symbol-positions-summary",
-    "institutional_13f_extract": "https://financialmodelingprep.com/stable/institutional-ownership/extract",
-    "insider_trading_statistics": "https://financialmodelingprep.com/stable/insider-trading/statistics",
-    "economic_calendar": "https://financialmodelingprep.com/stable/economic-calendar",
-    "earnings_calendar": "https://financialmodelingprep.com/stable/earnings-calendar",
-    "key_metrics_ttm_bulk": "https://financialmodelingprep.com/stable/key-metrics-ttm-bulk",
-    "ratios_ttm_bulk": "https://financialmodelingprep.com/stable/ratios-ttm-bulk",
-    "price_target_summary_bulk": "https://financialmodelingprep.com/stable/price-target-summary-bulk",
-    "company_profile_bulk": "https://financialmodelingprep.com/stable/profile-bulk",
+    "profile": f"{_FMP}/stable/profile",
+    "income_statement": f"{_FMP}/stable/income-statement",
+    "balance_sheet": f"{_FMP}/stable/balance-sheet-statement",
+    "cash_flow": f"{_FMP}/stable/cash-flow-statement",
+    "ratios": f"{_FMP}/stable/ratios",
+    "key_metrics": f"{_FMP}/stable/key-metrics",
+    "enterprise_values": f"{_FMP}/stable/enterprise-values",
+    "employee_history": f"{_FMP}/stable/historical-employee-count",
+    "prices_full": f"{_FMP}/stable/historical-price-eod/dividend-adjusted",
+    "analyst_estimates": f"{_FMP}/stable/analyst-estimates",
+    "price_target_consensus": f"{_FMP}/stable/price-target-consensus",
+    "insider_trading_search": f"{_FMP}/stable/insider-trading/search",
+    "institutional_ownership_summary": f"{_FMP}/stable/institutional-ownership/symbol-positions-summary",
+    "institutional_13f_extract": f"{_FMP}/stable/institutional-ownership/extract",
+    "insider_trading_statistics": f"{_FMP}/stable/insider-trading/statistics",
+    "economic_calendar": f"{_FMP}/stable/economic-calendar",
+    "earnings_calendar": f"{_FMP}/stable/earnings-calendar",
+    "key_metrics_ttm_bulk": f"{_FMP}/stable/key-metrics-ttm-bulk",
+    "ratios_ttm_bulk": f"{_FMP}/stable/ratios-ttm-bulk",
+    "price_target_summary_bulk": f"{_FMP}/stable/price-target-summary-bulk",
+    "company_profile_bulk": f"{_FMP}/stable/profile-bulk",
+    "eod_bulk": f"{_FMP}/stable/eod-bulk",
+    "peers_bulk": f"{_FMP}/stable/peers-bulk",
 }
 
 # BEA (Bureau of Economic Analysis) API Configuration
-BEA_BASE_URL = "https://apps.bea.gov/api/data"
+BEA_BASE_URL = settings.endpoints.bea_base_url
 BEA_DATASETS = {
     "NIPA": "National Income and Product Accounts",
     "Regional": "Regional Economic Accounts",
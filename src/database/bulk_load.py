@@ -0,0 +1,240 @@
+"""
+Column-oriented bulk loading
+
+Helpers for loading whole files into model tables without per-row Python:
+
+- coerce_to_model(): cast a DataFrame's columns to the model's column types
+  in one vectorized pass per column, nulling values that would overflow
+  Numeric/BigInteger columns and truncating strings (the same rules as
+  BaseCollector.sanitize_record, applied per column instead of per record)
+- copy_merge(): COPY the frame into a temporary staging table and merge it
+  into the target with one INSERT ... SELECT ... ON CONFLICT DO UPDATE.
+  Other dialects (SQLite in benchmarks) fall back to batched multi-row
+  upserts with the same conflict handling.
+- StageTimer: rows, seconds and rows/sec per load stage
+"""
+import csv
+import io
+import logging
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import BigInteger, Boolean, Date, DateTime, Integer, Numeric, String, column, select, table
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Rows per executemany call for the non-PostgreSQL fallback
+MAX_BATCH_ROWS = 10000
+MAX_BIGINT = 9223372036854775807
+
+
+# ===================== Timing ===================== #
+
+class StageTimer:
+    """
+    Rows and wall time per stage, measured lap by lap.
+
+    Usage:
+        timer = StageTimer()
+        df = pd.read_csv(path); timer.lap('read', len(df))
+        df = coerce_to_model(df, Model); timer.lap('coerce', len(df))
+        logger.info(timer.report())
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._last = time.perf_counter()
+
+    def lap(self, stage: str, rows: int) -> float:
+        """Close a stage started at the previous lap; returns its seconds."""
+        now = time.perf_counter()
+        seconds, self._last = now - self._last, now
+        totals = self.stages.setdefault(stage, {'rows': 0, 'seconds': 0.0})
+        totals['rows'] += rows
+        totals['seconds'] += seconds
+        return seconds
+
+    def merge(self, other: 'StageTimer'):
+        """Add another timer's totals (e.g. one file's) to this one."""
+        for stage, totals in other.stages.items():
+            mine = self.stages.setdefault(stage, {'rows': 0, 'seconds': 0.0})
+            mine['rows'] += totals['rows']
+            mine['seconds'] += totals['seconds']
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {
+            stage: {
+                'rows': int(t['rows']),
+                'seconds': round(t['seconds'], 4),
+                'rows_per_sec': round(t['rows'] / t['seconds'], 1) if t['seconds'] else None,
+            }
+            for stage, t in self.stages.items()
+        }
+
+    def report(self) -> str:
+        return " | ".join(
+            f"{stage} {s['rows']:,} rows {s['seconds']:.2f}s ({s['rows_per_sec'] or 0:,.0f}/s)"
+            for stage, s in self.summary().items()
+        )
+
+
+# ===================== Coercion ===================== #
+
+def coerce_to_model(df: pd.DataFrame, model: Any, label: str = '') -> pd.DataFrame:
+    """
+    Keep the model's columns and cast each one to its column type
+
+    Args:
+        df: Frame with snake_case columns
+        model: SQLAlchemy model class
+        label: Name used in warnings (e.g. the file name)
+
+    Returns:
+        New frame: model columns only; unparseable and overflowing values are
+        null, Integer columns use the nullable Int64 dtype, Date columns hold
+        datetime.date objects
+    """
+    columns = model.__table__.columns
+    dropped = [c for c in df.columns if c not in columns]
+    if dropped:
+        logger.debug(f"{label or model.__tablename__}: ignoring columns not in {model.__tablename__}: {dropped}")
+
+    out = {}
+    for name in [c for c in df.columns if c in columns]:
+        col_type = columns[name].type
+        values = df[name]
+
+        if isinstance(col_type, DateTime):
+            out[name] = pd.to_datetime(values, errors='coerce')
+        elif isinstance(col_type, Date):
+            parsed = pd.to_datetime(values, errors='coerce')
+            out[name] = pd.Series(parsed.dt.date, index=df.index).where(parsed.notna(), None)
+        elif isinstance(col_type, Boolean):
+            lowered = values.astype('string').str.strip().str.lower()
+            out[name] = lowered.map({'true': True, 't': True, '1': True, 'false': False, 'f': False, '0': False})
+        elif isinstance(col_type, (Integer, BigInteger)):
+            numbers = pd.to_numeric(values, errors='coerce')
+            overflow = numbers.abs() > MAX_BIGINT
+            _warn_sanitized(label, name, int(overflow.sum()), 'exceeds BigInteger limit')
+            out[name] = numbers.mask(overflow).round().astype('Int64')
+        elif isinstance(col_type, Numeric):
+            numbers = pd.to_numeric(values, errors='coerce')
+            if col_type.precision and col_type.scale is not None:
+                # Same 90% safety margin as BaseCollector.sanitize_record
+                limit = 10 ** (col_type.precision - col_type.scale) * 0.9
+                overflow = numbers.abs() >= limit
+                _warn_sanitized(label, name, int(overflow.sum()),
+                                f"exceeds Numeric({col_type.precision},{col_type.scale}) limit")
+                numbers = numbers.mask(overflow)
+            out[name] = numbers.replace([np.inf, -np.inf], np.nan)
+        elif isinstance(col_type, String):
+            text = values.astype('string')
+            if col_type.length:
+                too_long = text.str.len() > col_type.length
+                _warn_sanitized(label, name, int(too_long.fillna(False).sum()),
+                                f"truncated to {col_type.length} chars")
+                text = text.str.slice(0, col_type.length)
+            out[name] = text
+        else:
+            out[name] = values
+
+    return pd.DataFrame(out, index=df.index)
+
+
+def _warn_sanitized(label: str, column_name: str, count: int, reason: str):
+    if count:
+        logger.warning(f"Sanitizing {label or 'frame'}.{column_name}: {count:,} values -> {reason}")
+
+
+def frame_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Records with None for every missing value (NaN, NaT, pd.NA)."""
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+
+# ===================== Merge ===================== #
+
+def copy_merge(
+    session: Session,
+    model: Any,
+    df: pd.DataFrame,
+    conflict_columns: Optional[Sequence[str]] = None,
+    exclude_from_update: Sequence[str] = ('created_at',),
+) -> int:
+    """
+    Upsert a coerced frame into the model's table (the caller commits)
+
+    On PostgreSQL (psycopg2) the frame is streamed with COPY into a temporary
+    table and merged with one INSERT ... SELECT ... ON CONFLICT DO UPDATE;
+    elsewhere it is written as batched multi-row upserts. Rows must already
+    be unique on the conflict columns.
+
+    Args:
+        session: Database session; the merge runs in its transaction
+        model: SQLAlchemy model class
+        df: Frame from coerce_to_model()
+        conflict_columns: Conflict target (default: primary key)
+        exclude_from_update: Columns kept on conflict besides the conflict target
+
+    Returns:
+        Rows written
+    """
+    if df.empty:
+        return 0
+    conflict_columns = list(conflict_columns or [c.name for c in model.__table__.primary_key])
+    columns = list(df.columns)
+    update_columns = [c for c in columns if c not in conflict_columns and c not in exclude_from_update]
+    # Python-side onupdate (updated_at) is not in the frame; refresh it from the insert default
+    update_columns += [
+        c.name for c in model.__table__.columns
+        if c.onupdate is not None and c.name not in columns and c.name not in exclude_from_update
+    ]
+
+    connection = session.connection()
+    if connection.dialect.name == 'postgresql' and hasattr(connection.connection.driver_connection, 'cursor'):
+        return _copy_merge_postgres(connection, model, df, columns, conflict_columns, update_columns)
+    return _batched_upsert(connection, model, df, conflict_columns, update_columns)
+
+
+def _copy_merge_postgres(connection, model, df, columns, conflict_columns, update_columns) -> int:
+    target = model.__tablename__
+    staging = f"_stage_{target}_{uuid.uuid4().hex[:8]}"
+    quoted = ", ".join(f'"{c}"' for c in columns)
+
+    # Column types only (no NOT NULL/defaults): created_at/updated_at come from the insert defaults
+    connection.exec_driver_sql(
+        f'CREATE TEMP TABLE "{staging}" ON COMMIT DROP AS SELECT {quoted} FROM "{target}" WITH NO DATA'
+    )
+
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False, header=False, na_rep='', quoting=csv.QUOTE_MINIMAL,
+              date_format='%Y-%m-%d %H:%M:%S')
+    buffer.seek(0)
+    with connection.connection.driver_connection.cursor() as cursor:
+        cursor.copy_expert(f'COPY "{staging}" ({quoted}) FROM STDIN WITH (FORMAT csv, NULL \'\')', buffer)
+
+    source = select(*[column(c) for c in columns]).select_from(table(staging, *[column(c) for c in columns]))
+    stmt = insert(model).from_select(columns, source)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=conflict_columns,
+        set_={c: stmt.excluded[c] for c in update_columns},
+    )
+    connection.execute(stmt)
+    return len(df)
+
+
+def _batched_upsert(connection, model, df, conflict_columns, update_columns) -> int:
+    # One compiled statement, executemany: SQLAlchemy batches it into multi-row VALUES
+    records = frame_records(df)
+    stmt = insert(model)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=conflict_columns,
+        set_={c: stmt.excluded[c] for c in update_columns},
+    )
+    for i in range(0, len(records), MAX_BATCH_ROWS):
+        connection.execute(stmt, records[i:i + MAX_BATCH_ROWS])
+    return len(records)
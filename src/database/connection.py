@@ -3,19 +3,55 @@ Database Connection Management
 Handles connection pooling, session management, and database operations
 """
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import Generator, Optional, Tuple
 import logging
+import re
+import time
 
 from sqlalchemy import create_engine, event, exc
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session, scoped_session
-from sqlalchemy.pool import Pool
+from sqlalchemy.pool import Pool, QueuePool
+from sqlalchemy.sql.dml import Delete, Insert, Update
+from sqlalchemy.sql.elements import TextClause
 
 from src.config import settings
+from src.database import query_tracer
+from src.utils import metrics
 
 
 logger = logging.getLogger(__name__)
 
+# Target table of raw-SQL writes (INSERT ... SELECT rollups, promotions)
+_TEXT_WRITE_RE = re.compile(
+    r"^\s*(?:WITH\b.*?\)\s*)?(INSERT\s+INTO|UPDATE|DELETE\s+FROM)\s+([\w.\"]+)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each connection checkout waits."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.observe_pool_wait(time.perf_counter() - start)
+
+
+def _written_table(statement) -> Optional[Tuple[str, str]]:
+    """(table, operation) for an INSERT/UPDATE/DELETE statement, else None."""
+    for dml, operation in ((Insert, 'insert'), (Update, 'update'), (Delete, 'delete')):
+        if isinstance(statement, dml):
+            return getattr(statement.table, 'name', str(statement.table)), operation
+    if isinstance(statement, TextClause):
+        match = _TEXT_WRITE_RE.match(statement.text)
+        if match:
+            operation = match.group(1).split()[0].lower()
+            return match.group(2).replace('"', '').split('.')[-1], operation
+    return None
+
 
 class DatabaseConnection:
     """Singleton database connection manager"""
@@ -36,6 +72,7 @@ class DatabaseConnection:
                 pool_pre_ping=settings.database.pool_pre_ping,
                 pool_recycle=settings.database.pool_recycle,
                 echo=settings.database.echo,
+                poolclass=TimedQueuePool if metrics.ENABLED else QueuePool,
             )
             
             # Add event listeners
@@ -56,6 +93,8 @@ class DatabaseConnection:
                 autocommit=False,
                 autoflush=False,
             )
+            if metrics.ENABLED:
+                cls._setup_session_listeners(cls._session_factory)
             logger.info("Session factory created")
         
         return cls._session_factory
@@ -88,6 +127,47 @@ class DatabaseConnection:
         def receive_checkin(dbapi_conn, connection_record):
             """Log connection return to pool"""
             logger.debug("Connection returned to pool")
+
+        if metrics.ENABLED:
+            cls._setup_metrics_listeners(engine)
+
+        if settings.database.trace_queries:
+            query_tracer.install(engine)
+
+    @classmethod
+    def _setup_metrics_listeners(cls, engine: Engine):
+        """Pool usage and rows written, exported through src.utils.metrics"""
+
+        @event.listens_for(engine, "checkout")
+        def count_checkout(dbapi_conn, connection_record, connection_proxy):
+            metrics.observe_pool_checkout(engine.pool.checkedout(), engine.pool.overflow())
+
+        @event.listens_for(engine, "checkin")
+        def count_checkin(dbapi_conn, connection_record):
+            # The collector label belongs to one checkout only
+            connection_record.info.pop('collector', None)
+            # Fired before the connection is back in the pool, so it still counts as checked out
+            metrics.observe_pool_checkin(max(engine.pool.checkedout() - 1, 0), engine.pool.overflow())
+
+        @event.listens_for(engine, "after_execute")
+        def count_rows_written(conn, clauseelement, multiparams, params, execution_options, result):
+            target = _written_table(clauseelement)
+            if target is None:
+                return
+            rows = result.rowcount
+            if rows is None or rows < 0:
+                rows = len(multiparams) or 1
+            table, operation = target
+            metrics.record_rows_written(conn.info.get('collector', 'other'), table, operation, rows)
+
+    @classmethod
+    def _setup_session_listeners(cls, session_factory: sessionmaker):
+        """Carry Session.info['collector'] (set by BaseCollector) onto the connection it uses"""
+
+        @event.listens_for(session_factory, "after_begin")
+        def label_connection(session, transaction, connection):
+            if 'collector' in session.info:
+                connection.info['collector'] = session.info['collector']
     
     @classmethod
     def dispose(cls):
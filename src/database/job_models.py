@@ -0,0 +1,75 @@
+"""
+Collection Job Queue Models
+
+Database-backed queue for long-running collection jobs (BEA, Treasury, BLS).
+The admin API enqueues jobs; separate worker processes claim and run them,
+so job state and progress survive restarts of either side.
+
+Author: FinExus Data Collector
+Created: 2025-12-04
+"""
+from sqlalchemy import (
+    Column, Integer, String, SmallInteger, DateTime, Boolean, Text, Index, text
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.sql import func
+
+Base = declarative_base()
+
+
+class CollectionJob(Base):
+    """A queued, running or finished collection job
+
+    Lifecycle: queued -> running -> completed | failed | cancelled.
+    A failed attempt with retries left goes back to 'queued' with run_after
+    pushed out by exponential backoff. Workers refresh heartbeat_at while a job
+    runs; a running job whose heartbeat goes stale is treated as a failed
+    attempt (its worker died).
+    """
+    __tablename__ = 'collection_jobs'
+
+    job_id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # What to run
+    job_type = Column(String(100), nullable=False, index=True)  # e.g. 'bea.nipa_backfill'
+    params = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+
+    # At most one queued/running job per concurrency key (e.g. 'BEA:NIPA', 'BLS:CU')
+    concurrency_key = Column(String(100))
+    priority = Column(SmallInteger, nullable=False, server_default='0')
+
+    # State
+    status = Column(String(20), nullable=False, server_default='queued', index=True)
+    attempts = Column(SmallInteger, nullable=False, server_default='0')
+    max_attempts = Column(SmallInteger, nullable=False, server_default='3')
+    run_after = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    cancel_requested = Column(Boolean, nullable=False, server_default='false')
+
+    # Execution
+    worker_id = Column(String(100))
+    heartbeat_at = Column(DateTime(timezone=True))
+    progress = Column(JSONB)
+    result = Column(JSONB)
+    error_message = Column(Text)
+
+    # Linked collection run record (bea_collection_runs / treasury_collection_runs), if any
+    run_id = Column(Integer)
+
+    # Timing
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    completed_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        # Claim order for workers polling queued jobs
+        Index('ix_collection_jobs_claim', 'status', 'priority', 'run_after'),
+        Index(
+            'uq_collection_jobs_active_key', 'concurrency_key',
+            unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+    )
+
+    def __repr__(self):
+        return f"<CollectionJob(id={self.job_id}, type={self.job_type}, status={self.status})>"
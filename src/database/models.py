@@ -9,7 +9,7 @@ from decimal import Decimal
 from sqlalchemy import (
     Column, Integer, String, Numeric, Date, DateTime, 
     Boolean, Text, ForeignKey, Index, CheckConstraint,
-    UniqueConstraint, BigInteger, Float
+    UniqueConstraint, BigInteger, Float, DDL, event, inspect, table, column
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -529,6 +529,9 @@ class PriceMonthly(Base):
     volume = Column(BigInteger)
 
     created_at = Column(DateTime, default=func.now(), nullable=False)
+    # Last rollup of this month; daily rows created after a symbol's latest
+    # updated_at mark the months the next rollup recomputes
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
 
     __table_args__ = (
         Index('ix_prices_monthly_date_symbol', 'date', 'symbol'),
@@ -565,6 +568,79 @@ class PriceDailyBulk(Base):
     )
 
 
+# Daily prices from both sources in one relation: prices_daily wins, prices_daily_bulk
+# fills dates it lacks. Regular rows are dividend-adjusted (open..close = adj_*);
+# bulk rows keep raw OHLC plus adj_close. A plain view, so it is never stale and
+# symbol/date filters are pushed into both branches' primary keys.
+PRICES_DAILY_UNIFIED_SELECT = """
+    SELECT p.symbol, p.date,
+           p.adj_open AS open, p.adj_high AS high, p.adj_low AS low, p.adj_close AS close,
+           p.adj_close, p.volume, 'regular'::varchar(10) AS source
+    FROM prices_daily p
+    UNION ALL
+    SELECT b.symbol, b.date,
+           b.open, b.high, b.low, b.close,
+           b.adj_close, b.volume, 'bulk'::varchar(10) AS source
+    FROM prices_daily_bulk b
+    WHERE NOT EXISTS (
+        SELECT 1 FROM prices_daily p WHERE p.symbol = b.symbol AND p.date = b.date
+    )
+"""
+
+# Selectable for queries (not part of Base.metadata, so create_all never makes it a table)
+prices_daily_unified = table(
+    'prices_daily_unified',
+    column('symbol', String(20)),
+    column('date', Date),
+    column('open', Numeric(20, 4)),
+    column('high', Numeric(20, 4)),
+    column('low', Numeric(20, 4)),
+    column('close', Numeric(20, 4)),
+    column('adj_close', Numeric(20, 4)),
+    column('volume', BigInteger),
+    column('source', String(10)),
+)
+
+# Keep create_all/drop_all (init_database) in step with the alembic migration
+PRICES_DAILY_UNIFIED_SOURCES = ('prices_daily', 'prices_daily_bulk')
+
+
+def _create_unified_view_if(ddl, target, bind, **kw) -> bool:
+    # create_all(tables=[...]) may leave a source table out; only build the view once both exist
+    inspector = inspect(bind)
+    return all(inspector.has_table(name) for name in PRICES_DAILY_UNIFIED_SOURCES)
+
+
+def _drop_unified_view_if(ddl, target, bind, tables=None, **kw) -> bool:
+    # The view must go before either source table is dropped, and only then
+    return tables is None or any(t.name in PRICES_DAILY_UNIFIED_SOURCES for t in tables)
+
+
+event.listen(
+    Base.metadata, 'after_create',
+    DDL(f"CREATE OR REPLACE VIEW prices_daily_unified AS {PRICES_DAILY_UNIFIED_SELECT}")
+    .execute_if(dialect='postgresql', callable_=_create_unified_view_if)
+)
+event.listen(
+    Base.metadata, 'before_drop',
+    DDL("DROP VIEW IF EXISTS prices_daily_unified")
+    .execute_if(dialect='postgresql', callable_=_drop_unified_view_if)
+)
+
+
+class TradingCalendar(Base):
+    """
+    Exchange calendar exceptions - weekdays the exchange is closed
+    Trading days are Monday-Friday minus these rows
+    Filled by src.utils.trading_calendar (scripts/sync_trading_calendar.py)
+    """
+    __tablename__ = 'trading_calendar'
+
+    exchange = Column(String(10), primary_key=True)  # ISO 10383 MIC, e.g. 'XNYS'
+    date = Column(Date, primary_key=True)
+    description = Column(String(100))  # e.g. 'Good Friday'
+
+
 class PeersBulk(Base):
     """
     Stock peers bulk data - unvalidated peer relationships
@@ -582,9 +658,31 @@ class PeersBulk(Base):
 
     # Metadata
     collected_at = Column(DateTime, default=func.now(), nullable=False)
+    # Only moves when peers_list changes (PeerGraph refreshes from it)
+    last_updated = Column(DateTime, default=func.now(), server_default=func.now(), nullable=False)
 
     __table_args__ = (
         Index('ix_peers_bulk_symbol', 'symbol'),
+        Index('ix_peers_bulk_last_updated', 'last_updated'),
+    )
+
+
+class PeerEdge(Base):
+    """
+    One row per (symbol, peer) pair from peers_bulk.peers_list
+    Rewritten by BulkPeersCollector in the same transaction as peers_bulk
+    Forward lookups use the primary key, reverse lookups ix_peer_edges_peer_symbol
+    """
+    __tablename__ = 'peer_edges'
+
+    symbol = Column(String(20), ForeignKey('peers_bulk.symbol', ondelete='CASCADE'), primary_key=True)
+    peer_symbol = Column(String(20), primary_key=True)
+
+    # Position in the original peers_list (0-based)
+    position = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index('ix_peer_edges_peer_symbol', 'peer_symbol', 'symbol'),
     )
 
 
@@ -892,6 +990,9 @@ class EconomicIndicator(Base):
     native_frequency = Column(String(20))  # 'DAILY', 'MONTHLY', 'QUARTERLY', 'ANNUAL'
     units = Column(String(100))  # 'Billions', 'Index', 'Percent', etc.
     description = Column(Text)
+    # Change detection: hash of the stored series and its newest observation
+    content_hash = Column(String(64))
+    last_observation_date = Column(Date)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
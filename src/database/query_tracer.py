@@ -0,0 +1,334 @@
+"""
+SQL Query Tracer
+Per-unit-of-work query statistics and N+1 detection built on SQLAlchemy's
+before_cursor_execute/after_cursor_execute events.
+
+A unit of work (a collector run, a script, an admin request) opens a trace;
+every statement executed in that context is recorded with its duration and
+its shape (the SQL with literals and bound parameters replaced by '?'). At
+the end the trace reports query count, total DB time, the slowest
+statements and the shapes that repeated. A shape executed more than
+repeat_threshold times (e.g. one SELECT per row of a loop) is flagged with
+the call site that issued it.
+
+Tracing is opt-in:
+  - SQL_TRACE=True traces collector jobs, daily scripts and admin requests
+    (traced_unit() is a no-op otherwise)
+  - trace_queries() always traces, for checks and benchmarks
+
+Usage:
+    from src.database.query_tracer import trace_queries
+
+    with trace_queries('load_prices', repeat_threshold=10, strict=True) as trace:
+        load_prices(session)          # raises NPlusOneError on per-row lookups
+    print(trace.query_count, trace.total_seconds)
+
+    @traced_unit('collect_bulk_eod')
+    def main(): ...
+"""
+import contextvars
+import logging
+import os
+import re
+import threading
+import time
+import traceback
+from contextlib import ContextDecorator, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Project root, for locating the application frame that issued a statement
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+_SKIP_FRAMES = tuple(os.path.join('src', 'database', name) for name in ('query_tracer.py', 'connection.py'))
+
+_SHAPE_RULES = [
+    (re.compile(r"--[^\n]*"), " "),                                    # line comments
+    (re.compile(r"/\*.*?\*/", re.DOTALL), " "),                         # block comments
+    (re.compile(r"'(?:[^']|'')*'"), "?"),                               # string literals
+    (re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+|\?"), "?"),             # bound parameters
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),                            # numeric literals
+    (re.compile(r"\s+"), " "),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(?)"),                 # IN lists / VALUES rows
+    (re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+"), "(?)"),                   # multi-row VALUES
+]
+
+_active_traces: contextvars.ContextVar[Tuple["QueryTrace", ...]] = contextvars.ContextVar(
+    'finexus_query_traces', default=()
+)
+
+
+class NPlusOneError(AssertionError):
+    """Raised by strict traces when a statement shape repeats past the threshold."""
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Structural form of a SQL statement: literals, bound parameters, IN lists
+    and multi-row VALUES collapsed so per-row variants compare equal
+
+    Args:
+        statement: SQL text as sent to the DBAPI cursor
+
+    Returns:
+        Normalized statement
+    """
+    shape = statement
+    for pattern, replacement in _SHAPE_RULES:
+        shape = pattern.sub(replacement, shape)
+    return shape.strip()
+
+
+def _call_site() -> str:
+    """Innermost project frame outside the database layer, as 'path:line in func'."""
+    for frame in reversed(traceback.extract_stack()):
+        filename = os.path.abspath(frame.filename)
+        if not filename.startswith(_PROJECT_ROOT) or filename.endswith(_SKIP_FRAMES):
+            continue
+        if 'site-packages' in filename:
+            continue
+        return f"{os.path.relpath(filename, _PROJECT_ROOT)}:{frame.lineno} in {frame.name}"
+    return "unknown"
+
+
+@dataclass
+class ShapeStats:
+    """Executions of one statement shape within a trace."""
+    shape: str
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    call_site: Optional[str] = None
+
+
+@dataclass
+class SlowStatement:
+    seconds: float
+    statement: str
+
+
+class QueryTrace:
+    """
+    Statistics for the statements executed in one unit of work
+
+    Attributes:
+        name: Unit of work (job, script or route)
+        repeat_threshold: Executions of one shape above which it is flagged
+        slowest_limit: Number of slowest statements kept
+        query_count: Statements executed (an executemany counts once)
+        total_seconds: Time spent in cursor execution
+    """
+
+    def __init__(self, name: str, repeat_threshold: int = 20, slowest_limit: int = 5):
+        self.name = name
+        self.repeat_threshold = repeat_threshold
+        self.slowest_limit = slowest_limit
+        self.query_count = 0
+        self.total_seconds = 0.0
+        self.shapes: Dict[str, ShapeStats] = {}
+        self._slowest: List[SlowStatement] = []
+        self._lock = threading.Lock()
+        self.started_at = time.perf_counter()
+        self.wall_seconds: Optional[float] = None
+
+    def record(self, statement: str, seconds: float) -> None:
+        """Add one executed statement."""
+        shape = statement_shape(statement)
+        with self._lock:
+            self.query_count += 1
+            self.total_seconds += seconds
+
+            stats = self.shapes.get(shape)
+            if stats is None:
+                stats = self.shapes[shape] = ShapeStats(shape)
+            stats.count += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            flagged_now = stats.count == self.repeat_threshold + 1
+
+            if len(self._slowest) < self.slowest_limit or seconds > self._slowest[-1].seconds:
+                self._slowest.append(SlowStatement(seconds, statement))
+                self._slowest.sort(key=lambda s: s.seconds, reverse=True)
+                del self._slowest[self.slowest_limit:]
+
+        # Only walk the stack once per flagged shape
+        if flagged_now:
+            stats.call_site = _call_site()
+
+    @property
+    def slowest(self) -> List[SlowStatement]:
+        return list(self._slowest)
+
+    @property
+    def repeated(self) -> List[ShapeStats]:
+        """Shapes executed more than once, most frequent first."""
+        return sorted((s for s in self.shapes.values() if s.count > 1), key=lambda s: s.count, reverse=True)
+
+    @property
+    def flagged(self) -> List[ShapeStats]:
+        """Shapes executed more than repeat_threshold times (likely N+1 patterns)."""
+        return [s for s in self.repeated if s.count > self.repeat_threshold]
+
+    def summary(self) -> Dict:
+        """Plain-dict report, e.g. for job results or JSON logs."""
+        return {
+            'name': self.name,
+            'query_count': self.query_count,
+            'db_seconds': round(self.total_seconds, 4),
+            'wall_seconds': round(self.wall_seconds, 4) if self.wall_seconds is not None else None,
+            'distinct_shapes': len(self.shapes),
+            'slowest': [{'seconds': round(s.seconds, 4), 'statement': s.statement[:500]} for s in self._slowest],
+            'flagged': [
+                {'count': s.count, 'seconds': round(s.total_seconds, 4), 'call_site': s.call_site, 'shape': s.shape[:500]}
+                for s in self.flagged
+            ],
+        }
+
+    def log_summary(self, log: logging.Logger = logger) -> None:
+        """One line of totals; flagged shapes as warnings, the slowest statements at DEBUG."""
+        log.info(
+            f"SQL trace {self.name}: {self.query_count} queries, {self.total_seconds:.3f}s in DB, "
+            f"{len(self.shapes)} distinct shapes"
+        )
+        for stats in self.flagged:
+            log.warning(
+                f"SQL trace {self.name}: possible N+1, {stats.count} x ({stats.total_seconds:.3f}s) "
+                f"from {stats.call_site}: {stats.shape[:200]}"
+            )
+        for slow in self._slowest:
+            log.debug(f"SQL trace {self.name}: {slow.seconds:.4f}s {slow.statement[:200]}")
+
+    def assert_no_n_plus_one(self) -> None:
+        """Raise NPlusOneError if any shape was flagged."""
+        flagged = self.flagged
+        if flagged:
+            details = "; ".join(f"{s.count} x {s.shape[:120]} ({s.call_site})" for s in flagged)
+            raise NPlusOneError(f"{self.name}: statements repeated over {self.repeat_threshold} times: {details}")
+
+
+# ===================== Engine Listeners ===================== #
+
+def _start_timer(conn, cursor, statement, parameters, context, executemany):
+    if _active_traces.get() and context is not None:
+        context._trace_start = time.perf_counter()
+
+
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, '_trace_start', None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+    for trace in _active_traces.get():
+        trace.record(statement, elapsed)
+
+
+def install(engine: Engine) -> None:
+    """Register the tracing listeners on an engine (idempotent, cheap while no trace is active)."""
+    if not event.contains(engine, "before_cursor_execute", _start_timer):
+        event.listen(engine, "before_cursor_execute", _start_timer)
+        event.listen(engine, "after_cursor_execute", _record_statement)
+
+
+def current_trace() -> Optional[QueryTrace]:
+    """Innermost active trace in this context, if any."""
+    traces = _active_traces.get()
+    return traces[-1] if traces else None
+
+
+# ===================== Units of Work ===================== #
+
+@contextmanager
+def trace_queries(
+    name: str,
+    repeat_threshold: Optional[int] = None,
+    slowest_limit: Optional[int] = None,
+    strict: bool = False,
+    engine: Optional[Engine] = None,
+) -> Iterator[QueryTrace]:
+    """
+    Trace every statement executed in this context
+
+    Nested traces each see the statements of their own block, so a script
+    trace includes the collector traces inside it.
+
+    Args:
+        name: Unit of work label
+        repeat_threshold: Flag shapes executed more often (default SQL_TRACE_REPEAT_THRESHOLD)
+        slowest_limit: Slowest statements to keep (default SQL_TRACE_SLOWEST)
+        strict: Raise NPlusOneError on exit if a shape was flagged
+        engine: Engine to instrument (default: the DatabaseConnection engine)
+
+    Yields:
+        The QueryTrace being filled
+    """
+    from src.config import settings
+    if engine is None:
+        from src.database.connection import DatabaseConnection
+        engine = DatabaseConnection.get_engine()
+    install(engine)
+
+    trace = QueryTrace(
+        name,
+        repeat_threshold if repeat_threshold is not None else settings.database.trace_repeat_threshold,
+        slowest_limit if slowest_limit is not None else settings.database.trace_slowest,
+    )
+    token = _active_traces.set(_active_traces.get() + (trace,))
+    try:
+        yield trace
+    finally:
+        _active_traces.reset(token)
+        trace.wall_seconds = time.perf_counter() - trace.started_at
+        trace.log_summary()
+    if strict:
+        trace.assert_no_n_plus_one()
+
+
+class _NoTrace(ContextDecorator):
+    """Stand-in for trace_queries() when tracing is disabled."""
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+def traced_unit(name: str):
+    """
+    trace_queries(name) when SQL_TRACE is enabled, otherwise a no-op
+
+    Works as a context manager or a decorator:
+        @traced_unit('update_daily_prices')
+        def update_daily_prices(): ...
+    """
+    from src.config import settings
+    if settings.database.trace_queries:
+        return trace_queries(name)
+    return _NoTrace()
+
+
+class QueryTraceMiddleware:
+    """ASGI middleware tracing each admin API request, labelled by route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        # Sync endpoints run in a worker thread with a copy of this context,
+        # so their statements land in the trace opened here
+        with trace_queries(scope.get('path', '')) as trace:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                route = scope.get('route')
+                if route is not None:
+                    trace.name = f"{scope.get('method', '')} {route.path}"
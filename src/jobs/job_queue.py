@@ -0,0 +1,526 @@
+"""
+Collection Job Queue
+
+PostgreSQL-backed queue for long-running collection jobs. The admin API only
+enqueues; worker processes (src/jobs/job_worker.py) claim jobs with
+SELECT ... FOR UPDATE SKIP LOCKED, so several workers can poll the same table
+without handing out a job twice.
+
+Handlers are plain functions registered by job type:
+
+    @register_job_handler('bea.nipa_backfill')
+    def run_nipa_backfill(ctx: JobContext) -> Optional[Dict]:
+        ...
+        ctx.report({'tables_processed': n})   # raises JobCancelled if cancelled
+        return {'data_points': total}
+
+Author: FinExus Data Collector
+Created: 2025-12-04
+"""
+import logging
+import random
+import threading
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import Text, and_, case, literal, literal_column, not_, select, update, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.database.connection import get_session
+from src.database.job_models import CollectionJob
+
+log = logging.getLogger("JobQueue")
+
+
+class JobStatus:
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    ACTIVE = (QUEUED, RUNNING)
+
+
+class JobCancelled(BaseException):
+    """
+    Raised inside a handler once cancellation has been requested.
+
+    Derives from BaseException so collectors that catch Exception per table
+    or per series do not swallow it.
+    """
+
+
+class PermanentJobError(Exception):
+    """Raised by handlers for failures a retry cannot fix (e.g. missing API key)."""
+
+
+# Params holding credentials: kept only while the job may still run, removed
+# from the row as soon as it reaches a terminal status
+SECRET_PARAMS = ("api_key",)
+
+
+def _without_secrets(params):
+    """SQL expression: the params JSONB with SECRET_PARAMS removed."""
+    for key in SECRET_PARAMS:
+        params = params.op('-')(literal(key, Text))
+    return params
+
+
+# ===================== Handler Registry ===================== #
+
+JobHandler = Callable[["JobContext"], Optional[Dict[str, Any]]]
+
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+
+def register_job_handler(job_type: str) -> Callable[[JobHandler], JobHandler]:
+    """Decorator registering a handler function for a job type."""
+    def decorator(func: JobHandler) -> JobHandler:
+        JOB_HANDLERS[job_type] = func
+        return func
+    return decorator
+
+
+class JobContext:
+    """
+    What a running handler sees of its job.
+
+    The worker's heartbeat thread sets the cancel event when the job's
+    cancel_requested flag is seen; handlers call report() or check_cancelled()
+    at safe points (e.g. after each table) to stop there.
+    """
+
+    def __init__(self, job_id: int, job_type: str, params: Dict[str, Any],
+                 attempt: int, max_attempts: int, run_id: Optional[int] = None,
+                 worker_id: Optional[str] = None):
+        self.job_id = job_id
+        self.job_type = job_type
+        self.params = params or {}
+        self.attempt = attempt
+        self.max_attempts = max_attempts
+        self.run_id = run_id
+        self.worker_id = worker_id
+
+        self.progress: Dict[str, Any] = {}
+        self.cancel_event = threading.Event()
+        # Set when the job was re-queued away from this worker (heartbeat lost)
+        self.lost = False
+
+    @property
+    def is_last_attempt(self) -> bool:
+        return self.attempt >= self.max_attempts
+
+    def check_cancelled(self):
+        """Raise JobCancelled if cancellation has been requested."""
+        if self.cancel_event.is_set():
+            raise JobCancelled(f"Job {self.job_id} cancelled")
+
+    def report(self, progress: Optional[Dict[str, Any]] = None):
+        """
+        Record progress (persisted with the next heartbeat) and honour cancellation.
+
+        Args:
+            progress: JSON-serializable progress snapshot
+        """
+        if progress is not None:
+            self.progress = progress
+        self.check_cancelled()
+
+
+# ===================== Queue ===================== #
+
+class JobQueue:
+    """
+    Enqueue, claim and settle collection jobs.
+
+    Each method opens its own short session so it is safe to call from API
+    handlers, worker loops and heartbeat threads alike.
+    """
+
+    def __init__(
+        self,
+        retry_base_seconds: float = 30.0,
+        retry_max_seconds: float = 1800.0,
+        session_factory: Callable = get_session,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            retry_base_seconds: Delay before the first retry (doubles per attempt)
+            retry_max_seconds: Upper bound on the retry delay
+            session_factory: Context manager yielding a Session
+        """
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._session_factory = session_factory
+
+    # ---------- Producers ---------- #
+
+    def enqueue(
+        self,
+        job_type: str,
+        params: Optional[Dict[str, Any]] = None,
+        concurrency_key: Optional[str] = None,
+        max_attempts: int = 3,
+        priority: int = 0,
+        run_id: Optional[int] = None,
+        session: Optional[Session] = None,
+    ) -> Optional[int]:
+        """
+        Add a job to the queue.
+
+        Args:
+            job_type: Registered handler name
+            params: JSON-serializable handler parameters
+            concurrency_key: Only one queued/running job may hold this key
+            max_attempts: Attempts before the job is marked failed
+            priority: Higher runs first
+            run_id: Linked collection run record
+            session: Optional session to enqueue in (committed by the caller)
+
+        Returns:
+            job_id, or None if an active job already holds concurrency_key
+        """
+        stmt = insert(CollectionJob).values(
+            job_type=job_type,
+            params=params or {},
+            concurrency_key=concurrency_key,
+            max_attempts=max_attempts,
+            priority=priority,
+            run_id=run_id,
+        )
+        if concurrency_key:
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=['concurrency_key'],
+                index_where=CollectionJob.status.in_(JobStatus.ACTIVE),
+            )
+        stmt = stmt.returning(CollectionJob.job_id)
+
+        if session is not None:
+            job_id = session.execute(stmt).scalar_one_or_none()
+        else:
+            with self._session_factory() as own_session:
+                job_id = own_session.execute(stmt).scalar_one_or_none()
+                own_session.commit()
+
+        if job_id is None:
+            log.warning(f"Job {job_type} not queued: {concurrency_key} already active")
+        else:
+            log.info(f"Queued job {job_id} ({job_type}, key={concurrency_key})")
+        return job_id
+
+    def cancel(self, job_id: int) -> Optional[str]:
+        """
+        Cancel a job: queued jobs are cancelled at once, running jobs are
+        flagged and stop at their next check.
+
+        Returns:
+            New status ('cancelled' or 'running'), or None if the job is not active
+        """
+        with self._session_factory() as session:
+            job = session.execute(
+                select(CollectionJob).where(CollectionJob.job_id == job_id).with_for_update()
+            ).scalar_one_or_none()
+
+            if job is None or job.status not in JobStatus.ACTIVE:
+                return None
+
+            if job.status == JobStatus.QUEUED:
+                job.status = JobStatus.CANCELLED
+                job.completed_at = func.now()
+                job.params = _without_secrets(CollectionJob.params)
+            else:
+                job.cancel_requested = True
+            session.commit()
+
+            log.info(f"Cancel requested for job {job_id} (now {job.status})")
+            return job.status
+
+    def retry(self, job_id: int) -> bool:
+        """
+        Re-queue a failed or cancelled job for one more attempt.
+
+        Returns:
+            False if the job is not failed/cancelled or its concurrency key is busy
+        """
+        with self._session_factory() as session:
+            try:
+                result = session.execute(
+                    update(CollectionJob)
+                    .where(
+                        CollectionJob.job_id == job_id,
+                        CollectionJob.status.in_((JobStatus.FAILED, JobStatus.CANCELLED)),
+                    )
+                    .values(
+                        status=JobStatus.QUEUED,
+                        max_attempts=CollectionJob.attempts + 1,
+                        run_after=func.now(),
+                        cancel_requested=False,
+                        error_message=None,
+                        completed_at=None,
+                    )
+                )
+                session.commit()
+            except IntegrityError:
+                # Another job with the same concurrency key is active
+                session.rollback()
+                return False
+            return result.rowcount > 0
+
+    # ---------- Queries ---------- #
+
+    def get_job(self, job_id: int) -> Optional[CollectionJob]:
+        with self._session_factory() as session:
+            return session.get(CollectionJob, job_id)
+
+    def list_jobs(
+        self,
+        status: Optional[str] = None,
+        job_type_prefix: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[CollectionJob]:
+        """Most recent jobs first, optionally filtered by status and job type prefix."""
+        with self._session_factory() as session:
+            query = select(CollectionJob)
+            if status:
+                query = query.where(CollectionJob.status == status)
+            if job_type_prefix:
+                query = query.where(CollectionJob.job_type.startswith(job_type_prefix))
+            query = query.order_by(CollectionJob.job_id.desc()).limit(limit)
+            return list(session.execute(query).scalars())
+
+    def active_keys(self, keys: Optional[Iterable[str]] = None, session: Optional[Session] = None) -> set:
+        """
+        Concurrency keys held by queued or running jobs (optionally among `keys`).
+
+        Pass `session` to read inside the caller's transaction (e.g. under a
+        lock taken before enqueueing).
+        """
+        query = select(CollectionJob.concurrency_key).where(
+            CollectionJob.status.in_(JobStatus.ACTIVE),
+            CollectionJob.concurrency_key.isnot(None),
+        )
+        if keys is not None:
+            query = query.where(CollectionJob.concurrency_key.in_(list(keys)))
+        if session is not None:
+            return set(session.execute(query).scalars())
+        with self._session_factory() as own_session:
+            return set(own_session.execute(query).scalars())
+
+    # ---------- Workers ---------- #
+
+    def claim(self, worker_id: str, job_types: Optional[Iterable[str]] = None) -> Optional[JobContext]:
+        """
+        Atomically take the next runnable job.
+
+        Args:
+            worker_id: Identifier recorded on the job
+            job_types: Only claim these types (default: any)
+
+        Returns:
+            JobContext for the claimed job, or None if nothing is runnable
+        """
+        with self._session_factory() as session:
+            query = (
+                select(CollectionJob)
+                .where(
+                    CollectionJob.status == JobStatus.QUEUED,
+                    CollectionJob.run_after <= func.now(),
+                )
+                .order_by(CollectionJob.priority.desc(), CollectionJob.job_id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            if job_types is not None:
+                query = query.where(CollectionJob.job_type.in_(list(job_types)))
+
+            job = session.execute(query).scalar_one_or_none()
+            if job is None:
+                return None
+
+            job.status = JobStatus.RUNNING
+            job.worker_id = worker_id
+            job.attempts += 1
+            job.started_at = func.now()
+            job.heartbeat_at = func.now()
+            session.commit()
+
+            return JobContext(
+                job_id=job.job_id,
+                job_type=job.job_type,
+                params=job.params,
+                attempt=job.attempts,
+                max_attempts=job.max_attempts,
+                run_id=job.run_id,
+                worker_id=worker_id,
+            )
+
+    def heartbeat(self, job_id: int, worker_id: str,
+                  progress: Optional[Dict[str, Any]] = None) -> Optional[bool]:
+        """
+        Mark a running job alive and store its progress.
+
+        Args:
+            job_id: Job being run
+            worker_id: Worker that claimed it
+            progress: Progress snapshot to persist
+
+        Returns:
+            Whether cancellation has been requested, or None if the job is no
+            longer running under this worker (re-queued as stale, or settled)
+        """
+        values: Dict[str, Any] = {'heartbeat_at': func.now()}
+        if progress is not None:
+            values['progress'] = progress
+
+        with self._session_factory() as session:
+            cancel_requested = session.execute(
+                update(CollectionJob)
+                .where(
+                    CollectionJob.job_id == job_id,
+                    CollectionJob.worker_id == worker_id,
+                    CollectionJob.status == JobStatus.RUNNING,
+                )
+                .values(**values)
+                .returning(CollectionJob.cancel_requested)
+            ).scalar_one_or_none()
+            session.commit()
+        return None if cancel_requested is None else bool(cancel_requested)
+
+    def complete(self, job_id: int, worker_id: str, result: Optional[Dict[str, Any]] = None,
+                 progress: Optional[Dict[str, Any]] = None) -> bool:
+        """Mark a job completed; False if it is no longer this worker's."""
+        return self._finish(job_id, worker_id, JobStatus.COMPLETED, result=result, progress=progress)
+
+    def mark_cancelled(self, job_id: int, worker_id: str,
+                       progress: Optional[Dict[str, Any]] = None) -> bool:
+        """Mark a running job cancelled (its handler stopped on request)."""
+        return self._finish(job_id, worker_id, JobStatus.CANCELLED, progress=progress)
+
+    def fail(self, job_id: int, worker_id: str, error: str, retryable: bool = True,
+             progress: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Record a failed attempt, re-queueing with backoff while attempts remain.
+
+        Returns:
+            New status ('queued' if it will be retried, else 'failed'), or
+            None if the job is no longer running under this worker
+        """
+        with self._session_factory() as session:
+            job = session.execute(
+                select(CollectionJob).where(CollectionJob.job_id == job_id).with_for_update()
+            ).scalar_one_or_none()
+            if job is None or job.status != JobStatus.RUNNING or job.worker_id != worker_id:
+                log.warning(f"Job {job_id} is no longer running under {worker_id}; "
+                            f"not recording failure: {error}")
+                return None
+
+            job.error_message = error
+            if progress is not None:
+                job.progress = progress
+
+            if retryable and job.attempts < job.max_attempts and not job.cancel_requested:
+                delay = self.retry_delay(job.attempts)
+                job.status = JobStatus.QUEUED
+                job.run_after = func.now() + timedelta(seconds=delay)
+                job.worker_id = None
+                log.warning(f"Job {job_id} attempt {job.attempts}/{job.max_attempts} failed; "
+                            f"retrying in {delay:.0f}s: {error}")
+            else:
+                job.status = JobStatus.FAILED
+                job.completed_at = func.now()
+                job.params = _without_secrets(CollectionJob.params)
+                log.error(f"Job {job_id} failed after {job.attempts} attempt(s): {error}")
+
+            session.commit()
+            return job.status
+
+    def requeue_stale(self, timeout_seconds: float) -> int:
+        """
+        Treat running jobs with no heartbeat for timeout_seconds as failed attempts.
+
+        One UPDATE selects and settles the stale rows, so a job that completes
+        or heartbeats in the meantime no longer matches and is left alone.
+        Re-queued jobs get the same backoff as retry_delay(), computed in SQL.
+
+        Returns:
+            Number of stale jobs re-queued or failed
+        """
+        error = f"Worker heartbeat lost (no heartbeat for {timeout_seconds:.0f}s)"
+        retryable = and_(CollectionJob.attempts < CollectionJob.max_attempts,
+                         not_(CollectionJob.cancel_requested))
+        delay_seconds = (
+            func.least(self.retry_max_seconds,
+                       self.retry_base_seconds * func.power(2, CollectionJob.attempts - 1))
+            * (0.8 + func.random() * 0.4)
+        )
+
+        with self._session_factory() as session:
+            rows = session.execute(
+                update(CollectionJob)
+                .where(
+                    CollectionJob.status == JobStatus.RUNNING,
+                    CollectionJob.heartbeat_at < func.now() - timedelta(seconds=timeout_seconds),
+                )
+                .values(
+                    error_message=error,
+                    status=case((retryable, JobStatus.QUEUED), else_=JobStatus.FAILED),
+                    run_after=case(
+                        (retryable, func.now() + delay_seconds * literal_column("interval '1 second'")),
+                        else_=CollectionJob.run_after,
+                    ),
+                    worker_id=case((retryable, None), else_=CollectionJob.worker_id),
+                    completed_at=case((retryable, CollectionJob.completed_at), else_=func.now()),
+                    params=case((retryable, CollectionJob.params), else_=_without_secrets(CollectionJob.params)),
+                )
+                .returning(CollectionJob.job_id, CollectionJob.status, CollectionJob.attempts)
+                .execution_options(synchronize_session=False)
+            ).all()
+            session.commit()
+
+        for job_id, status, attempts in rows:
+            log.warning(f"Job {job_id} attempt {attempts}: {error}; now {status}")
+        return len(rows)
+
+    def retry_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter for the given (1-based) attempt number."""
+        delay = min(self.retry_max_seconds, self.retry_base_seconds * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.8, 1.2)
+
+    # ---------- Internals ---------- #
+
+    def _finish(self, job_id: int, worker_id: str, status: str, result: Optional[Dict[str, Any]] = None,
+                progress: Optional[Dict[str, Any]] = None) -> bool:
+        values: Dict[str, Any] = {
+            'status': status,
+            'completed_at': func.now(),
+            'params': _without_secrets(CollectionJob.params),
+        }
+        if result is not None:
+            values['result'] = result
+        if progress is not None:
+            values['progress'] = progress
+
+        with self._session_factory() as session:
+            settled = session.execute(
+                update(CollectionJob)
+                .where(
+                    CollectionJob.job_id == job_id,
+                    CollectionJob.worker_id == worker_id,
+                    CollectionJob.status == JobStatus.RUNNING,
+                )
+                .values(**values)
+            ).rowcount
+            session.commit()
+
+        if not settled:
+            log.warning(f"Job {job_id} is no longer running under {worker_id}; not marking it {status}")
+        return bool(settled)
+
+
+# Shared instance for API endpoints and workers
+job_queue = JobQueue()
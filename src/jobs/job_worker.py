@@ -0,0 +1,251 @@
+"""
+Collection Job Worker
+
+Claims jobs from the collection job queue and runs their handlers, one job at
+a time per worker process. While a job runs, a heartbeat thread refreshes its
+heartbeat, persists reported progress and picks up cancellation requests. If
+the job was re-queued away from this worker (its heartbeat went stale), the
+handler is stopped at its next check and the job is left to its new attempt.
+
+Run a pool of workers with:
+    python scripts/run_job_worker.py --processes 2
+
+Author: FinExus Data Collector
+Created: 2025-12-04
+"""
+import importlib
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+from typing import Iterable, List, Optional
+
+from src.database.connection import dispose_database_connections
+from src.jobs.job_queue import (
+    JOB_HANDLERS, JobCancelled, JobContext, JobQueue, PermanentJobError, job_queue
+)
+
+log = logging.getLogger("JobWorker")
+
+# Modules whose import registers job handlers
+HANDLER_MODULES = [
+    'src.bea.task_runner',
+    'src.treasury.treasury_jobs',
+    'src.bls.bls_jobs',
+]
+
+
+def load_handlers(modules: Iterable[str] = HANDLER_MODULES):
+    """Import handler modules so their @register_job_handler decorators run."""
+    for module in modules:
+        importlib.import_module(module)
+
+
+class _Heartbeat(threading.Thread):
+    """Background heartbeat for one running job."""
+
+    def __init__(self, queue: JobQueue, ctx: JobContext, interval: float):
+        super().__init__(name=f"job-{ctx.job_id}-heartbeat", daemon=True)
+        self.queue = queue
+        self.ctx = ctx
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                cancel_requested = self.queue.heartbeat(
+                    self.ctx.job_id, self.ctx.worker_id, self.ctx.progress or None
+                )
+                if cancel_requested is None:
+                    log.warning(f"Job {self.ctx.job_id} is no longer owned by {self.ctx.worker_id}; stopping it")
+                    self.ctx.lost = True
+                    self.ctx.cancel_event.set()
+                    return
+                if cancel_requested:
+                    self.ctx.cancel_event.set()
+            except Exception as e:
+                # A missed beat is fine; the stale timeout is several intervals long
+                log.warning(f"Heartbeat for job {self.ctx.job_id} failed: {e}")
+
+    def stop(self):
+        self._stop_event.set()
+        self.join(timeout=self.interval)
+
+
+class JobWorker:
+    """
+    Poll the queue and run one job at a time.
+
+    Usage:
+        worker = JobWorker()
+        worker.run_forever()
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue = job_queue,
+        worker_id: Optional[str] = None,
+        job_types: Optional[List[str]] = None,
+        poll_interval: float = 5.0,
+        heartbeat_interval: float = 15.0,
+        stale_timeout: float = 120.0,
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            queue: Job queue to poll
+            worker_id: Identifier stored on claimed jobs (default: host:pid)
+            job_types: Only run these job types (default: all registered)
+            poll_interval: Seconds between polls when the queue is empty
+            heartbeat_interval: Seconds between heartbeats of a running job
+            stale_timeout: Seconds without heartbeat before a running job is re-queued
+        """
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.job_types = job_types
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_timeout = stale_timeout
+        self._stopping = threading.Event()
+
+    def stop(self):
+        """Finish the current job, then exit run_forever()."""
+        self._stopping.set()
+
+    def run_forever(self):
+        log.info(f"Worker {self.worker_id} started")
+        last_sweep = 0.0
+
+        while not self._stopping.is_set():
+            try:
+                # Re-queue jobs whose worker died
+                if time.monotonic() - last_sweep >= self.stale_timeout / 2:
+                    last_sweep = time.monotonic()
+                    stale = self.queue.requeue_stale(self.stale_timeout)
+                    if stale:
+                        log.warning(f"Re-queued {stale} stale job(s)")
+
+                if not self.run_once():
+                    self._stopping.wait(self.poll_interval)
+
+            except Exception as e:
+                log.error(f"Worker loop error: {e}", exc_info=True)
+                self._stopping.wait(self.poll_interval)
+
+        log.info(f"Worker {self.worker_id} stopped")
+
+    def run_once(self) -> bool:
+        """
+        Claim and run a single job.
+
+        Returns:
+            True if a job was run, False if the queue had nothing runnable
+        """
+        ctx = self.queue.claim(self.worker_id, self.job_types or list(JOB_HANDLERS))
+        if ctx is None:
+            return False
+
+        handler = JOB_HANDLERS.get(ctx.job_type)
+        if handler is None:
+            self.queue.fail(ctx.job_id, self.worker_id, f"No handler registered for {ctx.job_type}",
+                            retryable=False)
+            return True
+
+        log.info(f"Running job {ctx.job_id} ({ctx.job_type}), attempt {ctx.attempt}/{ctx.max_attempts}")
+        heartbeat = _Heartbeat(self.queue, ctx, self.heartbeat_interval)
+        heartbeat.start()
+
+        try:
+            result = handler(ctx)
+        except JobCancelled:
+            heartbeat.stop()
+            if ctx.lost:
+                log.warning(f"Job {ctx.job_id} stopped: re-queued to another attempt")
+            elif self.queue.mark_cancelled(ctx.job_id, self.worker_id, ctx.progress or None):
+                log.info(f"Job {ctx.job_id} cancelled")
+        except PermanentJobError as e:
+            heartbeat.stop()
+            self.queue.fail(ctx.job_id, self.worker_id, str(e), retryable=False, progress=ctx.progress or None)
+        except Exception as e:
+            heartbeat.stop()
+            log.error(f"Job {ctx.job_id} raised: {e}", exc_info=True)
+            self.queue.fail(ctx.job_id, self.worker_id, f"{type(e).__name__}: {e}",
+                            progress=ctx.progress or None)
+        else:
+            heartbeat.stop()
+            if self.queue.complete(ctx.job_id, self.worker_id, result, ctx.progress or None):
+                log.info(f"Job {ctx.job_id} completed")
+
+        return True
+
+
+# ===================== Worker Pool ===================== #
+
+def _worker_process(index: int, job_types: Optional[List[str]], poll_interval: float):
+    # Never reuse connections inherited from the parent process
+    dispose_database_connections()
+    load_handlers()
+
+    worker = JobWorker(
+        worker_id=f"{socket.gethostname()}:{os.getpid()}:{index}",
+        job_types=job_types,
+        poll_interval=poll_interval,
+    )
+    signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+    signal.signal(signal.SIGINT, lambda *_: worker.stop())
+    worker.run_forever()
+
+
+def run_worker_pool(
+    processes: int = 2,
+    job_types: Optional[List[str]] = None,
+    poll_interval: float = 5.0,
+):
+    """
+    Run `processes` worker processes until interrupted.
+
+    Worker processes that exit unexpectedly are restarted.
+
+    Args:
+        processes: Number of worker processes
+        job_types: Only run these job types (default: all registered)
+        poll_interval: Seconds between polls when the queue is empty
+    """
+    workers: List[multiprocessing.Process] = []
+    stopping = threading.Event()
+
+    def start(index: int) -> multiprocessing.Process:
+        proc = multiprocessing.Process(
+            target=_worker_process,
+            args=(index, job_types, poll_interval),
+            name=f"job-worker-{index}",
+        )
+        proc.start()
+        return proc
+
+    def shutdown(*_):
+        stopping.set()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    workers = [start(i) for i in range(processes)]
+    log.info(f"Started {processes} job worker process(es)")
+
+    while not stopping.wait(poll_interval):
+        for i, proc in enumerate(workers):
+            if not proc.is_alive():
+                log.warning(f"Worker {proc.name} exited ({proc.exitcode}); restarting")
+                workers[i] = start(i)
+
+    log.info("Stopping job workers (running jobs finish first)...")
+    for proc in workers:
+        if proc.is_alive():
+            proc.terminate()  # SIGTERM -> worker.stop()
+    for proc in workers:
+        proc.join()
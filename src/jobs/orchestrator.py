@@ -0,0 +1,334 @@
+"""
+Job Orchestrator
+
+Runs a DAG of in-process collection jobs. Each job declares the jobs it
+depends on and the shared resources it holds while running, e.g.
+
+    JobSpec('financials', update_financial_statements,
+            depends_on=('profiles',), resources={'fmp_rpm': 300, 'db': 1})
+
+A job starts as soon as its dependencies have completed and its resource
+claims fit in what is left of the budgets, so independent jobs overlap and a
+nightly run is bounded by its longest dependency chain instead of the sum of
+all jobs. Jobs whose dependencies failed are skipped.
+
+Resources are counted units (FMP requests per minute, DB connection slots);
+a ResourcePool can be shared with other callers (e.g. cron-triggered jobs)
+so everything in the process draws on the same budgets.
+
+Author: FinExus Data Collector
+Created: 2025-12-12
+"""
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+log = logging.getLogger("JobOrchestrator")
+
+
+class JobRunStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """A job in the DAG: callable, upstream jobs and resource claims."""
+    name: str
+    func: Callable[[], Any]
+    depends_on: Tuple[str, ...] = ()
+    resources: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class JobRun:
+    """Outcome and timing of one job within an orchestrator run."""
+    name: str
+    status: str = JobRunStatus.PENDING
+    ready_at: Optional[float] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """Seconds spent running (0 if never started)."""
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    @property
+    def wait(self) -> float:
+        """Seconds between dependencies completing and the job starting (resource wait)."""
+        if self.ready_at is None or self.started_at is None:
+            return 0.0
+        return self.started_at - self.ready_at
+
+
+@dataclass
+class OrchestratorReport:
+    """Per-job runs plus end-to-end timing for one DAG run."""
+    runs: Dict[str, JobRun]
+    started_at: datetime
+    wall_seconds: float
+    critical_path: List[str]
+    critical_path_seconds: float
+
+    @property
+    def serial_seconds(self) -> float:
+        """Sum of job durations (what a strictly sequential run would take)."""
+        return sum(run.duration for run in self.runs.values())
+
+    @property
+    def failed(self) -> List[str]:
+        return [name for name, run in self.runs.items() if run.status == JobRunStatus.FAILED]
+
+    @property
+    def results(self) -> Dict[str, Any]:
+        """Job name -> return value, or {'status': ..., 'error': ...} if it did not complete."""
+        out = {}
+        for name, run in self.runs.items():
+            if run.status == JobRunStatus.COMPLETED:
+                out[name] = run.result
+            else:
+                out[name] = {'status': run.status, 'error': run.error}
+        return out
+
+    def log_summary(self, logger: logging.Logger = log) -> None:
+        """Log one line per job, then the critical path and totals."""
+        logger.info(f"{'Job':<28} {'Status':<10} {'Wait (s)':>9} {'Run (s)':>9}")
+        for name, run in self.runs.items():
+            logger.info(f"{name:<28} {run.status:<10} {run.wait:>9.1f} {run.duration:>9.1f}")
+        logger.info(
+            f"Critical path: {' -> '.join(self.critical_path) or '-'} ({self.critical_path_seconds:.1f}s)"
+        )
+        logger.info(
+            f"Wall time: {self.wall_seconds:.1f}s (sum of jobs {self.serial_seconds:.1f}s, "
+            f"{len(self.failed)} failed)"
+        )
+
+
+# ===================== Resources ===================== #
+
+class ResourcePool:
+    """
+    Counted resource budgets shared by concurrently running jobs.
+
+    Claims are taken all at once or not at all, so two jobs each holding part
+    of what the other needs cannot deadlock.
+    """
+
+    def __init__(self, capacities: Dict[str, int]):
+        self.capacities = dict(capacities)
+        self._available = dict(capacities)
+        self._cond = threading.Condition()
+
+    def check(self, claims: Dict[str, int]) -> None:
+        """Raise ValueError if a claim names an unknown resource or exceeds its capacity."""
+        for resource, units in claims.items():
+            if resource not in self.capacities:
+                raise ValueError(f"Unknown resource: {resource}")
+            if units > self.capacities[resource]:
+                raise ValueError(
+                    f"Claim of {units} {resource} exceeds capacity {self.capacities[resource]}"
+                )
+
+    def try_acquire(self, claims: Dict[str, int]) -> bool:
+        """Take all claims if they fit right now; never blocks."""
+        with self._cond:
+            if any(self._available[r] < units for r, units in claims.items()):
+                return False
+            for r, units in claims.items():
+                self._available[r] -= units
+            return True
+
+    def acquire(self, claims: Dict[str, int]) -> None:
+        """Block until all claims fit, then take them."""
+        self.check(claims)
+        with self._cond:
+            self._cond.wait_for(lambda: all(self._available[r] >= u for r, u in claims.items()))
+            for r, units in claims.items():
+                self._available[r] -= units
+
+    def release(self, claims: Dict[str, int]) -> None:
+        """Return claims taken by acquire()/try_acquire()."""
+        with self._cond:
+            for r, units in claims.items():
+                self._available[r] += units
+            self._cond.notify_all()
+
+
+# ===================== Orchestrator ===================== #
+
+class JobOrchestrator:
+    """
+    Runs JobSpecs concurrently in dependency order within resource budgets.
+
+    Usage:
+        orchestrator = JobOrchestrator(jobs, ResourcePool({'fmp_rpm': 750, 'db': 4}))
+        report = orchestrator.run()
+        report.log_summary()
+    """
+
+    def __init__(self, jobs: Sequence[JobSpec], pool: ResourcePool, max_workers: Optional[int] = None):
+        self.jobs = {job.name: job for job in jobs}
+        if len(self.jobs) != len(jobs):
+            raise ValueError("Duplicate job names")
+        self.pool = pool
+        self.max_workers = max_workers or len(jobs) or 1
+        self._validate()
+
+    def _validate(self) -> None:
+        """Reject unknown dependencies, cycles and claims that can never fit."""
+        for job in self.jobs.values():
+            for dep in job.depends_on:
+                if dep not in self.jobs:
+                    raise ValueError(f"Job {job.name} depends on unknown job {dep}")
+            self.pool.check(job.resources)
+        self.topological_order()
+
+    def topological_order(self) -> List[str]:
+        """Job names with every job after its dependencies (declaration order breaks ties)."""
+        order: List[str] = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(name: str, path: Tuple[str, ...]):
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Dependency cycle: {' -> '.join(path + (name,))}")
+            state[name] = 1
+            for dep in self.jobs[name].depends_on:
+                visit(dep, path + (name,))
+            state[name] = 2
+            order.append(name)
+
+        for name in self.jobs:
+            visit(name, ())
+        return order
+
+    def run(self) -> OrchestratorReport:
+        """
+        Run every job once
+
+        Returns:
+            OrchestratorReport with per-job status/timing and the critical path
+        """
+        started_at = datetime.now()
+        t0 = time.perf_counter()
+        runs = {name: JobRun(name) for name in self.jobs}
+        pending = list(self.jobs)
+        running: Dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job") as executor:
+            while pending or running:
+                self._skip_blocked(pending, runs)
+                now = time.perf_counter()
+
+                for name in list(pending):
+                    job = self.jobs[name]
+                    if any(runs[dep].status != JobRunStatus.COMPLETED for dep in job.depends_on):
+                        continue
+                    if runs[name].ready_at is None:
+                        runs[name].ready_at = now
+                    if len(running) >= self.max_workers:
+                        continue
+                    if not running:
+                        # Only callers outside this run hold the budget; wait for them
+                        self.pool.acquire(job.resources)
+                    elif not self.pool.try_acquire(job.resources):
+                        continue
+                    self._start(executor, name, runs, pending, running)
+
+                if not running:
+                    if pending:
+                        raise RuntimeError(f"Jobs cannot be scheduled: {pending}")
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    run = runs[name]
+                    run.finished_at = time.perf_counter()
+                    self.pool.release(self.jobs[name].resources)
+                    try:
+                        run.result = future.result()
+                        run.status = JobRunStatus.COMPLETED
+                        log.info(f"<<< {name} completed in {run.duration:.1f}s")
+                    except Exception as e:
+                        run.status = JobRunStatus.FAILED
+                        run.error = str(e)
+                        log.error(f"Error in {name}: {e}", exc_info=True)
+
+        path, path_seconds = self.critical_path(runs)
+        return OrchestratorReport(
+            runs=runs,
+            started_at=started_at,
+            wall_seconds=time.perf_counter() - t0,
+            critical_path=path,
+            critical_path_seconds=path_seconds,
+        )
+
+    def _start(self, executor: ThreadPoolExecutor, name: str, runs: Dict[str, JobRun],
+               pending: List[str], running: Dict[Future, str]) -> None:
+        """Submit a job whose resources have already been taken."""
+        pending.remove(name)
+        runs[name].status = JobRunStatus.RUNNING
+        runs[name].started_at = time.perf_counter()
+        log.info(f">>> Starting {name}")
+        running[executor.submit(self.jobs[name].func)] = name
+
+    def _skip_blocked(self, pending: List[str], runs: Dict[str, JobRun]) -> None:
+        """Mark pending jobs downstream of a failed or skipped job as skipped."""
+        changed = True
+        while changed:
+            changed = False
+            for name in list(pending):
+                blocked = [
+                    dep for dep in self.jobs[name].depends_on
+                    if runs[dep].status in (JobRunStatus.FAILED, JobRunStatus.SKIPPED)
+                ]
+                if blocked:
+                    pending.remove(name)
+                    runs[name].status = JobRunStatus.SKIPPED
+                    runs[name].error = f"upstream job(s) did not complete: {', '.join(blocked)}"
+                    log.warning(f"Skipping {name}: {runs[name].error}")
+                    changed = True
+
+    def critical_path(self, runs: Dict[str, JobRun]) -> Tuple[List[str], float]:
+        """
+        Longest dependency chain by measured job duration
+
+        Args:
+            runs: JobRuns from run()
+
+        Returns:
+            (job names from first to last, total seconds)
+        """
+        best: Dict[str, Tuple[float, Optional[str]]] = {}
+        for name in self.topological_order():
+            upstream = max(
+                ((best[dep][0], dep) for dep in self.jobs[name].depends_on),
+                default=(0.0, None),
+            )
+            best[name] = (upstream[0] + runs[name].duration, upstream[1])
+
+        if not best:
+            return [], 0.0
+
+        end = max(best, key=lambda n: best[n][0])
+        total = best[end][0]
+        path = []
+        node: Optional[str] = end
+        while node is not None:
+            path.append(node)
+            node = best[node][1]
+        return path[::-1], total
@@ -1,23 +1,31 @@
 """Main Job Orchestrator - Coordinates all data collection jobs"""
 import logging
 import argparse
+import math
+import threading
 from datetime import datetime
+from functools import wraps
+from typing import Callable, Dict, List, Optional
 
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from src.config import settings
 from src.database.connection import get_session
+from src.database.query_tracer import traced_unit
+from src.utils import metrics
 from src.collectors.financial_collector import FinancialCollector
 from src.collectors.price_collector import PriceCollector
 from src.collectors.economic_collector import EconomicCollector
 from src.collectors.analyst_collector import AnalystCollector
 from src.collectors.insider_collector import InsiderCollector
 from src.collectors.company_collector import CompanyCollector
+from src.jobs.orchestrator import JobOrchestrator, JobSpec, OrchestratorReport, ResourcePool
 
 logger = logging.getLogger(__name__)
 
 
+@traced_unit('update_financial_statements')
 def update_financial_statements():
     """Job: Update financial statements"""
     logger.info("=== Starting Financial Statements Update ===")
@@ -28,6 +36,7 @@ def update_financial_statements():
         return results
 
 
+@traced_unit('update_daily_prices')
 def update_daily_prices():
     """Job: Update daily prices"""
     logger.info("=== Starting Daily Prices Update ===")
@@ -39,16 +48,18 @@ def update_daily_prices():
         return results
 
 
+@traced_unit('update_economic_indicators')
 def update_economic_indicators():
     """Job: Update economic indicators"""
     logger.info("=== Starting Economic Indicators Update ===")
     with get_session() as session:
         collector = EconomicCollector(session)
-        results = collector.collect_all_indicators()
+        results = collector.collect_all()
         logger.info(f"Economic indicators update completed: {results}")
         return results
 
 
+@traced_unit('update_analyst_data')
 def update_analyst_data():
     """Job: Update analyst estimates and price targets"""
     logger.info("=== Starting Analyst Data Update ===")
@@ -59,6 +70,7 @@ def update_analyst_data():
         return results
 
 
+@traced_unit('update_insider_data')
 def update_insider_data():
     """Job: Update insider trading and institutional ownership"""
     logger.info("=== Starting Insider/Institutional Data Update ===")
@@ -69,6 +81,7 @@ def update_insider_data():
         return results
 
 
+@traced_unit('update_company_profiles')
 def update_company_profiles():
     """Job: Update company profiles"""
     logger.info("=== Starting Company Profiles Update ===")
@@ -79,89 +92,127 @@ def update_company_profiles():
         return results
 
 
-def run_all_jobs():
-    """Run all jobs once"""
-    logger.info("=== Running All Data Collection Jobs ===")
-    
-    jobs = [
-        ("Company Profiles", update_company_profiles),
-        ("Financial Statements", update_financial_statements),
-        ("Daily Prices", update_daily_prices),
-        ("Economic Indicators", update_economic_indicators),
-        ("Analyst Data", update_analyst_data),
-        ("Insider/Institutional Data", update_insider_data),
+_resource_pool: Optional[ResourcePool] = None
+_resource_pool_lock = threading.Lock()
+
+
+def get_resource_pool() -> ResourcePool:
+    """
+    Process-wide budgets shared by the DAG run and cron-triggered jobs
+
+    Resources:
+        fmp_rpm: FMP requests per minute (FMP_REQUESTS_PER_MINUTE)
+        db: DB connection slots (JOB_DB_SLOTS)
+    """
+    global _resource_pool
+    with _resource_pool_lock:
+        if _resource_pool is None:
+            _resource_pool = ResourcePool({
+                'fmp_rpm': settings.api.fmp_requests_per_minute,
+                'db': settings.schedule.job_db_slots,
+            })
+        return _resource_pool
+
+
+def fmp_job_claim() -> Dict[str, int]:
+    """Claims of a sequential FMP collector: its request rate at API_SLEEP_SEC pacing and one session."""
+    rate = math.ceil(60 / settings.api.sleep_sec) if settings.api.sleep_sec > 0 else settings.api.fmp_requests_per_minute
+    return {'fmp_rpm': min(rate, settings.api.fmp_requests_per_minute), 'db': 1}
+
+
+def nightly_jobs() -> List[JobSpec]:
+    """
+    Collection DAG for a full run
+
+    Symbol-based collectors iterate the companies table, so they wait for
+    company profiles; economic indicators (FRED) are independent.
+    """
+    fmp = fmp_job_claim()
+    profiles = "Company Profiles"
+    return [
+        JobSpec(profiles, update_company_profiles, resources=fmp),
+        JobSpec("Financial Statements", update_financial_statements, depends_on=(profiles,), resources=fmp),
+        JobSpec("Daily Prices", update_daily_prices, depends_on=(profiles,), resources=fmp),
+        JobSpec("Economic Indicators", update_economic_indicators, resources={'db': 1}),
+        JobSpec("Analyst Data", update_analyst_data, depends_on=(profiles,), resources=fmp),
+        JobSpec("Insider/Institutional Data", update_insider_data, depends_on=(profiles,), resources=fmp),
     ]
-    
-    results = {}
-    for job_name, job_func in jobs:
+
+
+def with_resources(func: Callable, claims: Dict[str, int]) -> Callable:
+    """Wrap a job so it holds claims on the shared pool while it runs."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        pool = get_resource_pool()
+        pool.acquire(claims)
         try:
-            logger.info(f"\n>>> Starting {job_name}...")
-            results[job_name] = job_func()
-        except Exception as e:
-            logger.error(f"Error in {job_name}: {e}", exc_info=True)
-            results[job_name] = {'status': 'failed', 'error': str(e)}
-    
-    return results
+            return func(*args, **kwargs)
+        finally:
+            pool.release(claims)
+    return wrapper
+
+
+def run_all_jobs_report(max_workers: Optional[int] = None) -> OrchestratorReport:
+    """
+    Run the collection DAG once, independent jobs concurrently
+
+    Args:
+        max_workers: Max jobs running at once (default: all, limited by resources)
+
+    Returns:
+        OrchestratorReport with per-job timing and the critical path
+    """
+    logger.info("=== Running All Data Collection Jobs ===")
+    orchestrator = JobOrchestrator(nightly_jobs(), get_resource_pool(), max_workers=max_workers)
+    report = orchestrator.run()
+    report.log_summary(logger)
+    return report
+
+
+def run_all_jobs(max_workers: Optional[int] = None):
+    """Run all jobs once"""
+    return run_all_jobs_report(max_workers).results
 
 
 def setup_scheduler():
     """Setup APScheduler with cron triggers"""
     scheduler = BlockingScheduler()
-    
+    claims = {spec.func: spec.resources for spec in nightly_jobs()}
+
+    def add_job(func, trigger, job_id, name):
+        # Cron jobs draw on the same budgets, so overlapping schedules queue instead of piling up
+        scheduler.add_job(
+            with_resources(func, claims[func]),
+            trigger=trigger,
+            id=job_id,
+            name=name,
+            replace_existing=True
+        )
+
     # Company profiles (weekly on Sundays at 6 AM)
-    scheduler.add_job(
-        update_company_profiles,
-        trigger=CronTrigger(day_of_week='sun', hour=6, minute=0),
-        id='update_companies',
-        name='Update Company Profiles',
-        replace_existing=True
-    )
-    
+    add_job(update_company_profiles, CronTrigger(day_of_week='sun', hour=6, minute=0),
+            'update_companies', 'Update Company Profiles')
+
     # Financial statements (daily at 7 PM)
-    scheduler.add_job(
-        update_financial_statements,
-        trigger=CronTrigger.from_crontab(settings.schedule.schedule_financials),
-        id='update_financials',
-        name='Update Financial Statements',
-        replace_existing=True
-    )
-    
+    add_job(update_financial_statements, CronTrigger.from_crontab(settings.schedule.schedule_financials),
+            'update_financials', 'Update Financial Statements')
+
     # Daily prices (weekdays at 6 PM)
-    scheduler.add_job(
-        update_daily_prices,
-        trigger=CronTrigger.from_crontab(settings.schedule.schedule_daily_prices),
-        id='update_prices',
-        name='Update Daily Prices',
-        replace_existing=True
-    )
-    
+    add_job(update_daily_prices, CronTrigger.from_crontab(settings.schedule.schedule_daily_prices),
+            'update_prices', 'Update Daily Prices')
+
     # Economic indicators (daily at 8 AM)
-    scheduler.add_job(
-        update_economic_indicators,
-        trigger=CronTrigger.from_crontab(settings.schedule.schedule_economic),
-        id='update_economic',
-        name='Update Economic Indicators',
-        replace_existing=True
-    )
-    
+    add_job(update_economic_indicators, CronTrigger.from_crontab(settings.schedule.schedule_economic),
+            'update_economic', 'Update Economic Indicators')
+
     # Analyst data (daily at 10 AM)
-    scheduler.add_job(
-        update_analyst_data,
-        trigger=CronTrigger.from_crontab(settings.schedule.schedule_analyst),
-        id='update_analyst',
-        name='Update Analyst Data',
-        replace_existing=True
-    )
-    
+    add_job(update_analyst_data, CronTrigger.from_crontab(settings.schedule.schedule_analyst),
+            'update_analyst', 'Update Analyst Data')
+
     # Insider/Institutional data (daily at 11 AM)
-    scheduler.add_job(
-        update_insider_data,
-        trigger=CronTrigger.from_crontab(settings.schedule.schedule_insider),
-        id='update_insider',
-        name='Update Insider Data',
-        replace_existing=True
-    )
-    
+    add_job(update_insider_data, CronTrigger.from_crontab(settings.schedule.schedule_insider),
+            'update_insider', 'Update Insider Data')
+
     return scheduler
 
 
@@ -172,6 +223,8 @@ def main():
                         help='Run all jobs once and exit')
     parser.add_argument('--schedule', action='store_true',
                         help='Run scheduler (production mode)')
+    parser.add_argument('--max-workers', type=int, default=None,
+                        help='Max jobs running at once with --run-once (default: limited by resources only)')
     
     args = parser.parse_args()
     
@@ -186,11 +239,13 @@ def main():
     
     if args.run_once:
         logger.info("Running all jobs once...")
-        results = run_all_jobs()
-        logger.info(f"\n=== All Jobs Completed ===\nResults: {results}")
+        metrics.export_on_exit('update_all_data')
+        report = run_all_jobs_report(args.max_workers)
+        logger.info(f"\n=== All Jobs Completed ===\nResults: {report.results}")
         
     elif args.schedule:
         logger.info("Starting scheduler...")
+        metrics.start_metrics_server()
         scheduler = setup_scheduler()
         
         logger.info("\nScheduled jobs:")
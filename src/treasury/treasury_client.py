@@ -16,10 +16,15 @@ Created: 2025-12-03
 from __future__ import annotations
 import time
 import logging
-from typing import Any, Dict, List, Optional, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Union
 from datetime import datetime, date, UTC
 import requests
 
+from src.config import settings
+from src.utils import metrics
+
 log = logging.getLogger("TreasuryClient")
 
 
@@ -42,6 +47,10 @@ class TreasuryClient:
 
         # Get average interest rates
         rates = client.get_average_interest_rates()
+
+        # Stream pages of a large endpoint in order (fetched concurrently)
+        for page in client.iter_pages(client.ENDPOINTS['auctions_query']):
+            ...
     """
 
     BASE_URL = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service"
@@ -104,6 +113,10 @@ class TreasuryClient:
         timeout: int = 60,
         max_retries: int = 3,
         user_agent: str = "Finexus-TreasuryClient/1.0",
+        base_url: Optional[str] = None,
+        max_workers: int = 4,
+        min_request_interval: float = 0.2,
+        max_resumes: int = 3,
     ):
         """
         Initialize Treasury Fiscal Data API client.
@@ -113,18 +126,40 @@ class TreasuryClient:
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts for failed requests
             user_agent: User agent string for requests
+            base_url: Override the API base URL (default: settings TREASURY_BASE_URL)
+            max_workers: Maximum concurrent page requests when paginating
+            min_request_interval: Minimum seconds between request starts,
+                shared by all threads of this client
+            max_resumes: Times a paginated fetch resumes after a page
+                fails with a transient error
         """
         self.session = session or requests.Session()
         self.session.headers.update({
             "User-Agent": user_agent,
             "Accept": "application/json",
         })
+        metrics.instrument_http_session(self.session, "treasury")
+        self.base_url = (base_url or settings.endpoints.treasury_base_url).rstrip('/')
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_workers = max(1, max_workers)
+        self.min_request_interval = min_request_interval
+        self.max_resumes = max_resumes
 
-        # Request tracking
+        # Request tracking (shared by paginator threads)
         self._request_count = 0
-        self._last_request_time: Optional[float] = None
+        self._next_request_at = 0.0
+        self._rate_lock = threading.Lock()
+
+    def _throttle(self):
+        """Wait for this client's next request slot - be gentle with the API."""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self.min_request_interval
+            self._request_count += 1
+
+        metrics.rate_limited_sleep("treasury", wait)
 
     # ===================== Core Request Method ===================== #
 
@@ -147,22 +182,16 @@ class TreasuryClient:
             requests.RequestException: On request failure
             ValueError: On API error response
         """
-        url = f"{self.BASE_URL}/{endpoint}"
+        url = f"{self.base_url}/{endpoint}"
         params = params or {}
 
         for attempt in range(self.max_retries):
             try:
-                # Rate limiting - be gentle with the API
-                if self._last_request_time:
-                    elapsed = time.time() - self._last_request_time
-                    if elapsed < 0.2:  # 200ms minimum between requests
-                        time.sleep(0.2 - elapsed)
+                self._throttle()
 
                 log.debug(f"Treasury API request: {endpoint}, params={params}")
 
                 response = self.session.get(url, params=params, timeout=self.timeout)
-                self._last_request_time = time.time()
-                self._request_count += 1
 
                 response.raise_for_status()
                 data = response.json()
@@ -178,7 +207,7 @@ class TreasuryClient:
                 if response.status_code == 429:  # Rate limited
                     wait_time = 2 ** attempt * 5  # Exponential backoff
                     log.warning(f"Rate limited, waiting {wait_time}s...")
-                    time.sleep(wait_time)
+                    metrics.rate_limited_sleep("treasury", wait_time)
                     continue
                 elif response.status_code >= 500:
                     wait_time = 2 ** attempt
@@ -198,6 +227,108 @@ class TreasuryClient:
 
         raise requests.exceptions.RequestException(f"Failed after {self.max_retries} attempts")
 
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        """Whether a failed request is worth retrying later (not a 4xx client error)."""
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            status = error.response.status_code
+            return status == 429 or status >= 500
+        return isinstance(error, requests.exceptions.RequestException)
+
+    def _fetch_page(self, endpoint: str, params: Dict[str, Any], page: int) -> Dict[str, Any]:
+        """Fetch one page; params are copied so pages can be fetched from several threads."""
+        return self._make_request(endpoint, {**params, 'page[number]': page})
+
+    def iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = 1000,
+        max_pages: Optional[int] = None,
+        start_page: int = 1,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the records of each page, in page order.
+
+        The first page is fetched alone to learn `meta.total-pages`; the rest
+        are fetched by up to `max_workers` threads, all sharing this client's
+        request rate cap. Pages are yielded as soon as every earlier page has
+        been yielded, so at most `max_workers` pages are buffered.
+
+        If a page fails with a transient error after `_make_request`'s own
+        retries, only that page is re-requested (up to `max_resumes` times);
+        pages already yielded are never fetched again. Closing the generator
+        early cancels pages that have not started.
+
+        Args:
+            endpoint: API endpoint
+            params: Base query parameters
+            page_size: Records per page
+            max_pages: Last page number to fetch (None = all)
+            start_page: First page number to fetch (to resume an earlier run)
+
+        Yields:
+            List of records for each page
+        """
+        params = {**(params or {}), 'page[size]': page_size}
+
+        response = self._fetch_page(endpoint, params, start_page)
+        data = response.get('data', [])
+        if not data:
+            return
+
+        total_pages = response.get('meta', {}).get('total-pages', 1)
+        last_page = min(total_pages, max_pages) if max_pages else total_pages
+
+        log.info(f"Fetched page {start_page}/{total_pages}, {len(data)} records")
+        yield data
+
+        if max_pages and total_pages > max_pages:
+            log.info(f"Stopping at max_pages limit ({max_pages})")
+
+        next_page = start_page + 1
+        if next_page > last_page:
+            return
+
+        resumes = 0
+        workers = min(self.max_workers, last_page - next_page + 1)
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="treasury-page")
+        pending = {}
+        to_submit = next_page
+
+        try:
+            while next_page <= last_page:
+                # Keep the window full: pages next_page .. next_page + workers - 1
+                while to_submit <= last_page and len(pending) < workers:
+                    pending[to_submit] = pool.submit(self._fetch_page, endpoint, params, to_submit)
+                    to_submit += 1
+
+                try:
+                    response = pending[next_page].result()
+                except requests.exceptions.RequestException as e:
+                    if not self._is_transient(e) or resumes >= self.max_resumes:
+                        raise
+                    resumes += 1
+                    wait_time = 2 ** resumes
+                    log.warning(f"Page {next_page} failed: {e}; resuming from page {next_page} "
+                                f"in {wait_time}s ({resumes}/{self.max_resumes})")
+                    time.sleep(wait_time)
+                    pending[next_page] = pool.submit(self._fetch_page, endpoint, params, next_page)
+                    continue
+
+                del pending[next_page]
+                data = response.get('data', [])
+                if not data:
+                    break
+
+                log.info(f"Fetched page {next_page}/{total_pages}, {len(data)} records")
+                yield data
+                next_page += 1
+        finally:
+            for future in pending.values():
+                future.cancel()
+            pool.shutdown(wait=True)
+
     def _paginate_request(
         self,
         endpoint: str,
@@ -217,38 +348,9 @@ class TreasuryClient:
         Returns:
             Combined list of all records
         """
-        params = params or {}
-        params['page[size]'] = page_size
-        params['page[number]'] = 1
-
         all_data = []
-        page = 1
-
-        while True:
-            params['page[number]'] = page
-            response = self._make_request(endpoint, params)
-
-            data = response.get('data', [])
-            if not data:
-                break
-
+        for data in self.iter_pages(endpoint, params, page_size=page_size, max_pages=max_pages):
             all_data.extend(data)
-
-            # Check pagination metadata
-            meta = response.get('meta', {})
-            total_pages = meta.get('total-pages', 1)
-
-            log.info(f"Fetched page {page}/{total_pages}, {len(data)} records")
-
-            if page >= total_pages:
-                break
-
-            if max_pages and page >= max_pages:
-                log.info(f"Reached max_pages limit ({max_pages})")
-                break
-
-            page += 1
-
         return all_data
 
     # ===================== Auction Methods ===================== #
@@ -299,7 +401,7 @@ class TreasuryClient:
 
         return auctions
 
-    def get_auction_results(
+    def iter_auction_results(
         self,
         security_type: Optional[str] = None,
         security_term: Optional[str] = None,
@@ -307,10 +409,14 @@ class TreasuryClient:
         end_date: Optional[str] = None,
         cusip: Optional[str] = None,
         target_terms_only: bool = True,
-        max_records: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
+        max_pages: int = 50,
+    ) -> Iterator[List[Dict[str, Any]]]:
         """
-        Get historical auction results from auctions_query endpoint.
+        Yield historical auction results one API page at a time.
+
+        Filters are applied to each page (see get_auction_results). Results
+        are sorted newest first, so paging stops once a page reaches auctions
+        older than start_date.
 
         Args:
             security_type: 'Note', 'Bond', 'Bill', 'TIPS', 'FRN'
@@ -319,10 +425,10 @@ class TreasuryClient:
             end_date: End date (YYYY-MM-DD)
             cusip: Specific CUSIP
             target_terms_only: Only return target terms (2Y-30Y)
-            max_records: Maximum records to return
+            max_pages: Maximum pages of 1000 records to fetch
 
-        Returns:
-            List of auction result records
+        Yields:
+            List of matching auction records for each page (may be empty)
         """
         params = {
             'sort': '-auction_date',  # Most recent first
@@ -330,41 +436,86 @@ class TreasuryClient:
 
         # Note: Some endpoints don't support filtering - we'll do client-side filtering
         # Just request all data and filter in Python
-
-        # Paginate to get all results
-        max_pages = (max_records // 1000 + 1) if max_records else 50  # Limit to 50 pages max (~50k records)
-        auctions = self._paginate_request(
+        pages = self.iter_pages(
             self.ENDPOINTS['auctions_query'],
             params,
             page_size=1000,
             max_pages=max_pages,
         )
 
-        # Client-side filtering
-        if security_type:
-            auctions = [a for a in auctions if a.get('security_type') == security_type]
-        else:
-            # Filter for Notes and Bonds only
-            auctions = [a for a in auctions if a.get('security_type') in ['Note', 'Bond']]
+        for auctions in pages:
+            reached_start = bool(start_date) and auctions[-1].get('auction_date', '') < start_date
 
-        if security_term:
-            # Match both exact term and normalized term
-            auctions = [
-                a for a in auctions
-                if a.get('security_term') == security_term or self.normalize_term(a.get('security_term')) == security_term
-            ]
-        elif target_terms_only:
-            # Filter by normalized term (handles reopenings)
-            auctions = [a for a in auctions if self.normalize_term(a.get('security_term')) in self.TARGET_TERMS]
+            if security_type:
+                auctions = [a for a in auctions if a.get('security_type') == security_type]
+            else:
+                # Filter for Notes and Bonds only
+                auctions = [a for a in auctions if a.get('security_type') in ['Note', 'Bond']]
 
-        if start_date:
-            auctions = [a for a in auctions if a.get('auction_date', '') >= start_date]
+            if security_term:
+                # Match both exact term and normalized term
+                auctions = [
+                    a for a in auctions
+                    if a.get('security_term') == security_term or self.normalize_term(a.get('security_term')) == security_term
+                ]
+            elif target_terms_only:
+                # Filter by normalized term (handles reopenings)
+                auctions = [a for a in auctions if self.normalize_term(a.get('security_term')) in self.TARGET_TERMS]
 
-        if end_date:
-            auctions = [a for a in auctions if a.get('auction_date', '') <= end_date]
+            if start_date:
+                auctions = [a for a in auctions if a.get('auction_date', '') >= start_date]
+
+            if end_date:
+                auctions = [a for a in auctions if a.get('auction_date', '') <= end_date]
+
+            if cusip:
+                auctions = [a for a in auctions if a.get('cusip') == cusip]
 
-        if cusip:
-            auctions = [a for a in auctions if a.get('cusip') == cusip]
+            yield auctions
+
+            if reached_start:
+                pages.close()
+                return
+
+    def get_auction_results(
+        self,
+        security_type: Optional[str] = None,
+        security_term: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        cusip: Optional[str] = None,
+        target_terms_only: bool = True,
+        max_records: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get historical auction results from auctions_query endpoint.
+
+        Args:
+            security_type: 'Note', 'Bond', 'Bill', 'TIPS', 'FRN'
+            security_term: '2-Year', '5-Year', '10-Year', etc.
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            cusip: Specific CUSIP
+            target_terms_only: Only return target terms (2Y-30Y)
+            max_records: Maximum records to return
+
+        Returns:
+            List of auction result records
+        """
+        # Paginate to get all results
+        max_pages = (max_records // 1000 + 1) if max_records else 50  # Limit to 50 pages max (~50k records)
+
+        auctions = []
+        for page in self.iter_auction_results(
+            security_type=security_type,
+            security_term=security_term,
+            start_date=start_date,
+            end_date=end_date,
+            cusip=cusip,
+            target_terms_only=target_terms_only,
+            max_pages=max_pages,
+        ):
+            auctions.extend(page)
 
         if max_records:
             auctions = auctions[:max_records]
@@ -17,7 +17,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, date, timedelta, UTC
 from decimal import Decimal, InvalidOperation
 
-from sqlalchemy import create_engine, select, func, and_, or_
+from sqlalchemy import create_engine, select, func, and_, or_, literal_column, tuple_
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
@@ -43,6 +43,18 @@ class TreasuryCollector:
         '30-Year': 360,
     }
 
+    # Columns refreshed from the API when an existing auction is upserted
+    AUCTION_UPSERT_COLUMNS = (
+        'security_type', 'security_term', 'term_months', 'issue_date', 'maturity_date',
+        'offering_amount', 'total_tendered', 'total_accepted', 'bid_to_cover_ratio',
+        'competitive_tendered', 'competitive_accepted',
+        'non_competitive_tendered', 'non_competitive_accepted',
+        'primary_dealer_tendered', 'primary_dealer_accepted',
+        'direct_bidder_tendered', 'direct_bidder_accepted', 'indirect_bidder_accepted',
+        'high_yield', 'high_discount_rate', 'low_yield', 'median_yield',
+        'coupon_rate', 'price_per_100', 'source_endpoint', 'raw_json',
+    )
+
     def __init__(
         self,
         db_session: Session,
@@ -63,6 +75,7 @@ class TreasuryCollector:
             'auctions_fetched': 0,
             'auctions_inserted': 0,
             'auctions_updated': 0,
+            'auctions_unchanged': 0,
             'upcoming_fetched': 0,
             'upcoming_inserted': 0,
             'api_requests': 0,
@@ -229,6 +242,10 @@ class TreasuryCollector:
         """
         Collect and store historical auction results.
 
+        Records are written as each API page arrives, one
+        INSERT ... ON CONFLICT (cusip, auction_date) statement per page.
+        The unchanged count is available as stats['auctions_unchanged'].
+
         Args:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
@@ -238,106 +255,151 @@ class TreasuryCollector:
         Returns:
             Tuple of (inserted_count, updated_count)
         """
-        from ..database.treasury_models import TreasuryAuction
-
         if backfill_years:
             start_date = (date.today() - timedelta(days=backfill_years * 365)).strftime('%Y-%m-%d')
 
         log.info(f"Collecting auction results: start={start_date}, end={end_date}, term={security_term}")
 
-        auctions = self.client.get_auction_results(
+        requests_before = self.client.request_count
+        fetched = 0
+        inserted = 0
+        updated = 0
+        unchanged = 0
+
+        # Each API page (up to 1000 records) is upserted as it arrives
+        for auctions in self.client.iter_auction_results(
             security_term=security_term,
             start_date=start_date,
             end_date=end_date,
-        )
-        self._stats['auctions_fetched'] = len(auctions)
-        self._stats['api_requests'] += 1
-
-        inserted = 0
-        updated = 0
+        ):
+            fetched += len(auctions)
 
-        for auc in auctions:
-            cusip = auc.get('cusip')
-            auction_date = self._parse_date(auc.get('auction_date'))
+            # ON CONFLICT cannot touch the same row twice in one statement; last record wins
+            rows = {}
+            for auc in auctions:
+                row = self._auction_row(auc)
+                if row:
+                    rows[(row['cusip'], row['auction_date'])] = row
 
-            if not cusip or not auction_date:
+            if not rows:
                 continue
 
-            # Parse all fields - use API field names
-            security_term = auc.get('security_term')
-            high_yield = self._parse_decimal(auc.get('high_yield'))
-            offering_amount = self._parse_decimal(auc.get('offering_amt'))
-            total_tendered = self._parse_decimal(auc.get('total_tendered'))
-            total_accepted = self._parse_decimal(auc.get('total_accepted'))
-
-            # Use bid_to_cover_ratio from API if available, otherwise compute
-            bid_to_cover = self._parse_decimal(auc.get('bid_to_cover_ratio'))
-            if bid_to_cover is None:
-                bid_to_cover = self._compute_bid_to_cover(total_tendered, total_accepted)
-
-            # Check if exists
-            existing = self.session.query(TreasuryAuction).filter(
-                TreasuryAuction.cusip == cusip,
-                TreasuryAuction.auction_date == auction_date,
-            ).first()
+            batch_inserted, batch_updated = self._upsert_auction_batch(list(rows.values()))
+            inserted += batch_inserted
+            updated += batch_updated
+            unchanged += len(rows) - batch_inserted - batch_updated
 
-            if existing:
-                # Update existing record
-                existing.high_yield = high_yield
-                existing.offering_amount = offering_amount
-                existing.total_tendered = total_tendered
-                existing.total_accepted = total_accepted
-                existing.bid_to_cover_ratio = bid_to_cover
-                existing.coupon_rate = self._parse_decimal(auc.get('int_rate'))
-                existing.price_per_100 = self._parse_decimal(auc.get('high_price'))
-                existing.raw_json = auc
-                existing.updated_at = datetime.now(UTC)
-                updated += 1
-            else:
-                # Create new record
-                # Note: API field names differ from model names
-                # comp_accepted -> competitive_accepted, noncomp_accepted -> non_competitive_accepted
-                # int_rate -> coupon_rate, high_discnt_rate -> high_discount_rate
-                auction = TreasuryAuction(
-                    cusip=cusip,
-                    auction_date=auction_date,
-                    security_type=auc.get('security_type', 'Note'),
-                    security_term=security_term,
-                    term_months=self.TERM_TO_MONTHS.get(security_term),
-                    issue_date=self._parse_date(auc.get('issue_date')),
-                    maturity_date=self._parse_date(auc.get('maturity_date')),
-                    offering_amount=offering_amount,
-                    total_tendered=total_tendered,
-                    total_accepted=total_accepted,
-                    bid_to_cover_ratio=bid_to_cover,
-                    competitive_tendered=self._parse_decimal(auc.get('comp_tendered')),
-                    competitive_accepted=self._parse_decimal(auc.get('comp_accepted')),
-                    non_competitive_tendered=self._parse_decimal(auc.get('noncomp_tendered')),
-                    non_competitive_accepted=self._parse_decimal(auc.get('noncomp_accepted')),
-                    primary_dealer_tendered=self._parse_decimal(auc.get('primary_dealer_tendered')),
-                    primary_dealer_accepted=self._parse_decimal(auc.get('primary_dealer_accepted')),
-                    direct_bidder_tendered=self._parse_decimal(auc.get('direct_bidder_tendered')),
-                    direct_bidder_accepted=self._parse_decimal(auc.get('direct_bidder_accepted')),
-                    indirect_bidder_accepted=self._parse_decimal(auc.get('indirect_bidder_accepted')),
-                    high_yield=high_yield,
-                    high_discount_rate=self._parse_decimal(auc.get('high_discnt_rate')),
-                    low_yield=self._parse_decimal(auc.get('low_yield')),
-                    median_yield=self._parse_decimal(auc.get('avg_med_yield')),
-                    coupon_rate=self._parse_decimal(auc.get('int_rate')),
-                    price_per_100=self._parse_decimal(auc.get('high_price')),
-                    source_endpoint='auctions_query',
-                    raw_json=auc,
-                )
-                self.session.add(auction)
-                inserted += 1
+        self._stats['auctions_fetched'] = fetched
+        self._stats['api_requests'] += self.client.request_count - requests_before
 
         self.session.commit()
         self._stats['auctions_inserted'] = inserted
         self._stats['auctions_updated'] = updated
+        self._stats['auctions_unchanged'] = unchanged
 
-        log.info(f"Collected {len(auctions)} auctions: {inserted} inserted, {updated} updated")
+        log.info(f"Collected {fetched} auctions: {inserted} inserted, {updated} updated, "
+                 f"{unchanged} unchanged")
         return inserted, updated
 
+    def _auction_row(self, auc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Map an auctions_query record to treasury_auctions column values.
+
+        Note: API field names differ from model names
+        comp_accepted -> competitive_accepted, noncomp_accepted -> non_competitive_accepted
+        int_rate -> coupon_rate, high_discnt_rate -> high_discount_rate
+
+        Args:
+            auc: Raw API record
+
+        Returns:
+            Column dict, or None if the record has no CUSIP or auction date
+        """
+        cusip = auc.get('cusip')
+        auction_date = self._parse_date(auc.get('auction_date'))
+        if not cusip or not auction_date:
+            return None
+
+        security_term = auc.get('security_term')
+        total_tendered = self._parse_decimal(auc.get('total_tendered'))
+        total_accepted = self._parse_decimal(auc.get('total_accepted'))
+
+        # Use bid_to_cover_ratio from API if available, otherwise compute
+        bid_to_cover = self._parse_decimal(auc.get('bid_to_cover_ratio'))
+        if bid_to_cover is None:
+            bid_to_cover = self._compute_bid_to_cover(total_tendered, total_accepted)
+
+        return {
+            'cusip': cusip,
+            'auction_date': auction_date,
+            'security_type': auc.get('security_type', 'Note'),
+            'security_term': security_term,
+            'term_months': self.TERM_TO_MONTHS.get(security_term),
+            'issue_date': self._parse_date(auc.get('issue_date')),
+            'maturity_date': self._parse_date(auc.get('maturity_date')),
+            'offering_amount': self._parse_decimal(auc.get('offering_amt')),
+            'total_tendered': total_tendered,
+            'total_accepted': total_accepted,
+            'bid_to_cover_ratio': bid_to_cover,
+            'competitive_tendered': self._parse_decimal(auc.get('comp_tendered')),
+            'competitive_accepted': self._parse_decimal(auc.get('comp_accepted')),
+            'non_competitive_tendered': self._parse_decimal(auc.get('noncomp_tendered')),
+            'non_competitive_accepted': self._parse_decimal(auc.get('noncomp_accepted')),
+            'primary_dealer_tendered': self._parse_decimal(auc.get('primary_dealer_tendered')),
+            'primary_dealer_accepted': self._parse_decimal(auc.get('primary_dealer_accepted')),
+            'direct_bidder_tendered': self._parse_decimal(auc.get('direct_bidder_tendered')),
+            'direct_bidder_accepted': self._parse_decimal(auc.get('direct_bidder_accepted')),
+            'indirect_bidder_accepted': self._parse_decimal(auc.get('indirect_bidder_accepted')),
+            'high_yield': self._parse_decimal(auc.get('high_yield')),
+            'high_discount_rate': self._parse_decimal(auc.get('high_discnt_rate')),
+            'low_yield': self._parse_decimal(auc.get('low_yield')),
+            'median_yield': self._parse_decimal(auc.get('avg_med_yield')),
+            'coupon_rate': self._parse_decimal(auc.get('int_rate')),
+            'price_per_100': self._parse_decimal(auc.get('high_price')),
+            'source_endpoint': 'auctions_query',
+            'raw_json': auc,
+        }
+
+    def _upsert_auction_batch(self, rows: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Write a batch of auction rows with one INSERT ... ON CONFLICT statement.
+
+        Conflicting rows are only rewritten when an API-sourced column changed,
+        so re-running a backfill leaves unchanged rows (and their updated_at)
+        alone. Derived analytics columns (wi_yield, tail_bps, auction_score,
+        auction_result) are never overwritten.
+
+        Args:
+            rows: Column dicts from _auction_row(), unique on (cusip, auction_date)
+
+        Returns:
+            Tuple of (inserted_count, updated_count); the remaining rows were unchanged
+        """
+        from ..database.treasury_models import TreasuryAuction
+
+        now = datetime.now(UTC)
+        for row in rows:
+            row['created_at'] = now
+            row['updated_at'] = now
+
+        stmt = pg_insert(TreasuryAuction).values(rows)
+        data_columns = self.AUCTION_UPSERT_COLUMNS
+        stmt = stmt.on_conflict_do_update(
+            constraint='uq_treasury_auction_cusip_date',
+            set_={
+                **{c: stmt.excluded[c] for c in data_columns},
+                'updated_at': stmt.excluded.updated_at,
+            },
+            where=tuple_(*(TreasuryAuction.__table__.c[c] for c in data_columns)).is_distinct_from(
+                tuple_(*(stmt.excluded[c] for c in data_columns))
+            ),
+        ).returning(literal_column('xmax = 0').label('inserted'))
+
+        # Rows skipped by the WHERE clause are not returned; xmax is 0 only for fresh inserts
+        results = self.session.execute(stmt).scalars().all()
+        inserted = sum(1 for was_inserted in results if was_inserted)
+        return inserted, len(results) - inserted
+
     def collect_recent_auctions(self, days: int = 30) -> Tuple[int, int]:
         """
         Collect auction results from the last N days.
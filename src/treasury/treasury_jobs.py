@@ -0,0 +1,222 @@
+"""
+Treasury Collection Jobs
+
+Enqueue helpers and job queue handlers for Treasury auction collection.
+The admin API calls enqueue_*(); job workers run the handlers below.
+
+Author: FinExus Data Collector
+Created: 2025-12-04
+"""
+import logging
+from datetime import datetime, UTC
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from src.database.connection import get_session
+from src.database.treasury_models import TreasuryAuction, TreasuryUpcomingAuction, TreasuryDailyRate
+from src.database.treasury_tracking_models import TreasuryCollectionRun, TreasuryDataFreshness
+from src.jobs.job_queue import JobCancelled, JobContext, job_queue, register_job_handler
+from src.treasury.treasury_collector import TreasuryCollector
+
+log = logging.getLogger("TreasuryJobs")
+
+# Queue concurrency keys: backfill and update share the auctions key
+AUCTIONS_KEY = "treasury:auctions"
+UPCOMING_KEY = "treasury:upcoming"
+
+
+# ==================== Enqueue ==================== #
+
+def is_running(key: str) -> bool:
+    """Whether a Treasury job holding `key` is queued or running."""
+    return bool(job_queue.active_keys([key]))
+
+
+def enqueue_auction_backfill(years: int, security_term: Optional[str] = None) -> Optional[int]:
+    """
+    Queue an auction backfill.
+
+    Returns:
+        run_id if queued, None if an auction job is already active
+    """
+    return _enqueue(
+        "treasury.auction_backfill", AUCTIONS_KEY,
+        {"years": years, "security_term": security_term},
+        collection_type='auctions', run_type='backfill',
+        security_term=security_term, year_spec=f'LAST{years}',
+    )
+
+
+def enqueue_auction_update(days: int, security_term: Optional[str] = None) -> Optional[int]:
+    """
+    Queue an update of recent auctions.
+
+    Returns:
+        run_id if queued, None if an auction job is already active
+    """
+    return _enqueue(
+        "treasury.auction_update", AUCTIONS_KEY,
+        {"days": days, "security_term": security_term},
+        collection_type='auctions', run_type='update',
+        security_term=security_term, year_spec=f'LAST{days}D',
+    )
+
+
+def enqueue_upcoming_refresh() -> Optional[int]:
+    """
+    Queue a refresh of the upcoming auctions calendar.
+
+    Returns:
+        run_id if queued, None if a refresh is already active
+    """
+    return _enqueue(
+        "treasury.upcoming_refresh", UPCOMING_KEY, {},
+        collection_type='upcoming', run_type='refresh',
+    )
+
+
+def _enqueue(job_type: str, key: str, params: Dict[str, Any], **run_fields) -> Optional[int]:
+    """Create the run record and its job in one transaction."""
+    with get_session() as session:
+        run = TreasuryCollectionRun(status='queued', **run_fields)
+        session.add(run)
+        session.flush()
+
+        job_id = job_queue.enqueue(job_type, params, concurrency_key=key, run_id=run.run_id, session=session)
+        if job_id is None:
+            session.rollback()
+            return None
+
+        session.commit()
+        return run.run_id
+
+
+# ==================== Job Handlers ==================== #
+
+def _run_collection(
+    ctx: JobContext,
+    data_type: str,
+    collect: Callable[[TreasuryCollector], Dict[str, int]],
+) -> Dict[str, Any]:
+    """
+    Shared job body: run the collector and settle the collection run record.
+
+    Failures re-raise so the queue can retry; the run record stays 'queued'
+    until the last attempt.
+    """
+    with get_session() as session:
+        run = session.query(TreasuryCollectionRun).filter(
+            TreasuryCollectionRun.run_id == ctx.run_id
+        ).first()
+        if not run:
+            raise ValueError(f"Run {ctx.run_id} not found")
+
+        run.status = 'running'
+        run.started_at = datetime.now(UTC)
+        session.commit()
+
+        try:
+            collector = TreasuryCollector(db_session=session)
+            counts = collect(collector)
+
+            run.status = 'completed'
+            run.completed_at = datetime.now(UTC)
+            run.records_fetched = counts.get('fetched', 0)
+            run.records_inserted = counts.get('inserted', 0)
+            run.records_updated = counts.get('updated', 0)
+            run.api_requests_made = collector.stats['api_requests']
+            run.duration_seconds = (run.completed_at - run.started_at).total_seconds()
+            session.commit()
+
+            _update_freshness(session, data_type)
+            log.info(f"Run {ctx.run_id} completed successfully: {counts}")
+            return counts
+
+        except JobCancelled:
+            session.rollback()
+            run.status = 'cancelled'
+            run.completed_at = datetime.now(UTC)
+            session.commit()
+            raise
+
+        except Exception as e:
+            log.error(f"Run {ctx.run_id} failed: {e}", exc_info=True)
+            session.rollback()
+            run.status = 'failed' if ctx.is_last_attempt else 'queued'
+            run.error_message = str(e)
+            if ctx.is_last_attempt:
+                run.completed_at = datetime.now(UTC)
+            session.commit()
+            raise
+
+
+@register_job_handler("treasury.auction_backfill")
+def run_auction_backfill(ctx: JobContext) -> Dict[str, Any]:
+    """Backfill auction results for the requested number of years."""
+    years = ctx.params.get("years", 5)
+    security_term = ctx.params.get("security_term")
+    log.info(f"Starting auction backfill: years={years}, run_id={ctx.run_id}")
+
+    def collect(collector: TreasuryCollector) -> Dict[str, int]:
+        inserted, updated = collector.backfill_auctions(years=years, security_term=security_term)
+        return {'fetched': collector.stats['auctions_fetched'], 'inserted': inserted, 'updated': updated,
+                'unchanged': collector.stats['auctions_unchanged']}
+
+    return _run_collection(ctx, 'auctions', collect)
+
+
+@register_job_handler("treasury.auction_update")
+def run_auction_update(ctx: JobContext) -> Dict[str, Any]:
+    """Update auction results from the last N days."""
+    days = ctx.params.get("days", 30)
+    log.info(f"Starting auction update: days={days}, run_id={ctx.run_id}")
+
+    def collect(collector: TreasuryCollector) -> Dict[str, int]:
+        inserted, updated = collector.collect_recent_auctions(days=days)
+        return {'fetched': collector.stats['auctions_fetched'], 'inserted': inserted, 'updated': updated,
+                'unchanged': collector.stats['auctions_unchanged']}
+
+    return _run_collection(ctx, 'auctions', collect)
+
+
+@register_job_handler("treasury.upcoming_refresh")
+def run_upcoming_refresh(ctx: JobContext) -> Dict[str, Any]:
+    """Refresh the upcoming auctions calendar."""
+    log.info(f"Starting upcoming refresh: run_id={ctx.run_id}")
+
+    def collect(collector: TreasuryCollector) -> Dict[str, int]:
+        inserted = collector.collect_upcoming_auctions()
+        return {'fetched': collector.stats['upcoming_fetched'], 'inserted': inserted}
+
+    return _run_collection(ctx, 'upcoming', collect)
+
+
+def _update_freshness(session: Session, data_type: str):
+    """Update freshness record after collection"""
+    freshness = session.query(TreasuryDataFreshness).filter(
+        TreasuryDataFreshness.data_type == data_type
+    ).first()
+
+    if not freshness:
+        freshness = TreasuryDataFreshness(data_type=data_type)
+        session.add(freshness)
+
+    freshness.last_update_completed = datetime.now(UTC)
+    freshness.needs_update = False
+    freshness.update_in_progress = False
+    freshness.total_updates = (freshness.total_updates or 0) + 1
+
+    # Update record counts and latest date
+    if data_type == 'auctions':
+        freshness.total_records = session.query(func.count(TreasuryAuction.auction_id)).scalar() or 0
+        freshness.latest_data_date = session.query(func.max(TreasuryAuction.auction_date)).scalar()
+    elif data_type == 'upcoming':
+        freshness.total_records = session.query(func.count(TreasuryUpcomingAuction.upcoming_id)).scalar() or 0
+        freshness.latest_data_date = session.query(func.max(TreasuryUpcomingAuction.auction_date)).scalar()
+    elif data_type == 'daily_rates':
+        freshness.total_records = session.query(func.count(TreasuryDailyRate.rate_id)).scalar() or 0
+        freshness.latest_data_date = session.query(func.max(TreasuryDailyRate.rate_date)).scalar()
+
+    session.commit()
@@ -2,6 +2,7 @@
 
 from .data_transform import (
     camel_to_snake,
+    KeyMapper,
     transform_keys,
     transform_income_statement,
     transform_balance_sheet,
@@ -14,6 +15,7 @@ from .data_transform import (
 
 __all__ = [
     'camel_to_snake',
+    'KeyMapper',
     'transform_keys',
     'transform_income_statement',
     'transform_balance_sheet',
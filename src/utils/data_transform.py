@@ -3,15 +3,28 @@ Data Transformation Utilities
 Converts FMP API responses (camelCase) to database model format (snake_case)
 """
 import re
-from typing import Dict, Any, List
+import threading
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime
 
+import pandas as pd
 
+_LOWER_DIGIT = re.compile('([a-z])([0-9])')
+_DIGITS_UPPER = re.compile('([0-9]+)([A-Z])')
+_LOWER_UPPER = re.compile('([a-z])([A-Z])')
+_ACRONYM_WORD = re.compile('([A-Z]+)([A-Z][a-z])')
+
+
+@lru_cache(maxsize=4096)
 def camel_to_snake(camel_str: str) -> str:
     """
     Convert camelCase string to snake_case
     Handles acronyms properly (EBT, EBITDA, etc.)
 
+    Cached: the APIs repeat a few hundred distinct keys across millions of
+    records, so each key is converted once per process.
+
     Args:
         camel_str: String in camelCase format
 
@@ -32,23 +45,120 @@ def camel_to_snake(camel_str: str) -> str:
     """
     # Step 1: Insert underscore between lowercase and digit
     # Handles: 'value2' -> 'value_2'
-    s1 = re.sub('([a-z])([0-9])', r'\1_\2', camel_str)
+    s1 = _LOWER_DIGIT.sub(r'\1_\2', camel_str)
 
     # Step 2: Insert underscore between digit sequences and uppercase
     # Handles: 'value_13F' -> 'value_13_F'
-    s2 = re.sub('([0-9]+)([A-Z])', r'\1_\2', s1)
+    s2 = _DIGITS_UPPER.sub(r'\1_\2', s1)
 
     # Step 3: Insert underscore between lowercase and uppercase
     # Handles: 'numberOf' -> 'number_Of'
-    s3 = re.sub('([a-z])([A-Z])', r'\1_\2', s2)
+    s3 = _LOWER_UPPER.sub(r'\1_\2', s2)
 
     # Step 4: Insert underscore between consecutive capitals followed by lowercase
     # Handles: 'HTMLParser' -> 'HTML_Parser', 'EBITDA' stays 'EBITDA'
-    s4 = re.sub('([A-Z]+)([A-Z][a-z])', r'\1_\2', s3)
+    s4 = _ACRONYM_WORD.sub(r'\1_\2', s3)
 
     return s4.lower()
 
 
+class KeyMapper:
+    """
+    camelCase -> snake_case renames, planned once per response schema
+
+    A rename plan (source key -> target key, in the record's key order) is
+    compiled the first time a key set is seen and reused for every record
+    with the same keys, so a bulk load converts each distinct key once and
+    each record with a single dict build.
+
+    Schema-aware when given a model: keys whose snake_case name is not one
+    of the model's columns are dropped by the plan, so records and frames
+    come out ready to insert. `renames` overrides individual keys (API name
+    -> column name) where the generic conversion does not match the model.
+
+    Usage:
+        mapper = KeyMapper(IncomeStatement)
+        records = mapper.transform_records(api_rows)
+        df = mapper.transform_frame(pd.read_csv(path))
+    """
+
+    # Plans kept per mapper; the APIs use a handful of schemas per endpoint
+    max_plans = 1024
+
+    def __init__(self, model: Optional[Any] = None, renames: Optional[Dict[str, str]] = None):
+        self.columns = frozenset(model.__table__.columns.keys()) if model is not None else None
+        self.renames = dict(renames or {})
+        self._plans: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+        self._lock = threading.Lock()
+
+    def target(self, key: str) -> Optional[str]:
+        """Column name for an API key, or None when the model has no such column"""
+        name = self.renames.get(key) or camel_to_snake(key)
+        if self.columns is not None and name not in self.columns:
+            return None
+        return name
+
+    def plan(self, keys: Iterable[str]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Rename plan for a key set
+
+        Returns:
+            (source keys, target keys) for the keys that are kept, in order;
+            when two keys map to the same target the later one's value wins
+            (as in a dict comprehension over the record)
+        """
+        keys = tuple(keys)
+        plan = self._plans.get(keys)
+        if plan is None:
+            pairs = {}
+            for key in keys:
+                name = self.target(key)
+                if name is not None:
+                    pairs[name] = key
+            plan = (tuple(pairs.values()), tuple(pairs))
+            with self._lock:
+                if len(self._plans) >= self.max_plans:
+                    self._plans.clear()
+                self._plans[keys] = plan
+        return plan
+
+    def transform(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Rename one record's keys"""
+        sources, targets = self.plan(record)
+        return {target: record[source] for source, target in zip(sources, targets)}
+
+    def transform_records(self, records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Rename every record's keys; consecutive records with the same keys share one plan lookup"""
+        out = []
+        last_keys = None
+        sources = targets = ()
+        keeps_all = False
+        for record in records:
+            keys = tuple(record)
+            if keys != last_keys:
+                sources, targets = self.plan(keys)
+                keeps_all = sources == keys
+                last_keys = keys
+            if keeps_all:
+                # Every key kept in order: pair the new names with the values directly
+                out.append(dict(zip(targets, record.values())))
+            else:
+                out.append(dict(zip(targets, map(record.__getitem__, sources))))
+        return out
+
+    def transform_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Rename a DataFrame's columns (and drop unmapped ones) with one plan"""
+        sources, targets = self.plan(df.columns)
+        if list(sources) == list(df.columns):
+            return df.set_axis(list(targets), axis=1)
+        positions = [df.columns.get_loc(source) for source in sources]
+        return df.iloc[:, positions].set_axis(list(targets), axis=1)
+
+
+# Shared mapper behind transform_keys / transform_batch (keeps every key)
+_DEFAULT_MAPPER = KeyMapper()
+
+
 def transform_keys(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Transform all keys in a dictionary from camelCase to snake_case
@@ -59,7 +169,7 @@ def transform_keys(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dictionary with snake_case keys
     """
-    return {camel_to_snake(key): value for key, value in data.items()}
+    return _DEFAULT_MAPPER.transform(data)
 
 
 def transform_income_statement(api_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -152,6 +262,8 @@ def transform_batch(api_data_list: List[Dict[str, Any]],
     Returns:
         List of transformed dictionaries
     """
+    if transform_func is transform_keys:
+        return _DEFAULT_MAPPER.transform_records(api_data_list)
     return [transform_func(item) for item in api_data_list]
 
 
@@ -0,0 +1,278 @@
+"""
+Prometheus Metrics
+Process-wide counters and histograms for API clients, collectors, the DB
+pool and the admin API, exported in one of two ways:
+
+  - Long-running processes (scheduler, job workers) call start_metrics_server()
+    to serve /metrics on MonitoringSettings.metrics_port; the admin API
+    mounts /metrics on its own port.
+  - Short-lived scripts call export_on_exit('<job>') so the registry is pushed
+    to a Pushgateway (METRICS_PUSHGATEWAY_URL) or written as
+    <METRICS_TEXTFILE_DIR>/<job>.prom for node_exporter's textfile collector
+    when the script exits.
+
+Everything is a no-op when ENABLE_METRICS is false or prometheus_client is
+not installed, so instrumented code never has to check.
+
+Usage:
+    from src.utils import metrics
+
+    metrics.instrument_http_session(self.session, 'bls')
+    metrics.observe_rate_limit_wait('bls', slept)
+    metrics.record_rows_parsed('FinancialCollector', 'income_statements', len(df))
+"""
+import atexit
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+import requests
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    from prometheus_client import (
+        REGISTRY, Counter, Gauge, Histogram, push_to_gateway, start_http_server, write_to_textfile
+    )
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+# Latency buckets (seconds) for HTTP calls and routes; API calls run 50ms-60s
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+# Waits for rate limiters and pool checkouts are usually short but can reach minutes
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 15, 60, 300)
+
+
+ENABLED = PROMETHEUS_AVAILABLE and settings.monitoring.enable_metrics
+
+if ENABLED:
+    HTTP_REQUESTS = Counter(
+        'finexus_http_requests_total', 'HTTP requests to external APIs', ['client', 'status']
+    )
+    HTTP_REQUEST_SECONDS = Histogram(
+        'finexus_http_request_seconds', 'External API request latency', ['client'], buckets=LATENCY_BUCKETS
+    )
+    HTTP_RATE_LIMITED = Counter(
+        'finexus_http_rate_limited_total', 'HTTP 429 responses from external APIs', ['client']
+    )
+    RATE_LIMIT_WAIT_SECONDS = Histogram(
+        'finexus_rate_limit_wait_seconds', 'Time spent waiting on client-side rate limits and backoff',
+        ['client'], buckets=WAIT_BUCKETS
+    )
+    ROWS_PARSED = Counter(
+        'finexus_rows_parsed_total', 'Rows parsed from API responses or files', ['collector', 'table']
+    )
+    ROWS_WRITTEN = Counter(
+        'finexus_rows_written_total', 'Rows inserted/upserted/updated in the database',
+        ['collector', 'table', 'operation']
+    )
+    DB_POOL_CHECKOUTS = Counter('finexus_db_pool_checkouts_total', 'DB connections checked out of the pool')
+    DB_POOL_CHECKED_OUT = Gauge('finexus_db_pool_checked_out', 'DB connections currently checked out')
+    DB_POOL_OVERFLOW = Gauge('finexus_db_pool_overflow', 'DB connections open beyond pool_size')
+    DB_POOL_WAIT_SECONDS = Histogram(
+        'finexus_db_pool_wait_seconds', 'Time to obtain a DB connection (includes opening new ones)',
+        buckets=WAIT_BUCKETS
+    )
+    ROUTE_REQUESTS = Counter(
+        'finexus_admin_requests_total', 'Admin API requests', ['method', 'route', 'status']
+    )
+    ROUTE_SECONDS = Histogram(
+        'finexus_admin_request_seconds', 'Admin API route latency', ['method', 'route'], buckets=LATENCY_BUCKETS
+    )
+
+
+# ===================== API Clients ===================== #
+
+def instrument_http_session(
+    session: requests.Session, client: Union[str, Callable[[str], str]]
+) -> requests.Session:
+    """
+    Count requests, latency and 429s for every response a session receives
+
+    Args:
+        session: requests session used by an API client
+        client: Client label ('fmp', 'fred', 'bls', 'bea', 'treasury'), or a
+            function mapping the request URL to one for sessions shared by APIs
+
+    Returns:
+        The same session
+    """
+    if not ENABLED:
+        return session
+
+    def on_response(response: requests.Response, *args, **kwargs):
+        label = client(response.url) if callable(client) else client
+        HTTP_REQUESTS.labels(label, str(response.status_code)).inc()
+        HTTP_REQUEST_SECONDS.labels(label).observe(response.elapsed.total_seconds())
+        if response.status_code == 429:
+            HTTP_RATE_LIMITED.labels(label).inc()
+
+    session.hooks['response'].append(on_response)
+    return session
+
+
+def observe_rate_limit_wait(client: str, seconds: float) -> None:
+    """Record time a client spent sleeping for its rate limit or retry backoff."""
+    if ENABLED and seconds > 0:
+        RATE_LIMIT_WAIT_SECONDS.labels(client).observe(seconds)
+
+
+def rate_limited_sleep(client: str, seconds: float) -> None:
+    """time.sleep() that is recorded as a rate-limit wait."""
+    if seconds > 0:
+        time.sleep(seconds)
+        observe_rate_limit_wait(client, seconds)
+
+
+# ===================== Collectors ===================== #
+
+def record_rows_parsed(collector: str, table: str, rows: int) -> None:
+    """Record rows parsed for a collector's target table."""
+    if ENABLED and rows:
+        ROWS_PARSED.labels(collector, table).inc(rows)
+
+
+def record_rows_written(collector: str, table: str, operation: str, rows: int) -> None:
+    """Record rows written to a table (operation: insert/update/delete)."""
+    if ENABLED and rows:
+        ROWS_WRITTEN.labels(collector, table, operation).inc(rows)
+
+
+# ===================== Database Pool ===================== #
+
+def observe_pool_checkout(checked_out: int, overflow: int) -> None:
+    """Record a checkout and the pool's current usage."""
+    if ENABLED:
+        DB_POOL_CHECKOUTS.inc()
+        DB_POOL_CHECKED_OUT.set(checked_out)
+        DB_POOL_OVERFLOW.set(max(overflow, 0))
+
+
+def observe_pool_checkin(checked_out: int, overflow: int) -> None:
+    """Record the pool's usage after a connection is returned."""
+    if ENABLED:
+        DB_POOL_CHECKED_OUT.set(checked_out)
+        DB_POOL_OVERFLOW.set(max(overflow, 0))
+
+
+def observe_pool_wait(seconds: float) -> None:
+    """Record how long obtaining a connection took."""
+    if ENABLED:
+        DB_POOL_WAIT_SECONDS.observe(seconds)
+
+
+# ===================== Admin API ===================== #
+
+class RouteMetricsMiddleware:
+    """
+    ASGI middleware recording admin API latency per route template
+    (e.g. /api/v1/bea/runs/{run_id}), so path parameters do not explode
+    label cardinality.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if not ENABLED or scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = {'code': 500}
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start':
+                status['code'] = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get('route')
+            path = getattr(route, 'path', None) or 'unmatched'
+            method = scope.get('method', '')
+            ROUTE_REQUESTS.labels(method, path, str(status['code'])).inc()
+            ROUTE_SECONDS.labels(method, path).observe(time.perf_counter() - start)
+
+
+def asgi_metrics_app():
+    """ASGI app serving the registry (mounted at /metrics by the admin API), or None."""
+    if not ENABLED:
+        return None
+    from prometheus_client import make_asgi_app
+    return make_asgi_app()
+
+
+# ===================== Export ===================== #
+
+_server_lock = threading.Lock()
+_server_started = False
+_exit_job: Optional[str] = None
+
+
+def start_metrics_server(port: Optional[int] = None) -> bool:
+    """
+    Serve /metrics over HTTP for a long-running process (idempotent)
+
+    Args:
+        port: Port to listen on (default: MonitoringSettings.metrics_port)
+
+    Returns:
+        True if the server is running
+    """
+    global _server_started
+    if not ENABLED:
+        return False
+
+    with _server_lock:
+        if not _server_started:
+            port = port or settings.monitoring.metrics_port
+            start_http_server(port)
+            _server_started = True
+            logger.info(f"Metrics server listening on :{port}/metrics")
+    return True
+
+
+def export_metrics(job: str) -> Optional[str]:
+    """
+    Push the registry to the Pushgateway, or write it as a textfile
+
+    Args:
+        job: Job name (Pushgateway job label / textfile name)
+
+    Returns:
+        Where the metrics went, or None if no push/textfile target is configured
+    """
+    if not ENABLED:
+        return None
+
+    monitoring = settings.monitoring
+    try:
+        if monitoring.metrics_pushgateway_url:
+            push_to_gateway(monitoring.metrics_pushgateway_url, job=job, registry=REGISTRY)
+            return monitoring.metrics_pushgateway_url
+        if monitoring.metrics_textfile_dir:
+            path = Path(monitoring.metrics_textfile_dir) / f"{job}.prom"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # write_to_textfile writes a temp file and renames it, so scrapes never see a partial file
+            write_to_textfile(str(path), REGISTRY)
+            return str(path)
+    except Exception as e:
+        logger.warning(f"Could not export metrics for {job}: {e}")
+    return None
+
+
+def export_on_exit(job: str) -> None:
+    """Export metrics once when a short-lived script exits (push or textfile mode)."""
+    global _exit_job
+    if not ENABLED or _exit_job is not None:
+        return
+    _exit_job = job
+    atexit.register(export_metrics, job)
@@ -0,0 +1,281 @@
+"""
+In-Memory Peer Graph
+Process-level adjacency cache over peers_bulk for analytics that query peers
+for many symbols. Built once, then refreshed incrementally from rows whose
+last_updated moved (BulkPeersCollector only moves it when a list changes).
+
+Usage:
+    from src.utils.peer_graph import peer_graph
+
+    with get_session() as session:
+        peer_graph.ensure_loaded(session)
+
+    peer_graph.get_peers('AAPL')
+    peer_graph.find_common_peers('AAPL', 'MSFT')
+    peer_graph.get_peer_network('AAPL', depth=2)
+
+Answers match the peers_helpers functions of the same name.
+"""
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.database.models import PeersBulk
+
+logger = logging.getLogger(__name__)
+
+# Re-read rows this far behind the newest last_updated seen, so a collection
+# transaction that started earlier but committed later is not missed
+REFRESH_OVERLAP = timedelta(minutes=5)
+
+
+def _split_peers(peers_list: Optional[str]) -> Tuple[str, ...]:
+    """Split a comma-separated peers list, dropping blanks and repeats."""
+    if not peers_list:
+        return ()
+    return tuple(dict.fromkeys(p.strip() for p in peers_list.split(',') if p.strip()))
+
+
+class PeerGraph:
+    """
+    Forward and reverse peer adjacency held in memory.
+
+    Writers hold a lock and only ever replace dict entries with new
+    immutable values, so readers need no lock and one instance can be shared
+    by API threads.
+    """
+
+    def __init__(self):
+        self._peers: Dict[str, Tuple[str, ...]] = {}
+        self._listed_by: Dict[str, FrozenSet[str]] = {}
+        self._watermark: Optional[datetime] = None
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the graph has been built."""
+        return self._loaded
+
+    @property
+    def last_updated(self) -> Optional[datetime]:
+        """Newest peers_bulk.last_updated applied to the graph."""
+        return self._watermark
+
+    def __len__(self) -> int:
+        return len(self._peers)
+
+    # ===================== Loading ===================== #
+
+    def load(self, session: Session) -> int:
+        """
+        Build the graph from all of peers_bulk
+
+        Args:
+            session: Database session
+
+        Returns:
+            Number of symbols loaded
+        """
+        rows = session.query(
+            PeersBulk.symbol, PeersBulk.peers_list, PeersBulk.last_updated
+        ).yield_per(10000)
+
+        peers = {}
+        listed_by: Dict[str, Set[str]] = {}
+        watermark = None
+
+        for symbol, peers_list, last_updated in rows:
+            symbol_peers = _split_peers(peers_list)
+            peers[symbol] = symbol_peers
+            for peer in symbol_peers:
+                listed_by.setdefault(peer, set()).add(symbol)
+            if watermark is None or last_updated > watermark:
+                watermark = last_updated
+
+        with self._lock:
+            self._peers = peers
+            self._listed_by = {peer: frozenset(symbols) for peer, symbols in listed_by.items()}
+            self._watermark = watermark
+            self._loaded = True
+
+        logger.info(f"Peer graph loaded: {len(peers):,} symbols")
+        return len(peers)
+
+    def ensure_loaded(self, session: Session):
+        """Load the graph on first use."""
+        if not self.is_loaded:
+            with self._lock:
+                if not self.is_loaded:
+                    self.load(session)
+
+    def refresh(self, session: Session) -> int:
+        """
+        Apply peers_bulk rows changed since the last load/refresh
+
+        Args:
+            session: Database session
+
+        Returns:
+            Number of symbols whose peer lists changed (all symbols on first load)
+        """
+        if not self.is_loaded:
+            return self.load(session)
+
+        with self._lock:
+            query = session.query(PeersBulk.symbol, PeersBulk.peers_list, PeersBulk.last_updated)
+            if self._watermark is not None:
+                query = query.filter(PeersBulk.last_updated > self._watermark - REFRESH_OVERLAP)
+
+            changed = 0
+            for symbol, peers_list, last_updated in query.all():
+                if self._set_peers(symbol, _split_peers(peers_list)):
+                    changed += 1
+                if self._watermark is None or last_updated > self._watermark:
+                    self._watermark = last_updated
+
+        if changed:
+            logger.info(f"Peer graph refreshed: {changed:,} symbols changed")
+        return changed
+
+    def _set_peers(self, symbol: str, new_peers: Tuple[str, ...]) -> bool:
+        """Replace one symbol's peers and its reverse entries (caller holds the lock)."""
+        old_peers = self._peers.get(symbol)
+        if old_peers == new_peers:
+            return False
+
+        for peer in set(old_peers or ()) - set(new_peers):
+            listed_by = self._listed_by.get(peer, frozenset()) - {symbol}
+            if listed_by:
+                self._listed_by[peer] = listed_by
+            else:
+                self._listed_by.pop(peer, None)
+        for peer in set(new_peers) - set(old_peers or ()):
+            self._listed_by[peer] = self._listed_by.get(peer, frozenset()) | {symbol}
+
+        self._peers[symbol] = new_peers
+        return True
+
+    # ===================== Queries ===================== #
+
+    def get_peers(self, symbol: str) -> Optional[List[str]]:
+        """
+        Get list of peers for a symbol
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            List of peer symbols or None if not found
+        """
+        peers = self._peers.get(symbol)
+        return list(peers) if peers else None
+
+    def are_peers(self, symbol1: str, symbol2: str) -> bool:
+        """
+        Check if two symbols are listed as peers of each other
+
+        Args:
+            symbol1: First stock symbol
+            symbol2: Second stock symbol
+
+        Returns:
+            True if they are mutual peers
+        """
+        return (symbol2 in self._peers.get(symbol1, ())
+                and symbol1 in self._peers.get(symbol2, ()))
+
+    def find_common_peers(self, symbol1: str, symbol2: str) -> List[str]:
+        """
+        Find common peers between two symbols
+
+        Args:
+            symbol1: First stock symbol
+            symbol2: Second stock symbol
+
+        Returns:
+            List of common peer symbols (may be empty)
+        """
+        return sorted(set(self._peers.get(symbol1, ())) & set(self._peers.get(symbol2, ())))
+
+    def get_peer_network(self, symbol: str, depth: int = 1) -> Dict[int, Set[str]]:
+        """
+        Get network of peers at different depths (k-hop neighborhood)
+
+        Args:
+            symbol: Starting stock symbol
+            depth: How many levels deep to traverse
+
+        Returns:
+            Dictionary mapping depth level to set of symbols at that level
+        """
+        network = {}
+        visited = {symbol}
+        current_level = {symbol}
+
+        for level in range(1, depth + 1):
+            next_level = set()
+            for sym in current_level:
+                for peer in self._peers.get(sym, ()):
+                    if peer not in visited:
+                        next_level.add(peer)
+                        visited.add(peer)
+
+            if not next_level:
+                break
+            network[level] = next_level
+            current_level = next_level
+
+        return network
+
+    def get_peer_counts(self, symbols: List[str]) -> Dict[str, int]:
+        """
+        Get peer count for multiple symbols
+
+        Args:
+            symbols: List of stock symbols
+
+        Returns:
+            Dictionary mapping symbol to number of peers
+        """
+        return {symbol: len(self._peers.get(symbol, ())) for symbol in symbols}
+
+    def find_most_connected(self, limit: int = 10) -> List[Dict]:
+        """
+        Find symbols with the most peers (most connected)
+
+        Args:
+            limit: Number of results to return
+
+        Returns:
+            List of dictionaries with symbol and peer count
+        """
+        top = heapq.nsmallest(
+            limit,
+            ((symbol, peers) for symbol, peers in list(self._peers.items()) if peers),
+            key=lambda item: (-len(item[1]), item[0]),
+        )
+        return [
+            {'symbol': symbol, 'peer_count': len(peers), 'peers': ','.join(peers)}
+            for symbol, peers in top
+        ]
+
+    def search_by_peer(self, peer_symbol: str) -> List[str]:
+        """
+        Find all symbols that list a specific symbol as a peer
+
+        Args:
+            peer_symbol: Symbol to search for in peers lists
+
+        Returns:
+            List of symbols that have peer_symbol in their peers list
+        """
+        return sorted(self._listed_by.get(peer_symbol, ()))
+
+
+# Process-level graph shared by API handlers and analytics
+peer_graph = PeerGraph()
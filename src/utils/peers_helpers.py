@@ -1,11 +1,13 @@
 """
 Peers Query Helper Functions
 Utilities for querying stock peer relationships from bulk peers data
+Reverse lookups and counts use the peer_edges table (one row per symbol/peer pair)
 """
-from typing import Optional, List, Set, Dict
+from typing import Any, Optional, List, Set, Dict
+from sqlalchemy import and_, cast, func, literal, select
 from sqlalchemy.orm import Session
 
-from src.database.models import PeersBulk
+from src.database.models import PeersBulk, PeerEdge
 
 
 def get_peers(session: Session, symbol: str) -> Optional[List[str]]:
@@ -96,6 +98,81 @@ def are_peers(session: Session, symbol1: str, symbol2: str) -> bool:
     return symbol2 in peers1 and symbol1 in peers2
 
 
+def get_peer_graph(
+    session: Session,
+    symbol: str,
+    depth: int = 1
+) -> Dict[str, Any]:
+    """
+    Get the peer network around a symbol in a single recursive query
+
+    Walks peer_edges breadth-first inside PostgreSQL. The recursive term is a
+    UNION over (symbol, depth), so each node is expanded at most once per
+    level however many paths reach it, and the depth bound stops the walk:
+    the CTE holds at most (nodes x depth) rows. A node reached again at a
+    deeper level (through a cycle) is expanded again there; each node keeps
+    the smallest depth it was reached at, its breadth-first distance.
+
+    Args:
+        session: Database session
+        symbol: Starting stock symbol
+        depth: How many levels deep to traverse
+
+    Returns:
+        Dictionary with:
+            'nodes': symbol -> depth (the starting symbol has depth 0)
+            'edges': (symbol, peer_symbol) pairs from nodes above the depth
+                limit to other nodes in the network
+        Example: {'nodes': {'AAPL': 0, 'MSFT': 1, ...}, 'edges': [('AAPL', 'MSFT'), ...]}
+    """
+    if depth < 1:
+        return {'nodes': {symbol: 0}, 'edges': []}
+
+    # Seed column must have the same type as peer_edges.peer_symbol
+    reach = select(
+        cast(literal(symbol), PeerEdge.peer_symbol.type).label('symbol'),
+        literal(0).label('depth')
+    ).cte('reach', recursive=True)
+
+    reach = reach.union(
+        select(
+            PeerEdge.peer_symbol,
+            reach.c.depth + 1
+        ).join_from(
+            reach, PeerEdge, PeerEdge.symbol == reach.c.symbol
+        ).where(reach.c.depth < depth)
+    )
+
+    nodes = select(
+        reach.c.symbol,
+        func.min(reach.c.depth).label('depth')
+    ).group_by(reach.c.symbol).cte('nodes')
+
+    # Edges whose target is also in the network
+    peer_nodes = nodes.alias('peer_nodes')
+    network_edges = PeerEdge.__table__.join(peer_nodes, peer_nodes.c.symbol == PeerEdge.peer_symbol)
+
+    query = select(
+        nodes.c.symbol,
+        nodes.c.depth,
+        PeerEdge.peer_symbol
+    ).select_from(
+        nodes.outerjoin(
+            network_edges,
+            and_(PeerEdge.symbol == nodes.c.symbol, nodes.c.depth < depth)
+        )
+    ).order_by(nodes.c.depth, nodes.c.symbol, PeerEdge.position)
+
+    graph_nodes = {}
+    graph_edges = []
+    for node, node_depth, peer in session.execute(query):
+        graph_nodes[node] = node_depth
+        if peer is not None:
+            graph_edges.append((node, peer))
+
+    return {'nodes': graph_nodes, 'edges': graph_edges}
+
+
 def get_peer_network(
     session: Session,
     symbol: str,
@@ -120,25 +197,9 @@ def get_peer_network(
         return {}
 
     network = {}
-    visited = {symbol}  # Don't revisit the starting symbol
-    current_level = {symbol}
-
-    for level in range(1, depth + 1):
-        next_level = set()
-
-        for sym in current_level:
-            peers = get_peers(session, sym)
-            if peers:
-                for peer in peers:
-                    if peer not in visited:
-                        next_level.add(peer)
-                        visited.add(peer)
-
-        if next_level:
-            network[level] = next_level
-            current_level = next_level
-        else:
-            break  # No more peers to explore
+    for node, node_depth in get_peer_graph(session, symbol, depth)['nodes'].items():
+        if node_depth > 0:
+            network.setdefault(node_depth, set()).add(node)
 
     return network
 
@@ -154,23 +215,17 @@ def get_peer_counts(session: Session, symbols: List[str]) -> Dict[str, int]:
     Returns:
         Dictionary mapping symbol to number of peers
     """
-    results = session.query(PeersBulk).filter(
-        PeersBulk.symbol.in_(symbols)
-    ).all()
-
-    counts = {}
-    for result in results:
-        if result.peers_list:
-            peer_count = len([p for p in result.peers_list.split(',') if p.strip()])
-            counts[result.symbol] = peer_count
-        else:
-            counts[result.symbol] = 0
+    counts = {symbol: 0 for symbol in symbols}
+    if not symbols:
+        return counts
 
-    # Add zeros for symbols not found
-    for symbol in symbols:
-        if symbol not in counts:
-            counts[symbol] = 0
+    results = session.query(
+        PeerEdge.symbol, func.count()
+    ).filter(
+        PeerEdge.symbol.in_(symbols)
+    ).group_by(PeerEdge.symbol).all()
 
+    counts.update(dict(results))
     return counts
 
 
@@ -185,23 +240,27 @@ def find_most_connected(session: Session, limit: int = 10) -> List[Dict]:
     Returns:
         List of dictionaries with symbol and peer count
     """
-    results = session.query(PeersBulk).all()
-
-    # Calculate peer counts
-    symbol_counts = []
-    for result in results:
-        if result.peers_list:
-            peer_count = len([p for p in result.peers_list.split(',') if p.strip()])
-            symbol_counts.append({
-                'symbol': result.symbol,
-                'peer_count': peer_count,
-                'peers': result.peers_list
-            })
-
-    # Sort by peer count descending
-    symbol_counts.sort(key=lambda x: x['peer_count'], reverse=True)
+    top = session.query(
+        PeerEdge.symbol.label('symbol'),
+        func.count().label('peer_count')
+    ).group_by(
+        PeerEdge.symbol
+    ).order_by(
+        func.count().desc(), PeerEdge.symbol
+    ).limit(limit).subquery()
+
+    results = session.query(
+        top.c.symbol, top.c.peer_count, PeersBulk.peers_list
+    ).join(
+        PeersBulk, PeersBulk.symbol == top.c.symbol
+    ).order_by(
+        top.c.peer_count.desc(), top.c.symbol
+    ).all()
 
-    return symbol_counts[:limit]
+    return [
+        {'symbol': symbol, 'peer_count': peer_count, 'peers': peers_list}
+        for symbol, peer_count, peers_list in results
+    ]
 
 
 def search_by_peer(session: Session, peer_symbol: str) -> List[str]:
@@ -215,20 +274,12 @@ def search_by_peer(session: Session, peer_symbol: str) -> List[str]:
     Returns:
         List of symbols that have peer_symbol in their peers list
     """
-    # Use SQL LIKE to find symbol in comma-separated list
-    results = session.query(PeersBulk).filter(
-        PeersBulk.peers_list.contains(peer_symbol)
-    ).all()
-
-    matches = []
-    for result in results:
-        if result.peers_list:
-            # Verify exact match (not substring)
-            peers = [p.strip() for p in result.peers_list.split(',')]
-            if peer_symbol in peers:
-                matches.append(result.symbol)
+    # Index-only scan on ix_peer_edges_peer_symbol (peer_symbol, symbol)
+    results = session.query(PeerEdge.symbol).filter(
+        PeerEdge.peer_symbol == peer_symbol
+    ).order_by(PeerEdge.symbol).all()
 
-    return sorted(matches)
+    return [symbol for (symbol,) in results]
 
 
 if __name__ == "__main__":
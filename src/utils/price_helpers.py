@@ -1,13 +1,71 @@
 """
 Price Query Helper Functions
 Utilities for querying price data with fallback from bulk prices
+Lookups read the prices_daily_unified view (regular rows first, bulk fills the rest)
+Gap finders compare against exchange trading days (see src/utils/trading_calendar.py)
 """
-from datetime import date
+import logging
+from datetime import date, timedelta
 from typing import Optional, List, Dict, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
 
-from src.database.models import PriceDaily, PriceDailyBulk
+import pandas as pd
+from sqlalchemy.orm import Session
+from sqlalchemy import func, and_, or_, text, select
+
+from src.database.models import Company, PriceDaily, PriceDailyBulk, prices_daily_unified
+from src.utils.trading_calendar import DEFAULT_EXCHANGE
+
+logger = logging.getLogger(__name__)
+
+# Days of bulk prices promoted per INSERT ... SELECT (one transaction each)
+PROMOTE_CHUNK_DAYS = 31
+
+# Tables a gap finder checks for each price source; 'either' = missing from both
+GAP_SOURCES = {
+    'regular': ('prices_daily',),
+    'bulk': ('prices_daily_bulk',),
+    'either': ('prices_daily', 'prices_daily_bulk'),
+}
+
+# Trading days in [:start_date, :end_date]: weekdays minus exchange closures,
+# numbered so consecutive trading days differ by 1 (used for gap runs)
+_TRADING_DAYS_CTE = """
+    days AS (
+        SELECT d::date AS date, row_number() OVER (ORDER BY d) AS day_no
+        FROM generate_series(CAST(:start_date AS date), CAST(:end_date AS date), interval '1 day') AS d
+        WHERE extract(isodow FROM d) < 6
+          AND NOT EXISTS (
+              SELECT 1 FROM trading_calendar tc
+              WHERE tc.exchange = :exchange AND tc.date = d::date
+          )
+    )"""
+
+
+PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'adj_close']
+
+
+def _price_row_to_dict(row) -> Dict:
+    """Convert a prices_daily_unified row to the helper dict format."""
+    price = {'symbol': row.symbol, 'date': row.date}
+    for col in PRICE_COLUMNS:
+        value = getattr(row, col)
+        price[col] = float(value) if value is not None else None
+    price['volume'] = int(row.volume) if row.volume is not None else None
+    price['source'] = row.source
+    return price
+
+
+def _unified_query(symbols: List[str], start_date: date, end_date: date, fallback_to_bulk: bool):
+    """SELECT over prices_daily_unified for symbols and an inclusive date range."""
+    view = prices_daily_unified
+    stmt = select(view).where(
+        view.c.symbol.in_(symbols),
+        view.c.date >= start_date,
+        view.c.date <= end_date
+    )
+    if not fallback_to_bulk:
+        stmt = stmt.where(view.c.source == 'regular')
+    return stmt.order_by(view.c.symbol, view.c.date)
 
 
 def get_price(
@@ -27,46 +85,13 @@ def get_price(
 
     Returns:
         Dictionary with OHLCV data or None if not found
+        (regular prices are dividend-adjusted: open..close = adj_open..adj_close)
     """
-    # Try regular prices first
-    price = session.query(PriceDaily).filter(
-        PriceDaily.symbol == symbol,
-        PriceDaily.date == target_date
+    row = session.execute(
+        _unified_query([symbol], target_date, target_date, fallback_to_bulk)
     ).first()
 
-    if price:
-        return {
-            'symbol': price.symbol,
-            'date': price.date,
-            'open': float(price.open) if price.open else None,
-            'high': float(price.high) if price.high else None,
-            'low': float(price.low) if price.low else None,
-            'close': float(price.close) if price.close else None,
-            'volume': int(price.volume) if price.volume else None,
-            'source': 'regular'
-        }
-
-    # Fallback to bulk if enabled
-    if fallback_to_bulk:
-        bulk_price = session.query(PriceDailyBulk).filter(
-            PriceDailyBulk.symbol == symbol,
-            PriceDailyBulk.date == target_date
-        ).first()
-
-        if bulk_price:
-            return {
-                'symbol': bulk_price.symbol,
-                'date': bulk_price.date,
-                'open': float(bulk_price.open) if bulk_price.open else None,
-                'high': float(bulk_price.high) if bulk_price.high else None,
-                'low': float(bulk_price.low) if bulk_price.low else None,
-                'close': float(bulk_price.close) if bulk_price.close else None,
-                'adj_close': float(bulk_price.adj_close) if bulk_price.adj_close else None,
-                'volume': int(bulk_price.volume) if bulk_price.volume else None,
-                'source': 'bulk'
-            }
-
-    return None
+    return _price_row_to_dict(row) if row else None
 
 
 def get_close_price(
@@ -111,55 +136,41 @@ def get_price_range(
     Returns:
         List of price dictionaries sorted by date
     """
-    # Get regular prices
-    regular_prices = session.query(PriceDaily).filter(
-        PriceDaily.symbol == symbol,
-        PriceDaily.date >= start_date,
-        PriceDaily.date <= end_date
-    ).order_by(PriceDaily.date).all()
-
-    results = []
-    regular_dates = set()
-
-    for price in regular_prices:
-        regular_dates.add(price.date)
-        results.append({
-            'symbol': price.symbol,
-            'date': price.date,
-            'open': float(price.open) if price.open else None,
-            'high': float(price.high) if price.high else None,
-            'low': float(price.low) if price.low else None,
-            'close': float(price.close) if price.close else None,
-            'volume': int(price.volume) if price.volume else None,
-            'source': 'regular'
-        })
-
-    # Fallback to bulk for missing dates
-    if fallback_to_bulk:
-        bulk_prices = session.query(PriceDailyBulk).filter(
-            PriceDailyBulk.symbol == symbol,
-            PriceDailyBulk.date >= start_date,
-            PriceDailyBulk.date <= end_date,
-            ~PriceDailyBulk.date.in_(regular_dates)  # Only dates not in regular
-        ).order_by(PriceDailyBulk.date).all()
-
-        for price in bulk_prices:
-            results.append({
-                'symbol': price.symbol,
-                'date': price.date,
-                'open': float(price.open) if price.open else None,
-                'high': float(price.high) if price.high else None,
-                'low': float(price.low) if price.low else None,
-                'close': float(price.close) if price.close else None,
-                'adj_close': float(price.adj_close) if price.adj_close else None,
-                'volume': int(price.volume) if price.volume else None,
-                'source': 'bulk'
-            })
-
-    # Sort by date
-    results.sort(key=lambda x: x['date'])
-
-    return results
+    result = session.execute(_unified_query([symbol], start_date, end_date, fallback_to_bulk))
+    return [_price_row_to_dict(row) for row in result]
+
+
+def get_prices(
+    session: Session,
+    symbols: List[str],
+    start_date: date,
+    end_date: date,
+    fallback_to_bulk: bool = True
+) -> pd.DataFrame:
+    """
+    Get price history for many symbols in one query
+
+    Args:
+        session: Database session
+        symbols: Stock symbols
+        start_date: Start date (inclusive)
+        end_date: End date (inclusive)
+        fallback_to_bulk: If True, include bulk data for dates missing from prices_daily
+
+    Returns:
+        DataFrame with columns symbol, date, open, high, low, close, adj_close,
+        volume, source; sorted by symbol and date (empty if nothing found)
+    """
+    columns = ['symbol', 'date'] + PRICE_COLUMNS + ['volume', 'source']
+    if not symbols:
+        return pd.DataFrame(columns=columns)
+
+    result = session.execute(_unified_query(list(symbols), start_date, end_date, fallback_to_bulk))
+    df = pd.DataFrame(result.fetchall(), columns=columns)
+
+    df[PRICE_COLUMNS] = df[PRICE_COLUMNS].astype(float)
+    df['volume'] = df['volume'].astype('Int64')
+    return df
 
 
 def check_price_availability(
@@ -196,6 +207,234 @@ def check_price_availability(
     }
 
 
+def _gap_tables(source: str) -> Tuple[str, ...]:
+    """Validate a gap-finder source and return the tables it checks."""
+    if source not in GAP_SOURCES:
+        raise ValueError(f"Unknown price source '{source}', expected one of {sorted(GAP_SOURCES)}")
+    return GAP_SOURCES[source]
+
+
+def _missing_cte(source: str, within_history: bool) -> str:
+    """
+    SQL for the days, symbols and missing CTEs shared by the per-symbol gap finders
+
+    missing holds one row per (symbol, trading day) with no price in the source tables.
+    """
+    tables = _gap_tables(source)
+    no_price = " AND ".join(
+        f"NOT EXISTS (SELECT 1 FROM {table} p WHERE p.symbol = s.symbol AND p.date = days.date)"
+        for table in tables
+    )
+
+    bounds_cte = ""
+    bounds_join = ""
+    if within_history:
+        per_table = " UNION ALL ".join(
+            f"SELECT symbol, min(date) AS first_date, max(date) AS last_date "
+            f"FROM {table} WHERE symbol = ANY(CAST(:symbols AS varchar[])) GROUP BY symbol"
+            for table in tables
+        )
+        bounds_cte = f""",
+    bounds AS (
+        SELECT symbol, min(first_date) AS first_date, max(last_date) AS last_date
+        FROM ({per_table}) b
+        GROUP BY symbol
+    )"""
+        bounds_join = "JOIN bounds b ON b.symbol = s.symbol AND days.date BETWEEN b.first_date AND b.last_date"
+
+    return f"""
+    WITH {_TRADING_DAYS_CTE.strip()},
+    symbols AS (
+        SELECT DISTINCT unnest(CAST(:symbols AS varchar[])) AS symbol
+    ){bounds_cte},
+    missing AS (
+        SELECT s.symbol, days.date, days.day_no
+        FROM symbols s
+        CROSS JOIN days
+        {bounds_join}
+        WHERE {no_price}
+    )"""
+
+
+def get_trading_days(
+    session: Session,
+    start_date: date,
+    end_date: date,
+    exchange: str = DEFAULT_EXCHANGE
+) -> List[date]:
+    """
+    Get exchange trading days in a date range
+
+    Args:
+        session: Database session
+        start_date: Start date (inclusive)
+        end_date: End date (inclusive)
+        exchange: Exchange MIC in trading_calendar
+
+    Returns:
+        List of trading days sorted chronologically
+    """
+    sql = f"WITH {_TRADING_DAYS_CTE.strip()} SELECT date FROM days ORDER BY date"
+    result = session.execute(text(sql), {
+        'start_date': start_date, 'end_date': end_date, 'exchange': exchange
+    })
+    return [row[0] for row in result]
+
+
+def find_missing_trading_days(
+    session: Session,
+    symbols: List[str],
+    start_date: date,
+    end_date: date,
+    source: str = 'regular',
+    within_history: bool = False,
+    exchange: str = DEFAULT_EXCHANGE
+) -> Dict[str, List[date]]:
+    """
+    Find trading days without a price, for many symbols in one query
+
+    Expected days come from generate_series over the range minus weekends and
+    trading_calendar closures; each (symbol, day) is probed on the price
+    table's primary key.
+
+    Args:
+        session: Database session
+        symbols: Stock symbols
+        start_date: Start date (inclusive)
+        end_date: End date (inclusive)
+        source: 'regular' (prices_daily), 'bulk' (prices_daily_bulk)
+            or 'either' (missing from both)
+        within_history: Only report days between each symbol's first and
+            last stored price (symbols with no prices report nothing)
+        exchange: Exchange MIC in trading_calendar
+
+    Returns:
+        Dictionary mapping every requested symbol to its missing trading days
+    """
+    missing = {symbol: [] for symbol in symbols}
+    if not symbols:
+        return missing
+
+    sql = _missing_cte(source, within_history) + " SELECT symbol, date FROM missing ORDER BY symbol, date"
+    result = session.execute(text(sql), {
+        'symbols': list(symbols), 'start_date': start_date, 'end_date': end_date, 'exchange': exchange
+    })
+
+    for symbol, missing_date in result:
+        missing[symbol].append(missing_date)
+
+    return missing
+
+
+def summarize_missing_trading_days(
+    session: Session,
+    symbols: List[str],
+    start_date: date,
+    end_date: date,
+    source: str = 'regular',
+    within_history: bool = False,
+    exchange: str = DEFAULT_EXCHANGE
+) -> Dict[str, Dict]:
+    """
+    Summarize price gaps per symbol without returning every missing day
+
+    Consecutive missing trading days form one gap (a holiday or weekend
+    between them does not split it).
+
+    Args:
+        session: Database session
+        symbols: Stock symbols
+        start_date: Start date (inclusive)
+        end_date: End date (inclusive)
+        source: 'regular', 'bulk' or 'either' (see find_missing_trading_days)
+        within_history: Only count days between each symbol's first and last price
+        exchange: Exchange MIC in trading_calendar
+
+    Returns:
+        Dictionary mapping every requested symbol to:
+        {'missing_days': int, 'gaps': int, 'longest_gap': int,
+         'longest_gap_start': date or None, 'longest_gap_end': date or None}
+    """
+    summary = {
+        symbol: {
+            'missing_days': 0, 'gaps': 0, 'longest_gap': 0,
+            'longest_gap_start': None, 'longest_gap_end': None,
+        }
+        for symbol in symbols
+    }
+    if not symbols:
+        return summary
+
+    sql = _missing_cte(source, within_history) + """,
+    runs AS (
+        SELECT symbol, count(*) AS gap_length, min(date) AS gap_start, max(date) AS gap_end
+        FROM (
+            SELECT symbol, date,
+                   day_no - row_number() OVER (PARTITION BY symbol ORDER BY date) AS run_id
+            FROM missing
+        ) m
+        GROUP BY symbol, run_id
+    )
+    SELECT DISTINCT ON (symbol)
+        symbol,
+        sum(gap_length) OVER w AS missing_days,
+        count(*) OVER w AS gaps,
+        gap_length AS longest_gap,
+        gap_start,
+        gap_end
+    FROM runs
+    WINDOW w AS (PARTITION BY symbol)
+    ORDER BY symbol, gap_length DESC, gap_start
+    """
+    result = session.execute(text(sql), {
+        'symbols': list(symbols), 'start_date': start_date, 'end_date': end_date, 'exchange': exchange
+    })
+
+    for symbol, missing_days, gaps, longest_gap, gap_start, gap_end in result:
+        summary[symbol] = {
+            'missing_days': int(missing_days),
+            'gaps': int(gaps),
+            'longest_gap': int(longest_gap),
+            'longest_gap_start': gap_start,
+            'longest_gap_end': gap_end,
+        }
+
+    return summary
+
+
+def find_missing_market_days(
+    session: Session,
+    start_date: date,
+    end_date: date,
+    source: str = 'bulk',
+    exchange: str = DEFAULT_EXCHANGE
+) -> List[date]:
+    """
+    Find trading days with no prices at all for any symbol
+
+    Used by the bulk EOD backfill scripts to find whole days to re-download.
+
+    Args:
+        session: Database session
+        start_date: Start date (inclusive)
+        end_date: End date (inclusive)
+        source: 'regular', 'bulk' or 'either' (see find_missing_trading_days)
+        exchange: Exchange MIC in trading_calendar
+
+    Returns:
+        List of missing trading days sorted chronologically
+    """
+    no_prices = " AND ".join(
+        f"NOT EXISTS (SELECT 1 FROM {table} p WHERE p.date = days.date)"
+        for table in _gap_tables(source)
+    )
+    sql = f"WITH {_TRADING_DAYS_CTE.strip()} SELECT date FROM days WHERE {no_prices} ORDER BY date"
+    result = session.execute(text(sql), {
+        'start_date': start_date, 'end_date': end_date, 'exchange': exchange
+    })
+    return [row[0] for row in result]
+
+
 def find_missing_dates(
     session: Session,
     symbol: str,
@@ -204,7 +443,7 @@ def find_missing_dates(
     check_bulk: bool = False
 ) -> List[date]:
     """
-    Find dates where price data is missing
+    Find trading days where price data is missing
 
     Args:
         session: Database session
@@ -216,42 +455,11 @@ def find_missing_dates(
     Returns:
         List of missing dates
     """
-    # Get all dates that exist in regular table
-    regular_dates = set(
-        row[0] for row in session.query(PriceDaily.date).filter(
-            PriceDaily.symbol == symbol,
-            PriceDaily.date >= start_date,
-            PriceDaily.date <= end_date
-        ).all()
+    missing = find_missing_trading_days(
+        session, [symbol], start_date, end_date,
+        source='either' if check_bulk else 'regular'
     )
-
-    if check_bulk:
-        # Get dates from bulk table
-        bulk_dates = set(
-            row[0] for row in session.query(PriceDailyBulk.date).filter(
-                PriceDailyBulk.symbol == symbol,
-                PriceDailyBulk.date >= start_date,
-                PriceDailyBulk.date <= end_date
-            ).all()
-        )
-
-        # Combined dates
-        available_dates = regular_dates | bulk_dates
-    else:
-        available_dates = regular_dates
-
-    # Generate all dates in range
-    from datetime import timedelta
-    all_dates = []
-    current = start_date
-    while current <= end_date:
-        all_dates.append(current)
-        current += timedelta(days=1)
-
-    # Find missing dates
-    missing = [d for d in all_dates if d not in available_dates]
-
-    return missing
+    return missing[symbol]
 
 
 def compare_prices(
@@ -283,14 +491,15 @@ def compare_prices(
     if not regular or not bulk:
         return None
 
-    close_diff = abs(float(regular.close) - float(bulk.close)) if regular.close and bulk.close else None
+    # prices_daily is dividend-adjusted, so compare against the bulk adjusted close
+    close_diff = abs(float(regular.adj_close) - float(bulk.adj_close)) if regular.adj_close and bulk.adj_close else None
     volume_diff = abs(int(regular.volume) - int(bulk.volume)) if regular.volume and bulk.volume else None
 
     return {
         'symbol': symbol,
         'date': target_date,
-        'regular_close': float(regular.close) if regular.close else None,
-        'bulk_close': float(bulk.close) if bulk.close else None,
+        'regular_close': float(regular.adj_close) if regular.adj_close else None,
+        'bulk_close': float(bulk.adj_close) if bulk.adj_close else None,
         'close_difference': close_diff,
         'regular_volume': int(regular.volume) if regular.volume else None,
         'bulk_volume': int(bulk.volume) if bulk.volume else None,
@@ -299,6 +508,123 @@ def compare_prices(
     }
 
 
+# Bulk rows to promote: targets(symbol, after_date) x prices_daily_bulk in one date chunk,
+# skipping dates prices_daily already has. Bulk carries only adj_close among the
+# dividend-adjusted columns, so adj_open/high/low stay NULL.
+_PROMOTE_FROM = """
+    FROM unnest(CAST(:symbols AS varchar[]), CAST(:after_dates AS date[])) AS t(symbol, after_date)
+    JOIN prices_daily_bulk b
+      ON b.symbol = t.symbol
+     AND b.date > t.after_date
+     AND b.date >= :chunk_start
+     AND b.date < :chunk_end
+"""
+
+_PROMOTE_SQL = f"""
+    WITH promoted AS (
+        INSERT INTO prices_daily (symbol, date, adj_open, adj_high, adj_low, adj_close, volume, created_at)
+        SELECT b.symbol, b.date, NULL, NULL, NULL, b.adj_close, b.volume, now()
+        {_PROMOTE_FROM}
+        ON CONFLICT (symbol, date) DO NOTHING
+        RETURNING symbol
+    )
+    SELECT symbol, count(*) FROM promoted GROUP BY symbol
+"""
+
+_PROMOTE_DRY_RUN_SQL = f"""
+    SELECT b.symbol, count(*)
+    {_PROMOTE_FROM}
+    WHERE NOT EXISTS (
+        SELECT 1 FROM prices_daily p WHERE p.symbol = b.symbol AND p.date = b.date
+    )
+    GROUP BY b.symbol
+"""
+
+
+def promote_bulk_prices(
+    session: Session,
+    symbols: Optional[List[str]] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    after_latest: bool = False,
+    chunk_days: int = PROMOTE_CHUNK_DAYS,
+    dry_run: bool = False
+) -> Dict[str, int]:
+    """
+    Copy prices from the bulk table into prices_daily with set-based SQL
+
+    Runs one INSERT ... SELECT ... ON CONFLICT DO NOTHING per date chunk
+    covering every symbol, committing after each chunk to keep locks short.
+    Dates prices_daily already has are never overwritten.
+
+    Args:
+        session: Database session
+        symbols: Symbols to promote (default: all companies). Symbols not in
+            companies are skipped (prices_daily references companies)
+        start_date: First date (default: earliest bulk date for the symbols)
+        end_date: Last date (default: latest bulk date for the symbols)
+        after_latest: Only promote dates after each symbol's latest prices_daily
+            date; symbols with no prices_daily rows are skipped
+        chunk_days: Calendar days per statement
+        dry_run: Count rows that would be promoted without inserting
+
+    Returns:
+        Dictionary mapping symbol to rows promoted (symbols with none are omitted)
+    """
+    company_symbols = session.query(Company.symbol)
+    if symbols is not None:
+        company_symbols = company_symbols.filter(Company.symbol.in_(symbols))
+    targets = {row[0]: None for row in company_symbols}
+
+    if after_latest and targets:
+        latest = session.query(PriceDaily.symbol, func.max(PriceDaily.date)).filter(
+            PriceDaily.symbol.in_(list(targets))
+        ).group_by(PriceDaily.symbol).all()
+        targets = dict(latest)
+
+    if not targets:
+        return {}
+
+    if start_date is None or end_date is None:
+        bulk_min, bulk_max = session.query(
+            func.min(PriceDailyBulk.date), func.max(PriceDailyBulk.date)
+        ).filter(PriceDailyBulk.symbol.in_(list(targets))).one()
+        if bulk_min is None:
+            return {}
+        if start_date is None:
+            start_date = min(targets.values()) + timedelta(days=1) if after_latest else bulk_min
+        end_date = end_date or bulk_max
+
+    # A symbol without a lower bound takes every date in range
+    floor = start_date - timedelta(days=1)
+    params = {
+        'symbols': list(targets),
+        'after_dates': [max(d, floor) if d else floor for d in targets.values()],
+    }
+
+    sql = text(_PROMOTE_DRY_RUN_SQL if dry_run else _PROMOTE_SQL)
+    promoted: Dict[str, int] = {}
+    chunk_start = start_date
+
+    while chunk_start <= end_date:
+        chunk_end = min(chunk_start + timedelta(days=chunk_days), end_date + timedelta(days=1))
+        result = session.execute(sql, {**params, 'chunk_start': chunk_start, 'chunk_end': chunk_end})
+
+        rows = 0
+        for symbol, count in result:
+            promoted[symbol] = promoted.get(symbol, 0) + count
+            rows += count
+        if not dry_run:
+            session.commit()
+
+        if rows:
+            logger.info(f"{'Would promote' if dry_run else 'Promoted'} {rows:,} bulk prices "
+                        f"for {chunk_start} to {chunk_end - timedelta(days=1)}")
+        chunk_start = chunk_end
+
+    return promoted
+
+
 def copy_from_bulk_to_regular(
     session: Session,
     symbol: str,
@@ -318,50 +644,8 @@ def copy_from_bulk_to_regular(
     Returns:
         Number of records copied
     """
-    from sqlalchemy.dialects.postgresql import insert
-
-    # Get bulk prices for dates not in regular table
-    regular_dates = set(
-        row[0] for row in session.query(PriceDaily.date).filter(
-            PriceDaily.symbol == symbol,
-            PriceDaily.date >= start_date,
-            PriceDaily.date <= end_date
-        ).all()
-    )
-
-    bulk_prices = session.query(PriceDailyBulk).filter(
-        PriceDailyBulk.symbol == symbol,
-        PriceDailyBulk.date >= start_date,
-        PriceDailyBulk.date <= end_date,
-        ~PriceDailyBulk.date.in_(regular_dates) if regular_dates else True
-    ).all()
-
-    if not bulk_prices:
-        return 0
-
-    # Convert to regular price records
-    records = []
-    for bp in bulk_prices:
-        records.append({
-            'symbol': bp.symbol,
-            'date': bp.date,
-            'open': bp.open,
-            'high': bp.high,
-            'low': bp.low,
-            'close': bp.close,
-            'volume': bp.volume,
-            'change': None,  # Will be calculated separately if needed
-            'change_percent': None,
-            'vwap': None
-        })
-
-    if records:
-        stmt = insert(PriceDaily).values(records)
-        stmt = stmt.on_conflict_do_nothing(index_elements=['symbol', 'date'])
-        session.execute(stmt)
-        session.commit()
-
-    return len(records)
+    promoted = promote_bulk_prices(session, [symbol], start_date, end_date)
+    return promoted.get(symbol, 0)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,155 @@
+"""
+Exchange Trading Calendar
+Rule-based NYSE closures used to fill the trading_calendar table
+
+The table stores exceptions only: weekdays an exchange is closed. Trading
+days are every Monday-Friday minus those rows, which is how the SQL gap
+finders in price_helpers build their expected-date series.
+"""
+import logging
+from datetime import date, timedelta
+from typing import Dict, List
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.database.models import TradingCalendar
+
+logger = logging.getLogger(__name__)
+
+# ISO 10383 market identifier for the New York Stock Exchange
+DEFAULT_EXCHANGE = 'XNYS'
+
+# Unscheduled NYSE closures (national days of mourning, weather, 9/11)
+NYSE_SPECIAL_CLOSURES = {
+    date(1994, 4, 27): "Nixon National Day of Mourning",
+    date(2001, 9, 11): "September 11 attacks",
+    date(2001, 9, 12): "September 11 attacks",
+    date(2001, 9, 13): "September 11 attacks",
+    date(2001, 9, 14): "September 11 attacks",
+    date(2004, 6, 11): "Reagan National Day of Mourning",
+    date(2007, 1, 2): "Ford National Day of Mourning",
+    date(2012, 10, 29): "Hurricane Sandy",
+    date(2012, 10, 30): "Hurricane Sandy",
+    date(2018, 12, 5): "George H.W. Bush National Day of Mourning",
+    date(2025, 1, 9): "Carter National Day of Mourning",
+}
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th given weekday of a month (n=-1 for the last one)."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays are observed Friday, Sunday holidays Monday."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def nyse_holidays(year: int) -> Dict[date, str]:
+    """
+    Full-day NYSE holidays for a year under current rules
+
+    Args:
+        year: Calendar year
+
+    Returns:
+        Dictionary mapping weekday closure dates to holiday names
+    """
+    holidays = {}
+
+    # New Year's Day: Sunday -> Monday; a Saturday holiday is not moved to Dec 31
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays[_observed(new_year)] = "New Year's Day"
+
+    if year >= 1998:
+        holidays[_nth_weekday(year, 1, 0, 3)] = "Martin Luther King Jr. Day"
+    holidays[_nth_weekday(year, 2, 0, 3)] = "Washington's Birthday"
+    holidays[_easter(year) - timedelta(days=2)] = "Good Friday"
+    holidays[_nth_weekday(year, 5, 0, -1)] = "Memorial Day"
+    if year >= 2022:
+        holidays[_observed(date(year, 6, 19))] = "Juneteenth"
+    holidays[_observed(date(year, 7, 4))] = "Independence Day"
+    holidays[_nth_weekday(year, 9, 0, 1)] = "Labor Day"
+    holidays[_nth_weekday(year, 11, 3, 4)] = "Thanksgiving Day"
+    holidays[_observed(date(year, 12, 25))] = "Christmas Day"
+
+    return holidays
+
+
+def nyse_closures(start_year: int, end_year: int) -> List[Dict]:
+    """
+    Weekday NYSE closures (holidays and special closures) for a year range
+
+    Args:
+        start_year: First year (inclusive)
+        end_year: Last year (inclusive)
+
+    Returns:
+        List of trading_calendar rows sorted by date
+    """
+    closures = {}
+    for year in range(start_year, end_year + 1):
+        closures.update(nyse_holidays(year))
+    closures.update({
+        d: name for d, name in NYSE_SPECIAL_CLOSURES.items()
+        if start_year <= d.year <= end_year
+    })
+
+    return [
+        {'exchange': DEFAULT_EXCHANGE, 'date': d, 'description': name}
+        for d, name in sorted(closures.items())
+        if d.weekday() < 5
+    ]
+
+
+def sync_trading_calendar(session: Session, start_year: int, end_year: int) -> int:
+    """
+    Upsert NYSE closures for a year range into trading_calendar
+
+    Args:
+        session: Database session
+        start_year: First year (inclusive)
+        end_year: Last year (inclusive)
+
+    Returns:
+        Number of closure rows written
+    """
+    rows = nyse_closures(start_year, end_year)
+    if not rows:
+        return 0
+
+    stmt = insert(TradingCalendar).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['exchange', 'date'],
+        set_={'description': stmt.excluded.description}
+    )
+    session.execute(stmt)
+    session.commit()
+
+    logger.info(f"Trading calendar synced: {len(rows)} {DEFAULT_EXCHANGE} closures for {start_year}-{end_year}")
+    return len(rows)